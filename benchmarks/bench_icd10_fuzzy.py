@@ -0,0 +1,51 @@
+"""
+Compares ICD10Code.best_matches (batched, vectorized scoring) against calling the per-code scoring loop
+once per description.
+
+Run from the base directory of the repo:
+    python benchmarks/bench_icd10_fuzzy.py [number of descriptions]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from rapidfuzz import fuzz, utils
+from cdcwonderpy.icd10code import ICD10Code
+
+
+def per_code_loop(description):
+    """
+    The original implementation, kept here as the baseline.
+    """
+    best_score, best_code = 0, None
+    for code in ICD10Code:
+        score = fuzz.token_set_ratio(description, ICD10Code.codeToLabels[code.value], processor=utils.default_process)
+        if score > best_score:
+            best_score, best_code = score, code
+    return best_code
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    ICD10Code._open_description_map()
+    random.seed(0)
+    labels = list(ICD10Code.codeToLabels.values())
+    descriptions = [" ".join(random.choice(labels).split()[:4]) for _ in range(n)]
+    ICD10Code.best_matches(["warm up"])
+
+    start = time.perf_counter()
+    expected = [per_code_loop(description) for description in descriptions]
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = ICD10Code.best_matches(descriptions)
+    batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ICD10Code.best_matches(descriptions, score_cutoff=90)
+    cutoff = time.perf_counter() - start
+
+    assert batched == expected
+    print(f"{n} descriptions: per-code loop {loop:.2f} s | best_matches {batch:.2f} s | best_matches(score_cutoff=90) {cutoff:.2f} s")
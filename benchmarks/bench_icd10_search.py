@@ -0,0 +1,45 @@
+"""
+Compares ICD10Code.description_matches_regex (search index) against a full scan of every description.
+
+Run from the base directory of the repo:
+    python benchmarks/bench_icd10_search.py
+"""
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from cdcwonderpy.icd10code import ICD10Code
+
+QUERIES = [
+    ("kidney", re.I),
+    (r"\bkidney\b", re.I),
+    ("malignant neoplasm of (upper|lower)", re.I),
+    ("disease.*( ear(\\W+|$)| throat(\\W+|$))", re.I),
+    ("[Ww]aldenstr.m", 0),
+]
+
+
+def full_scan(regex, flags):
+    """
+    The original implementation, kept here as the baseline.
+    """
+    return [code for code in ICD10Code if re.search(regex, ICD10Code.codeToLabels[code.value], flags)]
+
+
+if __name__ == "__main__":
+    ICD10Code.description_matches_regex("warm up")
+
+    for regex, flags in QUERIES:
+        assert ICD10Code.description_matches_regex(regex, flags) == full_scan(regex, flags)
+
+        number = 20
+        scan = timeit.timeit(lambda: full_scan(regex, flags), number=number) / number
+        def cold():
+            ICD10Code._search_index.clear_cache()
+            ICD10Code.description_matches_regex(regex, flags)
+        indexed = timeit.timeit(cold, number=number) / number
+        cached = timeit.timeit(lambda: ICD10Code.description_matches_regex(regex, flags), number=number) / number
+
+        print(f"{regex!r:45} full scan {scan * 1e3:8.2f} ms | index {indexed * 1e3:8.2f} ms | cached {cached * 1e3:8.3f} ms")
@@ -0,0 +1,42 @@
+"""
+Compares parsing a batch of responses one after the other with parse_responses on a growing number
+of worker processes.
+
+Run from the base directory of the repo:
+    python benchmarks/bench_parse_responses.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import cdcwonderpy as wonder
+from cdcwonderpy.enums import *
+
+NUM_RESPONSES = 32
+ROWS = 20000
+
+
+def batch(xmls):
+    return [wonder.Response(xml, ["Month", "Age", "Race"]) for xml in xmls]
+
+
+if __name__ == "__main__":
+    groupings = [Grouping.MONTH, Grouping.SINGLE_YEAR_AGE_GROUPS, Grouping.RACE]
+    xmls = [wonder.SyntheticResponseGenerator(seed=seed).xml(groupings, rows=ROWS) for seed in range(NUM_RESPONSES)]
+    print(f"{NUM_RESPONSES} responses of {ROWS} rows ({sum(len(xml) for xml in xmls) / 2**20:.1f} MB), {os.cpu_count()} CPUs")
+
+    start = time.perf_counter()
+    for response in batch(xmls):
+        response.as_dataframe()
+    serial = time.perf_counter() - start
+    print(f"serial as_dataframe:          {serial:6.2f}s")
+
+    workers = 1
+    while workers <= os.cpu_count():
+        responses = batch(xmls)
+        start = time.perf_counter()
+        wonder.parse_responses(responses, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"parse_responses {workers:>2} workers:  {elapsed:6.2f}s ({serial / elapsed:4.1f}x)")
+        workers *= 2
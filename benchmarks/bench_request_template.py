@@ -0,0 +1,69 @@
+"""
+Compares building request XML with the compiled request template (Request.to_xml) against the original
+string concatenation, for 100k variants of a request that differ in their race, gender and date filters.
+
+Run from the base directory of the repo:
+    python benchmarks/bench_request_template.py [number of variants]
+"""
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from cdcwonderpy import *
+
+
+def concatenated_xml(request):
+    """
+    The original implementation, kept here as the baseline.
+    """
+    requestString = "<request-parameters>\n"
+    for parameterDict in request._parameter_dicts():
+        for key in parameterDict:
+            requestString += "<parameter>\n"
+            requestString += "<name>" + key + "</name>\n"
+            if isinstance(parameterDict[key], list) or isinstance(parameterDict[key], tuple):
+                for value in parameterDict[key]:
+                    requestString += "<value>" + value + "</value>\n"
+            else:
+                requestString += "<value>" + parameterDict[key] + "</value>\n"
+            requestString += "</parameter>\n"
+    requestString += "</request-parameters>"
+    return requestString
+
+
+def variants(n):
+    """
+    Yields n requests, each differing from the previous one in at least one filter.
+    """
+    request = Request().group_by(Grouping.YEAR, Grouping.RACE, Grouping.GENDER)
+    races = [race for race in Race if race != Race.ALL]
+    genders = [gender for gender in Gender if gender != Gender.ALL]
+    years = range(1999, 2019)
+    for race, gender, year in itertools.islice(itertools.cycle(itertools.product(races, genders, years)), n):
+        yield request.race(race).gender(gender).dates(Dates.single(Year(year)))
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    for request in variants(100):
+        assert request.to_xml() == concatenated_xml(request)
+
+    start = time.perf_counter()
+    for request in variants(n):
+        pass
+    setup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for request in variants(n):
+        concatenated_xml(request)
+    concatenated = time.perf_counter() - start - setup
+
+    start = time.perf_counter()
+    for request in variants(n):
+        request.to_xml()
+    template = time.perf_counter() - start - setup
+
+    print(f"{n} variants: concatenation {concatenated:.2f} s | template {template:.2f} s | speedup {concatenated / template:.1f}x")
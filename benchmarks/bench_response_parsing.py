@@ -0,0 +1,97 @@
+"""
+Compares the streaming Response parser against the original BeautifulSoup implementation
+on large synthetic D76 responses.
+
+Run from the base directory of the repo:
+    python benchmarks/bench_response_parsing.py
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+import warnings
+
+import bs4 as bs
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import cdcwonderpy as wonder
+
+
+def synthetic_xml(years, months, ages, seed=0):
+    """
+    Builds a Year x Month x Single-Year-Age response with the same rowspan layout the D76 endpoint uses.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for year in range(1999, 1999 + years):
+        for month in range(1, months + 1):
+            for age in range(1, ages + 1):
+                cells = []
+                if month == 1 and age == 1:
+                    cells.append(f'<c l="{year}" r="{months * ages}"/>')
+                if age == 1:
+                    cells.append(f'<c l="{year}/{month:02d}" r="{ages}"/>')
+                deaths = rng.randint(0, 5000)
+                cells.append(f'<c l="{age} years"/>')
+                cells.append(f'<c v="{deaths:,}"/>' if deaths >= 10 else '<c v="Suppressed"/>')
+                cells.append('<c v="Not Applicable"/><c v="Not Applicable"/>')
+                rows.append("<r>" + "".join(cells) + "</r>")
+    return '<?xml version="1.0"?>\n<page><response><data-table>\n' + "\n".join(rows) + "\n</data-table></response></page>"
+
+
+def beautifulsoup_2d_list(xml):
+    """
+    The original as_2d_list implementation, kept here as the baseline.
+    """
+    root = bs.BeautifulSoup(xml, "lxml")
+    all_records = []
+    row_number = 0
+    for row in root.find_all("r"):
+        if row_number >= len(all_records):
+            all_records.append([])
+        for cell in row.find_all("c"):
+            if 'v' in cell.attrs:
+                try:
+                    all_records[row_number].append(float(cell.attrs["v"].replace(',', '')))
+                except ValueError:
+                    all_records[row_number].append(cell.attrs["v"])
+            elif 'r' not in cell.attrs:
+                all_records[row_number].append(cell.attrs["l"])
+            else:
+                for row_index in range(int(cell.attrs["r"])):
+                    if (row_number + row_index) >= len(all_records):
+                        all_records.append([])
+                    all_records[row_number + row_index].append(cell.attrs["l"])
+        row_number += 1
+    return all_records
+
+
+def measure(f):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = f()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+
+if __name__ == "__main__":
+    warnings.filterwarnings("ignore", category=bs.XMLParsedAsHTMLWarning)
+    for years, months, ages in [(2, 12, 99), (10, 12, 99), (20, 12, 99)]:
+        xml = synthetic_xml(years, months, ages)
+        response = wonder.Response(xml, ["Year", "Month", "Age"])
+
+        expected, bs_time, bs_mem = measure(lambda: beautifulsoup_2d_list(xml))
+        streamed, stream_time, stream_mem = measure(lambda: sum(1 for _ in response.iter_rows()))
+        assert response.as_2d_list() == expected
+
+        print(f"{len(expected):>7} rows ({len(xml) / 2**20:6.1f} MB): "
+              f"BeautifulSoup {bs_time:6.2f}s {bs_mem:7.1f} MB peak | "
+              f"iter_rows {stream_time:6.2f}s {stream_mem:7.1f} MB peak")
+        object_frame = pd.DataFrame(expected, columns=["Year", "Month", "Age", "Deaths", "Population", "Crude Rate Per 100,000"])
+        typed_frame = response.as_dataframe()
+        print(f"{'':>7}      DataFrame memory: object columns {object_frame.memory_usage(deep=True).sum() / 2**20:6.1f} MB | "
+              f"typed columns {typed_frame.memory_usage(deep=True).sum() / 2**20:6.1f} MB")
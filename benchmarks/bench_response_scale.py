@@ -0,0 +1,64 @@
+"""
+Time and peak memory of the response parsing pipeline (iter_rows, as_2d_list and as_dataframe) on
+synthetic D76 responses of 10k, 100k and 1M rows, for a shallow and a deeply nested grouping layout.
+
+Run from the base directory of the repo:
+    python benchmarks/bench_response_scale.py [max_rows]
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import cdcwonderpy as wonder
+from cdcwonderpy.enums import *
+
+SIZES = [10000, 100000, 1000000]
+
+LAYOUTS = {
+    "Month x Cause": [Grouping.MONTH, Grouping.CAUSE_OF_DEATH],
+    "Month x Age x Race x Hispanic x Weekday": [Grouping.MONTH, Grouping.SINGLE_YEAR_AGE_GROUPS, Grouping.RACE,
+                                                Grouping.HISPANIC_ORIGIN, Grouping.WEEKDAY],
+}
+
+METHODS = {
+    "iter_rows": lambda response: sum(1 for _ in response.iter_rows()),
+    "as_2d_list": lambda response: len(response.as_2d_list()),
+    "as_dataframe": lambda response: len(response.as_dataframe()),
+}
+
+
+def measure(f):
+    """
+    Times f, then runs it again under tracemalloc (which slows it down considerably) for its peak memory.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    result = f()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    f()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+
+if __name__ == "__main__":
+    max_rows = int(sys.argv[1]) if len(sys.argv) > 1 else max(SIZES)
+    generator = wonder.SyntheticResponseGenerator(seed=0, totals=True)
+    for layout, groupings in LAYOUTS.items():
+        print(layout)
+        columns = ["Age" if grouping.name.endswith("AGE_GROUPS") else grouping.name.capitalize() for grouping in groupings]
+        for size in [size for size in SIZES if size <= max_rows]:
+            xml = generator.xml(groupings, rows=size)
+            results = []
+            for name, method in METHODS.items():
+                # A fresh Response per method, so no method benefits from another's memoized results.
+                rows, elapsed, peak = measure(lambda: method(wonder.Response(xml, columns)))
+                assert rows == size
+                results.append(f"{name} {elapsed:6.2f}s {peak:7.1f} MB peak")
+            print(f"{size:>8} rows ({len(xml) / 2**20:6.1f} MB): " + " | ".join(results))
@@ -0,0 +1,51 @@
+"""
+Compares the time and peak memory of downloading and parsing a large response with Request.send,
+send(stream=True) and send(stream=True, spool=True), against a local MockD76Server.
+
+The server runs in the same process, so the peaks include the one copy of the body it sends; that
+copy is the same for every mode.
+
+Run from the base directory of the repo:
+    python benchmarks/bench_streaming.py
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import cdcwonderpy as wonder
+from cdcwonderpy.enums import *
+
+GROUPINGS = [Grouping.MONTH, Grouping.RACE, Grouping.GENDER, Grouping.HISPANIC_ORIGIN, Grouping.WEEKDAY]
+
+
+def measure(f):
+    """
+    Times f, then runs it again under tracemalloc (which slows it down considerably) for its peak memory.
+    """
+    gc.collect()
+    start = time.perf_counter()
+    result = f()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    f()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+
+if __name__ == "__main__":
+    request = wonder.Request().group_by(*GROUPINGS)
+    xml = wonder.SyntheticResponseGenerator(totals=True).xml(GROUPINGS)
+    print(f"{xml.count('<r>')} rows, {len(xml) / 2**20:.1f} MB of XML")
+
+    with wonder.MockD76Server(recordings={request: xml}) as server, wonder.WonderClient(url=server.url) as client:
+        for name, kwargs in [("send", {}), ("send(stream=True)", {"stream": True}),
+                             ("send(stream=True, spool=True)", {"stream": True, "spool": True})]:
+            df, elapsed, peak = measure(lambda: request.send(client=client, **kwargs).as_dataframe())
+            assert len(df) == xml.count("<r>")
+            print(f"{name:<32} {elapsed:6.2f}s  peak {peak:7.1f} MB")
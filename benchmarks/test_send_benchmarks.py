@@ -0,0 +1,101 @@
+"""
+Throughput and latency benchmarks of Request.send and gather_requests against a local
+MockD76Server, so they can run in CI or on machines without access to CDC Wonder.
+
+Requires the pytest-benchmark plugin (pip install pytest-benchmark). Run from the base directory of the repo:
+    python -m pytest benchmarks/test_send_benchmarks.py
+"""
+import asyncio
+import concurrent.futures
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import cdcwonderpy as wonder
+from cdcwonderpy.enums import *
+
+SAMPLE_XML = open(os.path.join(os.path.dirname(__file__), '..', 'tests', 'sample_response.xml')).read()
+BATCH_SIZE = 20
+
+
+@pytest.fixture(scope="module")
+def server():
+    with wonder.MockD76Server(generator=lambda request: SAMPLE_XML) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with wonder.WonderClient(url=server.url, retries=0) as client:
+        yield client
+
+
+def test_send_latency(benchmark, server, client):
+    """
+    Round trip of a single request and parse of its response over a kept-alive connection.
+    """
+    server.latency = 0
+    df = benchmark(lambda: wonder.Request().group_by(Grouping.YEAR, Grouping.RACE).send(client=client).as_dataframe())
+    assert len(df) == 80
+
+
+def test_send_latency_with_server_delay(benchmark, server, client):
+    """
+    Client overhead on top of a fixed 20 ms server latency.
+    """
+    server.latency = 0.02
+    try:
+        benchmark.pedantic(lambda: wonder.Request().send(client=client), rounds=20)
+    finally:
+        server.latency = 0
+
+
+@pytest.mark.parametrize("workers", [1, 4, 8])
+def test_threaded_throughput(benchmark, server, client, workers):
+    """
+    Batches of requests sent from a thread pool sharing one client, with 10 ms of server latency.
+    """
+    server.latency = 0.01
+    requests = [wonder.Request().gender(gender) for gender in [Gender.MALE, Gender.FEMALE]] * (BATCH_SIZE // 2)
+
+    def send_batch():
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda request: request.send(client=client), requests))
+
+    try:
+        responses = benchmark.pedantic(send_batch, rounds=3)
+    finally:
+        server.latency = 0
+    assert len(responses) == BATCH_SIZE
+
+
+@pytest.mark.parametrize("concurrency", [1, 4, 8])
+def test_async_throughput(benchmark, server, concurrency):
+    """
+    Batches of requests sent with gather_requests, without rate limiting, with 10 ms of server latency.
+    """
+    server.latency = 0.01
+    requests = [wonder.Request().race(race) for race in [Race.WHITE, Race.ASIAN_OR_PACIFIC_ISLANDER]] * (BATCH_SIZE // 2)
+    try:
+        responses = benchmark.pedantic(
+            lambda: asyncio.run(wonder.gather_requests(requests, concurrency=concurrency, rate=None, url=server.url)), rounds=3)
+    finally:
+        server.latency = 0
+    assert len(responses) == BATCH_SIZE
+
+
+def test_send_with_retries(benchmark, server):
+    """
+    Requests against a server failing a quarter of the time, retried with a short backoff.
+    """
+    server.error_rate = 0.25
+    try:
+        with wonder.WonderClient(url=server.url, retries=10, backoff=0.001) as client:
+            benchmark.pedantic(lambda: [wonder.Request().send(client=client) for _ in range(BATCH_SIZE)], rounds=3)
+    finally:
+        server.error_rate = 0
+
@@ -2,4 +2,13 @@ from .enums import *
 from .request import Request
 from .response import Response
 from .dates import *
-from .ages import *
\ No newline at end of file
+from .ages import *
+from .cache import ResponseCache
+from .batch import gather_requests, parse_responses
+from .client import WonderClient
+from .planner import QueryPlanner
+from .sweep import RequestSweep
+from .mockserver import MockD76Server
+from .synthetic import SyntheticResponseGenerator
+from .refresh import RefreshPlanner, RefreshReport
+from .instrumentation import Instrumentation, HistogramCollector, SpanCollector
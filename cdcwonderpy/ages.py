@@ -1,15 +1,37 @@
 import typing
 from cdcwonderpy.enums import Grouping
 
+# Bit i of an Ages mask is set when age i is included. Valid ages are 1 to 99, so every mask fits in 128 bits.
+_MIN_AGE = 1
+_MAX_AGE = 99
+
+def _block_masks(size: int, first: int) -> typing.List[int]:
+    """
+    Module internal helper returning the masks of the consecutive, aligned age blocks of the given size,
+    starting at age `first`, that fit within the valid ages.
+    """
+    block = (1 << size) - 1
+    return [block << start for start in range(first, _MAX_AGE - size + 2, size)]
+
 class Ages:
     """
     Immutable representation of collections of ages upon which CDC Wonder Requests can filter.
+    The ages are stored as the bits of an integer, so set operations are single bitwise operations.
     """
+    __slots__ = ("_mask",)
+
+    # (group size, aligned blocks) for the age groupings that ages can be partitioned into.
+    _AGE_GROUP_BLOCKS = {
+        Grouping.TEN_YEAR_AGE_GROUPS: (10, _block_masks(10, 5)),
+        Grouping.FIVE_YEAR_AGE_GROUPS: (5, _block_masks(5, 5)),
+        Grouping.SINGLE_YEAR_AGE_GROUPS: (1, _block_masks(1, _MIN_AGE)),
+    }
+
     def __init__(self):
         """
         Initializes an empty Ages instance.
         """
-        self._age_set = set()
+        self._mask = 0
     
     def __repr__(self) -> str:
         """
@@ -18,25 +40,42 @@ class Ages:
         @returns:   String representation of the Ages instance.
         """
         result = []
-        beginAge = None
-        lastAge = None
-        for age in self.as_list():
-            if lastAge == None or lastAge+1 != age:
-                if beginAge != None:
-                    if lastAge == beginAge:
-                        result.append(str(beginAge))
-                    else:
-                        result.append(str(beginAge)+"-"+str(lastAge))
-                beginAge = age
-            lastAge = age
-        
-        if lastAge == beginAge:
-            result.append(str(beginAge))
-        else:
-            result.append(str(beginAge)+"-"+str(lastAge))
+        for beginAge, lastAge in self._runs():
+            if lastAge == beginAge:
+                result.append(str(beginAge))
+            else:
+                result.append(str(beginAge)+"-"+str(lastAge))
+
+        if not result:
+            result.append(str(None))
 
         return str(result)
 
+    def __contains__(self, age: int) -> bool:
+        """
+        Returns whether the given age is represented by the Ages instance.
+
+        @param  age:    Age value to look up.
+        @returns:       True if age is an int contained in the Ages instance, False otherwise.
+        """
+        return isinstance(age, int) and _MIN_AGE <= age <= _MAX_AGE and bool(self._mask >> age & 1)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of ages represented by the Ages instance.
+
+        @returns:   Number of ages represented by the Ages instance.
+        """
+        return bin(self._mask).count("1")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Ages):
+            return NotImplemented
+        return self._mask == other._mask
+
+    def __hash__(self) -> int:
+        return hash(self._mask)
+
     @staticmethod
     def single(age: int) -> 'Ages':
         """
@@ -54,7 +93,7 @@ class Ages:
         elif age < 1 or age > 99:
             raise ValueError(f"Valid age values range from 1 to 99, inclusive, and user inputted: {age}")
         else:
-            result._age_set.add(age)
+            result._mask = 1 << age
 
         return result
 
@@ -77,11 +116,7 @@ class Ages:
         if end_age < start_age:
             raise ValueError("Starting age must be before or equal to end age; Start: "+str(start_age)+" End: "+str(end_age))
 
-        result = Ages()
-        for age in range(start_age, end_age+1):
-            result._age_set.add(age)
-
-        return result
+        return Ages._from_mask(((1 << (end_age - start_age + 1)) - 1) << start_age)
 
     def as_list(self) -> list:
         """
@@ -89,7 +124,7 @@ class Ages:
 
         @returns:   List containing sorted age values represented by called upon Ages instance.
         """
-        return sorted(list(self._age_set))
+        return [age for begin, end in self._runs() for age in range(begin, end + 1)]
 
     def union(self, other: 'Ages') -> 'Ages':
         """
@@ -103,9 +138,35 @@ class Ages:
         if not isinstance(other, Ages):
             raise TypeError("Both objects must be an instance of Ages")
 
-        result = Ages()
-        result._age_set = self._age_set.union(other._age_set)
-        return result
+        return Ages._from_mask(self._mask | other._mask)
+
+    def intersection(self, other: 'Ages') -> 'Ages':
+        """
+        Method for generating a new Ages instance containing the ages represented by both
+        the called upon instance and the other passed in instance.
+
+        @param  other:      A second Ages instance to be intersected.
+        @raises TypeError:  If user does not input an Ages instance as `other`.
+        @returns:           A new instance representing the intersection of the two target Ages instances.
+        """
+        if not isinstance(other, Ages):
+            raise TypeError("Both objects must be an instance of Ages")
+
+        return Ages._from_mask(self._mask & other._mask)
+
+    def difference(self, other: 'Ages') -> 'Ages':
+        """
+        Method for generating a new Ages instance containing the ages represented by the
+        called upon instance but not by the other passed in instance.
+
+        @param  other:      A second Ages instance whose ages are removed.
+        @raises TypeError:  If user does not input an Ages instance as `other`.
+        @returns:           A new instance representing the difference of the two target Ages instances.
+        """
+        if not isinstance(other, Ages):
+            raise TypeError("Both objects must be an instance of Ages")
+
+        return Ages._from_mask(self._mask & ~other._mask)
 
     ###############################
     ##### Private Methods
@@ -128,35 +189,19 @@ class Ages:
         @raises TypeError:      If inputted age_group_type is not a valid Grouping age group Enum.
         @returns:               Boolean representing if Ages instance is of valid age group type.
         """
-        if age_group_type not in [Grouping.TEN_YEAR_AGE_GROUPS,
-                                  Grouping.FIVE_YEAR_AGE_GROUPS,
-                                  Grouping.SINGLE_YEAR_AGE_GROUPS]:
+        if age_group_type not in Ages._AGE_GROUP_BLOCKS:
             raise TypeError("age_group_type not of valid type within the Grouping Enum class.")
 
-        try:
-            formatted_grouping = self._as_age_group_type(age_group_type)
-        except:
-            return False
-
-        age_group_size = 0
-        if age_group_type == Grouping.TEN_YEAR_AGE_GROUPS:
-            age_group_size = 10
-        elif age_group_type == Grouping.FIVE_YEAR_AGE_GROUPS:
-            age_group_size = 5
-        else:
-            age_group_size = 1
-
-        for block in formatted_grouping:
-            if len(block) != age_group_size:
-                return False
-            elif block != list(range(block[0], block[-1]+1)):
-                return False
-            elif age_group_type == Grouping.TEN_YEAR_AGE_GROUPS and block[0]%10 != 5:
-                return False
-            elif age_group_type == Grouping.FIVE_YEAR_AGE_GROUPS and block[0]%10 not in [0,5]:
+        # Valid when every aligned block of the grouping is either fully included or fully excluded,
+        # and no ages fall outside of the blocks.
+        remaining = self._mask
+        for block in Ages._AGE_GROUP_BLOCKS[age_group_type][1]:
+            covered = remaining & block
+            if covered != 0 and covered != block:
                 return False
+            remaining ^= covered
 
-        return True
+        return remaining == 0
 
     def _as_age_group_type(self, age_group_type: Grouping) -> typing.List[typing.List]:
         """
@@ -169,31 +214,42 @@ class Ages:
         @raises TypeError:      If inputted age_group_type is not a valid Grouping age group Enum.
         @returns:               2D list representing partitions of the called upon Ages instance.
         """
-        if age_group_type not in [Grouping.TEN_YEAR_AGE_GROUPS,
-                                  Grouping.FIVE_YEAR_AGE_GROUPS,
-                                  Grouping.SINGLE_YEAR_AGE_GROUPS]:
+        if age_group_type not in Ages._AGE_GROUP_BLOCKS:
             raise TypeError("age_group_type not of valid type within the Grouping Enum class.")
 
         ages = self.as_list()
+        age_group_size = Ages._AGE_GROUP_BLOCKS[age_group_type][0]
 
-        age_group_size = 0
-        if age_group_type == Grouping.TEN_YEAR_AGE_GROUPS:
-            age_group_size = 10
-        elif age_group_type == Grouping.FIVE_YEAR_AGE_GROUPS:
-            age_group_size = 5
-        else:
-            age_group_size = 1
-        
-        groups, curr_block, block_index = [], [], 0
-        for age in ages:
-            curr_block.append(age)
-            block_index += 1
-            if len(curr_block) == age_group_size:
-                groups.append(curr_block)
-                curr_block = []
-                block_index = 0
-        
-        if block_index != 0:
+        if len(ages) % age_group_size != 0:
             raise ValueError(f"Invalid Group Size: Cannot group ages by type {age_group_type.name}")
 
-        return groups
+        return [ages[i:i + age_group_size] for i in range(0, len(ages), age_group_size)]
+
+    @staticmethod
+    def _from_mask(mask: int) -> 'Ages':
+        """
+        Module internal method for creating an Ages instance from a bitmask of ages.
+
+        @param  mask:   Integer whose bit i is set when age i is included.
+        @returns:       Ages instance representing the ages of the mask.
+        """
+        result = Ages()
+        result._mask = mask
+        return result
+
+    def _runs(self) -> typing.List[typing.Tuple[int, int]]:
+        """
+        Module internal method for extracting the maximal runs of consecutive ages as sorted
+        (first age, last age) pairs, e.g. [(15, 44), (50, 50)].
+
+        @returns:   List of inclusive age ranges represented by the Ages instance.
+        """
+        runs = []
+        mask = self._mask
+        while mask:
+            begin = (mask & -mask).bit_length() - 1
+            # Adding the lowest bit of the run carries through the whole run and clears it.
+            end = ((mask + (1 << begin)) & -(mask + (1 << begin))).bit_length() - 2
+            runs.append((begin, end))
+            mask &= -(1 << (end + 1))
+        return runs
@@ -0,0 +1,195 @@
+import asyncio
+import concurrent.futures
+import time
+import typing
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pandas as pd
+
+from cdcwonderpy.request import Request
+from cdcwonderpy.response import Response, _ColumnarTable
+
+
+class TokenBucket():
+    """
+    * Token bucket rate limiter for asyncio code. Tokens are added at a constant rate up to a maximum
+    * burst size, and each acquire call waits until a token is available and consumes it.
+    """
+    def __init__(self, rate : float, burst : int = 1):
+        """
+        Create a token bucket that starts full.
+        :param rate:        number of tokens added per second
+        :param burst:       maximum number of tokens the bucket can hold
+        :raises ValueError: if rate or burst are not positive
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be a positive number of requests per second")
+        if burst < 1:
+            raise ValueError("Burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = None
+
+    async def acquire(self):
+        """
+        Wait until a token is available and consume it.
+        """
+        # Created lazily so the lock belongs to the running event loop.
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+async def gather_requests(requests : typing.Iterable[Request], concurrency : int = 4, rate : typing.Optional[float] = 1.0,
+                          burst : int = 1, cache : 'ResponseCache' = None, url : str = None) -> typing.List[Response]:
+    """
+    Send many requests concurrently and return their responses in the same order as the requests.
+    At most `concurrency` requests are in flight at any time, and new requests are started no faster
+    than `rate` per second (with bursts of up to `burst` requests) so the CDC Wonder servers are not
+    overwhelmed. All requests share a single pooled HTTP session, and each gets the connect and read timeouts
+    of Request.send_async; time spent waiting for a free connection does not count towards them.
+
+    Example:
+        responses = asyncio.run(gather_requests([request1, request2], concurrency=2))
+
+    :param requests:            the Requests to send
+    :param concurrency:         maximum number of requests in flight at once
+    :param rate:                maximum number of requests started per second, or None for no rate limit
+    :param burst:               number of requests that may be started back to back before the rate applies
+    :param cache:               optional ResponseCache used by every request (see Request.send)
+    :param url:                 endpoint to send the requests to, defaults to the URL of the default WonderClient
+    :returns:                   list of Responses, one per request, in input order
+    :raises ValueError:         if concurrency is not positive
+    :raises RequestException:   if any request fails (see Request.send_async)
+    """
+    import aiohttp
+
+    if concurrency < 1:
+        raise ValueError("Concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    bucket = TokenBucket(rate, burst) if rate is not None else None
+
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=concurrency)) as session:
+        async def send(request):
+            async with semaphore:
+                if bucket is not None:
+                    await bucket.acquire()
+                return await request.send_async(session=session, cache=cache, url=url)
+
+        return await asyncio.gather(*(send(request) for request in requests))
+
+
+def parse_responses(responses : typing.Iterable[Response], executor : concurrent.futures.Executor = None,
+                    max_workers : typing.Optional[int] = None) -> typing.List[pd.DataFrame]:
+    """
+    Parse many responses in parallel, one worker process per response at a time, and return their DataFrames
+    (see Response.as_dataframe) in input order. Each DataFrame is also memoized in its Response.
+
+    Workers receive the raw XML bytes and parse them into the typed NumPy columns as_dataframe is built from.
+    The columns come back through a block of shared memory per response rather than as a pickled DataFrame,
+    so only the (small) lists of grouping labels are pickled. Responses that were already parsed, or streamed
+    (see Request.send), are not sent.
+
+    Example:
+        dataframes = parse_responses([request.send() for request in requests])
+
+    :param responses:   the Responses to parse
+    :param executor:    executor to run the parsing on, for example a ProcessPoolExecutor shared between calls.
+                        By default a ProcessPoolExecutor is created for the call and shut down afterwards.
+    :param max_workers: number of worker processes of the default executor, by default the number of CPUs
+    :returns:           list of DataFrames, one per response, in input order
+    """
+    responses = list(responses)
+    pending = [response for response in responses if response._dataframe is None and response._table is None]
+    if pending:
+        if executor is None:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+                _parse_in(pool, pending)
+        else:
+            _parse_in(executor, pending)
+    return [response.as_dataframe() for response in responses]
+
+
+def _parse_in(executor : concurrent.futures.Executor, responses : typing.List[Response]):
+    """
+    Private helper parsing responses on an executor and memoizing the resulting DataFrames in them.
+    """
+    futures = [executor.submit(_parse_to_shared_memory, response._xml_bytes(), len(response._groupings))
+               for response in responses]
+
+    # Every block of shared memory is released, even if another response failed to parse.
+    error = None
+    for response, future in zip(responses, futures):
+        try:
+            table = _table_from_shared_memory(*future.result())
+        except Exception as e:
+            error = error or e
+            continue
+        with response._lock:
+            if response._dataframe is None:
+                response._dataframe = table.to_dataframe(response._groupings)
+    if error is not None:
+        raise error
+
+
+def _parse_to_shared_memory(xml : bytes, num_groupings : int) -> tuple:
+    """
+    Private helper run by the workers of parse_responses: parses response XML and copies the resulting
+    columns into a new block of shared memory, which the calling process is responsible for releasing.
+    Returns the name of the block (None if it would be empty), the name, dtype, shape and offset of every
+    column in it, and the grouping labels and missing value reasons.
+    """
+    table = _ColumnarTable(num_groupings, capacity=xml.count(b"<r>"))
+    for record in Response._parse_records(xml):
+        table.append(record)
+    arrays = table.arrays()
+
+    layout = []
+    size = 0
+    for name, array in arrays.items():
+        size = -(-size // 8) * 8
+        layout.append((name, array.dtype.str, array.shape, size))
+        size += array.nbytes
+
+    name = None
+    if size > 0:
+        block = shared_memory.SharedMemory(create=True, size=size)
+        # The calling process unlinks the block, so this process must not clean it up on exit.
+        resource_tracker.unregister(block._name, "shared_memory")
+        for column, dtype, shape, offset in layout:
+            np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset)[...] = arrays[column]
+        name = block.name
+        block.close()
+    return name, layout, table.categories(), table.reasons()
+
+
+def _table_from_shared_memory(name : typing.Optional[str], layout : list, categories : typing.List[typing.List[str]],
+                              reasons : typing.List[str]) -> _ColumnarTable:
+    """
+    Private helper copying the columns written by _parse_to_shared_memory out of shared memory and releasing it.
+    """
+    if name is None:
+        return _ColumnarTable.from_arrays({column: np.empty(shape, dtype=dtype) for column, dtype, shape, _ in layout}, categories, reasons)
+
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        arrays = {column: np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset).copy()
+                  for column, dtype, shape, offset in layout}
+    finally:
+        block.close()
+        block.unlink()
+    return _ColumnarTable.from_arrays(arrays, categories, reasons)
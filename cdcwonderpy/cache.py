@@ -0,0 +1,397 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import typing
+import zlib
+from xml.sax.saxutils import escape
+
+from cdcwonderpy.enums import *
+from cdcwonderpy.response import Response
+
+
+class ResponseCache():
+    """
+    * Persistent, content-addressed cache of CDC Wonder responses, stored as compressed XML in a local
+    * SQLite database. Pass an instance to Request.send to reuse responses of identical requests.
+    *
+    * Entries are keyed by a hash of the request's canonical XML (parameters and their values sorted), so
+    * requests that differ only in the order filters were specified share an entry.
+    *
+    * - ttl:        entries older than this many seconds are treated as missing (None keeps them forever)
+    * - max_size:   once the compressed responses exceed this many bytes, the least recently used
+    *               entries are evicted
+    * - offline:    when True, Request.send raises instead of contacting the server on a cache miss
+    * - coalesce:   when True, a request without an entry of its own is answered from a cached response to a
+    *               broader request, if one is grouped by the dimensions the new request filters on and all
+    *               other parameters match (see _QueryCoalescing). E.g. a response grouped by Year and Gender
+    *               answers Request().gender(Gender.MALE) by keeping its Male rows, and a response grouped
+    *               by Year and Race answers a request for two races by summing Deaths and Population over
+    *               them and recomputing the crude rate. Such answers are derived on every lookup, not stored.
+    *
+    * Instances can be shared between threads.
+    """
+    DEFAULT_MAX_SIZE = 512 * 2**20
+    DATABASE_NAME = "responses.sqlite"
+
+    def __init__(self, path : str, ttl : typing.Optional[float] = None, max_size : int = DEFAULT_MAX_SIZE, offline : bool = False,
+                 coalesce : bool = False):
+        """
+        Open (or create) a response cache.
+        :param path:        directory in which the cache database is stored; created if it does not exist
+        :param ttl:         maximum age of a usable entry in seconds, or None for no expiry
+        :param max_size:    maximum total size of the compressed responses in bytes
+        :param offline:     whether Request.send may go to the network on a cache miss
+        :param coalesce:    whether requests may be answered from cached responses to broader requests
+        :raises ValueError: if ttl or max_size are not positive
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be a positive number of seconds or None")
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive number of bytes")
+
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.max_size = max_size
+        self.offline = offline
+        self.coalesce = coalesce
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.path.join(path, ResponseCache.DATABASE_NAME), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, size INTEGER NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL, shape TEXT, request BLOB)")
+
+            # Databases created before coalescing was supported lack the columns it needs.
+            columns = {row[1] for row in self._connection.execute("PRAGMA table_info(responses)")}
+            for column, column_type in [("shape", "TEXT"), ("request", "BLOB")]:
+                if column not in columns:
+                    self._connection.execute(f"ALTER TABLE responses ADD COLUMN {column} {column_type}")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS responses_shape ON responses (shape)")
+
+    @staticmethod
+    def key(request : 'Request') -> str:
+        """
+        Compute the cache key of a request.
+        :param request: the Request to compute the key of
+        :returns:       hex digest of the request's canonical XML
+        """
+        return hashlib.sha256(request._canonical_xml().encode("utf-8")).hexdigest()
+
+    def get(self, request : 'Request') -> typing.Optional[str]:
+        """
+        Look up the response XML stored for a request, counting the lookup as a hit or miss.
+        If coalescing is enabled and there is no entry for the request itself, the response is
+        derived from a cached response to a broader request when possible.
+        :param request: the Request to look up
+        :returns:       the cached (or derived) response XML, or None if it is missing or expired
+        """
+        key = ResponseCache.key(request)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute("SELECT body, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                with self._connection:
+                    self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                row = None
+
+            if row is not None:
+                with self._connection:
+                    self._connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                self.hits += 1
+                return zlib.decompress(row[0]).decode("utf-8")
+
+            candidates = self._candidates(request, now) if self.coalesce else []
+
+        xml = self._coalesce(request, candidates, now)
+        with self._lock:
+            if xml is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.coalesced += 1
+        return xml
+
+    def put(self, request : 'Request', xml : str):
+        """
+        Store the response XML for a request, evicting least recently used entries if the cache
+        grows beyond max_size.
+        :param request: the Request the response belongs to
+        :param xml:     the response XML returned by the server
+        """
+        key = ResponseCache.key(request)
+        body = zlib.compress(xml.encode("utf-8"))
+        request_body = zlib.compress(request.to_xml().encode("utf-8"))
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, body, size, created, accessed, shape, request) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, body, len(body), now, now, _QueryCoalescing.shape(request), request_body))
+            self._evict()
+
+    def clear(self):
+        """
+        Remove every entry from the cache and reset the hit, miss and coalesced counters.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+            self.hits = 0
+            self.misses = 0
+            self.coalesced = 0
+
+    def size(self) -> int:
+        """
+        Total size of the stored (compressed) responses.
+        :returns:   size in bytes
+        """
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def close(self):
+        """
+        Close the underlying database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def __repr__(self):
+        return f"ResponseCache(path={self.path!r}, entries={len(self)}, hits={self.hits}, misses={self.misses})"
+
+    ##################################
+    # Private internal helper methods
+    ##################################
+    def _candidates(self, request : 'Request', now : float) -> typing.List[typing.Tuple[str, bytes]]:
+        """
+        Private helper returning the keys and compressed request XML of the unexpired entries that share the
+        request's shape, most recently used first. Must be called with the lock held.
+        """
+        created = -float("inf") if self.ttl is None else now - self.ttl
+        return self._connection.execute(
+            "SELECT key, request FROM responses WHERE shape = ? AND created >= ? ORDER BY accessed DESC",
+            (_QueryCoalescing.shape(request), created)).fetchall()
+
+    def _coalesce(self, request : 'Request', candidates : typing.List[typing.Tuple[str, bytes]], now : float) -> typing.Optional[str]:
+        """
+        Private helper deriving the response to a request from the first candidate entry able to answer it.
+        """
+        from cdcwonderpy.request import Request
+
+        for key, request_body in candidates:
+            coalescing = _QueryCoalescing.of(request, Request.from_xml(zlib.decompress(request_body).decode("utf-8")))
+            if coalescing is None:
+                continue
+
+            with self._lock:
+                row = self._connection.execute("SELECT body FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                continue
+            xml = coalescing.answer(zlib.decompress(row[0]).decode("utf-8"))
+            if xml is not None:
+                with self._lock, self._connection:
+                    self._connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+                return xml
+        return None
+
+    def _evict(self):
+        """
+        Private helper deleting least recently used entries until the cache fits in max_size.
+        Must be called with the lock held, inside a transaction.
+        """
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        for key, size in self._connection.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall():
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_size:
+                break
+
+
+class _QueryCoalescing():
+    """
+    Private helper answering a request from the response to a broader cached request.
+
+    Both requests must have the same shape: all parameters are equal except their groupings and the filters
+    on the dimensions listed in FILTERS (whose values the server reports as row labels). The cached request
+    must be grouped by every grouping of the new request and, for every such filter that differs, by the
+    filtered dimension, filtering on a superset of the values. The answer then keeps the rows whose labels
+    match the new filters and adds up the rows that differ only in groupings the new request does not have.
+
+    Rows are only added up over demographic groupings and years, which partition the population. The new
+    request is not answered (and goes to the server) if a row it needs is missing, or if a row would be
+    the sum of a suppressed count or of known and unknown ("Not Applicable") populations.
+    """
+    # Filter parameter -> (grouping reporting its values, enum of its values or None for years)
+    FILTERS = {
+        "V_D76.V7": (Grouping.GENDER, Gender),
+        "V_D76.V8": (Grouping.RACE, Race),
+        "V_D76.V17": (Grouping.HISPANIC_ORIGIN, HispanicOrigin),
+        "V_D76.V24": (Grouping.WEEKDAY, Weekday),
+        "V_D76.V20": (Grouping.AUTOPSY, Autopsy),
+        "F_D76.V1": (Grouping.YEAR, None),
+    }
+
+    SUMMABLE_GROUPINGS = [Grouping.GENDER, Grouping.RACE, Grouping.HISPANIC_ORIGIN, Grouping.YEAR]
+
+    UNRELIABLE_DEATHS = 20
+    ALL = "*All*"
+
+    def __init__(self, groupings : typing.List[Grouping], cached_groupings : typing.List[Grouping],
+                 restrictions : typing.List[typing.Optional[frozenset]], rate_per : float, precision : int):
+        self._positions = [cached_groupings.index(grouping) for grouping in groupings]
+        self._summed = [i for i, grouping in enumerate(cached_groupings) if grouping not in groupings]
+        self._restrictions = restrictions
+        self._rate_per = rate_per
+        self._precision = precision
+
+    @staticmethod
+    def shape(request : 'Request') -> str:
+        """
+        Hash of the request's parameters, leaving out its groupings and the filters that can be coalesced.
+        """
+        parameters = _QueryCoalescing._parameters(request)
+        for name in list(parameters):
+            if name.startswith("B_") or (name in _QueryCoalescing.FILTERS and _QueryCoalescing._labels(name, parameters[name]) is not None):
+                del parameters[name]
+        return hashlib.sha256(repr(sorted(parameters.items())).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def of(request : 'Request', cached : 'Request') -> typing.Optional['_QueryCoalescing']:
+        """
+        Plan answering a request from the response to a cached request of the same shape.
+        :returns:   the plan, or None if the cached response cannot answer the request
+        """
+        groupings = _QueryCoalescing._groupings(request)
+        cached_groupings = _QueryCoalescing._groupings(cached)
+        if not set(groupings) <= set(cached_groupings):
+            return None
+        if any(grouping not in _QueryCoalescing.SUMMABLE_GROUPINGS for grouping in cached_groupings if grouping not in groupings):
+            return None
+
+        parameters = _QueryCoalescing._parameters(request)
+        cached_parameters = _QueryCoalescing._parameters(cached)
+        restrictions = [None] * len(cached_groupings)
+        for name, (grouping, _) in _QueryCoalescing.FILTERS.items():
+            wanted = _QueryCoalescing._labels(name, parameters[name])
+            available = _QueryCoalescing._labels(name, cached_parameters[name])
+            if wanted == available:
+                continue
+            if wanted is None or available is None or wanted == _QueryCoalescing.ALL or grouping not in cached_groupings:
+                return None
+            if available != _QueryCoalescing.ALL and not wanted <= available:
+                return None
+            restrictions[cached_groupings.index(grouping)] = wanted
+
+        return _QueryCoalescing(groupings, cached_groupings, restrictions,
+                                float(request._o_parameters["O_rate_per"]), int(request._o_parameters["O_precision"]))
+
+    def answer(self, xml : str) -> typing.Optional[str]:
+        """
+        Derive the response XML of the request from the cached response XML.
+        :returns:   the derived response XML, or None if the cached response does not hold the needed rows
+        """
+        n = len(self._restrictions)
+        order = [dict() for _ in range(n)]
+        cells = dict()
+        for record in Response(xml, []).iter_rows():
+            if len(record) != n + 3:
+                return None
+            labels = record[:n]
+            for i, label in enumerate(labels):
+                order[i].setdefault(label, len(order[i]))
+            if any(restriction is not None and label not in restriction for label, restriction in zip(labels, self._restrictions)):
+                continue
+            cells.setdefault(tuple(labels[i] for i in self._positions), []).append(record[n:])
+
+        # Every wanted value must be reported, and every row must add up all combinations of the summed groupings.
+        if not cells or any(restriction is not None and not restriction <= order[i].keys() for i, restriction in enumerate(self._restrictions)):
+            return None
+        expected = 1
+        for i in self._summed:
+            expected *= len(order[i]) if self._restrictions[i] is None else len(self._restrictions[i])
+
+        rows = []
+        for key in sorted(cells, key=lambda key: [order[i][label] for i, label in zip(self._positions, key)]):
+            if len(cells[key]) != expected:
+                return None
+            measures = self._combine(cells[key])
+            if measures is None:
+                return None
+            labels = "".join(f'<c l="{escape(label, {chr(34): "&quot;"})}"/>' for label in key)
+            rows.append("<r>" + labels + "".join(f'<c v="{escape(value)}"/>' for value in measures) + "</r>")
+        return "<page>\n<data-table>\n" + "\n".join(rows) + "\n</data-table>\n</page>"
+
+    ##################################
+    # Private internal helper methods
+    ##################################
+    @staticmethod
+    def _parameters(request : 'Request') -> dict:
+        parameters = dict()
+        for parameter_dict in request._parameter_dicts():
+            for name, value in parameter_dict.items():
+                parameters[name] = tuple(sorted(value)) if isinstance(value, (list, tuple)) else value
+        return parameters
+
+    @staticmethod
+    def _groupings(request : 'Request') -> typing.List[Grouping]:
+        return [Grouping(value) for value in request._b_parameters.values() if value != "*None*"]
+
+    @staticmethod
+    def _labels(name : str, value) -> typing.Union[frozenset, str, None]:
+        """
+        Private helper returning the row labels of a filter's values, ALL if it does not filter, or None if its
+        values cannot be told apart by row labels (dates that are not whole years).
+        """
+        values = (value,) if isinstance(value, str) else value
+        if "*All*" in values:
+            return _QueryCoalescing.ALL
+        enum = _QueryCoalescing.FILTERS[name][1]
+        if enum is None:
+            return None if any("/" in date for date in values) else frozenset(values)
+        return frozenset(ENUM_LABELS[enum(v)] for v in values)
+
+    def _combine(self, measures : typing.List[typing.List]) -> typing.Optional[typing.List[str]]:
+        """
+        Private helper adding up the Deaths and Population of rows and recomputing their crude rate, formatted
+        the way the server reports them. A single row is kept as is.
+        """
+        if len(measures) == 1:
+            return [self._format(value, i == 2) for i, value in enumerate(measures[0])]
+
+        deaths = [row[0] for row in measures]
+        populations = [row[1] for row in measures]
+        if not all(isinstance(value, float) for value in deaths):
+            return None
+        total_deaths = sum(deaths)
+
+        if all(isinstance(value, float) for value in populations) and sum(populations) > 0:
+            total_population = sum(populations)
+            if total_deaths < _QueryCoalescing.UNRELIABLE_DEATHS:
+                rate = "Unreliable"
+            else:
+                rate = total_deaths / total_population * self._rate_per
+        elif all(value == "Not Applicable" for value in populations):
+            total_population = rate = "Not Applicable"
+        else:
+            return None
+        return [self._format(total_deaths, False), self._format(total_population, False), self._format(rate, True)]
+
+    def _format(self, value, is_rate : bool) -> str:
+        if isinstance(value, str):
+            return value
+        if is_rate:
+            return f"{value:.{self._precision}f}"
+        return f"{int(value):,}"
@@ -0,0 +1,143 @@
+import os
+import random
+import threading
+import time
+import typing
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class WonderClient():
+    """
+    * HTTP client used by Request.send to talk to the CDC Wonder endpoint.
+    * It owns a pooled requests.Session, so consecutive requests reuse kept-alive TCP/TLS connections
+    * instead of opening a new one every time, and negotiates gzip/deflate compressed responses.
+    *
+    * Requests answered with 429 (Too Many Requests) or a 5xx status, and requests that fail to connect,
+    * are retried with exponential backoff and full jitter. A Retry-After header sent by the server is honored.
+    *
+    * The read timeout follows the request's O_timeout parameter (the time the server may spend on the
+    * query) plus read_timeout_margin seconds.
+    *
+    * A single default client is shared by every Request in the process (see WonderClient.default).
+    * Clients can be shared between threads.
+    *
+    * The endpoint defaults to the CDC Wonder D76 endpoint, or to the URL in the CDC_WONDER_URL environment
+    * variable if it is set, e.g. to point a whole pipeline at a local MockD76Server.
+    """
+    DEFAULT_URL = "https://wonder.cdc.gov/controller/datarequest/D76"
+    URL_ENVIRONMENT_VARIABLE = "CDC_WONDER_URL"
+    RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, url : str = None, pool_size : int = 10,
+                 connect_timeout : float = 10, read_timeout_margin : float = 30, retries : int = 3,
+                 backoff : float = 1.0, max_backoff : float = 60):
+        """
+        Create a client with its own connection pool.
+        :param url:                 the D76 endpoint requests are posted to, by default WonderClient.default_url()
+        :param pool_size:           maximum number of connections kept alive
+        :param connect_timeout:     seconds to wait for a connection to be established
+        :param read_timeout_margin: seconds added to a request's O_timeout to get the read timeout
+        :param retries:             number of times a failed request is retried
+        :param backoff:             base delay in seconds, doubled after every failed attempt
+        :param max_backoff:         upper bound of a single delay in seconds
+        :raises ValueError:         if pool_size is not positive or retries is negative
+        """
+        if pool_size < 1:
+            raise ValueError("Pool size must be at least 1")
+        if retries < 0:
+            raise ValueError("Retries must not be negative")
+
+        self.url = url if url is not None else WonderClient.default_url()
+        self.connect_timeout = connect_timeout
+        self.read_timeout_margin = read_timeout_margin
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self._session = requests.Session()
+        self._session.headers.update({"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    @classmethod
+    def default(cls) -> 'WonderClient':
+        """
+        Return the client shared by all requests that are sent without an explicit client, creating it on first use.
+        :returns:   the process-wide default WonderClient
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = WonderClient()
+        return cls._default
+
+    @classmethod
+    def set_default(cls, client : typing.Optional['WonderClient']):
+        """
+        Replace the client shared by all requests that are sent without an explicit client.
+        :param client:  the new default client, or None to create a fresh one on next use
+        """
+        with cls._default_lock:
+            cls._default = client
+
+    @staticmethod
+    def default_url() -> str:
+        """
+        Return the endpoint clients post to when no URL is given.
+        :returns:   the value of the CDC_WONDER_URL environment variable if set, else DEFAULT_URL
+        """
+        return os.environ.get(WonderClient.URL_ENVIRONMENT_VARIABLE) or WonderClient.DEFAULT_URL
+
+    def post(self, request_xml : str, timeout : float = 600, stream : bool = False) -> requests.Response:
+        """
+        Post a request XML document to the endpoint, retrying transient failures.
+        :param request_xml:         the request XML to send
+        :param timeout:             the time in seconds the server may spend on the query (the O_timeout parameter)
+        :param stream:              if True, return as soon as the response headers arrived and leave the body to be
+                                    read (e.g. with iter_content); the caller must then close the response
+        :returns:                   the final HTTP response, which may still carry an error status once retries are exhausted
+        :raises RequestException:   if the server cannot be reached after all retries, or the read times out
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                response = self._session.post(self.url, data={"request_xml": request_xml}, stream=stream,
+                                              timeout=(self.connect_timeout, timeout + self.read_timeout_margin))
+            except requests.ConnectionError:
+                if attempt == self.retries:
+                    raise
+                time.sleep(self._delay(attempt, None))
+                continue
+
+            if response.status_code not in WonderClient.RETRY_STATUS_CODES or attempt == self.retries:
+                return response
+            response.close()
+            time.sleep(self._delay(attempt, response.headers.get("Retry-After")))
+
+    def close(self):
+        """
+        Close all pooled connections.
+        """
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    ##################################
+    # Private internal helper methods
+    ##################################
+    def _delay(self, attempt : int, retry_after : typing.Optional[str]) -> float:
+        """
+        Private helper computing how long to wait before the next attempt.
+        """
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
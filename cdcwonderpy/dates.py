@@ -1,3 +1,5 @@
+import bisect
+import functools
 import typing
 
 class Dates:
@@ -5,9 +7,14 @@ class Dates:
     * Represents an immutable set of dates to filter on in a Request. The dates can be specified to the month.
     * To create a new Dates object, use the static methods Dates.single and Dates.range.
     * The Dates object should not be created via the constructor (doing so will given an empty set of dates).
+    * Internally, the months are stored as sorted, disjoint and non-adjacent inclusive intervals of month indices
+    * (see YearAndMonth._index), so ranges of any length take constant space and set operations take time
+    * proportional to the number of intervals.
     """
+    __slots__ = ("_intervals",)
+
     def __init__(self):
-        self._date_set = set()
+        self._intervals = ()
 
     @staticmethod
     def single(timePeriod : typing.Union['Year', 'YearAndMonth']) -> 'Dates':
@@ -18,19 +25,11 @@ class Dates:
         :raises TypeError:      TypeError if timePeriod is not a Year or a YearAndMonth
         :returns:               a new Date object containing the timePeriod
         """
-        result = Dates()
-        if isinstance(timePeriod, Year):
-            for i in range(1, YearAndMonth.NUM_MONTHS + 1):
-                result._date_set.add(YearAndMonth(i, timePeriod.get_year()))
-
-        elif isinstance(timePeriod, YearAndMonth):
-            result._date_set.add(timePeriod)
-
+        if isinstance(timePeriod, (Year, YearAndMonth)):
+            return Dates._from_intervals([timePeriod._month_indices()])
         else:
             raise TypeError("Time period must be either a YearAndMonth or a Year")
 
-        return result
-
     @staticmethod
     def range(beginPeriod : typing.Union['Year', 'YearAndMonth'], endPeriod : typing.Union['Year', 'YearAndMonth']) -> 'Dates':
         """
@@ -53,55 +52,132 @@ class Dates:
         if beginPeriod.is_after(endPeriod):
             raise ValueError("Begin period must be before or equal to end period; Begin: "+str(beginPeriod)+" End: "+str(endPeriod))
 
-        result = Dates()
-        if(isinstance(beginPeriod, Year)):
-            for year in range(beginPeriod.get_year(), endPeriod.get_year()+1):
-                for month in range(1, YearAndMonth.NUM_MONTHS + 1):
-                    result._date_set.add(YearAndMonth(year, month))
-        else:
-            curr_year = beginPeriod.get_year()
-            curr_month = beginPeriod.get_month()
-            end_year = endPeriod.get_year()
-            end_month = endPeriod.get_month()
-            while(not (curr_month == end_month and curr_year == end_year)):
-                result._date_set.add(YearAndMonth(curr_year, curr_month))
-                curr_month+=1
-                if(curr_month > YearAndMonth.NUM_MONTHS):
-                    curr_month = 1
-                    curr_year+=1
-            result._date_set.add(YearAndMonth(end_year, end_month))
-        return result
+        return Dates._from_intervals([(beginPeriod._month_indices()[0], endPeriod._month_indices()[1])])
 
-    def get_months(self) -> 'YearAndMonth':
+    def get_months(self) -> typing.List['YearAndMonth']:
         """
         Get the list of months contained in this Dates object
-        :returns:       a list of YearAndMonths contained in this Dates object
+        :returns:       a sorted list of YearAndMonths contained in this Dates object
         """
-        return list(self._date_set)
+        return [YearAndMonth._from_index(i) for (low, high) in self._intervals for i in range(low, high + 1)]
 
     def union(self, other : 'Dates') -> 'Dates':
         """
-        Get the list of months contained in this Dates object
+        Get the union of this Dates object and another Dates object
         :param other:       the other Dates object to get the union of
         :raises TypeError:  if the other object is not a Dates object 
-        :returns:           a list of YearAndMonths contained in this Dates object
+        :returns:           a new Dates object containing the months of both Dates objects
         """
         if not isinstance(other, Dates):
             raise TypeError("Other object must be a Dates object")
 
-        result = Dates()
-        result._date_set = self._date_set.union(other._date_set)
-        return result
+        return Dates._from_intervals(sorted(self._intervals + other._intervals))
+
+    def intersection(self, other : 'Dates') -> 'Dates':
+        """
+        Get the intersection of this Dates object and another Dates object
+        :param other:       the other Dates object to get the intersection of
+        :raises TypeError:  if the other object is not a Dates object
+        :returns:           a new Dates object containing the months contained in both Dates objects
+        """
+        if not isinstance(other, Dates):
+            raise TypeError("Other object must be a Dates object")
+
+        intervals = []
+        i = j = 0
+        while i < len(self._intervals) and j < len(other._intervals):
+            (low, high) = self._intervals[i]
+            (otherLow, otherHigh) = other._intervals[j]
+            if max(low, otherLow) <= min(high, otherHigh):
+                intervals.append((max(low, otherLow), min(high, otherHigh)))
+            if high < otherHigh:
+                i += 1
+            else:
+                j += 1
+        return Dates._from_intervals(intervals)
+
+    def __contains__(self, timePeriod : typing.Union['Year', 'YearAndMonth']) -> bool:
+        """
+        Return whether a YearAndMonth, or every month of a Year, is contained in this Dates object
+        :param timePeriod:  the Year or YearAndMonth to look for
+        :returns:           true if all months of the time period are contained in this Dates object, false otherwise
+        """
+        if not isinstance(timePeriod, (Year, YearAndMonth)):
+            return False
+        (low, high) = timePeriod._month_indices()
+        i = bisect.bisect_right(self._intervals, (low, float("inf"))) - 1
+        return i >= 0 and self._intervals[i][1] >= high
+
+    def __len__(self) -> int:
+        return sum(high - low + 1 for (low, high) in self._intervals)
+
+    def __eq__(self, other):
+        if isinstance(other, Dates):
+            return self._intervals == other._intervals
+        return False
+
+    def __hash__(self):
+        return hash(self._intervals)
 
     def __repr__(self):
         return str(self.get_months())
 
+    ##################################
+    # Private internal helper methods
+    ##################################
+    @staticmethod
+    def _from_intervals(intervals : typing.List[typing.Tuple[int, int]]) -> 'Dates':
+        """
+        Private helper creating a Dates object from inclusive month index intervals sorted by their start,
+        merging intervals that overlap or are adjacent.
+        """
+        merged = []
+        for (low, high) in intervals:
+            if merged and low <= merged[-1][1] + 1:
+                if high > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], high)
+            else:
+                merged.append((low, high))
+
+        result = Dates()
+        result._intervals = tuple(merged)
+        return result
+
+    def _bounds(self) -> typing.Optional[typing.Tuple['YearAndMonth', 'YearAndMonth']]:
+        """
+        Private helper returning the first and last month of this Dates object, or None if it is empty.
+        """
+        if not self._intervals:
+            return None
+        return (YearAndMonth._from_index(self._intervals[0][0]), YearAndMonth._from_index(self._intervals[-1][1]))
 
+    def _as_periods(self) -> typing.List[typing.Union['Year', 'YearAndMonth']]:
+        """
+        Private helper returning the shortest sorted list of Years and YearAndMonths that covers exactly the
+        months of this Dates object: whole years become a Year, the remaining months stay YearAndMonths.
+        """
+        periods = []
+        for (low, high) in self._intervals:
+            i = low
+            while i <= high:
+                if i % YearAndMonth.NUM_MONTHS == 0 and i + YearAndMonth.NUM_MONTHS - 1 <= high:
+                    periods.append(Year(i // YearAndMonth.NUM_MONTHS))
+                    i += YearAndMonth.NUM_MONTHS
+                else:
+                    periods.append(YearAndMonth._from_index(i))
+                    i += 1
+        return periods
+
+
+@functools.total_ordering
 class Year:
     """
     * Represents a particular Gregorian calendar year such as 1998.
     * Used in creating a Dates object as a parameter to Dates.single or Dates.range
+    * Years are ordered chronologically and hashable, so they can be sorted and used as dict keys.
     """
+    __slots__ = ("_year",)
+
     def __init__(self, year : int):
         """
         Create a Year object representing the given calendar year.
@@ -155,16 +231,33 @@ class Year:
             return self._year == other._year
         return False
 
+    def __lt__(self, other):
+        if not isinstance(other, Year):
+            raise TypeError("Can only compare with other Year objects")
+
+        return self._year < other._year
+
     def __hash__(self):
         return hash(self._year)
 
+    def _month_indices(self) -> typing.Tuple[int, int]:
+        """
+        Private helper returning the month indices (see YearAndMonth._index) of the first and last month of this year.
+        """
+        first = self._year * YearAndMonth.NUM_MONTHS
+        return (first, first + YearAndMonth.NUM_MONTHS - 1)
+
+@functools.total_ordering
 class YearAndMonth:
     """
     * Represents a particular Gregorian calendar year and month such as July, 1998.
     * Used in creating a Dates object as a parameter to Dates.single or Dates.range.
     * Months are specified as numbers between 1 and 12, starting with January.
+    * YearAndMonths are ordered chronologically and hashable, so they can be sorted and used as dict keys.
     """
     NUM_MONTHS = 12
+    __slots__ = ("_year", "_month")
+
     def __init__(self, year : int, month : int):
         """
         Create a Year object representing the given calendar year and month.
@@ -253,4 +346,25 @@ class YearAndMonth:
         return self.is_before(other)
 
     def __hash__(self):
-        return hash((self._month, self._year))
+        return hash(self._index())
+
+    def _index(self) -> int:
+        """
+        Private helper returning the number of months between January of year 0 and this month,
+        which orders months chronologically.
+        """
+        return self._year * YearAndMonth.NUM_MONTHS + self._month - 1
+
+    def _month_indices(self) -> typing.Tuple[int, int]:
+        """
+        Private helper returning the month index of this month as a (first, last) pair, like Year._month_indices.
+        """
+        return (self._index(), self._index())
+
+    @staticmethod
+    def _from_index(index : int) -> 'YearAndMonth':
+        """
+        Private helper creating the YearAndMonth with the given month index.
+        """
+        (year, month) = divmod(index, YearAndMonth.NUM_MONTHS)
+        return YearAndMonth(year, month + 1)
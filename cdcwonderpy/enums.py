@@ -87,3 +87,30 @@ class Autopsy(Enum):
     NO = "N"
     YES = "Y"
     UNKNOWN = "U"
+
+#########################################
+#### Row Labels
+#########################################
+# Row labels the server reports for enum values.
+ENUM_LABELS = {
+    Gender.FEMALE: "Female",
+    Gender.MALE: "Male",
+    Race.AMERICAN_INDIAN_OR_ALASKAN_NATIVE: "American Indian or Alaska Native",
+    Race.ASIAN_OR_PACIFIC_ISLANDER: "Asian or Pacific Islander",
+    Race.BLACK_OR_AFRICAN_AMERICAN: "Black or African American",
+    Race.WHITE: "White",
+    HispanicOrigin.HISPANIC_OR_LATINO: "Hispanic or Latino",
+    HispanicOrigin.NOT_HISPANIC_OR_LATINO: "Not Hispanic or Latino",
+    HispanicOrigin.NOT_STATED: "Not Stated",
+    Weekday.SUN: "Sunday",
+    Weekday.MON: "Monday",
+    Weekday.TUE: "Tuesday",
+    Weekday.WED: "Wednesday",
+    Weekday.THU: "Thursday",
+    Weekday.FRI: "Friday",
+    Weekday.SAT: "Saturday",
+    Weekday.UNKNOWN: "Unknown",
+    Autopsy.NO: "No",
+    Autopsy.YES: "Yes",
+    Autopsy.UNKNOWN: "Unknown",
+}
@@ -1,12 +1,115 @@
-from enum import Enum
-import pickle
 import re
-from rapidfuzz import fuzz
+import numpy as np
 import typing
-import os
 
+# Number of descriptions scored at once by the batch fuzzy matching methods.
+_FUZZY_BLOCK_SIZE = 512
 
-class ICD10Code(Enum):
+# Member names are the code values with "-", "." and "*" replaced by "_" (except for ALL).
+_NAME_TRANSLATION = str.maketrans("-.*", "___")
+
+def _preorder_key(value : str) -> tuple:
+    """
+    Private helper sorting code values in hierarchical pre-order: ranges by their first code, wider ranges
+    (chapters) before the subchapters they contain, then single codes, each followed by its subcodes.
+    """
+    if "-" in value:
+        (begin, end) = value.split("-")
+        return (begin, 0, tuple(-ord(c) for c in end))
+    return (value[:3], 1, value)
+
+class _ICD10CodeRegistry(type):
+    """
+    * Metaclass giving ICD10Code the class level behaviour of an Enum: members can be accessed by name
+    * (ICD10Code.A00 or ICD10Code["A00"]) and looked up by value (ICD10Code("A00")), and the class supports
+    * iteration in declaration order, len and membership tests.
+    * Unlike an Enum, members are not built when the module is imported. The code values are read from the
+    * label store (see LabelStore) on first use, and each member is created the first time it is accessed and
+    * reused afterwards.
+    """
+    def __getattr__(cls, name : str) -> 'ICD10Code':
+        # Only called for names not found on the class, e.g. members that have not been accessed yet.
+        if name.startswith("_"):
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        index = cls._registry()["names"].get(name)
+        if index is None:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+        return cls._member(index)
+
+    def __getitem__(cls, name : str) -> 'ICD10Code':
+        try:
+            return cls._member(cls._registry()["names"][name])
+        except KeyError:
+            raise KeyError(name) from None
+
+    def __call__(cls, value : typing.Union[str, 'ICD10Code']) -> 'ICD10Code':
+        if isinstance(value, cls):
+            return value
+        try:
+            return cls._member(cls._registry()["values"][value])
+        except (KeyError, TypeError):
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+    def __iter__(cls) -> typing.Iterator['ICD10Code']:
+        return map(cls._member, range(len(cls)))
+
+    def __reversed__(cls) -> typing.Iterator['ICD10Code']:
+        return map(cls._member, reversed(range(len(cls))))
+
+    def __len__(cls) -> int:
+        return len(cls._registry()["codes"])
+
+    def __contains__(cls, member) -> bool:
+        return isinstance(member, cls)
+
+    def __dir__(cls) -> typing.List[str]:
+        return sorted(set(type.__dir__(cls)) | cls._registry()["names"].keys())
+
+    @property
+    def __members__(cls) -> typing.Mapping[str, 'ICD10Code']:
+        return {name: cls._member(index) for name, index in cls._registry()["names"].items()}
+
+    ##################################
+    # Private internal helper methods
+    ##################################
+    def _registry(cls) -> dict:
+        """
+        Private helper returning the code values and the name and value lookup tables, built on first use.
+        """
+        try:
+            return cls._codes
+        except AttributeError:
+            # Looking codeToLabels up as an attribute would come back here through __getattr__.
+            if "codeToLabels" not in vars(cls):
+                cls._open_description_map()
+            codes = ["*All*"] + sorted((value for value in cls.codeToLabels if value != "*All*"), key=_preorder_key)
+            names = {("ALL" if value == "*All*" else value.translate(_NAME_TRANSLATION)): i for i, value in enumerate(codes)}
+            cls._codes = {
+                "codes": codes,
+                "names": names,
+                "values": {value: i for i, value in enumerate(codes)},
+                "members": [None] * len(codes),
+            }
+            return cls._codes
+
+    def _member(cls, index : int) -> 'ICD10Code':
+        """
+        Private helper returning the member at the given position, creating it on first access.
+        """
+        members = cls._registry()["members"]
+        member = members[index]
+        if member is None:
+            member = object.__new__(cls)
+            value = cls._codes["codes"][index]
+            object.__setattr__(member, "_value_", value)
+            object.__setattr__(member, "_name_", "ALL" if value == "*All*" else value.translate(_NAME_TRANSLATION))
+            members[index] = member
+            # Later attribute access finds the member directly, without going through __getattr__.
+            type.__setattr__(cls, member._name_, member)
+        return member
+
+
+class ICD10Code(metaclass=_ICD10CodeRegistry):
     """
     * Represents a distinct ICD-10 code or range of related ICD-10 codes. ICD-10 is the International Classification
     * of Diseases standard. Each ICD10Code has a description associated with it that puts the code in medical terms.
@@ -15,7 +118,25 @@ class ICD10Code(Enum):
     * Example: the value of ICD10Code.A00_0 is "A00.0"
     * Includes all chapters, subchapters, and subcodes supported by the Detailed Mortality dataset
     * provided by the CDC WONDER API.
+    * ICD10Codes behave like the members of an Enum, but are only created when they are first used,
+    * so importing this module stays fast.
     """
+    __slots__ = ("_name_", "_value_")
+
+    @property
+    def name(self) -> str:
+        """
+        The name of this ICD10Code, e.g. "A00_0"
+        """
+        return self._name_
+
+    @property
+    def value(self) -> str:
+        """
+        The ICD-10 code or range of codes this ICD10Code represents, e.g. "A00.0"
+        """
+        return self._value_
+
     @classmethod
     def description(cls, icd10_code : 'ICD10Code') -> str:
         """
@@ -42,13 +163,10 @@ class ICD10Code(Enum):
         :returns:       a list of ICD10Codes whose descriptions match the given string
         """
         try:
-            results = []
-            for code in ICD10Code:
-                if re.search(regex, cls.codeToLabels[code.value], flags):
-                    results.append(code)
-            return results
+            codes = cls._search_index_codes
+            return [codes[i] for i in cls._search_index.search(regex, flags)]
         except AttributeError:
-            cls._open_description_map()
+            cls._build_search_index()
             return cls.description_matches_regex(regex, flags)
 
     @classmethod
@@ -58,18 +176,7 @@ class ICD10Code(Enum):
         :param description: the string to fuzzy match descriptions with
         :returns:           the ICD10Code that produces the best match with the given string
         """
-        try:
-            bestRatio = 0
-            bestCode = None
-            for code in ICD10Code:
-                ratio = fuzz.token_set_ratio(description, cls.codeToLabels[code.value])
-                if ratio > bestRatio:
-                    bestRatio = ratio
-                    bestCode = code
-            return bestCode
-        except AttributeError:
-            cls._open_description_map()
-            return cls.description_best_match(description)
+        return cls.best_matches([description], workers=1)[0]
 
     @classmethod
     def description_matches_above_threshold(cls, description : str, thresh : float = 90) -> typing.List['ICD10Code']:
@@ -81,16 +188,51 @@ class ICD10Code(Enum):
         :returns:           a list of ICD10Codes whose description produced a fuzzy match above the given threshold
         """
         try:
-            results = []
-            for code in ICD10Code:
-                ratio = fuzz.token_set_ratio(description, cls.codeToLabels[code.value])
-                if ratio > thresh:
-                    results.append(code)
-            return results
+            scores = cls._fuzzy_scores([description], thresh, workers=1)[0]
+            return [cls._fuzzy_codes[i] for i in np.flatnonzero(scores > thresh)]
         except AttributeError:
-            cls._open_description_map()
+            cls._prepare_fuzzy_choices()
             return cls.description_matches_above_threshold(description, thresh)
 
+    @classmethod
+    def best_matches(cls, descriptions : typing.Iterable[str], score_cutoff : float = 0, workers : int = -1) -> typing.List['ICD10Code']:
+        """
+        Batch version of description_best_match: return the best matching ICD10Code for every given string.
+        Descriptions are scored in vectorized blocks across multiple cores.
+        :param descriptions:    the strings to fuzzy match descriptions with
+        :param score_cutoff:    minimum fuzzy match value (between 0 and 100) a match needs; scoring of a
+                                description stops early once it cannot reach it
+        :param workers:         number of threads to score with, -1 uses all cores
+        :returns:               one ICD10Code per given string, or None where no description matched
+        """
+        results = []
+        for scores in cls._fuzzy_score_blocks(descriptions, score_cutoff, workers):
+            best = scores.argmax(axis=1)
+            for row, column in enumerate(best):
+                results.append(cls._fuzzy_codes[column] if scores[row, column] > 0 else None)
+        return results
+
+    @classmethod
+    def top_matches(cls, descriptions : typing.Iterable[str], k : int = 5, score_cutoff : float = 0,
+                    workers : int = -1) -> typing.List[typing.List[typing.Tuple['ICD10Code', float]]]:
+        """
+        Return the k best matching ICD10Codes for every given string, with their fuzzy match values.
+        Descriptions are scored in vectorized blocks across multiple cores.
+        :param descriptions:    the strings to fuzzy match descriptions with
+        :param k:               maximum number of matches returned per string
+        :param score_cutoff:    minimum fuzzy match value (between 0 and 100) a match needs; scoring of a
+                                description stops early once it cannot reach it
+        :param workers:         number of threads to score with, -1 uses all cores
+        :returns:               one list per given string of (ICD10Code, score) pairs, best first
+        """
+        results = []
+        for scores in cls._fuzzy_score_blocks(descriptions, score_cutoff, workers):
+            best = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+            for row, columns in enumerate(best):
+                results.append([(cls._fuzzy_codes[column], float(scores[row, column])) for column in columns
+                                if scores[row, column] > 0 and scores[row, column] >= score_cutoff])
+        return results
+
     def contains(self, other : 'ICD10Code') -> bool:
         """
         Returns whether the given ICD10Code is a subset of this ICD10Code
@@ -107,11 +249,91 @@ class ICD10Code(Enum):
         elif self == other:
             return True
 
-        (parentLow, parentHigh) = self._convert_to_numeric()
-        (childLow, childHigh) = other._convert_to_numeric()
+        intervals = ICD10Code._hierarchy()["intervals"]
+        (parentLow, parentHigh) = intervals[self]
+        (childLow, childHigh) = intervals[other]
 
         return parentLow <= childLow and parentHigh >= childHigh
 
+    @classmethod
+    def minimal_cover(cls, codes : typing.Iterable['ICD10Code']) -> typing.List['ICD10Code']:
+        """
+        Reduce a collection of ICD10Codes to the smallest subset that covers the same codes, by dropping
+        duplicates and every code contained in another code of the collection. Runs in O(n log n).
+        :param codes:       the ICD10Codes to reduce
+        :raises TypeError:  if any element is not an ICD10Code
+        :returns:           the remaining ICD10Codes, in the order they were first given
+        """
+        unique = []
+        seen = set()
+        for code in codes:
+            if not isinstance(code, ICD10Code):
+                raise TypeError("All elements must be ICD10Codes")
+            if code not in seen:
+                seen.add(code)
+                unique.append(code)
+
+        if ICD10Code.ALL in seen:
+            return [ICD10Code.ALL]
+
+        # Sorted by start (widest first on ties), a code is redundant iff an earlier code reaches at least as far.
+        intervals = cls._hierarchy()["intervals"]
+        order = sorted(range(len(unique)), key=lambda i: (intervals[unique[i]][0], -intervals[unique[i]][1]))
+        kept = set()
+        furthest = None
+        for i in order:
+            high = intervals[unique[i]][1]
+            if furthest is None or high > furthest:
+                kept.add(i)
+                furthest = high
+
+        return [code for i, code in enumerate(unique) if i in kept]
+
+    @classmethod
+    def children(cls, icd10_code : 'ICD10Code') -> typing.List['ICD10Code']:
+        """
+        Return the direct subdivisions of an ICD10Code, e.g. the subchapters of a chapter or the
+        four character codes of a three character code.
+        :param icd10_code:  the ICD10Code to get the subdivisions of
+        :raises TypeError:  if icd10_code is not an ICD10Code
+        :returns:           list of ICD10Codes directly below the given code in the ICD-10 hierarchy
+        """
+        if not isinstance(icd10_code, ICD10Code):
+            raise TypeError("Argument must be an ICD10Code")
+
+        hierarchy = cls._hierarchy()
+        if icd10_code == ICD10Code.ALL:
+            return list(hierarchy["chapters"])
+
+        codes, end = hierarchy["codes"], hierarchy["end"]
+        position = hierarchy["position"][icd10_code]
+        children = []
+        child = position + 1
+        while child < end[position]:
+            children.append(codes[child])
+            child = end[child]
+        return children
+
+    @classmethod
+    def ancestors(cls, icd10_code : 'ICD10Code') -> typing.List['ICD10Code']:
+        """
+        Return the ICD10Codes that contain the given code in the ICD-10 hierarchy, nearest first and
+        ending with its chapter. ICD10Code.ALL is not included.
+        :param icd10_code:  the ICD10Code to get the ancestors of
+        :raises TypeError:  if icd10_code is not an ICD10Code
+        :returns:           list of ICD10Codes containing the given code
+        """
+        if not isinstance(icd10_code, ICD10Code):
+            raise TypeError("Argument must be an ICD10Code")
+
+        parents = cls._hierarchy()["parent"]
+        ancestors = []
+        parent = parents.get(icd10_code)
+        while parent is not None:
+            ancestors.append(parent)
+            parent = parents.get(parent)
+        return ancestors
+
 
     ##################################
     # Private internal helper methods
@@ -147,10 +369,111 @@ class ICD10Code(Enum):
         endNumeric = 100*endLetterPart + endNumberPart + 0.1*endDecimalPart
         return (beginNumeric, endNumeric)
 
+    @classmethod
+    def _hierarchy(cls) -> dict:
+        """
+        Private helper returning the precomputed ICD-10 hierarchy, built on first use:
+        - intervals:    code -> numeric (low, high) interval, see _convert_to_numeric
+        - codes:        all codes except ALL, in declaration (hierarchical pre-)order
+        - position:     code -> index in codes
+        - end:          index one past the last descendant of the code at each index
+        - parent:       code -> smallest code containing it (chapters have none)
+        - chapters:     the top level codes
+        """
+        try:
+            return cls._hierarchy_index
+        except AttributeError:
+            codes = [code for code in cls if code != ICD10Code.ALL]
+            intervals = {code: code._convert_to_numeric() for code in codes}
+            end = [len(codes)] * len(codes)
+            parent = dict()
+            chapters = []
+
+            # Members are declared in pre-order, so the enclosing codes of each code are on the stack.
+            enclosing = []
+            for i, code in enumerate(codes):
+                (low, high) = intervals[code]
+                while enclosing:
+                    (parentLow, parentHigh) = intervals[codes[enclosing[-1]]]
+                    if parentLow <= low and parentHigh >= high:
+                        break
+                    end[enclosing.pop()] = i
+                if enclosing:
+                    parent[code] = codes[enclosing[-1]]
+                else:
+                    chapters.append(code)
+                enclosing.append(i)
+
+            cls._hierarchy_index = {
+                "intervals": intervals,
+                "codes": codes,
+                "position": {code: i for i, code in enumerate(codes)},
+                "end": end,
+                "parent": parent,
+                "chapters": chapters,
+            }
+            return cls._hierarchy_index
+
+    @classmethod
+    def _prepare_fuzzy_choices(cls):
+        from rapidfuzz import utils
+
+        try:
+            labels = cls.codeToLabels
+        except AttributeError:
+            cls._open_description_map()
+            labels = cls.codeToLabels
+        cls._fuzzy_codes = list(cls)
+        cls._fuzzy_choices = [utils.default_process(label) for label in labels.lookup_many([code.value for code in cls._fuzzy_codes])]
+
+    @classmethod
+    def _fuzzy_scores(cls, descriptions : typing.List[str], score_cutoff : float, workers : int) -> np.ndarray:
+        """
+        Private helper scoring descriptions (rows) against every code description (columns).
+        Scores below score_cutoff are reported as 0.
+        """
+        from rapidfuzz import fuzz, process, utils
+
+        queries = [utils.default_process(description) for description in descriptions]
+        return process.cdist(queries, cls._fuzzy_choices, scorer=fuzz.token_set_ratio, processor=None,
+                             score_cutoff=score_cutoff, dtype=np.float64, workers=workers)
+
+    @classmethod
+    def _fuzzy_score_blocks(cls, descriptions : typing.Iterable[str], score_cutoff : float, workers : int) -> typing.Iterator[np.ndarray]:
+        """
+        Private generator scoring descriptions in blocks of _FUZZY_BLOCK_SIZE, bounding the size of the score matrix.
+        """
+        try:
+            cls._fuzzy_choices
+        except AttributeError:
+            cls._prepare_fuzzy_choices()
+
+        block = []
+        for description in descriptions:
+            block.append(description)
+            if len(block) == _FUZZY_BLOCK_SIZE:
+                yield cls._fuzzy_scores(block, score_cutoff, workers)
+                block = []
+        if block:
+            yield cls._fuzzy_scores(block, score_cutoff, workers)
+
+    @classmethod
+    def _build_search_index(cls):
+        from cdcwonderpy.icd10search import DescriptionIndex
+
+        try:
+            labels = cls.codeToLabels
+        except AttributeError:
+            cls._open_description_map()
+            labels = cls.codeToLabels
+        cls._search_index_codes = list(cls)
+        cls._search_index = DescriptionIndex(labels.lookup_many([code.value for code in cls._search_index_codes]))
+
     @classmethod
     def _open_description_map(cls):
-        with open(os.path.join('resources', 'ICD10CodeToLabels.pickle'), 'rb') as f:
-            cls.codeToLabels = pickle.load(f)
+        from cdcwonderpy.icd10labels import LabelStore
+
+        cls.codeToLabels = LabelStore()
 
     def __str__(self):
         return self.__repr__()
@@ -158,9607 +481,18 @@ class ICD10Code(Enum):
     def __repr__(self):
         return self.value
 
-    #########################################
-    #### ICD-10 code enums
-    #########################################
-    ALL = "*All*"
-    A00_B99 = "A00-B99"
-    A00_A09 = "A00-A09"
-    A00 = "A00"
-    A00_0 = "A00.0"
-    A00_1 = "A00.1"
-    A00_9 = "A00.9"
-    A01 = "A01"
-    A01_0 = "A01.0"
-    A01_1 = "A01.1"
-    A01_2 = "A01.2"
-    A01_3 = "A01.3"
-    A01_4 = "A01.4"
-    A02 = "A02"
-    A02_0 = "A02.0"
-    A02_1 = "A02.1"
-    A02_2 = "A02.2"
-    A02_8 = "A02.8"
-    A02_9 = "A02.9"
-    A03 = "A03"
-    A03_0 = "A03.0"
-    A03_1 = "A03.1"
-    A03_2 = "A03.2"
-    A03_3 = "A03.3"
-    A03_8 = "A03.8"
-    A03_9 = "A03.9"
-    A04 = "A04"
-    A04_0 = "A04.0"
-    A04_1 = "A04.1"
-    A04_2 = "A04.2"
-    A04_3 = "A04.3"
-    A04_4 = "A04.4"
-    A04_5 = "A04.5"
-    A04_6 = "A04.6"
-    A04_7 = "A04.7"
-    A04_8 = "A04.8"
-    A04_9 = "A04.9"
-    A05 = "A05"
-    A05_0 = "A05.0"
-    A05_1 = "A05.1"
-    A05_2 = "A05.2"
-    A05_3 = "A05.3"
-    A05_4 = "A05.4"
-    A05_8 = "A05.8"
-    A05_9 = "A05.9"
-    A06 = "A06"
-    A06_0 = "A06.0"
-    A06_1 = "A06.1"
-    A06_2 = "A06.2"
-    A06_3 = "A06.3"
-    A06_4 = "A06.4"
-    A06_5 = "A06.5"
-    A06_6 = "A06.6"
-    A06_7 = "A06.7"
-    A06_8 = "A06.8"
-    A06_9 = "A06.9"
-    A07 = "A07"
-    A07_0 = "A07.0"
-    A07_1 = "A07.1"
-    A07_2 = "A07.2"
-    A07_3 = "A07.3"
-    A07_8 = "A07.8"
-    A07_9 = "A07.9"
-    A08 = "A08"
-    A08_0 = "A08.0"
-    A08_1 = "A08.1"
-    A08_2 = "A08.2"
-    A08_3 = "A08.3"
-    A08_4 = "A08.4"
-    A08_5 = "A08.5"
-    A09 = "A09"
-    A09_0 = "A09.0"
-    A09_9 = "A09.9"
-    A16_A19 = "A16-A19"
-    A16 = "A16"
-    A16_2 = "A16.2"
-    A16_3 = "A16.3"
-    A16_4 = "A16.4"
-    A16_5 = "A16.5"
-    A16_7 = "A16.7"
-    A16_8 = "A16.8"
-    A16_9 = "A16.9"
-    A17 = "A17"
-    A17_0 = "A17.0"
-    A17_1 = "A17.1"
-    A17_8 = "A17.8"
-    A17_9 = "A17.9"
-    A18 = "A18"
-    A18_0 = "A18.0"
-    A18_1 = "A18.1"
-    A18_2 = "A18.2"
-    A18_3 = "A18.3"
-    A18_4 = "A18.4"
-    A18_5 = "A18.5"
-    A18_6 = "A18.6"
-    A18_7 = "A18.7"
-    A18_8 = "A18.8"
-    A19 = "A19"
-    A19_0 = "A19.0"
-    A19_1 = "A19.1"
-    A19_2 = "A19.2"
-    A19_8 = "A19.8"
-    A19_9 = "A19.9"
-    A20_A28 = "A20-A28"
-    A20 = "A20"
-    A20_0 = "A20.0"
-    A20_1 = "A20.1"
-    A20_2 = "A20.2"
-    A20_3 = "A20.3"
-    A20_7 = "A20.7"
-    A20_8 = "A20.8"
-    A20_9 = "A20.9"
-    A21 = "A21"
-    A21_0 = "A21.0"
-    A21_1 = "A21.1"
-    A21_2 = "A21.2"
-    A21_3 = "A21.3"
-    A21_7 = "A21.7"
-    A21_8 = "A21.8"
-    A21_9 = "A21.9"
-    A22 = "A22"
-    A22_0 = "A22.0"
-    A22_1 = "A22.1"
-    A22_2 = "A22.2"
-    A22_7 = "A22.7"
-    A22_8 = "A22.8"
-    A22_9 = "A22.9"
-    A23 = "A23"
-    A23_0 = "A23.0"
-    A23_1 = "A23.1"
-    A23_2 = "A23.2"
-    A23_3 = "A23.3"
-    A23_8 = "A23.8"
-    A23_9 = "A23.9"
-    A24 = "A24"
-    A24_0 = "A24.0"
-    A24_1 = "A24.1"
-    A24_2 = "A24.2"
-    A24_3 = "A24.3"
-    A24_4 = "A24.4"
-    A25 = "A25"
-    A25_0 = "A25.0"
-    A25_1 = "A25.1"
-    A25_9 = "A25.9"
-    A26 = "A26"
-    A26_0 = "A26.0"
-    A26_7 = "A26.7"
-    A26_8 = "A26.8"
-    A26_9 = "A26.9"
-    A27 = "A27"
-    A27_0 = "A27.0"
-    A27_8 = "A27.8"
-    A27_9 = "A27.9"
-    A28 = "A28"
-    A28_0 = "A28.0"
-    A28_1 = "A28.1"
-    A28_2 = "A28.2"
-    A28_8 = "A28.8"
-    A28_9 = "A28.9"
-    A30_A49 = "A30-A49"
-    A30 = "A30"
-    A30_0 = "A30.0"
-    A30_1 = "A30.1"
-    A30_2 = "A30.2"
-    A30_3 = "A30.3"
-    A30_4 = "A30.4"
-    A30_5 = "A30.5"
-    A30_8 = "A30.8"
-    A30_9 = "A30.9"
-    A31 = "A31"
-    A31_0 = "A31.0"
-    A31_1 = "A31.1"
-    A31_8 = "A31.8"
-    A31_9 = "A31.9"
-    A32 = "A32"
-    A32_0 = "A32.0"
-    A32_1 = "A32.1"
-    A32_7 = "A32.7"
-    A32_8 = "A32.8"
-    A32_9 = "A32.9"
-    A33 = "A33"
-    A34 = "A34"
-    A35 = "A35"
-    A36 = "A36"
-    A36_0 = "A36.0"
-    A36_1 = "A36.1"
-    A36_2 = "A36.2"
-    A36_3 = "A36.3"
-    A36_8 = "A36.8"
-    A36_9 = "A36.9"
-    A37 = "A37"
-    A37_0 = "A37.0"
-    A37_1 = "A37.1"
-    A37_8 = "A37.8"
-    A37_9 = "A37.9"
-    A38 = "A38"
-    A39 = "A39"
-    A39_0 = "A39.0"
-    A39_1 = "A39.1"
-    A39_2 = "A39.2"
-    A39_3 = "A39.3"
-    A39_4 = "A39.4"
-    A39_5 = "A39.5"
-    A39_8 = "A39.8"
-    A39_9 = "A39.9"
-    A40 = "A40"
-    A40_0 = "A40.0"
-    A40_1 = "A40.1"
-    A40_2 = "A40.2"
-    A40_3 = "A40.3"
-    A40_8 = "A40.8"
-    A40_9 = "A40.9"
-    A41 = "A41"
-    A41_0 = "A41.0"
-    A41_1 = "A41.1"
-    A41_2 = "A41.2"
-    A41_3 = "A41.3"
-    A41_4 = "A41.4"
-    A41_5 = "A41.5"
-    A41_8 = "A41.8"
-    A41_9 = "A41.9"
-    A42 = "A42"
-    A42_0 = "A42.0"
-    A42_1 = "A42.1"
-    A42_2 = "A42.2"
-    A42_7 = "A42.7"
-    A42_8 = "A42.8"
-    A42_9 = "A42.9"
-    A43 = "A43"
-    A43_0 = "A43.0"
-    A43_1 = "A43.1"
-    A43_8 = "A43.8"
-    A43_9 = "A43.9"
-    A44 = "A44"
-    A44_0 = "A44.0"
-    A44_1 = "A44.1"
-    A44_8 = "A44.8"
-    A44_9 = "A44.9"
-    A46 = "A46"
-    A48 = "A48"
-    A48_0 = "A48.0"
-    A48_1 = "A48.1"
-    A48_2 = "A48.2"
-    A48_3 = "A48.3"
-    A48_4 = "A48.4"
-    A48_8 = "A48.8"
-    A49 = "A49"
-    A49_0 = "A49.0"
-    A49_1 = "A49.1"
-    A49_2 = "A49.2"
-    A49_3 = "A49.3"
-    A49_8 = "A49.8"
-    A49_9 = "A49.9"
-    A50_A64 = "A50-A64"
-    A50 = "A50"
-    A50_0 = "A50.0"
-    A50_1 = "A50.1"
-    A50_2 = "A50.2"
-    A50_3 = "A50.3"
-    A50_4 = "A50.4"
-    A50_5 = "A50.5"
-    A50_6 = "A50.6"
-    A50_7 = "A50.7"
-    A50_9 = "A50.9"
-    A51 = "A51"
-    A51_0 = "A51.0"
-    A51_1 = "A51.1"
-    A51_2 = "A51.2"
-    A51_3 = "A51.3"
-    A51_4 = "A51.4"
-    A51_5 = "A51.5"
-    A51_9 = "A51.9"
-    A52 = "A52"
-    A52_0 = "A52.0"
-    A52_1 = "A52.1"
-    A52_2 = "A52.2"
-    A52_3 = "A52.3"
-    A52_7 = "A52.7"
-    A52_8 = "A52.8"
-    A52_9 = "A52.9"
-    A53 = "A53"
-    A53_0 = "A53.0"
-    A53_9 = "A53.9"
-    A54 = "A54"
-    A54_0 = "A54.0"
-    A54_1 = "A54.1"
-    A54_2 = "A54.2"
-    A54_3 = "A54.3"
-    A54_4 = "A54.4"
-    A54_5 = "A54.5"
-    A54_6 = "A54.6"
-    A54_8 = "A54.8"
-    A54_9 = "A54.9"
-    A55 = "A55"
-    A56 = "A56"
-    A56_0 = "A56.0"
-    A56_1 = "A56.1"
-    A56_2 = "A56.2"
-    A56_3 = "A56.3"
-    A56_4 = "A56.4"
-    A56_8 = "A56.8"
-    A57 = "A57"
-    A58 = "A58"
-    A59 = "A59"
-    A59_0 = "A59.0"
-    A59_8 = "A59.8"
-    A59_9 = "A59.9"
-    A60 = "A60"
-    A60_0 = "A60.0"
-    A60_1 = "A60.1"
-    A60_9 = "A60.9"
-    A63 = "A63"
-    A63_0 = "A63.0"
-    A63_8 = "A63.8"
-    A64 = "A64"
-    A65_A69 = "A65-A69"
-    A65 = "A65"
-    A66 = "A66"
-    A66_0 = "A66.0"
-    A66_1 = "A66.1"
-    A66_2 = "A66.2"
-    A66_3 = "A66.3"
-    A66_4 = "A66.4"
-    A66_5 = "A66.5"
-    A66_6 = "A66.6"
-    A66_7 = "A66.7"
-    A66_8 = "A66.8"
-    A66_9 = "A66.9"
-    A67 = "A67"
-    A67_0 = "A67.0"
-    A67_1 = "A67.1"
-    A67_2 = "A67.2"
-    A67_3 = "A67.3"
-    A67_9 = "A67.9"
-    A68 = "A68"
-    A68_0 = "A68.0"
-    A68_1 = "A68.1"
-    A68_9 = "A68.9"
-    A69 = "A69"
-    A69_0 = "A69.0"
-    A69_1 = "A69.1"
-    A69_2 = "A69.2"
-    A69_8 = "A69.8"
-    A69_9 = "A69.9"
-    A70_A74 = "A70-A74"
-    A70 = "A70"
-    A71 = "A71"
-    A71_0 = "A71.0"
-    A71_1 = "A71.1"
-    A71_9 = "A71.9"
-    A74 = "A74"
-    A74_0 = "A74.0"
-    A74_8 = "A74.8"
-    A74_9 = "A74.9"
-    A75_A79 = "A75-A79"
-    A75 = "A75"
-    A75_0 = "A75.0"
-    A75_1 = "A75.1"
-    A75_2 = "A75.2"
-    A75_3 = "A75.3"
-    A75_9 = "A75.9"
-    A77 = "A77"
-    A77_0 = "A77.0"
-    A77_1 = "A77.1"
-    A77_2 = "A77.2"
-    A77_3 = "A77.3"
-    A77_8 = "A77.8"
-    A77_9 = "A77.9"
-    A78 = "A78"
-    A79 = "A79"
-    A79_0 = "A79.0"
-    A79_1 = "A79.1"
-    A79_8 = "A79.8"
-    A79_9 = "A79.9"
-    A80_A89 = "A80-A89"
-    A80 = "A80"
-    A80_0 = "A80.0"
-    A80_1 = "A80.1"
-    A80_2 = "A80.2"
-    A80_3 = "A80.3"
-    A80_4 = "A80.4"
-    A80_9 = "A80.9"
-    A81 = "A81"
-    A81_0 = "A81.0"
-    A81_1 = "A81.1"
-    A81_2 = "A81.2"
-    A81_8 = "A81.8"
-    A81_9 = "A81.9"
-    A82 = "A82"
-    A82_0 = "A82.0"
-    A82_1 = "A82.1"
-    A82_9 = "A82.9"
-    A83 = "A83"
-    A83_0 = "A83.0"
-    A83_1 = "A83.1"
-    A83_2 = "A83.2"
-    A83_3 = "A83.3"
-    A83_4 = "A83.4"
-    A83_5 = "A83.5"
-    A83_6 = "A83.6"
-    A83_8 = "A83.8"
-    A83_9 = "A83.9"
-    A84 = "A84"
-    A84_0 = "A84.0"
-    A84_1 = "A84.1"
-    A84_8 = "A84.8"
-    A84_9 = "A84.9"
-    A85 = "A85"
-    A85_0 = "A85.0"
-    A85_1 = "A85.1"
-    A85_2 = "A85.2"
-    A85_8 = "A85.8"
-    A86 = "A86"
-    A87 = "A87"
-    A87_0 = "A87.0"
-    A87_1 = "A87.1"
-    A87_2 = "A87.2"
-    A87_8 = "A87.8"
-    A87_9 = "A87.9"
-    A88 = "A88"
-    A88_0 = "A88.0"
-    A88_1 = "A88.1"
-    A88_8 = "A88.8"
-    A89 = "A89"
-    A90_A99 = "A90-A99"
-    A90 = "A90"
-    A91 = "A91"
-    A92 = "A92"
-    A92_0 = "A92.0"
-    A92_1 = "A92.1"
-    A92_2 = "A92.2"
-    A92_3 = "A92.3"
-    A92_4 = "A92.4"
-    A92_8 = "A92.8"
-    A92_9 = "A92.9"
-    A93 = "A93"
-    A93_0 = "A93.0"
-    A93_1 = "A93.1"
-    A93_2 = "A93.2"
-    A93_8 = "A93.8"
-    A94 = "A94"
-    A95 = "A95"
-    A95_0 = "A95.0"
-    A95_1 = "A95.1"
-    A95_9 = "A95.9"
-    A96 = "A96"
-    A96_0 = "A96.0"
-    A96_1 = "A96.1"
-    A96_2 = "A96.2"
-    A96_8 = "A96.8"
-    A96_9 = "A96.9"
-    A98 = "A98"
-    A98_0 = "A98.0"
-    A98_1 = "A98.1"
-    A98_2 = "A98.2"
-    A98_3 = "A98.3"
-    A98_4 = "A98.4"
-    A98_5 = "A98.5"
-    A98_8 = "A98.8"
-    A99 = "A99"
-    B00_B09 = "B00-B09"
-    B00 = "B00"
-    B00_0 = "B00.0"
-    B00_1 = "B00.1"
-    B00_2 = "B00.2"
-    B00_3 = "B00.3"
-    B00_4 = "B00.4"
-    B00_5 = "B00.5"
-    B00_7 = "B00.7"
-    B00_8 = "B00.8"
-    B00_9 = "B00.9"
-    B01 = "B01"
-    B01_0 = "B01.0"
-    B01_1 = "B01.1"
-    B01_2 = "B01.2"
-    B01_8 = "B01.8"
-    B01_9 = "B01.9"
-    B02 = "B02"
-    B02_0 = "B02.0"
-    B02_1 = "B02.1"
-    B02_2 = "B02.2"
-    B02_3 = "B02.3"
-    B02_7 = "B02.7"
-    B02_8 = "B02.8"
-    B02_9 = "B02.9"
-    B03 = "B03"
-    B04 = "B04"
-    B05 = "B05"
-    B05_0 = "B05.0"
-    B05_1 = "B05.1"
-    B05_2 = "B05.2"
-    B05_3 = "B05.3"
-    B05_4 = "B05.4"
-    B05_8 = "B05.8"
-    B05_9 = "B05.9"
-    B06 = "B06"
-    B06_0 = "B06.0"
-    B06_8 = "B06.8"
-    B06_9 = "B06.9"
-    B07 = "B07"
-    B08 = "B08"
-    B08_0 = "B08.0"
-    B08_1 = "B08.1"
-    B08_2 = "B08.2"
-    B08_3 = "B08.3"
-    B08_4 = "B08.4"
-    B08_5 = "B08.5"
-    B08_8 = "B08.8"
-    B09 = "B09"
-    B15_B19 = "B15-B19"
-    B15 = "B15"
-    B15_0 = "B15.0"
-    B15_9 = "B15.9"
-    B16 = "B16"
-    B16_0 = "B16.0"
-    B16_1 = "B16.1"
-    B16_2 = "B16.2"
-    B16_9 = "B16.9"
-    B17 = "B17"
-    B17_0 = "B17.0"
-    B17_1 = "B17.1"
-    B17_2 = "B17.2"
-    B17_8 = "B17.8"
-    B17_9 = "B17.9"
-    B18 = "B18"
-    B18_0 = "B18.0"
-    B18_1 = "B18.1"
-    B18_2 = "B18.2"
-    B18_8 = "B18.8"
-    B18_9 = "B18.9"
-    B19 = "B19"
-    B19_0 = "B19.0"
-    B19_9 = "B19.9"
-    B20_B24 = "B20-B24"
-    B20 = "B20"
-    B20_0 = "B20.0"
-    B20_1 = "B20.1"
-    B20_2 = "B20.2"
-    B20_3 = "B20.3"
-    B20_4 = "B20.4"
-    B20_5 = "B20.5"
-    B20_6 = "B20.6"
-    B20_7 = "B20.7"
-    B20_8 = "B20.8"
-    B20_9 = "B20.9"
-    B21 = "B21"
-    B21_0 = "B21.0"
-    B21_1 = "B21.1"
-    B21_2 = "B21.2"
-    B21_3 = "B21.3"
-    B21_7 = "B21.7"
-    B21_8 = "B21.8"
-    B21_9 = "B21.9"
-    B22 = "B22"
-    B22_0 = "B22.0"
-    B22_1 = "B22.1"
-    B22_2 = "B22.2"
-    B22_7 = "B22.7"
-    B23 = "B23"
-    B23_0 = "B23.0"
-    B23_1 = "B23.1"
-    B23_2 = "B23.2"
-    B23_8 = "B23.8"
-    B24 = "B24"
-    B25_B34 = "B25-B34"
-    B25 = "B25"
-    B25_0 = "B25.0"
-    B25_1 = "B25.1"
-    B25_2 = "B25.2"
-    B25_8 = "B25.8"
-    B25_9 = "B25.9"
-    B26 = "B26"
-    B26_0 = "B26.0"
-    B26_1 = "B26.1"
-    B26_2 = "B26.2"
-    B26_3 = "B26.3"
-    B26_8 = "B26.8"
-    B26_9 = "B26.9"
-    B27 = "B27"
-    B27_0 = "B27.0"
-    B27_1 = "B27.1"
-    B27_8 = "B27.8"
-    B27_9 = "B27.9"
-    B30 = "B30"
-    B30_0 = "B30.0"
-    B30_1 = "B30.1"
-    B30_2 = "B30.2"
-    B30_3 = "B30.3"
-    B30_8 = "B30.8"
-    B30_9 = "B30.9"
-    B33 = "B33"
-    B33_0 = "B33.0"
-    B33_1 = "B33.1"
-    B33_2 = "B33.2"
-    B33_3 = "B33.3"
-    B33_4 = "B33.4"
-    B33_8 = "B33.8"
-    B34 = "B34"
-    B34_0 = "B34.0"
-    B34_1 = "B34.1"
-    B34_2 = "B34.2"
-    B34_3 = "B34.3"
-    B34_4 = "B34.4"
-    B34_8 = "B34.8"
-    B34_9 = "B34.9"
-    B35_B49 = "B35-B49"
-    B35 = "B35"
-    B35_0 = "B35.0"
-    B35_1 = "B35.1"
-    B35_2 = "B35.2"
-    B35_3 = "B35.3"
-    B35_4 = "B35.4"
-    B35_5 = "B35.5"
-    B35_6 = "B35.6"
-    B35_8 = "B35.8"
-    B35_9 = "B35.9"
-    B36 = "B36"
-    B36_0 = "B36.0"
-    B36_1 = "B36.1"
-    B36_2 = "B36.2"
-    B36_3 = "B36.3"
-    B36_8 = "B36.8"
-    B36_9 = "B36.9"
-    B37 = "B37"
-    B37_0 = "B37.0"
-    B37_1 = "B37.1"
-    B37_2 = "B37.2"
-    B37_3 = "B37.3"
-    B37_4 = "B37.4"
-    B37_5 = "B37.5"
-    B37_6 = "B37.6"
-    B37_7 = "B37.7"
-    B37_8 = "B37.8"
-    B37_9 = "B37.9"
-    B38 = "B38"
-    B38_0 = "B38.0"
-    B38_1 = "B38.1"
-    B38_2 = "B38.2"
-    B38_3 = "B38.3"
-    B38_4 = "B38.4"
-    B38_7 = "B38.7"
-    B38_8 = "B38.8"
-    B38_9 = "B38.9"
-    B39 = "B39"
-    B39_0 = "B39.0"
-    B39_1 = "B39.1"
-    B39_2 = "B39.2"
-    B39_3 = "B39.3"
-    B39_4 = "B39.4"
-    B39_5 = "B39.5"
-    B39_9 = "B39.9"
-    B40 = "B40"
-    B40_0 = "B40.0"
-    B40_1 = "B40.1"
-    B40_2 = "B40.2"
-    B40_3 = "B40.3"
-    B40_7 = "B40.7"
-    B40_8 = "B40.8"
-    B40_9 = "B40.9"
-    B41 = "B41"
-    B41_0 = "B41.0"
-    B41_7 = "B41.7"
-    B41_8 = "B41.8"
-    B41_9 = "B41.9"
-    B42 = "B42"
-    B42_0 = "B42.0"
-    B42_1 = "B42.1"
-    B42_7 = "B42.7"
-    B42_8 = "B42.8"
-    B42_9 = "B42.9"
-    B43 = "B43"
-    B43_0 = "B43.0"
-    B43_1 = "B43.1"
-    B43_2 = "B43.2"
-    B43_8 = "B43.8"
-    B43_9 = "B43.9"
-    B44 = "B44"
-    B44_0 = "B44.0"
-    B44_1 = "B44.1"
-    B44_2 = "B44.2"
-    B44_7 = "B44.7"
-    B44_8 = "B44.8"
-    B44_9 = "B44.9"
-    B45 = "B45"
-    B45_0 = "B45.0"
-    B45_1 = "B45.1"
-    B45_2 = "B45.2"
-    B45_3 = "B45.3"
-    B45_7 = "B45.7"
-    B45_8 = "B45.8"
-    B45_9 = "B45.9"
-    B46 = "B46"
-    B46_0 = "B46.0"
-    B46_1 = "B46.1"
-    B46_2 = "B46.2"
-    B46_3 = "B46.3"
-    B46_4 = "B46.4"
-    B46_5 = "B46.5"
-    B46_8 = "B46.8"
-    B46_9 = "B46.9"
-    B47 = "B47"
-    B47_0 = "B47.0"
-    B47_1 = "B47.1"
-    B47_9 = "B47.9"
-    B48 = "B48"
-    B48_0 = "B48.0"
-    B48_1 = "B48.1"
-    B48_2 = "B48.2"
-    B48_3 = "B48.3"
-    B48_4 = "B48.4"
-    B48_7 = "B48.7"
-    B48_8 = "B48.8"
-    B49 = "B49"
-    B50_B64 = "B50-B64"
-    B50 = "B50"
-    B50_0 = "B50.0"
-    B50_8 = "B50.8"
-    B50_9 = "B50.9"
-    B51 = "B51"
-    B51_0 = "B51.0"
-    B51_8 = "B51.8"
-    B51_9 = "B51.9"
-    B52 = "B52"
-    B52_0 = "B52.0"
-    B52_8 = "B52.8"
-    B52_9 = "B52.9"
-    B53 = "B53"
-    B53_0 = "B53.0"
-    B53_1 = "B53.1"
-    B53_8 = "B53.8"
-    B54 = "B54"
-    B55 = "B55"
-    B55_0 = "B55.0"
-    B55_1 = "B55.1"
-    B55_2 = "B55.2"
-    B55_9 = "B55.9"
-    B56 = "B56"
-    B56_0 = "B56.0"
-    B56_1 = "B56.1"
-    B56_9 = "B56.9"
-    B57 = "B57"
-    B57_0 = "B57.0"
-    B57_1 = "B57.1"
-    B57_2 = "B57.2"
-    B57_3 = "B57.3"
-    B57_4 = "B57.4"
-    B57_5 = "B57.5"
-    B58 = "B58"
-    B58_0 = "B58.0"
-    B58_1 = "B58.1"
-    B58_2 = "B58.2"
-    B58_3 = "B58.3"
-    B58_8 = "B58.8"
-    B58_9 = "B58.9"
-    B59 = "B59"
-    B60 = "B60"
-    B60_0 = "B60.0"
-    B60_1 = "B60.1"
-    B60_2 = "B60.2"
-    B60_8 = "B60.8"
-    B64 = "B64"
-    B65_B83 = "B65-B83"
-    B65 = "B65"
-    B65_0 = "B65.0"
-    B65_1 = "B65.1"
-    B65_2 = "B65.2"
-    B65_3 = "B65.3"
-    B65_8 = "B65.8"
-    B65_9 = "B65.9"
-    B66 = "B66"
-    B66_0 = "B66.0"
-    B66_1 = "B66.1"
-    B66_2 = "B66.2"
-    B66_3 = "B66.3"
-    B66_4 = "B66.4"
-    B66_5 = "B66.5"
-    B66_8 = "B66.8"
-    B66_9 = "B66.9"
-    B67 = "B67"
-    B67_0 = "B67.0"
-    B67_1 = "B67.1"
-    B67_2 = "B67.2"
-    B67_3 = "B67.3"
-    B67_4 = "B67.4"
-    B67_5 = "B67.5"
-    B67_6 = "B67.6"
-    B67_7 = "B67.7"
-    B67_8 = "B67.8"
-    B67_9 = "B67.9"
-    B68 = "B68"
-    B68_0 = "B68.0"
-    B68_1 = "B68.1"
-    B68_9 = "B68.9"
-    B69 = "B69"
-    B69_0 = "B69.0"
-    B69_1 = "B69.1"
-    B69_8 = "B69.8"
-    B69_9 = "B69.9"
-    B70 = "B70"
-    B70_0 = "B70.0"
-    B70_1 = "B70.1"
-    B71 = "B71"
-    B71_0 = "B71.0"
-    B71_1 = "B71.1"
-    B71_8 = "B71.8"
-    B71_9 = "B71.9"
-    B72 = "B72"
-    B73 = "B73"
-    B74 = "B74"
-    B74_0 = "B74.0"
-    B74_1 = "B74.1"
-    B74_2 = "B74.2"
-    B74_3 = "B74.3"
-    B74_4 = "B74.4"
-    B74_8 = "B74.8"
-    B74_9 = "B74.9"
-    B75 = "B75"
-    B76 = "B76"
-    B76_0 = "B76.0"
-    B76_1 = "B76.1"
-    B76_8 = "B76.8"
-    B76_9 = "B76.9"
-    B77 = "B77"
-    B77_0 = "B77.0"
-    B77_8 = "B77.8"
-    B77_9 = "B77.9"
-    B78 = "B78"
-    B78_0 = "B78.0"
-    B78_1 = "B78.1"
-    B78_7 = "B78.7"
-    B78_9 = "B78.9"
-    B79 = "B79"
-    B80 = "B80"
-    B81 = "B81"
-    B81_0 = "B81.0"
-    B81_1 = "B81.1"
-    B81_2 = "B81.2"
-    B81_3 = "B81.3"
-    B81_4 = "B81.4"
-    B81_8 = "B81.8"
-    B82 = "B82"
-    B82_0 = "B82.0"
-    B82_9 = "B82.9"
-    B83 = "B83"
-    B83_0 = "B83.0"
-    B83_1 = "B83.1"
-    B83_2 = "B83.2"
-    B83_3 = "B83.3"
-    B83_4 = "B83.4"
-    B83_8 = "B83.8"
-    B83_9 = "B83.9"
-    B85_B89 = "B85-B89"
-    B85 = "B85"
-    B85_0 = "B85.0"
-    B85_1 = "B85.1"
-    B85_2 = "B85.2"
-    B85_3 = "B85.3"
-    B85_4 = "B85.4"
-    B86 = "B86"
-    B87 = "B87"
-    B87_0 = "B87.0"
-    B87_1 = "B87.1"
-    B87_2 = "B87.2"
-    B87_3 = "B87.3"
-    B87_4 = "B87.4"
-    B87_8 = "B87.8"
-    B87_9 = "B87.9"
-    B88 = "B88"
-    B88_0 = "B88.0"
-    B88_1 = "B88.1"
-    B88_2 = "B88.2"
-    B88_3 = "B88.3"
-    B88_8 = "B88.8"
-    B88_9 = "B88.9"
-    B89 = "B89"
-    B90_B94 = "B90-B94"
-    B90 = "B90"
-    B90_0 = "B90.0"
-    B90_1 = "B90.1"
-    B90_2 = "B90.2"
-    B90_8 = "B90.8"
-    B90_9 = "B90.9"
-    B91 = "B91"
-    B92 = "B92"
-    B94 = "B94"
-    B94_0 = "B94.0"
-    B94_1 = "B94.1"
-    B94_2 = "B94.2"
-    B94_8 = "B94.8"
-    B94_9 = "B94.9"
-    B99_B99 = "B99-B99"
-    B99 = "B99"
-    C00_D48 = "C00-D48"
-    C00_C97 = "C00-C97"
-    C00_C14 = "C00-C14"
-    C00 = "C00"
-    C00_0 = "C00.0"
-    C00_1 = "C00.1"
-    C00_2 = "C00.2"
-    C00_3 = "C00.3"
-    C00_4 = "C00.4"
-    C00_5 = "C00.5"
-    C00_6 = "C00.6"
-    C00_8 = "C00.8"
-    C00_9 = "C00.9"
-    C01 = "C01"
-    C02 = "C02"
-    C02_0 = "C02.0"
-    C02_1 = "C02.1"
-    C02_2 = "C02.2"
-    C02_3 = "C02.3"
-    C02_4 = "C02.4"
-    C02_8 = "C02.8"
-    C02_9 = "C02.9"
-    C03 = "C03"
-    C03_0 = "C03.0"
-    C03_1 = "C03.1"
-    C03_9 = "C03.9"
-    C04 = "C04"
-    C04_0 = "C04.0"
-    C04_1 = "C04.1"
-    C04_8 = "C04.8"
-    C04_9 = "C04.9"
-    C05 = "C05"
-    C05_0 = "C05.0"
-    C05_1 = "C05.1"
-    C05_2 = "C05.2"
-    C05_8 = "C05.8"
-    C05_9 = "C05.9"
-    C06 = "C06"
-    C06_0 = "C06.0"
-    C06_1 = "C06.1"
-    C06_2 = "C06.2"
-    C06_8 = "C06.8"
-    C06_9 = "C06.9"
-    C07 = "C07"
-    C08 = "C08"
-    C08_0 = "C08.0"
-    C08_1 = "C08.1"
-    C08_8 = "C08.8"
-    C08_9 = "C08.9"
-    C09 = "C09"
-    C09_0 = "C09.0"
-    C09_1 = "C09.1"
-    C09_8 = "C09.8"
-    C09_9 = "C09.9"
-    C10 = "C10"
-    C10_0 = "C10.0"
-    C10_1 = "C10.1"
-    C10_2 = "C10.2"
-    C10_3 = "C10.3"
-    C10_4 = "C10.4"
-    C10_8 = "C10.8"
-    C10_9 = "C10.9"
-    C11 = "C11"
-    C11_0 = "C11.0"
-    C11_1 = "C11.1"
-    C11_2 = "C11.2"
-    C11_3 = "C11.3"
-    C11_8 = "C11.8"
-    C11_9 = "C11.9"
-    C12 = "C12"
-    C13 = "C13"
-    C13_0 = "C13.0"
-    C13_1 = "C13.1"
-    C13_2 = "C13.2"
-    C13_8 = "C13.8"
-    C13_9 = "C13.9"
-    C14 = "C14"
-    C14_0 = "C14.0"
-    C14_2 = "C14.2"
-    C14_8 = "C14.8"
-    C15_C26 = "C15-C26"
-    C15 = "C15"
-    C15_0 = "C15.0"
-    C15_1 = "C15.1"
-    C15_2 = "C15.2"
-    C15_3 = "C15.3"
-    C15_4 = "C15.4"
-    C15_5 = "C15.5"
-    C15_8 = "C15.8"
-    C15_9 = "C15.9"
-    C16 = "C16"
-    C16_0 = "C16.0"
-    C16_1 = "C16.1"
-    C16_2 = "C16.2"
-    C16_3 = "C16.3"
-    C16_4 = "C16.4"
-    C16_5 = "C16.5"
-    C16_6 = "C16.6"
-    C16_8 = "C16.8"
-    C16_9 = "C16.9"
-    C17 = "C17"
-    C17_0 = "C17.0"
-    C17_1 = "C17.1"
-    C17_2 = "C17.2"
-    C17_3 = "C17.3"
-    C17_8 = "C17.8"
-    C17_9 = "C17.9"
-    C18 = "C18"
-    C18_0 = "C18.0"
-    C18_1 = "C18.1"
-    C18_2 = "C18.2"
-    C18_3 = "C18.3"
-    C18_4 = "C18.4"
-    C18_5 = "C18.5"
-    C18_6 = "C18.6"
-    C18_7 = "C18.7"
-    C18_8 = "C18.8"
-    C18_9 = "C18.9"
-    C19 = "C19"
-    C20 = "C20"
-    C21 = "C21"
-    C21_0 = "C21.0"
-    C21_1 = "C21.1"
-    C21_2 = "C21.2"
-    C21_8 = "C21.8"
-    C22 = "C22"
-    C22_0 = "C22.0"
-    C22_1 = "C22.1"
-    C22_2 = "C22.2"
-    C22_3 = "C22.3"
-    C22_4 = "C22.4"
-    C22_7 = "C22.7"
-    C22_9 = "C22.9"
-    C23 = "C23"
-    C24 = "C24"
-    C24_0 = "C24.0"
-    C24_1 = "C24.1"
-    C24_8 = "C24.8"
-    C24_9 = "C24.9"
-    C25 = "C25"
-    C25_0 = "C25.0"
-    C25_1 = "C25.1"
-    C25_2 = "C25.2"
-    C25_3 = "C25.3"
-    C25_4 = "C25.4"
-    C25_7 = "C25.7"
-    C25_8 = "C25.8"
-    C25_9 = "C25.9"
-    C26 = "C26"
-    C26_0 = "C26.0"
-    C26_1 = "C26.1"
-    C26_8 = "C26.8"
-    C26_9 = "C26.9"
-    C30_C39 = "C30-C39"
-    C30 = "C30"
-    C30_0 = "C30.0"
-    C30_1 = "C30.1"
-    C31 = "C31"
-    C31_0 = "C31.0"
-    C31_1 = "C31.1"
-    C31_2 = "C31.2"
-    C31_3 = "C31.3"
-    C31_8 = "C31.8"
-    C31_9 = "C31.9"
-    C32 = "C32"
-    C32_0 = "C32.0"
-    C32_1 = "C32.1"
-    C32_2 = "C32.2"
-    C32_3 = "C32.3"
-    C32_8 = "C32.8"
-    C32_9 = "C32.9"
-    C33 = "C33"
-    C34 = "C34"
-    C34_0 = "C34.0"
-    C34_1 = "C34.1"
-    C34_2 = "C34.2"
-    C34_3 = "C34.3"
-    C34_8 = "C34.8"
-    C34_9 = "C34.9"
-    C37 = "C37"
-    C38 = "C38"
-    C38_0 = "C38.0"
-    C38_1 = "C38.1"
-    C38_2 = "C38.2"
-    C38_3 = "C38.3"
-    C38_4 = "C38.4"
-    C38_8 = "C38.8"
-    C39 = "C39"
-    C39_0 = "C39.0"
-    C39_8 = "C39.8"
-    C39_9 = "C39.9"
-    C40_C41 = "C40-C41"
-    C40 = "C40"
-    C40_0 = "C40.0"
-    C40_1 = "C40.1"
-    C40_2 = "C40.2"
-    C40_3 = "C40.3"
-    C40_8 = "C40.8"
-    C40_9 = "C40.9"
-    C41 = "C41"
-    C41_0 = "C41.0"
-    C41_1 = "C41.1"
-    C41_2 = "C41.2"
-    C41_3 = "C41.3"
-    C41_4 = "C41.4"
-    C41_8 = "C41.8"
-    C41_9 = "C41.9"
-    C43_C44 = "C43-C44"
-    C43 = "C43"
-    C43_0 = "C43.0"
-    C43_1 = "C43.1"
-    C43_2 = "C43.2"
-    C43_3 = "C43.3"
-    C43_4 = "C43.4"
-    C43_5 = "C43.5"
-    C43_6 = "C43.6"
-    C43_7 = "C43.7"
-    C43_8 = "C43.8"
-    C43_9 = "C43.9"
-    C44 = "C44"
-    C44_0 = "C44.0"
-    C44_1 = "C44.1"
-    C44_2 = "C44.2"
-    C44_3 = "C44.3"
-    C44_4 = "C44.4"
-    C44_5 = "C44.5"
-    C44_6 = "C44.6"
-    C44_7 = "C44.7"
-    C44_8 = "C44.8"
-    C44_9 = "C44.9"
-    C45_C49 = "C45-C49"
-    C45 = "C45"
-    C45_0 = "C45.0"
-    C45_1 = "C45.1"
-    C45_2 = "C45.2"
-    C45_7 = "C45.7"
-    C45_9 = "C45.9"
-    C46 = "C46"
-    C46_0 = "C46.0"
-    C46_1 = "C46.1"
-    C46_2 = "C46.2"
-    C46_3 = "C46.3"
-    C46_7 = "C46.7"
-    C46_8 = "C46.8"
-    C46_9 = "C46.9"
-    C47 = "C47"
-    C47_0 = "C47.0"
-    C47_1 = "C47.1"
-    C47_2 = "C47.2"
-    C47_3 = "C47.3"
-    C47_4 = "C47.4"
-    C47_5 = "C47.5"
-    C47_6 = "C47.6"
-    C47_8 = "C47.8"
-    C47_9 = "C47.9"
-    C48 = "C48"
-    C48_0 = "C48.0"
-    C48_1 = "C48.1"
-    C48_2 = "C48.2"
-    C48_8 = "C48.8"
-    C49 = "C49"
-    C49_0 = "C49.0"
-    C49_1 = "C49.1"
-    C49_2 = "C49.2"
-    C49_3 = "C49.3"
-    C49_4 = "C49.4"
-    C49_5 = "C49.5"
-    C49_6 = "C49.6"
-    C49_8 = "C49.8"
-    C49_9 = "C49.9"
-    C50_C50 = "C50-C50"
-    C50 = "C50"
-    C50_0 = "C50.0"
-    C50_1 = "C50.1"
-    C50_2 = "C50.2"
-    C50_3 = "C50.3"
-    C50_4 = "C50.4"
-    C50_5 = "C50.5"
-    C50_6 = "C50.6"
-    C50_8 = "C50.8"
-    C50_9 = "C50.9"
-    C51_C58 = "C51-C58"
-    C51 = "C51"
-    C51_0 = "C51.0"
-    C51_1 = "C51.1"
-    C51_2 = "C51.2"
-    C51_8 = "C51.8"
-    C51_9 = "C51.9"
-    C52 = "C52"
-    C53 = "C53"
-    C53_0 = "C53.0"
-    C53_1 = "C53.1"
-    C53_8 = "C53.8"
-    C53_9 = "C53.9"
-    C54 = "C54"
-    C54_0 = "C54.0"
-    C54_1 = "C54.1"
-    C54_2 = "C54.2"
-    C54_3 = "C54.3"
-    C54_8 = "C54.8"
-    C54_9 = "C54.9"
-    C55 = "C55"
-    C56 = "C56"
-    C57 = "C57"
-    C57_0 = "C57.0"
-    C57_1 = "C57.1"
-    C57_2 = "C57.2"
-    C57_3 = "C57.3"
-    C57_4 = "C57.4"
-    C57_7 = "C57.7"
-    C57_8 = "C57.8"
-    C57_9 = "C57.9"
-    C58 = "C58"
-    C60_C63 = "C60-C63"
-    C60 = "C60"
-    C60_0 = "C60.0"
-    C60_1 = "C60.1"
-    C60_2 = "C60.2"
-    C60_8 = "C60.8"
-    C60_9 = "C60.9"
-    C61 = "C61"
-    C62 = "C62"
-    C62_0 = "C62.0"
-    C62_1 = "C62.1"
-    C62_9 = "C62.9"
-    C63 = "C63"
-    C63_0 = "C63.0"
-    C63_1 = "C63.1"
-    C63_2 = "C63.2"
-    C63_7 = "C63.7"
-    C63_8 = "C63.8"
-    C63_9 = "C63.9"
-    C64_C68 = "C64-C68"
-    C64 = "C64"
-    C65 = "C65"
-    C66 = "C66"
-    C67 = "C67"
-    C67_0 = "C67.0"
-    C67_1 = "C67.1"
-    C67_2 = "C67.2"
-    C67_3 = "C67.3"
-    C67_4 = "C67.4"
-    C67_5 = "C67.5"
-    C67_6 = "C67.6"
-    C67_7 = "C67.7"
-    C67_8 = "C67.8"
-    C67_9 = "C67.9"
-    C68 = "C68"
-    C68_0 = "C68.0"
-    C68_1 = "C68.1"
-    C68_8 = "C68.8"
-    C68_9 = "C68.9"
-    C69_C72 = "C69-C72"
-    C69 = "C69"
-    C69_0 = "C69.0"
-    C69_1 = "C69.1"
-    C69_2 = "C69.2"
-    C69_3 = "C69.3"
-    C69_4 = "C69.4"
-    C69_5 = "C69.5"
-    C69_6 = "C69.6"
-    C69_8 = "C69.8"
-    C69_9 = "C69.9"
-    C70 = "C70"
-    C70_0 = "C70.0"
-    C70_1 = "C70.1"
-    C70_9 = "C70.9"
-    C71 = "C71"
-    C71_0 = "C71.0"
-    C71_1 = "C71.1"
-    C71_2 = "C71.2"
-    C71_3 = "C71.3"
-    C71_4 = "C71.4"
-    C71_5 = "C71.5"
-    C71_6 = "C71.6"
-    C71_7 = "C71.7"
-    C71_8 = "C71.8"
-    C71_9 = "C71.9"
-    C72 = "C72"
-    C72_0 = "C72.0"
-    C72_1 = "C72.1"
-    C72_2 = "C72.2"
-    C72_3 = "C72.3"
-    C72_4 = "C72.4"
-    C72_5 = "C72.5"
-    C72_8 = "C72.8"
-    C72_9 = "C72.9"
-    C73_C75 = "C73-C75"
-    C73 = "C73"
-    C74 = "C74"
-    C74_0 = "C74.0"
-    C74_1 = "C74.1"
-    C74_9 = "C74.9"
-    C75 = "C75"
-    C75_0 = "C75.0"
-    C75_1 = "C75.1"
-    C75_2 = "C75.2"
-    C75_3 = "C75.3"
-    C75_4 = "C75.4"
-    C75_5 = "C75.5"
-    C75_8 = "C75.8"
-    C75_9 = "C75.9"
-    C76_C80 = "C76-C80"
-    C76 = "C76"
-    C76_0 = "C76.0"
-    C76_1 = "C76.1"
-    C76_2 = "C76.2"
-    C76_3 = "C76.3"
-    C76_4 = "C76.4"
-    C76_5 = "C76.5"
-    C76_7 = "C76.7"
-    C76_8 = "C76.8"
-    C77 = "C77"
-    C77_0 = "C77.0"
-    C77_1 = "C77.1"
-    C77_2 = "C77.2"
-    C77_3 = "C77.3"
-    C77_4 = "C77.4"
-    C77_5 = "C77.5"
-    C77_8 = "C77.8"
-    C77_9 = "C77.9"
-    C78 = "C78"
-    C78_0 = "C78.0"
-    C78_1 = "C78.1"
-    C78_2 = "C78.2"
-    C78_3 = "C78.3"
-    C78_4 = "C78.4"
-    C78_5 = "C78.5"
-    C78_6 = "C78.6"
-    C78_7 = "C78.7"
-    C78_8 = "C78.8"
-    C79 = "C79"
-    C79_0 = "C79.0"
-    C79_1 = "C79.1"
-    C79_2 = "C79.2"
-    C79_3 = "C79.3"
-    C79_4 = "C79.4"
-    C79_5 = "C79.5"
-    C79_6 = "C79.6"
-    C79_7 = "C79.7"
-    C79_8 = "C79.8"
-    C80 = "C80"
-    C81_C96 = "C81-C96"
-    C81 = "C81"
-    C81_0 = "C81.0"
-    C81_1 = "C81.1"
-    C81_2 = "C81.2"
-    C81_3 = "C81.3"
-    C81_7 = "C81.7"
-    C81_9 = "C81.9"
-    C82 = "C82"
-    C82_0 = "C82.0"
-    C82_1 = "C82.1"
-    C82_2 = "C82.2"
-    C82_7 = "C82.7"
-    C82_9 = "C82.9"
-    C83 = "C83"
-    C83_0 = "C83.0"
-    C83_1 = "C83.1"
-    C83_2 = "C83.2"
-    C83_3 = "C83.3"
-    C83_4 = "C83.4"
-    C83_5 = "C83.5"
-    C83_6 = "C83.6"
-    C83_7 = "C83.7"
-    C83_8 = "C83.8"
-    C83_9 = "C83.9"
-    C84 = "C84"
-    C84_0 = "C84.0"
-    C84_1 = "C84.1"
-    C84_2 = "C84.2"
-    C84_3 = "C84.3"
-    C84_4 = "C84.4"
-    C84_5 = "C84.5"
-    C85 = "C85"
-    C85_0 = "C85.0"
-    C85_1 = "C85.1"
-    C85_7 = "C85.7"
-    C85_9 = "C85.9"
-    C88 = "C88"
-    C88_0 = "C88.0"
-    C88_1 = "C88.1"
-    C88_2 = "C88.2"
-    C88_3 = "C88.3"
-    C88_7 = "C88.7"
-    C88_9 = "C88.9"
-    C90 = "C90"
-    C90_0 = "C90.0"
-    C90_1 = "C90.1"
-    C90_2 = "C90.2"
-    C91 = "C91"
-    C91_0 = "C91.0"
-    C91_1 = "C91.1"
-    C91_2 = "C91.2"
-    C91_3 = "C91.3"
-    C91_4 = "C91.4"
-    C91_5 = "C91.5"
-    C91_7 = "C91.7"
-    C91_9 = "C91.9"
-    C92 = "C92"
-    C92_0 = "C92.0"
-    C92_1 = "C92.1"
-    C92_2 = "C92.2"
-    C92_3 = "C92.3"
-    C92_4 = "C92.4"
-    C92_5 = "C92.5"
-    C92_7 = "C92.7"
-    C92_9 = "C92.9"
-    C93 = "C93"
-    C93_0 = "C93.0"
-    C93_1 = "C93.1"
-    C93_2 = "C93.2"
-    C93_7 = "C93.7"
-    C93_9 = "C93.9"
-    C94 = "C94"
-    C94_0 = "C94.0"
-    C94_1 = "C94.1"
-    C94_2 = "C94.2"
-    C94_3 = "C94.3"
-    C94_4 = "C94.4"
-    C94_5 = "C94.5"
-    C94_7 = "C94.7"
-    C95 = "C95"
-    C95_0 = "C95.0"
-    C95_1 = "C95.1"
-    C95_2 = "C95.2"
-    C95_7 = "C95.7"
-    C95_9 = "C95.9"
-    C96 = "C96"
-    C96_0 = "C96.0"
-    C96_1 = "C96.1"
-    C96_2 = "C96.2"
-    C96_3 = "C96.3"
-    C96_7 = "C96.7"
-    C96_9 = "C96.9"
-    C97_C97 = "C97-C97"
-    C97 = "C97"
-    D00_D09 = "D00-D09"
-    D00 = "D00"
-    D00_0 = "D00.0"
-    D00_1 = "D00.1"
-    D00_2 = "D00.2"
-    D01 = "D01"
-    D01_0 = "D01.0"
-    D01_1 = "D01.1"
-    D01_2 = "D01.2"
-    D01_3 = "D01.3"
-    D01_4 = "D01.4"
-    D01_5 = "D01.5"
-    D01_7 = "D01.7"
-    D01_9 = "D01.9"
-    D02 = "D02"
-    D02_0 = "D02.0"
-    D02_1 = "D02.1"
-    D02_2 = "D02.2"
-    D02_3 = "D02.3"
-    D02_4 = "D02.4"
-    D03 = "D03"
-    D03_0 = "D03.0"
-    D03_1 = "D03.1"
-    D03_2 = "D03.2"
-    D03_3 = "D03.3"
-    D03_4 = "D03.4"
-    D03_5 = "D03.5"
-    D03_6 = "D03.6"
-    D03_7 = "D03.7"
-    D03_8 = "D03.8"
-    D03_9 = "D03.9"
-    D04 = "D04"
-    D04_0 = "D04.0"
-    D04_1 = "D04.1"
-    D04_2 = "D04.2"
-    D04_3 = "D04.3"
-    D04_4 = "D04.4"
-    D04_5 = "D04.5"
-    D04_6 = "D04.6"
-    D04_7 = "D04.7"
-    D04_8 = "D04.8"
-    D04_9 = "D04.9"
-    D05 = "D05"
-    D05_0 = "D05.0"
-    D05_1 = "D05.1"
-    D05_7 = "D05.7"
-    D05_9 = "D05.9"
-    D06 = "D06"
-    D06_0 = "D06.0"
-    D06_1 = "D06.1"
-    D06_7 = "D06.7"
-    D06_9 = "D06.9"
-    D07 = "D07"
-    D07_0 = "D07.0"
-    D07_1 = "D07.1"
-    D07_2 = "D07.2"
-    D07_3 = "D07.3"
-    D07_4 = "D07.4"
-    D07_5 = "D07.5"
-    D07_6 = "D07.6"
-    D09 = "D09"
-    D09_0 = "D09.0"
-    D09_1 = "D09.1"
-    D09_2 = "D09.2"
-    D09_3 = "D09.3"
-    D09_7 = "D09.7"
-    D09_9 = "D09.9"
-    D10_D36 = "D10-D36"
-    D10 = "D10"
-    D10_0 = "D10.0"
-    D10_1 = "D10.1"
-    D10_2 = "D10.2"
-    D10_3 = "D10.3"
-    D10_4 = "D10.4"
-    D10_5 = "D10.5"
-    D10_6 = "D10.6"
-    D10_7 = "D10.7"
-    D10_9 = "D10.9"
-    D11 = "D11"
-    D11_0 = "D11.0"
-    D11_7 = "D11.7"
-    D11_9 = "D11.9"
-    D12 = "D12"
-    D12_0 = "D12.0"
-    D12_1 = "D12.1"
-    D12_2 = "D12.2"
-    D12_3 = "D12.3"
-    D12_4 = "D12.4"
-    D12_5 = "D12.5"
-    D12_6 = "D12.6"
-    D12_7 = "D12.7"
-    D12_8 = "D12.8"
-    D12_9 = "D12.9"
-    D13 = "D13"
-    D13_0 = "D13.0"
-    D13_1 = "D13.1"
-    D13_2 = "D13.2"
-    D13_3 = "D13.3"
-    D13_4 = "D13.4"
-    D13_5 = "D13.5"
-    D13_6 = "D13.6"
-    D13_7 = "D13.7"
-    D13_9 = "D13.9"
-    D14 = "D14"
-    D14_0 = "D14.0"
-    D14_1 = "D14.1"
-    D14_2 = "D14.2"
-    D14_3 = "D14.3"
-    D14_4 = "D14.4"
-    D15 = "D15"
-    D15_0 = "D15.0"
-    D15_1 = "D15.1"
-    D15_2 = "D15.2"
-    D15_7 = "D15.7"
-    D15_9 = "D15.9"
-    D16 = "D16"
-    D16_0 = "D16.0"
-    D16_1 = "D16.1"
-    D16_2 = "D16.2"
-    D16_3 = "D16.3"
-    D16_4 = "D16.4"
-    D16_5 = "D16.5"
-    D16_6 = "D16.6"
-    D16_7 = "D16.7"
-    D16_8 = "D16.8"
-    D16_9 = "D16.9"
-    D17 = "D17"
-    D17_0 = "D17.0"
-    D17_1 = "D17.1"
-    D17_2 = "D17.2"
-    D17_3 = "D17.3"
-    D17_4 = "D17.4"
-    D17_5 = "D17.5"
-    D17_6 = "D17.6"
-    D17_7 = "D17.7"
-    D17_9 = "D17.9"
-    D18 = "D18"
-    D18_0 = "D18.0"
-    D18_1 = "D18.1"
-    D19 = "D19"
-    D19_0 = "D19.0"
-    D19_1 = "D19.1"
-    D19_7 = "D19.7"
-    D19_9 = "D19.9"
-    D20 = "D20"
-    D20_0 = "D20.0"
-    D20_1 = "D20.1"
-    D21 = "D21"
-    D21_0 = "D21.0"
-    D21_1 = "D21.1"
-    D21_2 = "D21.2"
-    D21_3 = "D21.3"
-    D21_4 = "D21.4"
-    D21_5 = "D21.5"
-    D21_6 = "D21.6"
-    D21_9 = "D21.9"
-    D22 = "D22"
-    D22_0 = "D22.0"
-    D22_1 = "D22.1"
-    D22_2 = "D22.2"
-    D22_3 = "D22.3"
-    D22_4 = "D22.4"
-    D22_5 = "D22.5"
-    D22_6 = "D22.6"
-    D22_7 = "D22.7"
-    D22_9 = "D22.9"
-    D23 = "D23"
-    D23_0 = "D23.0"
-    D23_1 = "D23.1"
-    D23_2 = "D23.2"
-    D23_3 = "D23.3"
-    D23_4 = "D23.4"
-    D23_5 = "D23.5"
-    D23_6 = "D23.6"
-    D23_7 = "D23.7"
-    D23_9 = "D23.9"
-    D24 = "D24"
-    D25 = "D25"
-    D25_0 = "D25.0"
-    D25_1 = "D25.1"
-    D25_2 = "D25.2"
-    D25_9 = "D25.9"
-    D26 = "D26"
-    D26_0 = "D26.0"
-    D26_1 = "D26.1"
-    D26_7 = "D26.7"
-    D26_9 = "D26.9"
-    D27 = "D27"
-    D28 = "D28"
-    D28_0 = "D28.0"
-    D28_1 = "D28.1"
-    D28_2 = "D28.2"
-    D28_7 = "D28.7"
-    D28_9 = "D28.9"
-    D29 = "D29"
-    D29_0 = "D29.0"
-    D29_1 = "D29.1"
-    D29_2 = "D29.2"
-    D29_3 = "D29.3"
-    D29_4 = "D29.4"
-    D29_7 = "D29.7"
-    D29_9 = "D29.9"
-    D30 = "D30"
-    D30_0 = "D30.0"
-    D30_1 = "D30.1"
-    D30_2 = "D30.2"
-    D30_3 = "D30.3"
-    D30_4 = "D30.4"
-    D30_7 = "D30.7"
-    D30_9 = "D30.9"
-    D31 = "D31"
-    D31_0 = "D31.0"
-    D31_1 = "D31.1"
-    D31_2 = "D31.2"
-    D31_3 = "D31.3"
-    D31_4 = "D31.4"
-    D31_5 = "D31.5"
-    D31_6 = "D31.6"
-    D31_9 = "D31.9"
-    D32 = "D32"
-    D32_0 = "D32.0"
-    D32_1 = "D32.1"
-    D32_9 = "D32.9"
-    D33 = "D33"
-    D33_0 = "D33.0"
-    D33_1 = "D33.1"
-    D33_2 = "D33.2"
-    D33_3 = "D33.3"
-    D33_4 = "D33.4"
-    D33_7 = "D33.7"
-    D33_9 = "D33.9"
-    D34 = "D34"
-    D35 = "D35"
-    D35_0 = "D35.0"
-    D35_1 = "D35.1"
-    D35_2 = "D35.2"
-    D35_3 = "D35.3"
-    D35_4 = "D35.4"
-    D35_5 = "D35.5"
-    D35_6 = "D35.6"
-    D35_7 = "D35.7"
-    D35_8 = "D35.8"
-    D35_9 = "D35.9"
-    D36 = "D36"
-    D36_0 = "D36.0"
-    D36_1 = "D36.1"
-    D36_7 = "D36.7"
-    D36_9 = "D36.9"
-    D37_D48 = "D37-D48"
-    D37 = "D37"
-    D37_0 = "D37.0"
-    D37_1 = "D37.1"
-    D37_2 = "D37.2"
-    D37_3 = "D37.3"
-    D37_4 = "D37.4"
-    D37_5 = "D37.5"
-    D37_6 = "D37.6"
-    D37_7 = "D37.7"
-    D37_9 = "D37.9"
-    D38 = "D38"
-    D38_0 = "D38.0"
-    D38_1 = "D38.1"
-    D38_2 = "D38.2"
-    D38_3 = "D38.3"
-    D38_4 = "D38.4"
-    D38_5 = "D38.5"
-    D38_6 = "D38.6"
-    D39 = "D39"
-    D39_0 = "D39.0"
-    D39_1 = "D39.1"
-    D39_2 = "D39.2"
-    D39_7 = "D39.7"
-    D39_9 = "D39.9"
-    D40 = "D40"
-    D40_0 = "D40.0"
-    D40_1 = "D40.1"
-    D40_7 = "D40.7"
-    D40_9 = "D40.9"
-    D41 = "D41"
-    D41_0 = "D41.0"
-    D41_1 = "D41.1"
-    D41_2 = "D41.2"
-    D41_3 = "D41.3"
-    D41_4 = "D41.4"
-    D41_7 = "D41.7"
-    D41_9 = "D41.9"
-    D42 = "D42"
-    D42_0 = "D42.0"
-    D42_1 = "D42.1"
-    D42_9 = "D42.9"
-    D43 = "D43"
-    D43_0 = "D43.0"
-    D43_1 = "D43.1"
-    D43_2 = "D43.2"
-    D43_3 = "D43.3"
-    D43_4 = "D43.4"
-    D43_7 = "D43.7"
-    D43_9 = "D43.9"
-    D44 = "D44"
-    D44_0 = "D44.0"
-    D44_1 = "D44.1"
-    D44_2 = "D44.2"
-    D44_3 = "D44.3"
-    D44_4 = "D44.4"
-    D44_5 = "D44.5"
-    D44_6 = "D44.6"
-    D44_7 = "D44.7"
-    D44_8 = "D44.8"
-    D44_9 = "D44.9"
-    D45 = "D45"
-    D46 = "D46"
-    D46_0 = "D46.0"
-    D46_1 = "D46.1"
-    D46_2 = "D46.2"
-    D46_3 = "D46.3"
-    D46_4 = "D46.4"
-    D46_7 = "D46.7"
-    D46_9 = "D46.9"
-    D47 = "D47"
-    D47_0 = "D47.0"
-    D47_1 = "D47.1"
-    D47_2 = "D47.2"
-    D47_3 = "D47.3"
-    D47_7 = "D47.7"
-    D47_9 = "D47.9"
-    D48 = "D48"
-    D48_0 = "D48.0"
-    D48_1 = "D48.1"
-    D48_2 = "D48.2"
-    D48_3 = "D48.3"
-    D48_4 = "D48.4"
-    D48_5 = "D48.5"
-    D48_6 = "D48.6"
-    D48_7 = "D48.7"
-    D48_9 = "D48.9"
-    D50_D89 = "D50-D89"
-    D50_D53 = "D50-D53"
-    D50 = "D50"
-    D50_0 = "D50.0"
-    D50_1 = "D50.1"
-    D50_8 = "D50.8"
-    D50_9 = "D50.9"
-    D51 = "D51"
-    D51_0 = "D51.0"
-    D51_1 = "D51.1"
-    D51_2 = "D51.2"
-    D51_3 = "D51.3"
-    D51_8 = "D51.8"
-    D51_9 = "D51.9"
-    D52 = "D52"
-    D52_0 = "D52.0"
-    D52_1 = "D52.1"
-    D52_8 = "D52.8"
-    D52_9 = "D52.9"
-    D53 = "D53"
-    D53_0 = "D53.0"
-    D53_1 = "D53.1"
-    D53_2 = "D53.2"
-    D53_8 = "D53.8"
-    D53_9 = "D53.9"
-    D55_D59 = "D55-D59"
-    D55 = "D55"
-    D55_0 = "D55.0"
-    D55_1 = "D55.1"
-    D55_2 = "D55.2"
-    D55_3 = "D55.3"
-    D55_8 = "D55.8"
-    D55_9 = "D55.9"
-    D56 = "D56"
-    D56_0 = "D56.0"
-    D56_1 = "D56.1"
-    D56_2 = "D56.2"
-    D56_3 = "D56.3"
-    D56_4 = "D56.4"
-    D56_8 = "D56.8"
-    D56_9 = "D56.9"
-    D57 = "D57"
-    D57_0 = "D57.0"
-    D57_1 = "D57.1"
-    D57_2 = "D57.2"
-    D57_3 = "D57.3"
-    D57_8 = "D57.8"
-    D58 = "D58"
-    D58_0 = "D58.0"
-    D58_1 = "D58.1"
-    D58_2 = "D58.2"
-    D58_8 = "D58.8"
-    D58_9 = "D58.9"
-    D59 = "D59"
-    D59_0 = "D59.0"
-    D59_1 = "D59.1"
-    D59_2 = "D59.2"
-    D59_3 = "D59.3"
-    D59_4 = "D59.4"
-    D59_5 = "D59.5"
-    D59_6 = "D59.6"
-    D59_8 = "D59.8"
-    D59_9 = "D59.9"
-    D60_D64 = "D60-D64"
-    D60 = "D60"
-    D60_0 = "D60.0"
-    D60_1 = "D60.1"
-    D60_8 = "D60.8"
-    D60_9 = "D60.9"
-    D61 = "D61"
-    D61_0 = "D61.0"
-    D61_1 = "D61.1"
-    D61_2 = "D61.2"
-    D61_3 = "D61.3"
-    D61_8 = "D61.8"
-    D61_9 = "D61.9"
-    D62 = "D62"
-    D64 = "D64"
-    D64_0 = "D64.0"
-    D64_1 = "D64.1"
-    D64_2 = "D64.2"
-    D64_3 = "D64.3"
-    D64_4 = "D64.4"
-    D64_8 = "D64.8"
-    D64_9 = "D64.9"
-    D65_D69 = "D65-D69"
-    D65 = "D65"
-    D66 = "D66"
-    D67 = "D67"
-    D68 = "D68"
-    D68_0 = "D68.0"
-    D68_1 = "D68.1"
-    D68_2 = "D68.2"
-    D68_3 = "D68.3"
-    D68_4 = "D68.4"
-    D68_5 = "D68.5"
-    D68_6 = "D68.6"
-    D68_8 = "D68.8"
-    D68_9 = "D68.9"
-    D69 = "D69"
-    D69_0 = "D69.0"
-    D69_1 = "D69.1"
-    D69_2 = "D69.2"
-    D69_3 = "D69.3"
-    D69_4 = "D69.4"
-    D69_5 = "D69.5"
-    D69_6 = "D69.6"
-    D69_8 = "D69.8"
-    D69_9 = "D69.9"
-    D70_D76 = "D70-D76"
-    D70 = "D70"
-    D71 = "D71"
-    D72 = "D72"
-    D72_0 = "D72.0"
-    D72_1 = "D72.1"
-    D72_8 = "D72.8"
-    D72_9 = "D72.9"
-    D73 = "D73"
-    D73_0 = "D73.0"
-    D73_1 = "D73.1"
-    D73_2 = "D73.2"
-    D73_3 = "D73.3"
-    D73_4 = "D73.4"
-    D73_5 = "D73.5"
-    D73_8 = "D73.8"
-    D73_9 = "D73.9"
-    D74 = "D74"
-    D74_0 = "D74.0"
-    D74_8 = "D74.8"
-    D74_9 = "D74.9"
-    D75 = "D75"
-    D75_0 = "D75.0"
-    D75_1 = "D75.1"
-    D75_2 = "D75.2"
-    D75_8 = "D75.8"
-    D75_9 = "D75.9"
-    D76 = "D76"
-    D76_0 = "D76.0"
-    D76_1 = "D76.1"
-    D76_2 = "D76.2"
-    D76_3 = "D76.3"
-    D80_D89 = "D80-D89"
-    D80 = "D80"
-    D80_0 = "D80.0"
-    D80_1 = "D80.1"
-    D80_2 = "D80.2"
-    D80_3 = "D80.3"
-    D80_4 = "D80.4"
-    D80_5 = "D80.5"
-    D80_6 = "D80.6"
-    D80_7 = "D80.7"
-    D80_8 = "D80.8"
-    D80_9 = "D80.9"
-    D81 = "D81"
-    D81_0 = "D81.0"
-    D81_1 = "D81.1"
-    D81_2 = "D81.2"
-    D81_3 = "D81.3"
-    D81_4 = "D81.4"
-    D81_5 = "D81.5"
-    D81_6 = "D81.6"
-    D81_7 = "D81.7"
-    D81_8 = "D81.8"
-    D81_9 = "D81.9"
-    D82 = "D82"
-    D82_0 = "D82.0"
-    D82_1 = "D82.1"
-    D82_2 = "D82.2"
-    D82_3 = "D82.3"
-    D82_4 = "D82.4"
-    D82_8 = "D82.8"
-    D82_9 = "D82.9"
-    D83 = "D83"
-    D83_0 = "D83.0"
-    D83_1 = "D83.1"
-    D83_2 = "D83.2"
-    D83_8 = "D83.8"
-    D83_9 = "D83.9"
-    D84 = "D84"
-    D84_0 = "D84.0"
-    D84_1 = "D84.1"
-    D84_8 = "D84.8"
-    D84_9 = "D84.9"
-    D86 = "D86"
-    D86_0 = "D86.0"
-    D86_1 = "D86.1"
-    D86_2 = "D86.2"
-    D86_3 = "D86.3"
-    D86_8 = "D86.8"
-    D86_9 = "D86.9"
-    D89 = "D89"
-    D89_0 = "D89.0"
-    D89_1 = "D89.1"
-    D89_2 = "D89.2"
-    D89_3 = "D89.3"
-    D89_8 = "D89.8"
-    D89_9 = "D89.9"
-    E00_E88 = "E00-E88"
-    E00_E07 = "E00-E07"
-    E00 = "E00"
-    E00_0 = "E00.0"
-    E00_1 = "E00.1"
-    E00_2 = "E00.2"
-    E00_9 = "E00.9"
-    E01 = "E01"
-    E01_0 = "E01.0"
-    E01_1 = "E01.1"
-    E01_2 = "E01.2"
-    E01_8 = "E01.8"
-    E02 = "E02"
-    E03 = "E03"
-    E03_0 = "E03.0"
-    E03_1 = "E03.1"
-    E03_2 = "E03.2"
-    E03_3 = "E03.3"
-    E03_4 = "E03.4"
-    E03_5 = "E03.5"
-    E03_8 = "E03.8"
-    E03_9 = "E03.9"
-    E04 = "E04"
-    E04_0 = "E04.0"
-    E04_1 = "E04.1"
-    E04_2 = "E04.2"
-    E04_8 = "E04.8"
-    E04_9 = "E04.9"
-    E05 = "E05"
-    E05_0 = "E05.0"
-    E05_1 = "E05.1"
-    E05_2 = "E05.2"
-    E05_3 = "E05.3"
-    E05_4 = "E05.4"
-    E05_5 = "E05.5"
-    E05_8 = "E05.8"
-    E05_9 = "E05.9"
-    E06 = "E06"
-    E06_0 = "E06.0"
-    E06_1 = "E06.1"
-    E06_2 = "E06.2"
-    E06_3 = "E06.3"
-    E06_4 = "E06.4"
-    E06_5 = "E06.5"
-    E06_9 = "E06.9"
-    E07 = "E07"
-    E07_0 = "E07.0"
-    E07_1 = "E07.1"
-    E07_8 = "E07.8"
-    E07_9 = "E07.9"
-    E10_E14 = "E10-E14"
-    E10 = "E10"
-    E10_0 = "E10.0"
-    E10_1 = "E10.1"
-    E10_2 = "E10.2"
-    E10_3 = "E10.3"
-    E10_4 = "E10.4"
-    E10_5 = "E10.5"
-    E10_6 = "E10.6"
-    E10_7 = "E10.7"
-    E10_8 = "E10.8"
-    E10_9 = "E10.9"
-    E11 = "E11"
-    E11_0 = "E11.0"
-    E11_1 = "E11.1"
-    E11_2 = "E11.2"
-    E11_3 = "E11.3"
-    E11_4 = "E11.4"
-    E11_5 = "E11.5"
-    E11_6 = "E11.6"
-    E11_7 = "E11.7"
-    E11_8 = "E11.8"
-    E11_9 = "E11.9"
-    E12 = "E12"
-    E12_0 = "E12.0"
-    E12_1 = "E12.1"
-    E12_2 = "E12.2"
-    E12_3 = "E12.3"
-    E12_4 = "E12.4"
-    E12_5 = "E12.5"
-    E12_6 = "E12.6"
-    E12_7 = "E12.7"
-    E12_8 = "E12.8"
-    E12_9 = "E12.9"
-    E13 = "E13"
-    E13_0 = "E13.0"
-    E13_1 = "E13.1"
-    E13_2 = "E13.2"
-    E13_3 = "E13.3"
-    E13_4 = "E13.4"
-    E13_5 = "E13.5"
-    E13_6 = "E13.6"
-    E13_7 = "E13.7"
-    E13_8 = "E13.8"
-    E13_9 = "E13.9"
-    E14 = "E14"
-    E14_0 = "E14.0"
-    E14_1 = "E14.1"
-    E14_2 = "E14.2"
-    E14_3 = "E14.3"
-    E14_4 = "E14.4"
-    E14_5 = "E14.5"
-    E14_6 = "E14.6"
-    E14_7 = "E14.7"
-    E14_8 = "E14.8"
-    E14_9 = "E14.9"
-    E15_E16 = "E15-E16"
-    E15 = "E15"
-    E16 = "E16"
-    E16_0 = "E16.0"
-    E16_1 = "E16.1"
-    E16_2 = "E16.2"
-    E16_3 = "E16.3"
-    E16_4 = "E16.4"
-    E16_8 = "E16.8"
-    E16_9 = "E16.9"
-    E20_E34 = "E20-E34"
-    E20 = "E20"
-    E20_0 = "E20.0"
-    E20_1 = "E20.1"
-    E20_8 = "E20.8"
-    E20_9 = "E20.9"
-    E21 = "E21"
-    E21_0 = "E21.0"
-    E21_1 = "E21.1"
-    E21_2 = "E21.2"
-    E21_3 = "E21.3"
-    E21_4 = "E21.4"
-    E21_5 = "E21.5"
-    E22 = "E22"
-    E22_0 = "E22.0"
-    E22_1 = "E22.1"
-    E22_2 = "E22.2"
-    E22_8 = "E22.8"
-    E22_9 = "E22.9"
-    E23 = "E23"
-    E23_0 = "E23.0"
-    E23_1 = "E23.1"
-    E23_2 = "E23.2"
-    E23_3 = "E23.3"
-    E23_6 = "E23.6"
-    E23_7 = "E23.7"
-    E24 = "E24"
-    E24_0 = "E24.0"
-    E24_1 = "E24.1"
-    E24_2 = "E24.2"
-    E24_3 = "E24.3"
-    E24_4 = "E24.4"
-    E24_8 = "E24.8"
-    E24_9 = "E24.9"
-    E25 = "E25"
-    E25_0 = "E25.0"
-    E25_8 = "E25.8"
-    E25_9 = "E25.9"
-    E26 = "E26"
-    E26_0 = "E26.0"
-    E26_1 = "E26.1"
-    E26_8 = "E26.8"
-    E26_9 = "E26.9"
-    E27 = "E27"
-    E27_0 = "E27.0"
-    E27_1 = "E27.1"
-    E27_2 = "E27.2"
-    E27_3 = "E27.3"
-    E27_4 = "E27.4"
-    E27_5 = "E27.5"
-    E27_8 = "E27.8"
-    E27_9 = "E27.9"
-    E28 = "E28"
-    E28_0 = "E28.0"
-    E28_1 = "E28.1"
-    E28_2 = "E28.2"
-    E28_3 = "E28.3"
-    E28_8 = "E28.8"
-    E28_9 = "E28.9"
-    E29 = "E29"
-    E29_0 = "E29.0"
-    E29_1 = "E29.1"
-    E29_8 = "E29.8"
-    E29_9 = "E29.9"
-    E30 = "E30"
-    E30_0 = "E30.0"
-    E30_1 = "E30.1"
-    E30_8 = "E30.8"
-    E30_9 = "E30.9"
-    E31 = "E31"
-    E31_0 = "E31.0"
-    E31_1 = "E31.1"
-    E31_8 = "E31.8"
-    E31_9 = "E31.9"
-    E32 = "E32"
-    E32_0 = "E32.0"
-    E32_1 = "E32.1"
-    E32_8 = "E32.8"
-    E32_9 = "E32.9"
-    E34 = "E34"
-    E34_0 = "E34.0"
-    E34_1 = "E34.1"
-    E34_2 = "E34.2"
-    E34_3 = "E34.3"
-    E34_4 = "E34.4"
-    E34_5 = "E34.5"
-    E34_8 = "E34.8"
-    E34_9 = "E34.9"
-    E40_E46 = "E40-E46"
-    E40 = "E40"
-    E41 = "E41"
-    E42 = "E42"
-    E43 = "E43"
-    E44 = "E44"
-    E44_0 = "E44.0"
-    E44_1 = "E44.1"
-    E45 = "E45"
-    E46 = "E46"
-    E50_E64 = "E50-E64"
-    E50 = "E50"
-    E50_0 = "E50.0"
-    E50_1 = "E50.1"
-    E50_2 = "E50.2"
-    E50_3 = "E50.3"
-    E50_4 = "E50.4"
-    E50_5 = "E50.5"
-    E50_6 = "E50.6"
-    E50_7 = "E50.7"
-    E50_8 = "E50.8"
-    E50_9 = "E50.9"
-    E51 = "E51"
-    E51_1 = "E51.1"
-    E51_2 = "E51.2"
-    E51_8 = "E51.8"
-    E51_9 = "E51.9"
-    E52 = "E52"
-    E53 = "E53"
-    E53_0 = "E53.0"
-    E53_1 = "E53.1"
-    E53_8 = "E53.8"
-    E53_9 = "E53.9"
-    E54 = "E54"
-    E55 = "E55"
-    E55_0 = "E55.0"
-    E55_9 = "E55.9"
-    E56 = "E56"
-    E56_0 = "E56.0"
-    E56_1 = "E56.1"
-    E56_8 = "E56.8"
-    E56_9 = "E56.9"
-    E58 = "E58"
-    E59 = "E59"
-    E60 = "E60"
-    E61 = "E61"
-    E61_0 = "E61.0"
-    E61_1 = "E61.1"
-    E61_2 = "E61.2"
-    E61_3 = "E61.3"
-    E61_4 = "E61.4"
-    E61_5 = "E61.5"
-    E61_6 = "E61.6"
-    E61_7 = "E61.7"
-    E61_8 = "E61.8"
-    E61_9 = "E61.9"
-    E63 = "E63"
-    E63_0 = "E63.0"
-    E63_1 = "E63.1"
-    E63_8 = "E63.8"
-    E63_9 = "E63.9"
-    E64 = "E64"
-    E64_0 = "E64.0"
-    E64_1 = "E64.1"
-    E64_2 = "E64.2"
-    E64_3 = "E64.3"
-    E64_8 = "E64.8"
-    E64_9 = "E64.9"
-    E65_E68 = "E65-E68"
-    E65 = "E65"
-    E66 = "E66"
-    E66_0 = "E66.0"
-    E66_1 = "E66.1"
-    E66_2 = "E66.2"
-    E66_8 = "E66.8"
-    E66_9 = "E66.9"
-    E67 = "E67"
-    E67_0 = "E67.0"
-    E67_1 = "E67.1"
-    E67_2 = "E67.2"
-    E67_3 = "E67.3"
-    E67_8 = "E67.8"
-    E68 = "E68"
-    E70_E88 = "E70-E88"
-    E70 = "E70"
-    E70_0 = "E70.0"
-    E70_1 = "E70.1"
-    E70_2 = "E70.2"
-    E70_3 = "E70.3"
-    E70_8 = "E70.8"
-    E70_9 = "E70.9"
-    E71 = "E71"
-    E71_0 = "E71.0"
-    E71_1 = "E71.1"
-    E71_2 = "E71.2"
-    E71_3 = "E71.3"
-    E72 = "E72"
-    E72_0 = "E72.0"
-    E72_1 = "E72.1"
-    E72_2 = "E72.2"
-    E72_3 = "E72.3"
-    E72_4 = "E72.4"
-    E72_5 = "E72.5"
-    E72_8 = "E72.8"
-    E72_9 = "E72.9"
-    E73 = "E73"
-    E73_0 = "E73.0"
-    E73_1 = "E73.1"
-    E73_8 = "E73.8"
-    E73_9 = "E73.9"
-    E74 = "E74"
-    E74_0 = "E74.0"
-    E74_1 = "E74.1"
-    E74_2 = "E74.2"
-    E74_3 = "E74.3"
-    E74_4 = "E74.4"
-    E74_8 = "E74.8"
-    E74_9 = "E74.9"
-    E75 = "E75"
-    E75_0 = "E75.0"
-    E75_1 = "E75.1"
-    E75_2 = "E75.2"
-    E75_3 = "E75.3"
-    E75_4 = "E75.4"
-    E75_5 = "E75.5"
-    E75_6 = "E75.6"
-    E76 = "E76"
-    E76_0 = "E76.0"
-    E76_1 = "E76.1"
-    E76_2 = "E76.2"
-    E76_3 = "E76.3"
-    E76_8 = "E76.8"
-    E76_9 = "E76.9"
-    E77 = "E77"
-    E77_0 = "E77.0"
-    E77_1 = "E77.1"
-    E77_8 = "E77.8"
-    E77_9 = "E77.9"
-    E78 = "E78"
-    E78_0 = "E78.0"
-    E78_1 = "E78.1"
-    E78_2 = "E78.2"
-    E78_3 = "E78.3"
-    E78_4 = "E78.4"
-    E78_5 = "E78.5"
-    E78_6 = "E78.6"
-    E78_8 = "E78.8"
-    E78_9 = "E78.9"
-    E79 = "E79"
-    E79_0 = "E79.0"
-    E79_1 = "E79.1"
-    E79_8 = "E79.8"
-    E79_9 = "E79.9"
-    E80 = "E80"
-    E80_0 = "E80.0"
-    E80_1 = "E80.1"
-    E80_2 = "E80.2"
-    E80_3 = "E80.3"
-    E80_4 = "E80.4"
-    E80_5 = "E80.5"
-    E80_6 = "E80.6"
-    E80_7 = "E80.7"
-    E83 = "E83"
-    E83_0 = "E83.0"
-    E83_1 = "E83.1"
-    E83_2 = "E83.2"
-    E83_3 = "E83.3"
-    E83_4 = "E83.4"
-    E83_5 = "E83.5"
-    E83_8 = "E83.8"
-    E83_9 = "E83.9"
-    E84 = "E84"
-    E84_0 = "E84.0"
-    E84_1 = "E84.1"
-    E84_8 = "E84.8"
-    E84_9 = "E84.9"
-    E85 = "E85"
-    E85_0 = "E85.0"
-    E85_1 = "E85.1"
-    E85_2 = "E85.2"
-    E85_3 = "E85.3"
-    E85_4 = "E85.4"
-    E85_8 = "E85.8"
-    E85_9 = "E85.9"
-    E86 = "E86"
-    E87 = "E87"
-    E87_0 = "E87.0"
-    E87_1 = "E87.1"
-    E87_2 = "E87.2"
-    E87_3 = "E87.3"
-    E87_4 = "E87.4"
-    E87_5 = "E87.5"
-    E87_6 = "E87.6"
-    E87_7 = "E87.7"
-    E87_8 = "E87.8"
-    E88 = "E88"
-    E88_0 = "E88.0"
-    E88_1 = "E88.1"
-    E88_2 = "E88.2"
-    E88_3 = "E88.3"
-    E88_8 = "E88.8"
-    E88_9 = "E88.9"
-    F01_F99 = "F01-F99"
-    F01_F09 = "F01-F09"
-    F01 = "F01"
-    F01_0 = "F01.0"
-    F01_1 = "F01.1"
-    F01_2 = "F01.2"
-    F01_3 = "F01.3"
-    F01_8 = "F01.8"
-    F01_9 = "F01.9"
-    F03 = "F03"
-    F04 = "F04"
-    F05 = "F05"
-    F05_0 = "F05.0"
-    F05_1 = "F05.1"
-    F05_8 = "F05.8"
-    F05_9 = "F05.9"
-    F06 = "F06"
-    F06_0 = "F06.0"
-    F06_1 = "F06.1"
-    F06_2 = "F06.2"
-    F06_3 = "F06.3"
-    F06_4 = "F06.4"
-    F06_5 = "F06.5"
-    F06_6 = "F06.6"
-    F06_7 = "F06.7"
-    F06_8 = "F06.8"
-    F06_9 = "F06.9"
-    F07 = "F07"
-    F07_0 = "F07.0"
-    F07_1 = "F07.1"
-    F07_2 = "F07.2"
-    F07_8 = "F07.8"
-    F07_9 = "F07.9"
-    F09 = "F09"
-    F10_F19 = "F10-F19"
-    F10 = "F10"
-    F10_0 = "F10.0"
-    F10_1 = "F10.1"
-    F10_2 = "F10.2"
-    F10_3 = "F10.3"
-    F10_4 = "F10.4"
-    F10_5 = "F10.5"
-    F10_6 = "F10.6"
-    F10_7 = "F10.7"
-    F10_8 = "F10.8"
-    F10_9 = "F10.9"
-    F11 = "F11"
-    F11_0 = "F11.0"
-    F11_1 = "F11.1"
-    F11_2 = "F11.2"
-    F11_3 = "F11.3"
-    F11_4 = "F11.4"
-    F11_5 = "F11.5"
-    F11_6 = "F11.6"
-    F11_7 = "F11.7"
-    F11_8 = "F11.8"
-    F11_9 = "F11.9"
-    F12 = "F12"
-    F12_0 = "F12.0"
-    F12_1 = "F12.1"
-    F12_2 = "F12.2"
-    F12_3 = "F12.3"
-    F12_4 = "F12.4"
-    F12_5 = "F12.5"
-    F12_6 = "F12.6"
-    F12_7 = "F12.7"
-    F12_8 = "F12.8"
-    F12_9 = "F12.9"
-    F13 = "F13"
-    F13_0 = "F13.0"
-    F13_1 = "F13.1"
-    F13_2 = "F13.2"
-    F13_3 = "F13.3"
-    F13_4 = "F13.4"
-    F13_5 = "F13.5"
-    F13_6 = "F13.6"
-    F13_7 = "F13.7"
-    F13_8 = "F13.8"
-    F13_9 = "F13.9"
-    F14 = "F14"
-    F14_0 = "F14.0"
-    F14_1 = "F14.1"
-    F14_2 = "F14.2"
-    F14_3 = "F14.3"
-    F14_4 = "F14.4"
-    F14_5 = "F14.5"
-    F14_6 = "F14.6"
-    F14_7 = "F14.7"
-    F14_8 = "F14.8"
-    F14_9 = "F14.9"
-    F15 = "F15"
-    F15_0 = "F15.0"
-    F15_1 = "F15.1"
-    F15_2 = "F15.2"
-    F15_3 = "F15.3"
-    F15_4 = "F15.4"
-    F15_5 = "F15.5"
-    F15_6 = "F15.6"
-    F15_7 = "F15.7"
-    F15_8 = "F15.8"
-    F15_9 = "F15.9"
-    F16 = "F16"
-    F16_0 = "F16.0"
-    F16_1 = "F16.1"
-    F16_2 = "F16.2"
-    F16_3 = "F16.3"
-    F16_4 = "F16.4"
-    F16_5 = "F16.5"
-    F16_6 = "F16.6"
-    F16_7 = "F16.7"
-    F16_8 = "F16.8"
-    F16_9 = "F16.9"
-    F17 = "F17"
-    F17_0 = "F17.0"
-    F17_1 = "F17.1"
-    F17_2 = "F17.2"
-    F17_3 = "F17.3"
-    F17_4 = "F17.4"
-    F17_5 = "F17.5"
-    F17_6 = "F17.6"
-    F17_7 = "F17.7"
-    F17_8 = "F17.8"
-    F17_9 = "F17.9"
-    F18 = "F18"
-    F18_0 = "F18.0"
-    F18_1 = "F18.1"
-    F18_2 = "F18.2"
-    F18_3 = "F18.3"
-    F18_4 = "F18.4"
-    F18_5 = "F18.5"
-    F18_6 = "F18.6"
-    F18_7 = "F18.7"
-    F18_8 = "F18.8"
-    F18_9 = "F18.9"
-    F19 = "F19"
-    F19_0 = "F19.0"
-    F19_1 = "F19.1"
-    F19_2 = "F19.2"
-    F19_3 = "F19.3"
-    F19_4 = "F19.4"
-    F19_5 = "F19.5"
-    F19_6 = "F19.6"
-    F19_7 = "F19.7"
-    F19_8 = "F19.8"
-    F19_9 = "F19.9"
-    F20_F29 = "F20-F29"
-    F20 = "F20"
-    F20_0 = "F20.0"
-    F20_1 = "F20.1"
-    F20_2 = "F20.2"
-    F20_3 = "F20.3"
-    F20_4 = "F20.4"
-    F20_5 = "F20.5"
-    F20_6 = "F20.6"
-    F20_8 = "F20.8"
-    F20_9 = "F20.9"
-    F21 = "F21"
-    F22 = "F22"
-    F22_0 = "F22.0"
-    F22_8 = "F22.8"
-    F22_9 = "F22.9"
-    F23 = "F23"
-    F23_0 = "F23.0"
-    F23_1 = "F23.1"
-    F23_2 = "F23.2"
-    F23_3 = "F23.3"
-    F23_8 = "F23.8"
-    F23_9 = "F23.9"
-    F24 = "F24"
-    F25 = "F25"
-    F25_0 = "F25.0"
-    F25_1 = "F25.1"
-    F25_2 = "F25.2"
-    F25_8 = "F25.8"
-    F25_9 = "F25.9"
-    F28 = "F28"
-    F29 = "F29"
-    F30_F39 = "F30-F39"
-    F30 = "F30"
-    F30_0 = "F30.0"
-    F30_1 = "F30.1"
-    F30_2 = "F30.2"
-    F30_8 = "F30.8"
-    F30_9 = "F30.9"
-    F31 = "F31"
-    F31_0 = "F31.0"
-    F31_1 = "F31.1"
-    F31_2 = "F31.2"
-    F31_3 = "F31.3"
-    F31_4 = "F31.4"
-    F31_5 = "F31.5"
-    F31_6 = "F31.6"
-    F31_7 = "F31.7"
-    F31_8 = "F31.8"
-    F31_9 = "F31.9"
-    F32 = "F32"
-    F32_0 = "F32.0"
-    F32_1 = "F32.1"
-    F32_2 = "F32.2"
-    F32_3 = "F32.3"
-    F32_8 = "F32.8"
-    F32_9 = "F32.9"
-    F33 = "F33"
-    F33_0 = "F33.0"
-    F33_1 = "F33.1"
-    F33_2 = "F33.2"
-    F33_3 = "F33.3"
-    F33_4 = "F33.4"
-    F33_8 = "F33.8"
-    F33_9 = "F33.9"
-    F34 = "F34"
-    F34_0 = "F34.0"
-    F34_1 = "F34.1"
-    F34_8 = "F34.8"
-    F34_9 = "F34.9"
-    F38 = "F38"
-    F38_0 = "F38.0"
-    F38_1 = "F38.1"
-    F38_8 = "F38.8"
-    F39 = "F39"
-    F40_F48 = "F40-F48"
-    F40 = "F40"
-    F40_0 = "F40.0"
-    F40_1 = "F40.1"
-    F40_2 = "F40.2"
-    F40_8 = "F40.8"
-    F40_9 = "F40.9"
-    F41 = "F41"
-    F41_0 = "F41.0"
-    F41_1 = "F41.1"
-    F41_2 = "F41.2"
-    F41_3 = "F41.3"
-    F41_8 = "F41.8"
-    F41_9 = "F41.9"
-    F42 = "F42"
-    F42_0 = "F42.0"
-    F42_1 = "F42.1"
-    F42_2 = "F42.2"
-    F42_8 = "F42.8"
-    F42_9 = "F42.9"
-    F43 = "F43"
-    F43_0 = "F43.0"
-    F43_1 = "F43.1"
-    F43_2 = "F43.2"
-    F43_8 = "F43.8"
-    F43_9 = "F43.9"
-    F44 = "F44"
-    F44_0 = "F44.0"
-    F44_1 = "F44.1"
-    F44_2 = "F44.2"
-    F44_3 = "F44.3"
-    F44_4 = "F44.4"
-    F44_5 = "F44.5"
-    F44_6 = "F44.6"
-    F44_7 = "F44.7"
-    F44_8 = "F44.8"
-    F44_9 = "F44.9"
-    F45 = "F45"
-    F45_0 = "F45.0"
-    F45_1 = "F45.1"
-    F45_2 = "F45.2"
-    F45_3 = "F45.3"
-    F45_4 = "F45.4"
-    F45_8 = "F45.8"
-    F45_9 = "F45.9"
-    F48 = "F48"
-    F48_0 = "F48.0"
-    F48_1 = "F48.1"
-    F48_8 = "F48.8"
-    F48_9 = "F48.9"
-    F50_F59 = "F50-F59"
-    F50 = "F50"
-    F50_0 = "F50.0"
-    F50_1 = "F50.1"
-    F50_2 = "F50.2"
-    F50_3 = "F50.3"
-    F50_4 = "F50.4"
-    F50_5 = "F50.5"
-    F50_8 = "F50.8"
-    F50_9 = "F50.9"
-    F51 = "F51"
-    F51_0 = "F51.0"
-    F51_1 = "F51.1"
-    F51_2 = "F51.2"
-    F51_3 = "F51.3"
-    F51_4 = "F51.4"
-    F51_5 = "F51.5"
-    F51_8 = "F51.8"
-    F51_9 = "F51.9"
-    F52 = "F52"
-    F52_0 = "F52.0"
-    F52_1 = "F52.1"
-    F52_2 = "F52.2"
-    F52_3 = "F52.3"
-    F52_4 = "F52.4"
-    F52_5 = "F52.5"
-    F52_6 = "F52.6"
-    F52_7 = "F52.7"
-    F52_8 = "F52.8"
-    F52_9 = "F52.9"
-    F53 = "F53"
-    F53_0 = "F53.0"
-    F53_1 = "F53.1"
-    F53_8 = "F53.8"
-    F53_9 = "F53.9"
-    F54 = "F54"
-    F55 = "F55"
-    F59 = "F59"
-    F60_F69 = "F60-F69"
-    F60 = "F60"
-    F60_0 = "F60.0"
-    F60_1 = "F60.1"
-    F60_2 = "F60.2"
-    F60_3 = "F60.3"
-    F60_4 = "F60.4"
-    F60_5 = "F60.5"
-    F60_6 = "F60.6"
-    F60_7 = "F60.7"
-    F60_8 = "F60.8"
-    F60_9 = "F60.9"
-    F61 = "F61"
-    F62 = "F62"
-    F62_0 = "F62.0"
-    F62_1 = "F62.1"
-    F62_8 = "F62.8"
-    F62_9 = "F62.9"
-    F63 = "F63"
-    F63_0 = "F63.0"
-    F63_1 = "F63.1"
-    F63_2 = "F63.2"
-    F63_3 = "F63.3"
-    F63_8 = "F63.8"
-    F63_9 = "F63.9"
-    F64 = "F64"
-    F64_0 = "F64.0"
-    F64_1 = "F64.1"
-    F64_2 = "F64.2"
-    F64_8 = "F64.8"
-    F64_9 = "F64.9"
-    F65 = "F65"
-    F65_0 = "F65.0"
-    F65_1 = "F65.1"
-    F65_2 = "F65.2"
-    F65_3 = "F65.3"
-    F65_4 = "F65.4"
-    F65_5 = "F65.5"
-    F65_6 = "F65.6"
-    F65_8 = "F65.8"
-    F65_9 = "F65.9"
-    F66 = "F66"
-    F66_0 = "F66.0"
-    F66_1 = "F66.1"
-    F66_2 = "F66.2"
-    F66_8 = "F66.8"
-    F66_9 = "F66.9"
-    F68 = "F68"
-    F68_0 = "F68.0"
-    F68_1 = "F68.1"
-    F68_8 = "F68.8"
-    F69 = "F69"
-    F70_F79 = "F70-F79"
-    F70 = "F70"
-    F71 = "F71"
-    F72 = "F72"
-    F73 = "F73"
-    F78 = "F78"
-    F79 = "F79"
-    F80_F89 = "F80-F89"
-    F80 = "F80"
-    F80_0 = "F80.0"
-    F80_1 = "F80.1"
-    F80_2 = "F80.2"
-    F80_3 = "F80.3"
-    F80_8 = "F80.8"
-    F80_9 = "F80.9"
-    F81 = "F81"
-    F81_0 = "F81.0"
-    F81_1 = "F81.1"
-    F81_2 = "F81.2"
-    F81_3 = "F81.3"
-    F81_8 = "F81.8"
-    F81_9 = "F81.9"
-    F82 = "F82"
-    F83 = "F83"
-    F84 = "F84"
-    F84_0 = "F84.0"
-    F84_1 = "F84.1"
-    F84_2 = "F84.2"
-    F84_3 = "F84.3"
-    F84_4 = "F84.4"
-    F84_5 = "F84.5"
-    F84_8 = "F84.8"
-    F84_9 = "F84.9"
-    F88 = "F88"
-    F89 = "F89"
-    F90_F98 = "F90-F98"
-    F90 = "F90"
-    F90_0 = "F90.0"
-    F90_1 = "F90.1"
-    F90_8 = "F90.8"
-    F90_9 = "F90.9"
-    F91 = "F91"
-    F91_0 = "F91.0"
-    F91_1 = "F91.1"
-    F91_2 = "F91.2"
-    F91_3 = "F91.3"
-    F91_8 = "F91.8"
-    F91_9 = "F91.9"
-    F92 = "F92"
-    F92_0 = "F92.0"
-    F92_8 = "F92.8"
-    F92_9 = "F92.9"
-    F93 = "F93"
-    F93_0 = "F93.0"
-    F93_1 = "F93.1"
-    F93_2 = "F93.2"
-    F93_3 = "F93.3"
-    F93_8 = "F93.8"
-    F93_9 = "F93.9"
-    F94 = "F94"
-    F94_0 = "F94.0"
-    F94_1 = "F94.1"
-    F94_2 = "F94.2"
-    F94_8 = "F94.8"
-    F94_9 = "F94.9"
-    F95 = "F95"
-    F95_0 = "F95.0"
-    F95_1 = "F95.1"
-    F95_2 = "F95.2"
-    F95_8 = "F95.8"
-    F95_9 = "F95.9"
-    F98 = "F98"
-    F98_0 = "F98.0"
-    F98_1 = "F98.1"
-    F98_2 = "F98.2"
-    F98_3 = "F98.3"
-    F98_4 = "F98.4"
-    F98_5 = "F98.5"
-    F98_6 = "F98.6"
-    F98_8 = "F98.8"
-    F98_9 = "F98.9"
-    F99_F99 = "F99-F99"
-    F99 = "F99"
-    G00_G98 = "G00-G98"
-    G00_G09 = "G00-G09"
-    G00 = "G00"
-    G00_0 = "G00.0"
-    G00_1 = "G00.1"
-    G00_2 = "G00.2"
-    G00_3 = "G00.3"
-    G00_8 = "G00.8"
-    G00_9 = "G00.9"
-    G03 = "G03"
-    G03_0 = "G03.0"
-    G03_1 = "G03.1"
-    G03_2 = "G03.2"
-    G03_8 = "G03.8"
-    G03_9 = "G03.9"
-    G04 = "G04"
-    G04_0 = "G04.0"
-    G04_1 = "G04.1"
-    G04_2 = "G04.2"
-    G04_8 = "G04.8"
-    G04_9 = "G04.9"
-    G06 = "G06"
-    G06_0 = "G06.0"
-    G06_1 = "G06.1"
-    G06_2 = "G06.2"
-    G08 = "G08"
-    G09 = "G09"
-    G10_G14 = "G10-G14"
-    G10 = "G10"
-    G11 = "G11"
-    G11_0 = "G11.0"
-    G11_1 = "G11.1"
-    G11_2 = "G11.2"
-    G11_3 = "G11.3"
-    G11_4 = "G11.4"
-    G11_8 = "G11.8"
-    G11_9 = "G11.9"
-    G12 = "G12"
-    G12_0 = "G12.0"
-    G12_1 = "G12.1"
-    G12_2 = "G12.2"
-    G12_8 = "G12.8"
-    G12_9 = "G12.9"
-    G14 = "G14"
-    G20_G25 = "G20-G25"
-    G20 = "G20"
-    G21 = "G21"
-    G21_0 = "G21.0"
-    G21_1 = "G21.1"
-    G21_2 = "G21.2"
-    G21_3 = "G21.3"
-    G21_4 = "G21.4"
-    G21_8 = "G21.8"
-    G21_9 = "G21.9"
-    G23 = "G23"
-    G23_0 = "G23.0"
-    G23_1 = "G23.1"
-    G23_2 = "G23.2"
-    G23_8 = "G23.8"
-    G23_9 = "G23.9"
-    G24 = "G24"
-    G24_0 = "G24.0"
-    G24_1 = "G24.1"
-    G24_2 = "G24.2"
-    G24_3 = "G24.3"
-    G24_4 = "G24.4"
-    G24_5 = "G24.5"
-    G24_8 = "G24.8"
-    G24_9 = "G24.9"
-    G25 = "G25"
-    G25_0 = "G25.0"
-    G25_1 = "G25.1"
-    G25_2 = "G25.2"
-    G25_3 = "G25.3"
-    G25_4 = "G25.4"
-    G25_5 = "G25.5"
-    G25_6 = "G25.6"
-    G25_8 = "G25.8"
-    G25_9 = "G25.9"
-    G30_G31 = "G30-G31"
-    G30 = "G30"
-    G30_0 = "G30.0"
-    G30_1 = "G30.1"
-    G30_8 = "G30.8"
-    G30_9 = "G30.9"
-    G31 = "G31"
-    G31_0 = "G31.0"
-    G31_1 = "G31.1"
-    G31_2 = "G31.2"
-    G31_8 = "G31.8"
-    G31_9 = "G31.9"
-    G35_G37 = "G35-G37"
-    G35 = "G35"
-    G36 = "G36"
-    G36_0 = "G36.0"
-    G36_1 = "G36.1"
-    G36_8 = "G36.8"
-    G36_9 = "G36.9"
-    G37 = "G37"
-    G37_0 = "G37.0"
-    G37_1 = "G37.1"
-    G37_2 = "G37.2"
-    G37_3 = "G37.3"
-    G37_4 = "G37.4"
-    G37_5 = "G37.5"
-    G37_8 = "G37.8"
-    G37_9 = "G37.9"
-    G40_G47 = "G40-G47"
-    G40 = "G40"
-    G40_0 = "G40.0"
-    G40_1 = "G40.1"
-    G40_2 = "G40.2"
-    G40_3 = "G40.3"
-    G40_4 = "G40.4"
-    G40_5 = "G40.5"
-    G40_6 = "G40.6"
-    G40_7 = "G40.7"
-    G40_8 = "G40.8"
-    G40_9 = "G40.9"
-    G41 = "G41"
-    G41_0 = "G41.0"
-    G41_1 = "G41.1"
-    G41_2 = "G41.2"
-    G41_8 = "G41.8"
-    G41_9 = "G41.9"
-    G43 = "G43"
-    G43_0 = "G43.0"
-    G43_1 = "G43.1"
-    G43_2 = "G43.2"
-    G43_3 = "G43.3"
-    G43_8 = "G43.8"
-    G43_9 = "G43.9"
-    G44 = "G44"
-    G44_0 = "G44.0"
-    G44_1 = "G44.1"
-    G44_2 = "G44.2"
-    G44_3 = "G44.3"
-    G44_4 = "G44.4"
-    G44_8 = "G44.8"
-    G45 = "G45"
-    G45_0 = "G45.0"
-    G45_1 = "G45.1"
-    G45_2 = "G45.2"
-    G45_3 = "G45.3"
-    G45_4 = "G45.4"
-    G45_8 = "G45.8"
-    G45_9 = "G45.9"
-    G47 = "G47"
-    G47_0 = "G47.0"
-    G47_1 = "G47.1"
-    G47_2 = "G47.2"
-    G47_3 = "G47.3"
-    G47_4 = "G47.4"
-    G47_8 = "G47.8"
-    G47_9 = "G47.9"
-    G50_G58 = "G50-G58"
-    G50 = "G50"
-    G50_0 = "G50.0"
-    G50_1 = "G50.1"
-    G50_8 = "G50.8"
-    G50_9 = "G50.9"
-    G51 = "G51"
-    G51_0 = "G51.0"
-    G51_1 = "G51.1"
-    G51_2 = "G51.2"
-    G51_3 = "G51.3"
-    G51_4 = "G51.4"
-    G51_8 = "G51.8"
-    G51_9 = "G51.9"
-    G52 = "G52"
-    G52_0 = "G52.0"
-    G52_1 = "G52.1"
-    G52_2 = "G52.2"
-    G52_3 = "G52.3"
-    G52_7 = "G52.7"
-    G52_8 = "G52.8"
-    G52_9 = "G52.9"
-    G54 = "G54"
-    G54_0 = "G54.0"
-    G54_1 = "G54.1"
-    G54_2 = "G54.2"
-    G54_3 = "G54.3"
-    G54_4 = "G54.4"
-    G54_5 = "G54.5"
-    G54_6 = "G54.6"
-    G54_7 = "G54.7"
-    G54_8 = "G54.8"
-    G54_9 = "G54.9"
-    G56 = "G56"
-    G56_0 = "G56.0"
-    G56_1 = "G56.1"
-    G56_2 = "G56.2"
-    G56_3 = "G56.3"
-    G56_4 = "G56.4"
-    G56_8 = "G56.8"
-    G56_9 = "G56.9"
-    G57 = "G57"
-    G57_0 = "G57.0"
-    G57_1 = "G57.1"
-    G57_2 = "G57.2"
-    G57_3 = "G57.3"
-    G57_4 = "G57.4"
-    G57_5 = "G57.5"
-    G57_6 = "G57.6"
-    G57_8 = "G57.8"
-    G57_9 = "G57.9"
-    G58 = "G58"
-    G58_0 = "G58.0"
-    G58_7 = "G58.7"
-    G58_8 = "G58.8"
-    G58_9 = "G58.9"
-    G60_G64 = "G60-G64"
-    G60 = "G60"
-    G60_0 = "G60.0"
-    G60_1 = "G60.1"
-    G60_2 = "G60.2"
-    G60_3 = "G60.3"
-    G60_8 = "G60.8"
-    G60_9 = "G60.9"
-    G61 = "G61"
-    G61_0 = "G61.0"
-    G61_1 = "G61.1"
-    G61_8 = "G61.8"
-    G61_9 = "G61.9"
-    G62 = "G62"
-    G62_0 = "G62.0"
-    G62_1 = "G62.1"
-    G62_2 = "G62.2"
-    G62_8 = "G62.8"
-    G62_9 = "G62.9"
-    G64 = "G64"
-    G70_G72 = "G70-G72"
-    G70 = "G70"
-    G70_0 = "G70.0"
-    G70_1 = "G70.1"
-    G70_2 = "G70.2"
-    G70_8 = "G70.8"
-    G70_9 = "G70.9"
-    G71 = "G71"
-    G71_0 = "G71.0"
-    G71_1 = "G71.1"
-    G71_2 = "G71.2"
-    G71_3 = "G71.3"
-    G71_8 = "G71.8"
-    G71_9 = "G71.9"
-    G72 = "G72"
-    G72_0 = "G72.0"
-    G72_1 = "G72.1"
-    G72_2 = "G72.2"
-    G72_3 = "G72.3"
-    G72_4 = "G72.4"
-    G72_8 = "G72.8"
-    G72_9 = "G72.9"
-    G80_G83 = "G80-G83"
-    G80 = "G80"
-    G80_0 = "G80.0"
-    G80_1 = "G80.1"
-    G80_2 = "G80.2"
-    G80_3 = "G80.3"
-    G80_4 = "G80.4"
-    G80_8 = "G80.8"
-    G80_9 = "G80.9"
-    G81 = "G81"
-    G81_0 = "G81.0"
-    G81_1 = "G81.1"
-    G81_9 = "G81.9"
-    G82 = "G82"
-    G82_0 = "G82.0"
-    G82_1 = "G82.1"
-    G82_2 = "G82.2"
-    G82_3 = "G82.3"
-    G82_4 = "G82.4"
-    G82_5 = "G82.5"
-    G83 = "G83"
-    G83_0 = "G83.0"
-    G83_1 = "G83.1"
-    G83_2 = "G83.2"
-    G83_3 = "G83.3"
-    G83_4 = "G83.4"
-    G83_8 = "G83.8"
-    G83_9 = "G83.9"
-    G90_G98 = "G90-G98"
-    G90 = "G90"
-    G90_0 = "G90.0"
-    G90_1 = "G90.1"
-    G90_2 = "G90.2"
-    G90_3 = "G90.3"
-    G90_4 = "G90.4"
-    G90_8 = "G90.8"
-    G90_9 = "G90.9"
-    G91 = "G91"
-    G91_0 = "G91.0"
-    G91_1 = "G91.1"
-    G91_2 = "G91.2"
-    G91_3 = "G91.3"
-    G91_8 = "G91.8"
-    G91_9 = "G91.9"
-    G92 = "G92"
-    G93 = "G93"
-    G93_0 = "G93.0"
-    G93_1 = "G93.1"
-    G93_2 = "G93.2"
-    G93_3 = "G93.3"
-    G93_4 = "G93.4"
-    G93_5 = "G93.5"
-    G93_6 = "G93.6"
-    G93_7 = "G93.7"
-    G93_8 = "G93.8"
-    G93_9 = "G93.9"
-    G95 = "G95"
-    G95_0 = "G95.0"
-    G95_1 = "G95.1"
-    G95_2 = "G95.2"
-    G95_8 = "G95.8"
-    G95_9 = "G95.9"
-    G96 = "G96"
-    G96_0 = "G96.0"
-    G96_1 = "G96.1"
-    G96_8 = "G96.8"
-    G96_9 = "G96.9"
-    G98 = "G98"
-    H00_H57 = "H00-H57"
-    H00_H05 = "H00-H05"
-    H00 = "H00"
-    H00_0 = "H00.0"
-    H00_1 = "H00.1"
-    H01 = "H01"
-    H01_0 = "H01.0"
-    H01_1 = "H01.1"
-    H01_8 = "H01.8"
-    H01_9 = "H01.9"
-    H02 = "H02"
-    H02_0 = "H02.0"
-    H02_1 = "H02.1"
-    H02_2 = "H02.2"
-    H02_3 = "H02.3"
-    H02_4 = "H02.4"
-    H02_5 = "H02.5"
-    H02_6 = "H02.6"
-    H02_7 = "H02.7"
-    H02_8 = "H02.8"
-    H02_9 = "H02.9"
-    H04 = "H04"
-    H04_0 = "H04.0"
-    H04_1 = "H04.1"
-    H04_2 = "H04.2"
-    H04_3 = "H04.3"
-    H04_4 = "H04.4"
-    H04_5 = "H04.5"
-    H04_6 = "H04.6"
-    H04_8 = "H04.8"
-    H04_9 = "H04.9"
-    H05 = "H05"
-    H05_0 = "H05.0"
-    H05_1 = "H05.1"
-    H05_2 = "H05.2"
-    H05_3 = "H05.3"
-    H05_4 = "H05.4"
-    H05_5 = "H05.5"
-    H05_8 = "H05.8"
-    H05_9 = "H05.9"
-    H10_H11 = "H10-H11"
-    H10 = "H10"
-    H10_0 = "H10.0"
-    H10_1 = "H10.1"
-    H10_2 = "H10.2"
-    H10_3 = "H10.3"
-    H10_4 = "H10.4"
-    H10_5 = "H10.5"
-    H10_8 = "H10.8"
-    H10_9 = "H10.9"
-    H11 = "H11"
-    H11_0 = "H11.0"
-    H11_1 = "H11.1"
-    H11_2 = "H11.2"
-    H11_3 = "H11.3"
-    H11_4 = "H11.4"
-    H11_8 = "H11.8"
-    H11_9 = "H11.9"
-    H15_H21 = "H15-H21"
-    H15 = "H15"
-    H15_0 = "H15.0"
-    H15_1 = "H15.1"
-    H15_8 = "H15.8"
-    H15_9 = "H15.9"
-    H16 = "H16"
-    H16_0 = "H16.0"
-    H16_1 = "H16.1"
-    H16_2 = "H16.2"
-    H16_3 = "H16.3"
-    H16_4 = "H16.4"
-    H16_8 = "H16.8"
-    H16_9 = "H16.9"
-    H17 = "H17"
-    H17_0 = "H17.0"
-    H17_1 = "H17.1"
-    H17_8 = "H17.8"
-    H17_9 = "H17.9"
-    H18 = "H18"
-    H18_0 = "H18.0"
-    H18_1 = "H18.1"
-    H18_2 = "H18.2"
-    H18_3 = "H18.3"
-    H18_4 = "H18.4"
-    H18_5 = "H18.5"
-    H18_6 = "H18.6"
-    H18_7 = "H18.7"
-    H18_8 = "H18.8"
-    H18_9 = "H18.9"
-    H20 = "H20"
-    H20_0 = "H20.0"
-    H20_1 = "H20.1"
-    H20_2 = "H20.2"
-    H20_8 = "H20.8"
-    H20_9 = "H20.9"
-    H21 = "H21"
-    H21_0 = "H21.0"
-    H21_1 = "H21.1"
-    H21_2 = "H21.2"
-    H21_3 = "H21.3"
-    H21_4 = "H21.4"
-    H21_5 = "H21.5"
-    H21_8 = "H21.8"
-    H21_9 = "H21.9"
-    H25_H27 = "H25-H27"
-    H25 = "H25"
-    H25_0 = "H25.0"
-    H25_1 = "H25.1"
-    H25_2 = "H25.2"
-    H25_8 = "H25.8"
-    H25_9 = "H25.9"
-    H26 = "H26"
-    H26_0 = "H26.0"
-    H26_1 = "H26.1"
-    H26_2 = "H26.2"
-    H26_3 = "H26.3"
-    H26_4 = "H26.4"
-    H26_8 = "H26.8"
-    H26_9 = "H26.9"
-    H27 = "H27"
-    H27_0 = "H27.0"
-    H27_1 = "H27.1"
-    H27_8 = "H27.8"
-    H27_9 = "H27.9"
-    H30_H35 = "H30-H35"
-    H30 = "H30"
-    H30_0 = "H30.0"
-    H30_1 = "H30.1"
-    H30_2 = "H30.2"
-    H30_8 = "H30.8"
-    H30_9 = "H30.9"
-    H31 = "H31"
-    H31_0 = "H31.0"
-    H31_1 = "H31.1"
-    H31_2 = "H31.2"
-    H31_3 = "H31.3"
-    H31_4 = "H31.4"
-    H31_8 = "H31.8"
-    H31_9 = "H31.9"
-    H33 = "H33"
-    H33_0 = "H33.0"
-    H33_1 = "H33.1"
-    H33_2 = "H33.2"
-    H33_3 = "H33.3"
-    H33_4 = "H33.4"
-    H33_5 = "H33.5"
-    H34 = "H34"
-    H34_0 = "H34.0"
-    H34_1 = "H34.1"
-    H34_2 = "H34.2"
-    H34_8 = "H34.8"
-    H34_9 = "H34.9"
-    H35 = "H35"
-    H35_0 = "H35.0"
-    H35_1 = "H35.1"
-    H35_2 = "H35.2"
-    H35_3 = "H35.3"
-    H35_4 = "H35.4"
-    H35_5 = "H35.5"
-    H35_6 = "H35.6"
-    H35_7 = "H35.7"
-    H35_8 = "H35.8"
-    H35_9 = "H35.9"
-    H40_H40 = "H40-H40"
-    H40 = "H40"
-    H40_0 = "H40.0"
-    H40_1 = "H40.1"
-    H40_2 = "H40.2"
-    H40_3 = "H40.3"
-    H40_4 = "H40.4"
-    H40_5 = "H40.5"
-    H40_6 = "H40.6"
-    H40_8 = "H40.8"
-    H40_9 = "H40.9"
-    H43_H44 = "H43-H44"
-    H43 = "H43"
-    H43_0 = "H43.0"
-    H43_1 = "H43.1"
-    H43_2 = "H43.2"
-    H43_3 = "H43.3"
-    H43_8 = "H43.8"
-    H43_9 = "H43.9"
-    H44 = "H44"
-    H44_0 = "H44.0"
-    H44_1 = "H44.1"
-    H44_2 = "H44.2"
-    H44_3 = "H44.3"
-    H44_4 = "H44.4"
-    H44_5 = "H44.5"
-    H44_6 = "H44.6"
-    H44_7 = "H44.7"
-    H44_8 = "H44.8"
-    H44_9 = "H44.9"
-    H46_H47 = "H46-H47"
-    H46 = "H46"
-    H47 = "H47"
-    H47_0 = "H47.0"
-    H47_1 = "H47.1"
-    H47_2 = "H47.2"
-    H47_3 = "H47.3"
-    H47_4 = "H47.4"
-    H47_5 = "H47.5"
-    H47_6 = "H47.6"
-    H47_7 = "H47.7"
-    H49_H52 = "H49-H52"
-    H49 = "H49"
-    H49_0 = "H49.0"
-    H49_1 = "H49.1"
-    H49_2 = "H49.2"
-    H49_3 = "H49.3"
-    H49_4 = "H49.4"
-    H49_8 = "H49.8"
-    H49_9 = "H49.9"
-    H50 = "H50"
-    H50_0 = "H50.0"
-    H50_1 = "H50.1"
-    H50_2 = "H50.2"
-    H50_3 = "H50.3"
-    H50_4 = "H50.4"
-    H50_5 = "H50.5"
-    H50_6 = "H50.6"
-    H50_8 = "H50.8"
-    H50_9 = "H50.9"
-    H51 = "H51"
-    H51_0 = "H51.0"
-    H51_1 = "H51.1"
-    H51_2 = "H51.2"
-    H51_8 = "H51.8"
-    H51_9 = "H51.9"
-    H52 = "H52"
-    H52_0 = "H52.0"
-    H52_1 = "H52.1"
-    H52_2 = "H52.2"
-    H52_3 = "H52.3"
-    H52_4 = "H52.4"
-    H52_5 = "H52.5"
-    H52_6 = "H52.6"
-    H52_7 = "H52.7"
-    H53_H54 = "H53-H54"
-    H53 = "H53"
-    H53_0 = "H53.0"
-    H53_1 = "H53.1"
-    H53_2 = "H53.2"
-    H53_3 = "H53.3"
-    H53_4 = "H53.4"
-    H53_5 = "H53.5"
-    H53_6 = "H53.6"
-    H53_8 = "H53.8"
-    H53_9 = "H53.9"
-    H54 = "H54"
-    H54_0 = "H54.0"
-    H54_1 = "H54.1"
-    H54_2 = "H54.2"
-    H54_3 = "H54.3"
-    H54_4 = "H54.4"
-    H54_5 = "H54.5"
-    H54_6 = "H54.6"
-    H54_7 = "H54.7"
-    H54_9 = "H54.9"
-    H55_H57 = "H55-H57"
-    H55 = "H55"
-    H57 = "H57"
-    H57_0 = "H57.0"
-    H57_1 = "H57.1"
-    H57_8 = "H57.8"
-    H57_9 = "H57.9"
-    H60_H93 = "H60-H93"
-    H60_H61 = "H60-H61"
-    H60 = "H60"
-    H60_0 = "H60.0"
-    H60_1 = "H60.1"
-    H60_2 = "H60.2"
-    H60_3 = "H60.3"
-    H60_4 = "H60.4"
-    H60_5 = "H60.5"
-    H60_8 = "H60.8"
-    H60_9 = "H60.9"
-    H61 = "H61"
-    H61_0 = "H61.0"
-    H61_1 = "H61.1"
-    H61_2 = "H61.2"
-    H61_3 = "H61.3"
-    H61_8 = "H61.8"
-    H61_9 = "H61.9"
-    H65_H74 = "H65-H74"
-    H65 = "H65"
-    H65_0 = "H65.0"
-    H65_1 = "H65.1"
-    H65_2 = "H65.2"
-    H65_3 = "H65.3"
-    H65_4 = "H65.4"
-    H65_9 = "H65.9"
-    H66 = "H66"
-    H66_0 = "H66.0"
-    H66_1 = "H66.1"
-    H66_2 = "H66.2"
-    H66_3 = "H66.3"
-    H66_4 = "H66.4"
-    H66_9 = "H66.9"
-    H68 = "H68"
-    H68_0 = "H68.0"
-    H68_1 = "H68.1"
-    H69 = "H69"
-    H69_0 = "H69.0"
-    H69_8 = "H69.8"
-    H69_9 = "H69.9"
-    H70 = "H70"
-    H70_0 = "H70.0"
-    H70_1 = "H70.1"
-    H70_2 = "H70.2"
-    H70_8 = "H70.8"
-    H70_9 = "H70.9"
-    H71 = "H71"
-    H72 = "H72"
-    H72_0 = "H72.0"
-    H72_1 = "H72.1"
-    H72_2 = "H72.2"
-    H72_8 = "H72.8"
-    H72_9 = "H72.9"
-    H73 = "H73"
-    H73_0 = "H73.0"
-    H73_1 = "H73.1"
-    H73_8 = "H73.8"
-    H73_9 = "H73.9"
-    H74 = "H74"
-    H74_0 = "H74.0"
-    H74_1 = "H74.1"
-    H74_2 = "H74.2"
-    H74_3 = "H74.3"
-    H74_4 = "H74.4"
-    H74_8 = "H74.8"
-    H74_9 = "H74.9"
-    H80_H83 = "H80-H83"
-    H80 = "H80"
-    H80_0 = "H80.0"
-    H80_1 = "H80.1"
-    H80_2 = "H80.2"
-    H80_8 = "H80.8"
-    H80_9 = "H80.9"
-    H81 = "H81"
-    H81_0 = "H81.0"
-    H81_1 = "H81.1"
-    H81_2 = "H81.2"
-    H81_3 = "H81.3"
-    H81_4 = "H81.4"
-    H81_8 = "H81.8"
-    H81_9 = "H81.9"
-    H83 = "H83"
-    H83_0 = "H83.0"
-    H83_1 = "H83.1"
-    H83_2 = "H83.2"
-    H83_3 = "H83.3"
-    H83_8 = "H83.8"
-    H83_9 = "H83.9"
-    H90_H93 = "H90-H93"
-    H90 = "H90"
-    H90_0 = "H90.0"
-    H90_1 = "H90.1"
-    H90_2 = "H90.2"
-    H90_3 = "H90.3"
-    H90_4 = "H90.4"
-    H90_5 = "H90.5"
-    H90_6 = "H90.6"
-    H90_7 = "H90.7"
-    H90_8 = "H90.8"
-    H91 = "H91"
-    H91_0 = "H91.0"
-    H91_1 = "H91.1"
-    H91_2 = "H91.2"
-    H91_3 = "H91.3"
-    H91_8 = "H91.8"
-    H91_9 = "H91.9"
-    H92 = "H92"
-    H92_0 = "H92.0"
-    H92_1 = "H92.1"
-    H92_2 = "H92.2"
-    H93 = "H93"
-    H93_0 = "H93.0"
-    H93_1 = "H93.1"
-    H93_2 = "H93.2"
-    H93_3 = "H93.3"
-    H93_8 = "H93.8"
-    H93_9 = "H93.9"
-    I00_I99 = "I00-I99"
-    I00_I02 = "I00-I02"
-    I00 = "I00"
-    I01 = "I01"
-    I01_0 = "I01.0"
-    I01_1 = "I01.1"
-    I01_2 = "I01.2"
-    I01_8 = "I01.8"
-    I01_9 = "I01.9"
-    I02 = "I02"
-    I02_0 = "I02.0"
-    I02_9 = "I02.9"
-    I05_I09 = "I05-I09"
-    I05 = "I05"
-    I05_0 = "I05.0"
-    I05_1 = "I05.1"
-    I05_2 = "I05.2"
-    I05_8 = "I05.8"
-    I05_9 = "I05.9"
-    I06 = "I06"
-    I06_0 = "I06.0"
-    I06_1 = "I06.1"
-    I06_2 = "I06.2"
-    I06_8 = "I06.8"
-    I06_9 = "I06.9"
-    I07 = "I07"
-    I07_0 = "I07.0"
-    I07_1 = "I07.1"
-    I07_2 = "I07.2"
-    I07_8 = "I07.8"
-    I07_9 = "I07.9"
-    I08 = "I08"
-    I08_0 = "I08.0"
-    I08_1 = "I08.1"
-    I08_2 = "I08.2"
-    I08_3 = "I08.3"
-    I08_8 = "I08.8"
-    I08_9 = "I08.9"
-    I09 = "I09"
-    I09_0 = "I09.0"
-    I09_1 = "I09.1"
-    I09_2 = "I09.2"
-    I09_8 = "I09.8"
-    I09_9 = "I09.9"
-    I10_I15 = "I10-I15"
-    I10 = "I10"
-    I11 = "I11"
-    I11_0 = "I11.0"
-    I11_9 = "I11.9"
-    I12 = "I12"
-    I12_0 = "I12.0"
-    I12_9 = "I12.9"
-    I13 = "I13"
-    I13_0 = "I13.0"
-    I13_1 = "I13.1"
-    I13_2 = "I13.2"
-    I13_9 = "I13.9"
-    I15 = "I15"
-    I15_0 = "I15.0"
-    I15_9 = "I15.9"
-    I20_I25 = "I20-I25"
-    I20 = "I20"
-    I20_0 = "I20.0"
-    I20_1 = "I20.1"
-    I20_8 = "I20.8"
-    I20_9 = "I20.9"
-    I21 = "I21"
-    I21_0 = "I21.0"
-    I21_1 = "I21.1"
-    I21_2 = "I21.2"
-    I21_3 = "I21.3"
-    I21_4 = "I21.4"
-    I21_9 = "I21.9"
-    I22 = "I22"
-    I22_0 = "I22.0"
-    I22_1 = "I22.1"
-    I22_8 = "I22.8"
-    I22_9 = "I22.9"
-    I24 = "I24"
-    I24_1 = "I24.1"
-    I24_8 = "I24.8"
-    I24_9 = "I24.9"
-    I25 = "I25"
-    I25_0 = "I25.0"
-    I25_1 = "I25.1"
-    I25_2 = "I25.2"
-    I25_3 = "I25.3"
-    I25_4 = "I25.4"
-    I25_5 = "I25.5"
-    I25_6 = "I25.6"
-    I25_8 = "I25.8"
-    I25_9 = "I25.9"
-    I26_I28 = "I26-I28"
-    I26 = "I26"
-    I26_0 = "I26.0"
-    I26_9 = "I26.9"
-    I27 = "I27"
-    I27_0 = "I27.0"
-    I27_1 = "I27.1"
-    I27_2 = "I27.2"
-    I27_8 = "I27.8"
-    I27_9 = "I27.9"
-    I28 = "I28"
-    I28_0 = "I28.0"
-    I28_1 = "I28.1"
-    I28_8 = "I28.8"
-    I28_9 = "I28.9"
-    I30_I51 = "I30-I51"
-    I30 = "I30"
-    I30_0 = "I30.0"
-    I30_1 = "I30.1"
-    I30_8 = "I30.8"
-    I30_9 = "I30.9"
-    I31 = "I31"
-    I31_0 = "I31.0"
-    I31_1 = "I31.1"
-    I31_2 = "I31.2"
-    I31_3 = "I31.3"
-    I31_8 = "I31.8"
-    I31_9 = "I31.9"
-    I33 = "I33"
-    I33_0 = "I33.0"
-    I33_9 = "I33.9"
-    I34 = "I34"
-    I34_0 = "I34.0"
-    I34_1 = "I34.1"
-    I34_2 = "I34.2"
-    I34_8 = "I34.8"
-    I34_9 = "I34.9"
-    I35 = "I35"
-    I35_0 = "I35.0"
-    I35_1 = "I35.1"
-    I35_2 = "I35.2"
-    I35_8 = "I35.8"
-    I35_9 = "I35.9"
-    I36 = "I36"
-    I36_0 = "I36.0"
-    I36_1 = "I36.1"
-    I36_2 = "I36.2"
-    I36_8 = "I36.8"
-    I36_9 = "I36.9"
-    I37 = "I37"
-    I37_0 = "I37.0"
-    I37_1 = "I37.1"
-    I37_2 = "I37.2"
-    I37_8 = "I37.8"
-    I37_9 = "I37.9"
-    I38 = "I38"
-    I40 = "I40"
-    I40_0 = "I40.0"
-    I40_1 = "I40.1"
-    I40_8 = "I40.8"
-    I40_9 = "I40.9"
-    I42 = "I42"
-    I42_0 = "I42.0"
-    I42_1 = "I42.1"
-    I42_2 = "I42.2"
-    I42_3 = "I42.3"
-    I42_4 = "I42.4"
-    I42_5 = "I42.5"
-    I42_6 = "I42.6"
-    I42_7 = "I42.7"
-    I42_8 = "I42.8"
-    I42_9 = "I42.9"
-    I44 = "I44"
-    I44_0 = "I44.0"
-    I44_1 = "I44.1"
-    I44_2 = "I44.2"
-    I44_3 = "I44.3"
-    I44_4 = "I44.4"
-    I44_5 = "I44.5"
-    I44_6 = "I44.6"
-    I44_7 = "I44.7"
-    I45 = "I45"
-    I45_0 = "I45.0"
-    I45_1 = "I45.1"
-    I45_2 = "I45.2"
-    I45_3 = "I45.3"
-    I45_4 = "I45.4"
-    I45_5 = "I45.5"
-    I45_6 = "I45.6"
-    I45_8 = "I45.8"
-    I45_9 = "I45.9"
-    I46 = "I46"
-    I46_0 = "I46.0"
-    I46_1 = "I46.1"
-    I46_9 = "I46.9"
-    I47 = "I47"
-    I47_0 = "I47.0"
-    I47_1 = "I47.1"
-    I47_2 = "I47.2"
-    I47_9 = "I47.9"
-    I48 = "I48"
-    I49 = "I49"
-    I49_0 = "I49.0"
-    I49_1 = "I49.1"
-    I49_2 = "I49.2"
-    I49_3 = "I49.3"
-    I49_4 = "I49.4"
-    I49_5 = "I49.5"
-    I49_8 = "I49.8"
-    I49_9 = "I49.9"
-    I50 = "I50"
-    I50_0 = "I50.0"
-    I50_1 = "I50.1"
-    I50_9 = "I50.9"
-    I51 = "I51"
-    I51_0 = "I51.0"
-    I51_1 = "I51.1"
-    I51_2 = "I51.2"
-    I51_3 = "I51.3"
-    I51_4 = "I51.4"
-    I51_5 = "I51.5"
-    I51_6 = "I51.6"
-    I51_7 = "I51.7"
-    I51_8 = "I51.8"
-    I51_9 = "I51.9"
-    I60_I69 = "I60-I69"
-    I60 = "I60"
-    I60_0 = "I60.0"
-    I60_1 = "I60.1"
-    I60_2 = "I60.2"
-    I60_3 = "I60.3"
-    I60_4 = "I60.4"
-    I60_5 = "I60.5"
-    I60_6 = "I60.6"
-    I60_7 = "I60.7"
-    I60_8 = "I60.8"
-    I60_9 = "I60.9"
-    I61 = "I61"
-    I61_0 = "I61.0"
-    I61_1 = "I61.1"
-    I61_2 = "I61.2"
-    I61_3 = "I61.3"
-    I61_4 = "I61.4"
-    I61_5 = "I61.5"
-    I61_6 = "I61.6"
-    I61_8 = "I61.8"
-    I61_9 = "I61.9"
-    I62 = "I62"
-    I62_0 = "I62.0"
-    I62_1 = "I62.1"
-    I62_9 = "I62.9"
-    I63 = "I63"
-    I63_0 = "I63.0"
-    I63_1 = "I63.1"
-    I63_2 = "I63.2"
-    I63_3 = "I63.3"
-    I63_4 = "I63.4"
-    I63_5 = "I63.5"
-    I63_6 = "I63.6"
-    I63_8 = "I63.8"
-    I63_9 = "I63.9"
-    I64 = "I64"
-    I67 = "I67"
-    I67_0 = "I67.0"
-    I67_1 = "I67.1"
-    I67_2 = "I67.2"
-    I67_3 = "I67.3"
-    I67_4 = "I67.4"
-    I67_5 = "I67.5"
-    I67_6 = "I67.6"
-    I67_7 = "I67.7"
-    I67_8 = "I67.8"
-    I67_9 = "I67.9"
-    I69 = "I69"
-    I69_0 = "I69.0"
-    I69_1 = "I69.1"
-    I69_2 = "I69.2"
-    I69_3 = "I69.3"
-    I69_4 = "I69.4"
-    I69_8 = "I69.8"
-    I70_I78 = "I70-I78"
-    I70 = "I70"
-    I70_0 = "I70.0"
-    I70_1 = "I70.1"
-    I70_2 = "I70.2"
-    I70_8 = "I70.8"
-    I70_9 = "I70.9"
-    I71 = "I71"
-    I71_0 = "I71.0"
-    I71_1 = "I71.1"
-    I71_2 = "I71.2"
-    I71_3 = "I71.3"
-    I71_4 = "I71.4"
-    I71_5 = "I71.5"
-    I71_6 = "I71.6"
-    I71_8 = "I71.8"
-    I71_9 = "I71.9"
-    I72 = "I72"
-    I72_0 = "I72.0"
-    I72_1 = "I72.1"
-    I72_2 = "I72.2"
-    I72_3 = "I72.3"
-    I72_4 = "I72.4"
-    I72_5 = "I72.5"
-    I72_8 = "I72.8"
-    I72_9 = "I72.9"
-    I73 = "I73"
-    I73_0 = "I73.0"
-    I73_1 = "I73.1"
-    I73_8 = "I73.8"
-    I73_9 = "I73.9"
-    I74 = "I74"
-    I74_0 = "I74.0"
-    I74_1 = "I74.1"
-    I74_2 = "I74.2"
-    I74_3 = "I74.3"
-    I74_4 = "I74.4"
-    I74_5 = "I74.5"
-    I74_8 = "I74.8"
-    I74_9 = "I74.9"
-    I77 = "I77"
-    I77_0 = "I77.0"
-    I77_1 = "I77.1"
-    I77_2 = "I77.2"
-    I77_3 = "I77.3"
-    I77_4 = "I77.4"
-    I77_5 = "I77.5"
-    I77_6 = "I77.6"
-    I77_8 = "I77.8"
-    I77_9 = "I77.9"
-    I78 = "I78"
-    I78_0 = "I78.0"
-    I78_1 = "I78.1"
-    I78_8 = "I78.8"
-    I78_9 = "I78.9"
-    I80_I89 = "I80-I89"
-    I80 = "I80"
-    I80_0 = "I80.0"
-    I80_1 = "I80.1"
-    I80_2 = "I80.2"
-    I80_3 = "I80.3"
-    I80_8 = "I80.8"
-    I80_9 = "I80.9"
-    I81 = "I81"
-    I82 = "I82"
-    I82_0 = "I82.0"
-    I82_1 = "I82.1"
-    I82_2 = "I82.2"
-    I82_3 = "I82.3"
-    I82_8 = "I82.8"
-    I82_9 = "I82.9"
-    I83 = "I83"
-    I83_0 = "I83.0"
-    I83_1 = "I83.1"
-    I83_2 = "I83.2"
-    I83_9 = "I83.9"
-    I84 = "I84"
-    I84_0 = "I84.0"
-    I84_1 = "I84.1"
-    I84_2 = "I84.2"
-    I84_3 = "I84.3"
-    I84_4 = "I84.4"
-    I84_5 = "I84.5"
-    I84_6 = "I84.6"
-    I84_7 = "I84.7"
-    I84_8 = "I84.8"
-    I84_9 = "I84.9"
-    I85 = "I85"
-    I85_0 = "I85.0"
-    I85_9 = "I85.9"
-    I86 = "I86"
-    I86_0 = "I86.0"
-    I86_1 = "I86.1"
-    I86_2 = "I86.2"
-    I86_3 = "I86.3"
-    I86_4 = "I86.4"
-    I86_8 = "I86.8"
-    I87 = "I87"
-    I87_0 = "I87.0"
-    I87_1 = "I87.1"
-    I87_2 = "I87.2"
-    I87_8 = "I87.8"
-    I87_9 = "I87.9"
-    I88 = "I88"
-    I88_0 = "I88.0"
-    I88_1 = "I88.1"
-    I88_8 = "I88.8"
-    I88_9 = "I88.9"
-    I89 = "I89"
-    I89_0 = "I89.0"
-    I89_1 = "I89.1"
-    I89_8 = "I89.8"
-    I89_9 = "I89.9"
-    I95_I99 = "I95-I99"
-    I95 = "I95"
-    I95_0 = "I95.0"
-    I95_1 = "I95.1"
-    I95_2 = "I95.2"
-    I95_8 = "I95.8"
-    I95_9 = "I95.9"
-    I99 = "I99"
-    J00_J98 = "J00-J98"
-    J00_J06 = "J00-J06"
-    J00 = "J00"
-    J01 = "J01"
-    J01_0 = "J01.0"
-    J01_1 = "J01.1"
-    J01_2 = "J01.2"
-    J01_3 = "J01.3"
-    J01_4 = "J01.4"
-    J01_8 = "J01.8"
-    J01_9 = "J01.9"
-    J02 = "J02"
-    J02_0 = "J02.0"
-    J02_8 = "J02.8"
-    J02_9 = "J02.9"
-    J03 = "J03"
-    J03_0 = "J03.0"
-    J03_8 = "J03.8"
-    J03_9 = "J03.9"
-    J04 = "J04"
-    J04_0 = "J04.0"
-    J04_1 = "J04.1"
-    J04_2 = "J04.2"
-    J05 = "J05"
-    J05_0 = "J05.0"
-    J05_1 = "J05.1"
-    J06 = "J06"
-    J06_0 = "J06.0"
-    J06_8 = "J06.8"
-    J06_9 = "J06.9"
-    J09_J18 = "J09-J18"
-    J09 = "J09"
-    J10 = "J10"
-    J10_0 = "J10.0"
-    J10_1 = "J10.1"
-    J10_8 = "J10.8"
-    J11 = "J11"
-    J11_0 = "J11.0"
-    J11_1 = "J11.1"
-    J11_8 = "J11.8"
-    J12 = "J12"
-    J12_0 = "J12.0"
-    J12_1 = "J12.1"
-    J12_2 = "J12.2"
-    J12_3 = "J12.3"
-    J12_8 = "J12.8"
-    J12_9 = "J12.9"
-    J13 = "J13"
-    J14 = "J14"
-    J15 = "J15"
-    J15_0 = "J15.0"
-    J15_1 = "J15.1"
-    J15_2 = "J15.2"
-    J15_3 = "J15.3"
-    J15_4 = "J15.4"
-    J15_5 = "J15.5"
-    J15_6 = "J15.6"
-    J15_7 = "J15.7"
-    J15_8 = "J15.8"
-    J15_9 = "J15.9"
-    J16 = "J16"
-    J16_0 = "J16.0"
-    J16_8 = "J16.8"
-    J18 = "J18"
-    J18_0 = "J18.0"
-    J18_1 = "J18.1"
-    J18_2 = "J18.2"
-    J18_8 = "J18.8"
-    J18_9 = "J18.9"
-    J20_J22 = "J20-J22"
-    J20 = "J20"
-    J20_0 = "J20.0"
-    J20_1 = "J20.1"
-    J20_2 = "J20.2"
-    J20_3 = "J20.3"
-    J20_4 = "J20.4"
-    J20_5 = "J20.5"
-    J20_6 = "J20.6"
-    J20_7 = "J20.7"
-    J20_8 = "J20.8"
-    J20_9 = "J20.9"
-    J21 = "J21"
-    J21_0 = "J21.0"
-    J21_1 = "J21.1"
-    J21_8 = "J21.8"
-    J21_9 = "J21.9"
-    J22 = "J22"
-    J30_J39 = "J30-J39"
-    J30 = "J30"
-    J30_0 = "J30.0"
-    J30_1 = "J30.1"
-    J30_2 = "J30.2"
-    J30_3 = "J30.3"
-    J30_4 = "J30.4"
-    J31 = "J31"
-    J31_0 = "J31.0"
-    J31_1 = "J31.1"
-    J31_2 = "J31.2"
-    J32 = "J32"
-    J32_0 = "J32.0"
-    J32_1 = "J32.1"
-    J32_2 = "J32.2"
-    J32_3 = "J32.3"
-    J32_4 = "J32.4"
-    J32_8 = "J32.8"
-    J32_9 = "J32.9"
-    J33 = "J33"
-    J33_0 = "J33.0"
-    J33_1 = "J33.1"
-    J33_8 = "J33.8"
-    J33_9 = "J33.9"
-    J34 = "J34"
-    J34_0 = "J34.0"
-    J34_1 = "J34.1"
-    J34_2 = "J34.2"
-    J34_3 = "J34.3"
-    J34_8 = "J34.8"
-    J35 = "J35"
-    J35_0 = "J35.0"
-    J35_1 = "J35.1"
-    J35_2 = "J35.2"
-    J35_3 = "J35.3"
-    J35_8 = "J35.8"
-    J35_9 = "J35.9"
-    J36 = "J36"
-    J37 = "J37"
-    J37_0 = "J37.0"
-    J37_1 = "J37.1"
-    J38 = "J38"
-    J38_0 = "J38.0"
-    J38_1 = "J38.1"
-    J38_2 = "J38.2"
-    J38_3 = "J38.3"
-    J38_4 = "J38.4"
-    J38_5 = "J38.5"
-    J38_6 = "J38.6"
-    J38_7 = "J38.7"
-    J39 = "J39"
-    J39_0 = "J39.0"
-    J39_1 = "J39.1"
-    J39_2 = "J39.2"
-    J39_3 = "J39.3"
-    J39_8 = "J39.8"
-    J39_9 = "J39.9"
-    J40_J47 = "J40-J47"
-    J40 = "J40"
-    J41 = "J41"
-    J41_0 = "J41.0"
-    J41_1 = "J41.1"
-    J41_8 = "J41.8"
-    J42 = "J42"
-    J43 = "J43"
-    J43_0 = "J43.0"
-    J43_1 = "J43.1"
-    J43_2 = "J43.2"
-    J43_8 = "J43.8"
-    J43_9 = "J43.9"
-    J44 = "J44"
-    J44_0 = "J44.0"
-    J44_1 = "J44.1"
-    J44_8 = "J44.8"
-    J44_9 = "J44.9"
-    J45 = "J45"
-    J45_0 = "J45.0"
-    J45_1 = "J45.1"
-    J45_8 = "J45.8"
-    J45_9 = "J45.9"
-    J46 = "J46"
-    J47 = "J47"
-    J60_J70 = "J60-J70"
-    J60 = "J60"
-    J61 = "J61"
-    J62 = "J62"
-    J62_0 = "J62.0"
-    J62_8 = "J62.8"
-    J63 = "J63"
-    J63_0 = "J63.0"
-    J63_1 = "J63.1"
-    J63_2 = "J63.2"
-    J63_3 = "J63.3"
-    J63_4 = "J63.4"
-    J63_5 = "J63.5"
-    J63_8 = "J63.8"
-    J64 = "J64"
-    J65 = "J65"
-    J66 = "J66"
-    J66_0 = "J66.0"
-    J66_1 = "J66.1"
-    J66_2 = "J66.2"
-    J66_8 = "J66.8"
-    J67 = "J67"
-    J67_0 = "J67.0"
-    J67_1 = "J67.1"
-    J67_2 = "J67.2"
-    J67_3 = "J67.3"
-    J67_4 = "J67.4"
-    J67_5 = "J67.5"
-    J67_6 = "J67.6"
-    J67_7 = "J67.7"
-    J67_8 = "J67.8"
-    J67_9 = "J67.9"
-    J68 = "J68"
-    J68_0 = "J68.0"
-    J68_1 = "J68.1"
-    J68_2 = "J68.2"
-    J68_3 = "J68.3"
-    J68_4 = "J68.4"
-    J68_8 = "J68.8"
-    J68_9 = "J68.9"
-    J69 = "J69"
-    J69_0 = "J69.0"
-    J69_1 = "J69.1"
-    J69_8 = "J69.8"
-    J70 = "J70"
-    J70_0 = "J70.0"
-    J70_1 = "J70.1"
-    J70_2 = "J70.2"
-    J70_3 = "J70.3"
-    J70_4 = "J70.4"
-    J70_8 = "J70.8"
-    J70_9 = "J70.9"
-    J80_J84 = "J80-J84"
-    J80 = "J80"
-    J81 = "J81"
-    J82 = "J82"
-    J84 = "J84"
-    J84_0 = "J84.0"
-    J84_1 = "J84.1"
-    J84_8 = "J84.8"
-    J84_9 = "J84.9"
-    J85_J86 = "J85-J86"
-    J85 = "J85"
-    J85_0 = "J85.0"
-    J85_1 = "J85.1"
-    J85_2 = "J85.2"
-    J85_3 = "J85.3"
-    J86 = "J86"
-    J86_0 = "J86.0"
-    J86_9 = "J86.9"
-    J90_J94 = "J90-J94"
-    J90 = "J90"
-    J92 = "J92"
-    J92_0 = "J92.0"
-    J92_9 = "J92.9"
-    J93 = "J93"
-    J93_0 = "J93.0"
-    J93_1 = "J93.1"
-    J93_8 = "J93.8"
-    J93_9 = "J93.9"
-    J94 = "J94"
-    J94_0 = "J94.0"
-    J94_1 = "J94.1"
-    J94_2 = "J94.2"
-    J94_8 = "J94.8"
-    J94_9 = "J94.9"
-    J96_J98 = "J96-J98"
-    J96 = "J96"
-    J96_0 = "J96.0"
-    J96_1 = "J96.1"
-    J96_9 = "J96.9"
-    J98 = "J98"
-    J98_0 = "J98.0"
-    J98_1 = "J98.1"
-    J98_2 = "J98.2"
-    J98_3 = "J98.3"
-    J98_4 = "J98.4"
-    J98_5 = "J98.5"
-    J98_6 = "J98.6"
-    J98_8 = "J98.8"
-    J98_9 = "J98.9"
-    K00_K92 = "K00-K92"
-    K00_K14 = "K00-K14"
-    K00 = "K00"
-    K00_0 = "K00.0"
-    K00_1 = "K00.1"
-    K00_2 = "K00.2"
-    K00_3 = "K00.3"
-    K00_4 = "K00.4"
-    K00_5 = "K00.5"
-    K00_6 = "K00.6"
-    K00_7 = "K00.7"
-    K00_8 = "K00.8"
-    K00_9 = "K00.9"
-    K01 = "K01"
-    K01_0 = "K01.0"
-    K01_1 = "K01.1"
-    K02 = "K02"
-    K02_0 = "K02.0"
-    K02_1 = "K02.1"
-    K02_2 = "K02.2"
-    K02_3 = "K02.3"
-    K02_4 = "K02.4"
-    K02_8 = "K02.8"
-    K02_9 = "K02.9"
-    K03 = "K03"
-    K03_0 = "K03.0"
-    K03_1 = "K03.1"
-    K03_2 = "K03.2"
-    K03_3 = "K03.3"
-    K03_4 = "K03.4"
-    K03_5 = "K03.5"
-    K03_6 = "K03.6"
-    K03_7 = "K03.7"
-    K03_8 = "K03.8"
-    K03_9 = "K03.9"
-    K04 = "K04"
-    K04_0 = "K04.0"
-    K04_1 = "K04.1"
-    K04_2 = "K04.2"
-    K04_3 = "K04.3"
-    K04_4 = "K04.4"
-    K04_5 = "K04.5"
-    K04_6 = "K04.6"
-    K04_7 = "K04.7"
-    K04_8 = "K04.8"
-    K04_9 = "K04.9"
-    K05 = "K05"
-    K05_0 = "K05.0"
-    K05_1 = "K05.1"
-    K05_2 = "K05.2"
-    K05_3 = "K05.3"
-    K05_4 = "K05.4"
-    K05_5 = "K05.5"
-    K05_6 = "K05.6"
-    K06 = "K06"
-    K06_0 = "K06.0"
-    K06_1 = "K06.1"
-    K06_2 = "K06.2"
-    K06_8 = "K06.8"
-    K06_9 = "K06.9"
-    K07 = "K07"
-    K07_0 = "K07.0"
-    K07_1 = "K07.1"
-    K07_2 = "K07.2"
-    K07_3 = "K07.3"
-    K07_4 = "K07.4"
-    K07_5 = "K07.5"
-    K07_6 = "K07.6"
-    K07_8 = "K07.8"
-    K07_9 = "K07.9"
-    K08 = "K08"
-    K08_0 = "K08.0"
-    K08_1 = "K08.1"
-    K08_2 = "K08.2"
-    K08_3 = "K08.3"
-    K08_8 = "K08.8"
-    K08_9 = "K08.9"
-    K09 = "K09"
-    K09_0 = "K09.0"
-    K09_1 = "K09.1"
-    K09_2 = "K09.2"
-    K09_8 = "K09.8"
-    K09_9 = "K09.9"
-    K10 = "K10"
-    K10_0 = "K10.0"
-    K10_1 = "K10.1"
-    K10_2 = "K10.2"
-    K10_3 = "K10.3"
-    K10_8 = "K10.8"
-    K10_9 = "K10.9"
-    K11 = "K11"
-    K11_0 = "K11.0"
-    K11_1 = "K11.1"
-    K11_2 = "K11.2"
-    K11_3 = "K11.3"
-    K11_4 = "K11.4"
-    K11_5 = "K11.5"
-    K11_6 = "K11.6"
-    K11_7 = "K11.7"
-    K11_8 = "K11.8"
-    K11_9 = "K11.9"
-    K12 = "K12"
-    K12_0 = "K12.0"
-    K12_1 = "K12.1"
-    K12_2 = "K12.2"
-    K12_3 = "K12.3"
-    K13 = "K13"
-    K13_0 = "K13.0"
-    K13_1 = "K13.1"
-    K13_2 = "K13.2"
-    K13_3 = "K13.3"
-    K13_4 = "K13.4"
-    K13_5 = "K13.5"
-    K13_6 = "K13.6"
-    K13_7 = "K13.7"
-    K14 = "K14"
-    K14_0 = "K14.0"
-    K14_1 = "K14.1"
-    K14_2 = "K14.2"
-    K14_3 = "K14.3"
-    K14_4 = "K14.4"
-    K14_5 = "K14.5"
-    K14_6 = "K14.6"
-    K14_8 = "K14.8"
-    K14_9 = "K14.9"
-    K20_K31 = "K20-K31"
-    K20 = "K20"
-    K21 = "K21"
-    K21_0 = "K21.0"
-    K21_9 = "K21.9"
-    K22 = "K22"
-    K22_0 = "K22.0"
-    K22_1 = "K22.1"
-    K22_2 = "K22.2"
-    K22_3 = "K22.3"
-    K22_4 = "K22.4"
-    K22_5 = "K22.5"
-    K22_6 = "K22.6"
-    K22_7 = "K22.7"
-    K22_8 = "K22.8"
-    K22_9 = "K22.9"
-    K25 = "K25"
-    K25_0 = "K25.0"
-    K25_1 = "K25.1"
-    K25_2 = "K25.2"
-    K25_3 = "K25.3"
-    K25_4 = "K25.4"
-    K25_5 = "K25.5"
-    K25_6 = "K25.6"
-    K25_7 = "K25.7"
-    K25_9 = "K25.9"
-    K26 = "K26"
-    K26_0 = "K26.0"
-    K26_1 = "K26.1"
-    K26_2 = "K26.2"
-    K26_3 = "K26.3"
-    K26_4 = "K26.4"
-    K26_5 = "K26.5"
-    K26_6 = "K26.6"
-    K26_7 = "K26.7"
-    K26_9 = "K26.9"
-    K27 = "K27"
-    K27_0 = "K27.0"
-    K27_1 = "K27.1"
-    K27_2 = "K27.2"
-    K27_3 = "K27.3"
-    K27_4 = "K27.4"
-    K27_5 = "K27.5"
-    K27_6 = "K27.6"
-    K27_7 = "K27.7"
-    K27_9 = "K27.9"
-    K28 = "K28"
-    K28_0 = "K28.0"
-    K28_1 = "K28.1"
-    K28_2 = "K28.2"
-    K28_3 = "K28.3"
-    K28_4 = "K28.4"
-    K28_5 = "K28.5"
-    K28_6 = "K28.6"
-    K28_7 = "K28.7"
-    K28_9 = "K28.9"
-    K29 = "K29"
-    K29_0 = "K29.0"
-    K29_1 = "K29.1"
-    K29_2 = "K29.2"
-    K29_3 = "K29.3"
-    K29_4 = "K29.4"
-    K29_5 = "K29.5"
-    K29_6 = "K29.6"
-    K29_7 = "K29.7"
-    K29_8 = "K29.8"
-    K29_9 = "K29.9"
-    K30 = "K30"
-    K31 = "K31"
-    K31_0 = "K31.0"
-    K31_1 = "K31.1"
-    K31_2 = "K31.2"
-    K31_3 = "K31.3"
-    K31_4 = "K31.4"
-    K31_5 = "K31.5"
-    K31_6 = "K31.6"
-    K31_7 = "K31.7"
-    K31_8 = "K31.8"
-    K31_9 = "K31.9"
-    K35_K38 = "K35-K38"
-    K35 = "K35"
-    K35_0 = "K35.0"
-    K35_1 = "K35.1"
-    K35_2 = "K35.2"
-    K35_3 = "K35.3"
-    K35_8 = "K35.8"
-    K35_9 = "K35.9"
-    K36 = "K36"
-    K37 = "K37"
-    K38 = "K38"
-    K38_0 = "K38.0"
-    K38_1 = "K38.1"
-    K38_2 = "K38.2"
-    K38_3 = "K38.3"
-    K38_8 = "K38.8"
-    K38_9 = "K38.9"
-    K40_K46 = "K40-K46"
-    K40 = "K40"
-    K40_0 = "K40.0"
-    K40_1 = "K40.1"
-    K40_2 = "K40.2"
-    K40_3 = "K40.3"
-    K40_4 = "K40.4"
-    K40_9 = "K40.9"
-    K41 = "K41"
-    K41_0 = "K41.0"
-    K41_1 = "K41.1"
-    K41_2 = "K41.2"
-    K41_3 = "K41.3"
-    K41_4 = "K41.4"
-    K41_9 = "K41.9"
-    K42 = "K42"
-    K42_0 = "K42.0"
-    K42_1 = "K42.1"
-    K42_9 = "K42.9"
-    K43 = "K43"
-    K43_0 = "K43.0"
-    K43_1 = "K43.1"
-    K43_9 = "K43.9"
-    K44 = "K44"
-    K44_0 = "K44.0"
-    K44_1 = "K44.1"
-    K44_9 = "K44.9"
-    K45 = "K45"
-    K45_0 = "K45.0"
-    K45_1 = "K45.1"
-    K45_8 = "K45.8"
-    K46 = "K46"
-    K46_0 = "K46.0"
-    K46_1 = "K46.1"
-    K46_9 = "K46.9"
-    K50_K52 = "K50-K52"
-    K50 = "K50"
-    K50_0 = "K50.0"
-    K50_1 = "K50.1"
-    K50_8 = "K50.8"
-    K50_9 = "K50.9"
-    K51 = "K51"
-    K51_0 = "K51.0"
-    K51_1 = "K51.1"
-    K51_2 = "K51.2"
-    K51_3 = "K51.3"
-    K51_4 = "K51.4"
-    K51_5 = "K51.5"
-    K51_8 = "K51.8"
-    K51_9 = "K51.9"
-    K52 = "K52"
-    K52_0 = "K52.0"
-    K52_1 = "K52.1"
-    K52_2 = "K52.2"
-    K52_3 = "K52.3"
-    K52_8 = "K52.8"
-    K52_9 = "K52.9"
-    K55_K63 = "K55-K63"
-    K55 = "K55"
-    K55_0 = "K55.0"
-    K55_1 = "K55.1"
-    K55_2 = "K55.2"
-    K55_8 = "K55.8"
-    K55_9 = "K55.9"
-    K56 = "K56"
-    K56_0 = "K56.0"
-    K56_1 = "K56.1"
-    K56_2 = "K56.2"
-    K56_3 = "K56.3"
-    K56_4 = "K56.4"
-    K56_5 = "K56.5"
-    K56_6 = "K56.6"
-    K56_7 = "K56.7"
-    K57 = "K57"
-    K57_0 = "K57.0"
-    K57_1 = "K57.1"
-    K57_2 = "K57.2"
-    K57_3 = "K57.3"
-    K57_4 = "K57.4"
-    K57_5 = "K57.5"
-    K57_8 = "K57.8"
-    K57_9 = "K57.9"
-    K58 = "K58"
-    K58_0 = "K58.0"
-    K58_9 = "K58.9"
-    K59 = "K59"
-    K59_0 = "K59.0"
-    K59_1 = "K59.1"
-    K59_2 = "K59.2"
-    K59_3 = "K59.3"
-    K59_4 = "K59.4"
-    K59_8 = "K59.8"
-    K59_9 = "K59.9"
-    K60 = "K60"
-    K60_0 = "K60.0"
-    K60_1 = "K60.1"
-    K60_2 = "K60.2"
-    K60_3 = "K60.3"
-    K60_4 = "K60.4"
-    K60_5 = "K60.5"
-    K61 = "K61"
-    K61_0 = "K61.0"
-    K61_1 = "K61.1"
-    K61_2 = "K61.2"
-    K61_3 = "K61.3"
-    K61_4 = "K61.4"
-    K62 = "K62"
-    K62_0 = "K62.0"
-    K62_1 = "K62.1"
-    K62_2 = "K62.2"
-    K62_3 = "K62.3"
-    K62_4 = "K62.4"
-    K62_5 = "K62.5"
-    K62_6 = "K62.6"
-    K62_7 = "K62.7"
-    K62_8 = "K62.8"
-    K62_9 = "K62.9"
-    K63 = "K63"
-    K63_0 = "K63.0"
-    K63_1 = "K63.1"
-    K63_2 = "K63.2"
-    K63_3 = "K63.3"
-    K63_4 = "K63.4"
-    K63_5 = "K63.5"
-    K63_8 = "K63.8"
-    K63_9 = "K63.9"
-    K65_K66 = "K65-K66"
-    K65 = "K65"
-    K65_0 = "K65.0"
-    K65_8 = "K65.8"
-    K65_9 = "K65.9"
-    K66 = "K66"
-    K66_0 = "K66.0"
-    K66_1 = "K66.1"
-    K66_8 = "K66.8"
-    K66_9 = "K66.9"
-    K70_K76 = "K70-K76"
-    K70 = "K70"
-    K70_0 = "K70.0"
-    K70_1 = "K70.1"
-    K70_2 = "K70.2"
-    K70_3 = "K70.3"
-    K70_4 = "K70.4"
-    K70_9 = "K70.9"
-    K71 = "K71"
-    K71_0 = "K71.0"
-    K71_1 = "K71.1"
-    K71_2 = "K71.2"
-    K71_3 = "K71.3"
-    K71_4 = "K71.4"
-    K71_5 = "K71.5"
-    K71_6 = "K71.6"
-    K71_7 = "K71.7"
-    K71_8 = "K71.8"
-    K71_9 = "K71.9"
-    K72 = "K72"
-    K72_0 = "K72.0"
-    K72_1 = "K72.1"
-    K72_9 = "K72.9"
-    K73 = "K73"
-    K73_0 = "K73.0"
-    K73_1 = "K73.1"
-    K73_2 = "K73.2"
-    K73_8 = "K73.8"
-    K73_9 = "K73.9"
-    K74 = "K74"
-    K74_0 = "K74.0"
-    K74_1 = "K74.1"
-    K74_2 = "K74.2"
-    K74_3 = "K74.3"
-    K74_4 = "K74.4"
-    K74_5 = "K74.5"
-    K74_6 = "K74.6"
-    K75 = "K75"
-    K75_0 = "K75.0"
-    K75_1 = "K75.1"
-    K75_2 = "K75.2"
-    K75_3 = "K75.3"
-    K75_4 = "K75.4"
-    K75_8 = "K75.8"
-    K75_9 = "K75.9"
-    K76 = "K76"
-    K76_0 = "K76.0"
-    K76_1 = "K76.1"
-    K76_2 = "K76.2"
-    K76_3 = "K76.3"
-    K76_4 = "K76.4"
-    K76_5 = "K76.5"
-    K76_6 = "K76.6"
-    K76_7 = "K76.7"
-    K76_8 = "K76.8"
-    K76_9 = "K76.9"
-    K80_K86 = "K80-K86"
-    K80 = "K80"
-    K80_0 = "K80.0"
-    K80_1 = "K80.1"
-    K80_2 = "K80.2"
-    K80_3 = "K80.3"
-    K80_4 = "K80.4"
-    K80_5 = "K80.5"
-    K80_8 = "K80.8"
-    K81 = "K81"
-    K81_0 = "K81.0"
-    K81_1 = "K81.1"
-    K81_8 = "K81.8"
-    K81_9 = "K81.9"
-    K82 = "K82"
-    K82_0 = "K82.0"
-    K82_1 = "K82.1"
-    K82_2 = "K82.2"
-    K82_3 = "K82.3"
-    K82_4 = "K82.4"
-    K82_8 = "K82.8"
-    K82_9 = "K82.9"
-    K83 = "K83"
-    K83_0 = "K83.0"
-    K83_1 = "K83.1"
-    K83_2 = "K83.2"
-    K83_3 = "K83.3"
-    K83_4 = "K83.4"
-    K83_5 = "K83.5"
-    K83_8 = "K83.8"
-    K83_9 = "K83.9"
-    K85 = "K85"
-    K85_0 = "K85.0"
-    K85_1 = "K85.1"
-    K85_2 = "K85.2"
-    K85_3 = "K85.3"
-    K85_8 = "K85.8"
-    K85_9 = "K85.9"
-    K86 = "K86"
-    K86_0 = "K86.0"
-    K86_1 = "K86.1"
-    K86_2 = "K86.2"
-    K86_3 = "K86.3"
-    K86_8 = "K86.8"
-    K86_9 = "K86.9"
-    K90_K92 = "K90-K92"
-    K90 = "K90"
-    K90_0 = "K90.0"
-    K90_1 = "K90.1"
-    K90_2 = "K90.2"
-    K90_3 = "K90.3"
-    K90_4 = "K90.4"
-    K90_8 = "K90.8"
-    K90_9 = "K90.9"
-    K92 = "K92"
-    K92_0 = "K92.0"
-    K92_1 = "K92.1"
-    K92_2 = "K92.2"
-    K92_8 = "K92.8"
-    K92_9 = "K92.9"
-    L00_L98 = "L00-L98"
-    L00_L08 = "L00-L08"
-    L00 = "L00"
-    L01 = "L01"
-    L01_0 = "L01.0"
-    L01_1 = "L01.1"
-    L02 = "L02"
-    L02_0 = "L02.0"
-    L02_1 = "L02.1"
-    L02_2 = "L02.2"
-    L02_3 = "L02.3"
-    L02_4 = "L02.4"
-    L02_8 = "L02.8"
-    L02_9 = "L02.9"
-    L03 = "L03"
-    L03_0 = "L03.0"
-    L03_1 = "L03.1"
-    L03_2 = "L03.2"
-    L03_3 = "L03.3"
-    L03_8 = "L03.8"
-    L03_9 = "L03.9"
-    L04 = "L04"
-    L04_0 = "L04.0"
-    L04_1 = "L04.1"
-    L04_2 = "L04.2"
-    L04_3 = "L04.3"
-    L04_8 = "L04.8"
-    L04_9 = "L04.9"
-    L05 = "L05"
-    L05_0 = "L05.0"
-    L05_9 = "L05.9"
-    L08 = "L08"
-    L08_0 = "L08.0"
-    L08_1 = "L08.1"
-    L08_8 = "L08.8"
-    L08_9 = "L08.9"
-    L10_L13 = "L10-L13"
-    L10 = "L10"
-    L10_0 = "L10.0"
-    L10_1 = "L10.1"
-    L10_2 = "L10.2"
-    L10_3 = "L10.3"
-    L10_4 = "L10.4"
-    L10_5 = "L10.5"
-    L10_8 = "L10.8"
-    L10_9 = "L10.9"
-    L11 = "L11"
-    L11_0 = "L11.0"
-    L11_1 = "L11.1"
-    L11_8 = "L11.8"
-    L11_9 = "L11.9"
-    L12 = "L12"
-    L12_0 = "L12.0"
-    L12_1 = "L12.1"
-    L12_2 = "L12.2"
-    L12_3 = "L12.3"
-    L12_8 = "L12.8"
-    L12_9 = "L12.9"
-    L13 = "L13"
-    L13_0 = "L13.0"
-    L13_1 = "L13.1"
-    L13_8 = "L13.8"
-    L13_9 = "L13.9"
-    L20_L30 = "L20-L30"
-    L20 = "L20"
-    L20_0 = "L20.0"
-    L20_8 = "L20.8"
-    L20_9 = "L20.9"
-    L21 = "L21"
-    L21_0 = "L21.0"
-    L21_1 = "L21.1"
-    L21_8 = "L21.8"
-    L21_9 = "L21.9"
-    L22 = "L22"
-    L23 = "L23"
-    L23_0 = "L23.0"
-    L23_1 = "L23.1"
-    L23_2 = "L23.2"
-    L23_3 = "L23.3"
-    L23_4 = "L23.4"
-    L23_5 = "L23.5"
-    L23_6 = "L23.6"
-    L23_7 = "L23.7"
-    L23_8 = "L23.8"
-    L23_9 = "L23.9"
-    L24 = "L24"
-    L24_0 = "L24.0"
-    L24_1 = "L24.1"
-    L24_2 = "L24.2"
-    L24_3 = "L24.3"
-    L24_4 = "L24.4"
-    L24_5 = "L24.5"
-    L24_6 = "L24.6"
-    L24_7 = "L24.7"
-    L24_8 = "L24.8"
-    L24_9 = "L24.9"
-    L25 = "L25"
-    L25_0 = "L25.0"
-    L25_1 = "L25.1"
-    L25_2 = "L25.2"
-    L25_3 = "L25.3"
-    L25_4 = "L25.4"
-    L25_5 = "L25.5"
-    L25_8 = "L25.8"
-    L25_9 = "L25.9"
-    L26 = "L26"
-    L27 = "L27"
-    L27_0 = "L27.0"
-    L27_1 = "L27.1"
-    L27_2 = "L27.2"
-    L27_8 = "L27.8"
-    L27_9 = "L27.9"
-    L28 = "L28"
-    L28_0 = "L28.0"
-    L28_1 = "L28.1"
-    L28_2 = "L28.2"
-    L29 = "L29"
-    L29_0 = "L29.0"
-    L29_1 = "L29.1"
-    L29_2 = "L29.2"
-    L29_3 = "L29.3"
-    L29_8 = "L29.8"
-    L29_9 = "L29.9"
-    L30 = "L30"
-    L30_0 = "L30.0"
-    L30_1 = "L30.1"
-    L30_2 = "L30.2"
-    L30_3 = "L30.3"
-    L30_4 = "L30.4"
-    L30_5 = "L30.5"
-    L30_8 = "L30.8"
-    L30_9 = "L30.9"
-    L40_L44 = "L40-L44"
-    L40 = "L40"
-    L40_0 = "L40.0"
-    L40_1 = "L40.1"
-    L40_2 = "L40.2"
-    L40_3 = "L40.3"
-    L40_4 = "L40.4"
-    L40_5 = "L40.5"
-    L40_8 = "L40.8"
-    L40_9 = "L40.9"
-    L41 = "L41"
-    L41_0 = "L41.0"
-    L41_1 = "L41.1"
-    L41_2 = "L41.2"
-    L41_3 = "L41.3"
-    L41_4 = "L41.4"
-    L41_5 = "L41.5"
-    L41_8 = "L41.8"
-    L41_9 = "L41.9"
-    L42 = "L42"
-    L43 = "L43"
-    L43_0 = "L43.0"
-    L43_1 = "L43.1"
-    L43_2 = "L43.2"
-    L43_3 = "L43.3"
-    L43_8 = "L43.8"
-    L43_9 = "L43.9"
-    L44 = "L44"
-    L44_0 = "L44.0"
-    L44_1 = "L44.1"
-    L44_2 = "L44.2"
-    L44_3 = "L44.3"
-    L44_4 = "L44.4"
-    L44_8 = "L44.8"
-    L44_9 = "L44.9"
-    L50_L53 = "L50-L53"
-    L50 = "L50"
-    L50_0 = "L50.0"
-    L50_1 = "L50.1"
-    L50_2 = "L50.2"
-    L50_3 = "L50.3"
-    L50_4 = "L50.4"
-    L50_5 = "L50.5"
-    L50_6 = "L50.6"
-    L50_8 = "L50.8"
-    L50_9 = "L50.9"
-    L51 = "L51"
-    L51_0 = "L51.0"
-    L51_1 = "L51.1"
-    L51_2 = "L51.2"
-    L51_8 = "L51.8"
-    L51_9 = "L51.9"
-    L52 = "L52"
-    L53 = "L53"
-    L53_0 = "L53.0"
-    L53_1 = "L53.1"
-    L53_2 = "L53.2"
-    L53_3 = "L53.3"
-    L53_8 = "L53.8"
-    L53_9 = "L53.9"
-    L55_L59 = "L55-L59"
-    L55 = "L55"
-    L55_0 = "L55.0"
-    L55_1 = "L55.1"
-    L55_2 = "L55.2"
-    L55_8 = "L55.8"
-    L55_9 = "L55.9"
-    L56 = "L56"
-    L56_0 = "L56.0"
-    L56_1 = "L56.1"
-    L56_2 = "L56.2"
-    L56_3 = "L56.3"
-    L56_4 = "L56.4"
-    L56_8 = "L56.8"
-    L56_9 = "L56.9"
-    L57 = "L57"
-    L57_0 = "L57.0"
-    L57_1 = "L57.1"
-    L57_2 = "L57.2"
-    L57_3 = "L57.3"
-    L57_4 = "L57.4"
-    L57_5 = "L57.5"
-    L57_8 = "L57.8"
-    L57_9 = "L57.9"
-    L58 = "L58"
-    L58_0 = "L58.0"
-    L58_1 = "L58.1"
-    L58_9 = "L58.9"
-    L59 = "L59"
-    L59_0 = "L59.0"
-    L59_8 = "L59.8"
-    L59_9 = "L59.9"
-    L60_L75 = "L60-L75"
-    L60 = "L60"
-    L60_0 = "L60.0"
-    L60_1 = "L60.1"
-    L60_2 = "L60.2"
-    L60_3 = "L60.3"
-    L60_4 = "L60.4"
-    L60_5 = "L60.5"
-    L60_8 = "L60.8"
-    L60_9 = "L60.9"
-    L63 = "L63"
-    L63_0 = "L63.0"
-    L63_1 = "L63.1"
-    L63_2 = "L63.2"
-    L63_8 = "L63.8"
-    L63_9 = "L63.9"
-    L64 = "L64"
-    L64_0 = "L64.0"
-    L64_8 = "L64.8"
-    L64_9 = "L64.9"
-    L65 = "L65"
-    L65_0 = "L65.0"
-    L65_1 = "L65.1"
-    L65_2 = "L65.2"
-    L65_8 = "L65.8"
-    L65_9 = "L65.9"
-    L66 = "L66"
-    L66_0 = "L66.0"
-    L66_1 = "L66.1"
-    L66_2 = "L66.2"
-    L66_3 = "L66.3"
-    L66_4 = "L66.4"
-    L66_8 = "L66.8"
-    L66_9 = "L66.9"
-    L67 = "L67"
-    L67_0 = "L67.0"
-    L67_1 = "L67.1"
-    L67_8 = "L67.8"
-    L67_9 = "L67.9"
-    L68 = "L68"
-    L68_0 = "L68.0"
-    L68_1 = "L68.1"
-    L68_2 = "L68.2"
-    L68_3 = "L68.3"
-    L68_8 = "L68.8"
-    L68_9 = "L68.9"
-    L70 = "L70"
-    L70_0 = "L70.0"
-    L70_1 = "L70.1"
-    L70_2 = "L70.2"
-    L70_3 = "L70.3"
-    L70_4 = "L70.4"
-    L70_5 = "L70.5"
-    L70_8 = "L70.8"
-    L70_9 = "L70.9"
-    L71 = "L71"
-    L71_0 = "L71.0"
-    L71_1 = "L71.1"
-    L71_8 = "L71.8"
-    L71_9 = "L71.9"
-    L72 = "L72"
-    L72_0 = "L72.0"
-    L72_1 = "L72.1"
-    L72_2 = "L72.2"
-    L72_8 = "L72.8"
-    L72_9 = "L72.9"
-    L73 = "L73"
-    L73_0 = "L73.0"
-    L73_1 = "L73.1"
-    L73_2 = "L73.2"
-    L73_8 = "L73.8"
-    L73_9 = "L73.9"
-    L74 = "L74"
-    L74_0 = "L74.0"
-    L74_1 = "L74.1"
-    L74_2 = "L74.2"
-    L74_3 = "L74.3"
-    L74_4 = "L74.4"
-    L74_8 = "L74.8"
-    L74_9 = "L74.9"
-    L75 = "L75"
-    L75_0 = "L75.0"
-    L75_1 = "L75.1"
-    L75_2 = "L75.2"
-    L75_8 = "L75.8"
-    L75_9 = "L75.9"
-    L80_L98 = "L80-L98"
-    L80 = "L80"
-    L81 = "L81"
-    L81_0 = "L81.0"
-    L81_1 = "L81.1"
-    L81_2 = "L81.2"
-    L81_3 = "L81.3"
-    L81_4 = "L81.4"
-    L81_5 = "L81.5"
-    L81_6 = "L81.6"
-    L81_7 = "L81.7"
-    L81_8 = "L81.8"
-    L81_9 = "L81.9"
-    L82 = "L82"
-    L83 = "L83"
-    L84 = "L84"
-    L85 = "L85"
-    L85_0 = "L85.0"
-    L85_1 = "L85.1"
-    L85_2 = "L85.2"
-    L85_3 = "L85.3"
-    L85_8 = "L85.8"
-    L85_9 = "L85.9"
-    L87 = "L87"
-    L87_0 = "L87.0"
-    L87_1 = "L87.1"
-    L87_2 = "L87.2"
-    L87_8 = "L87.8"
-    L87_9 = "L87.9"
-    L88 = "L88"
-    L89 = "L89"
-    L89_0 = "L89.0"
-    L89_1 = "L89.1"
-    L89_2 = "L89.2"
-    L89_3 = "L89.3"
-    L89_9 = "L89.9"
-    L90 = "L90"
-    L90_0 = "L90.0"
-    L90_1 = "L90.1"
-    L90_2 = "L90.2"
-    L90_3 = "L90.3"
-    L90_4 = "L90.4"
-    L90_5 = "L90.5"
-    L90_6 = "L90.6"
-    L90_8 = "L90.8"
-    L90_9 = "L90.9"
-    L91 = "L91"
-    L91_0 = "L91.0"
-    L91_8 = "L91.8"
-    L91_9 = "L91.9"
-    L92 = "L92"
-    L92_0 = "L92.0"
-    L92_1 = "L92.1"
-    L92_2 = "L92.2"
-    L92_3 = "L92.3"
-    L92_8 = "L92.8"
-    L92_9 = "L92.9"
-    L93 = "L93"
-    L93_0 = "L93.0"
-    L93_1 = "L93.1"
-    L93_2 = "L93.2"
-    L94 = "L94"
-    L94_0 = "L94.0"
-    L94_1 = "L94.1"
-    L94_2 = "L94.2"
-    L94_3 = "L94.3"
-    L94_4 = "L94.4"
-    L94_5 = "L94.5"
-    L94_6 = "L94.6"
-    L94_8 = "L94.8"
-    L94_9 = "L94.9"
-    L95 = "L95"
-    L95_0 = "L95.0"
-    L95_1 = "L95.1"
-    L95_8 = "L95.8"
-    L95_9 = "L95.9"
-    L97 = "L97"
-    L98 = "L98"
-    L98_0 = "L98.0"
-    L98_1 = "L98.1"
-    L98_2 = "L98.2"
-    L98_3 = "L98.3"
-    L98_4 = "L98.4"
-    L98_5 = "L98.5"
-    L98_6 = "L98.6"
-    L98_8 = "L98.8"
-    L98_9 = "L98.9"
-    M00_M99 = "M00-M99"
-    M00_M25 = "M00-M25"
-    M00_M02 = "M00-M02"
-    M00 = "M00"
-    M00_0 = "M00.0"
-    M00_1 = "M00.1"
-    M00_2 = "M00.2"
-    M00_8 = "M00.8"
-    M00_9 = "M00.9"
-    M02 = "M02"
-    M02_0 = "M02.0"
-    M02_1 = "M02.1"
-    M02_2 = "M02.2"
-    M02_3 = "M02.3"
-    M02_8 = "M02.8"
-    M02_9 = "M02.9"
-    M05_M13 = "M05-M13"
-    M05 = "M05"
-    M05_0 = "M05.0"
-    M05_1 = "M05.1"
-    M05_2 = "M05.2"
-    M05_3 = "M05.3"
-    M05_8 = "M05.8"
-    M05_9 = "M05.9"
-    M06 = "M06"
-    M06_0 = "M06.0"
-    M06_1 = "M06.1"
-    M06_2 = "M06.2"
-    M06_3 = "M06.3"
-    M06_4 = "M06.4"
-    M06_8 = "M06.8"
-    M06_9 = "M06.9"
-    M08 = "M08"
-    M08_0 = "M08.0"
-    M08_1 = "M08.1"
-    M08_2 = "M08.2"
-    M08_3 = "M08.3"
-    M08_4 = "M08.4"
-    M08_8 = "M08.8"
-    M08_9 = "M08.9"
-    M10 = "M10"
-    M10_0 = "M10.0"
-    M10_1 = "M10.1"
-    M10_2 = "M10.2"
-    M10_3 = "M10.3"
-    M10_4 = "M10.4"
-    M10_9 = "M10.9"
-    M11 = "M11"
-    M11_0 = "M11.0"
-    M11_1 = "M11.1"
-    M11_2 = "M11.2"
-    M11_8 = "M11.8"
-    M11_9 = "M11.9"
-    M12 = "M12"
-    M12_0 = "M12.0"
-    M12_1 = "M12.1"
-    M12_2 = "M12.2"
-    M12_3 = "M12.3"
-    M12_4 = "M12.4"
-    M12_5 = "M12.5"
-    M12_8 = "M12.8"
-    M13 = "M13"
-    M13_0 = "M13.0"
-    M13_1 = "M13.1"
-    M13_8 = "M13.8"
-    M13_9 = "M13.9"
-    M15_M19 = "M15-M19"
-    M15 = "M15"
-    M15_0 = "M15.0"
-    M15_1 = "M15.1"
-    M15_2 = "M15.2"
-    M15_3 = "M15.3"
-    M15_4 = "M15.4"
-    M15_8 = "M15.8"
-    M15_9 = "M15.9"
-    M16 = "M16"
-    M16_0 = "M16.0"
-    M16_1 = "M16.1"
-    M16_2 = "M16.2"
-    M16_3 = "M16.3"
-    M16_4 = "M16.4"
-    M16_5 = "M16.5"
-    M16_6 = "M16.6"
-    M16_7 = "M16.7"
-    M16_9 = "M16.9"
-    M17 = "M17"
-    M17_0 = "M17.0"
-    M17_1 = "M17.1"
-    M17_2 = "M17.2"
-    M17_3 = "M17.3"
-    M17_4 = "M17.4"
-    M17_5 = "M17.5"
-    M17_9 = "M17.9"
-    M18 = "M18"
-    M18_0 = "M18.0"
-    M18_1 = "M18.1"
-    M18_2 = "M18.2"
-    M18_3 = "M18.3"
-    M18_4 = "M18.4"
-    M18_5 = "M18.5"
-    M18_9 = "M18.9"
-    M19 = "M19"
-    M19_0 = "M19.0"
-    M19_1 = "M19.1"
-    M19_2 = "M19.2"
-    M19_8 = "M19.8"
-    M19_9 = "M19.9"
-    M20_M25 = "M20-M25"
-    M20 = "M20"
-    M20_0 = "M20.0"
-    M20_1 = "M20.1"
-    M20_2 = "M20.2"
-    M20_3 = "M20.3"
-    M20_4 = "M20.4"
-    M20_5 = "M20.5"
-    M20_6 = "M20.6"
-    M21 = "M21"
-    M21_0 = "M21.0"
-    M21_1 = "M21.1"
-    M21_2 = "M21.2"
-    M21_3 = "M21.3"
-    M21_4 = "M21.4"
-    M21_5 = "M21.5"
-    M21_6 = "M21.6"
-    M21_7 = "M21.7"
-    M21_8 = "M21.8"
-    M21_9 = "M21.9"
-    M22 = "M22"
-    M22_0 = "M22.0"
-    M22_1 = "M22.1"
-    M22_2 = "M22.2"
-    M22_3 = "M22.3"
-    M22_4 = "M22.4"
-    M22_8 = "M22.8"
-    M22_9 = "M22.9"
-    M23 = "M23"
-    M23_0 = "M23.0"
-    M23_1 = "M23.1"
-    M23_2 = "M23.2"
-    M23_3 = "M23.3"
-    M23_4 = "M23.4"
-    M23_5 = "M23.5"
-    M23_6 = "M23.6"
-    M23_8 = "M23.8"
-    M23_9 = "M23.9"
-    M24 = "M24"
-    M24_0 = "M24.0"
-    M24_1 = "M24.1"
-    M24_2 = "M24.2"
-    M24_3 = "M24.3"
-    M24_4 = "M24.4"
-    M24_5 = "M24.5"
-    M24_6 = "M24.6"
-    M24_7 = "M24.7"
-    M24_8 = "M24.8"
-    M24_9 = "M24.9"
-    M25 = "M25"
-    M25_0 = "M25.0"
-    M25_1 = "M25.1"
-    M25_2 = "M25.2"
-    M25_3 = "M25.3"
-    M25_4 = "M25.4"
-    M25_5 = "M25.5"
-    M25_6 = "M25.6"
-    M25_7 = "M25.7"
-    M25_8 = "M25.8"
-    M25_9 = "M25.9"
-    M30_M35 = "M30-M35"
-    M30 = "M30"
-    M30_0 = "M30.0"
-    M30_1 = "M30.1"
-    M30_2 = "M30.2"
-    M30_3 = "M30.3"
-    M30_8 = "M30.8"
-    M31 = "M31"
-    M31_0 = "M31.0"
-    M31_1 = "M31.1"
-    M31_2 = "M31.2"
-    M31_3 = "M31.3"
-    M31_4 = "M31.4"
-    M31_5 = "M31.5"
-    M31_6 = "M31.6"
-    M31_7 = "M31.7"
-    M31_8 = "M31.8"
-    M31_9 = "M31.9"
-    M32 = "M32"
-    M32_0 = "M32.0"
-    M32_1 = "M32.1"
-    M32_8 = "M32.8"
-    M32_9 = "M32.9"
-    M33 = "M33"
-    M33_0 = "M33.0"
-    M33_1 = "M33.1"
-    M33_2 = "M33.2"
-    M33_9 = "M33.9"
-    M34 = "M34"
-    M34_0 = "M34.0"
-    M34_1 = "M34.1"
-    M34_2 = "M34.2"
-    M34_8 = "M34.8"
-    M34_9 = "M34.9"
-    M35 = "M35"
-    M35_0 = "M35.0"
-    M35_1 = "M35.1"
-    M35_2 = "M35.2"
-    M35_3 = "M35.3"
-    M35_4 = "M35.4"
-    M35_5 = "M35.5"
-    M35_6 = "M35.6"
-    M35_7 = "M35.7"
-    M35_8 = "M35.8"
-    M35_9 = "M35.9"
-    M40_M54 = "M40-M54"
-    M40_M43 = "M40-M43"
-    M40 = "M40"
-    M40_0 = "M40.0"
-    M40_1 = "M40.1"
-    M40_2 = "M40.2"
-    M40_3 = "M40.3"
-    M40_4 = "M40.4"
-    M40_5 = "M40.5"
-    M41 = "M41"
-    M41_0 = "M41.0"
-    M41_1 = "M41.1"
-    M41_2 = "M41.2"
-    M41_3 = "M41.3"
-    M41_4 = "M41.4"
-    M41_5 = "M41.5"
-    M41_8 = "M41.8"
-    M41_9 = "M41.9"
-    M42 = "M42"
-    M42_0 = "M42.0"
-    M42_1 = "M42.1"
-    M42_9 = "M42.9"
-    M43 = "M43"
-    M43_0 = "M43.0"
-    M43_1 = "M43.1"
-    M43_2 = "M43.2"
-    M43_3 = "M43.3"
-    M43_4 = "M43.4"
-    M43_5 = "M43.5"
-    M43_6 = "M43.6"
-    M43_8 = "M43.8"
-    M43_9 = "M43.9"
-    M45_M48 = "M45-M48"
-    M45 = "M45"
-    M46 = "M46"
-    M46_0 = "M46.0"
-    M46_1 = "M46.1"
-    M46_2 = "M46.2"
-    M46_3 = "M46.3"
-    M46_4 = "M46.4"
-    M46_5 = "M46.5"
-    M46_8 = "M46.8"
-    M46_9 = "M46.9"
-    M47 = "M47"
-    M47_0 = "M47.0"
-    M47_1 = "M47.1"
-    M47_2 = "M47.2"
-    M47_8 = "M47.8"
-    M47_9 = "M47.9"
-    M48 = "M48"
-    M48_0 = "M48.0"
-    M48_1 = "M48.1"
-    M48_2 = "M48.2"
-    M48_3 = "M48.3"
-    M48_4 = "M48.4"
-    M48_5 = "M48.5"
-    M48_8 = "M48.8"
-    M48_9 = "M48.9"
-    M50_M54 = "M50-M54"
-    M50 = "M50"
-    M50_0 = "M50.0"
-    M50_1 = "M50.1"
-    M50_2 = "M50.2"
-    M50_3 = "M50.3"
-    M50_8 = "M50.8"
-    M50_9 = "M50.9"
-    M51 = "M51"
-    M51_0 = "M51.0"
-    M51_1 = "M51.1"
-    M51_2 = "M51.2"
-    M51_3 = "M51.3"
-    M51_4 = "M51.4"
-    M51_8 = "M51.8"
-    M51_9 = "M51.9"
-    M53 = "M53"
-    M53_0 = "M53.0"
-    M53_1 = "M53.1"
-    M53_2 = "M53.2"
-    M53_3 = "M53.3"
-    M53_8 = "M53.8"
-    M53_9 = "M53.9"
-    M54 = "M54"
-    M54_0 = "M54.0"
-    M54_1 = "M54.1"
-    M54_2 = "M54.2"
-    M54_3 = "M54.3"
-    M54_4 = "M54.4"
-    M54_5 = "M54.5"
-    M54_6 = "M54.6"
-    M54_8 = "M54.8"
-    M54_9 = "M54.9"
-    M60_M79 = "M60-M79"
-    M60_M62 = "M60-M62"
-    M60 = "M60"
-    M60_0 = "M60.0"
-    M60_1 = "M60.1"
-    M60_2 = "M60.2"
-    M60_8 = "M60.8"
-    M60_9 = "M60.9"
-    M61 = "M61"
-    M61_0 = "M61.0"
-    M61_1 = "M61.1"
-    M61_2 = "M61.2"
-    M61_3 = "M61.3"
-    M61_4 = "M61.4"
-    M61_5 = "M61.5"
-    M61_9 = "M61.9"
-    M62 = "M62"
-    M62_0 = "M62.0"
-    M62_1 = "M62.1"
-    M62_2 = "M62.2"
-    M62_3 = "M62.3"
-    M62_4 = "M62.4"
-    M62_5 = "M62.5"
-    M62_6 = "M62.6"
-    M62_8 = "M62.8"
-    M62_9 = "M62.9"
-    M65_M67 = "M65-M67"
-    M65 = "M65"
-    M65_0 = "M65.0"
-    M65_1 = "M65.1"
-    M65_2 = "M65.2"
-    M65_3 = "M65.3"
-    M65_4 = "M65.4"
-    M65_8 = "M65.8"
-    M65_9 = "M65.9"
-    M66 = "M66"
-    M66_0 = "M66.0"
-    M66_1 = "M66.1"
-    M66_2 = "M66.2"
-    M66_3 = "M66.3"
-    M66_4 = "M66.4"
-    M66_5 = "M66.5"
-    M67 = "M67"
-    M67_0 = "M67.0"
-    M67_1 = "M67.1"
-    M67_2 = "M67.2"
-    M67_3 = "M67.3"
-    M67_4 = "M67.4"
-    M67_8 = "M67.8"
-    M67_9 = "M67.9"
-    M70_M79 = "M70-M79"
-    M70 = "M70"
-    M70_0 = "M70.0"
-    M70_1 = "M70.1"
-    M70_2 = "M70.2"
-    M70_3 = "M70.3"
-    M70_4 = "M70.4"
-    M70_5 = "M70.5"
-    M70_6 = "M70.6"
-    M70_7 = "M70.7"
-    M70_8 = "M70.8"
-    M70_9 = "M70.9"
-    M71 = "M71"
-    M71_0 = "M71.0"
-    M71_1 = "M71.1"
-    M71_2 = "M71.2"
-    M71_3 = "M71.3"
-    M71_4 = "M71.4"
-    M71_5 = "M71.5"
-    M71_8 = "M71.8"
-    M71_9 = "M71.9"
-    M72 = "M72"
-    M72_0 = "M72.0"
-    M72_1 = "M72.1"
-    M72_2 = "M72.2"
-    M72_3 = "M72.3"
-    M72_4 = "M72.4"
-    M72_5 = "M72.5"
-    M72_6 = "M72.6"
-    M72_8 = "M72.8"
-    M72_9 = "M72.9"
-    M75 = "M75"
-    M75_0 = "M75.0"
-    M75_1 = "M75.1"
-    M75_2 = "M75.2"
-    M75_3 = "M75.3"
-    M75_4 = "M75.4"
-    M75_5 = "M75.5"
-    M75_8 = "M75.8"
-    M75_9 = "M75.9"
-    M76 = "M76"
-    M76_0 = "M76.0"
-    M76_1 = "M76.1"
-    M76_2 = "M76.2"
-    M76_3 = "M76.3"
-    M76_4 = "M76.4"
-    M76_5 = "M76.5"
-    M76_6 = "M76.6"
-    M76_7 = "M76.7"
-    M76_8 = "M76.8"
-    M76_9 = "M76.9"
-    M77 = "M77"
-    M77_0 = "M77.0"
-    M77_1 = "M77.1"
-    M77_2 = "M77.2"
-    M77_3 = "M77.3"
-    M77_4 = "M77.4"
-    M77_5 = "M77.5"
-    M77_8 = "M77.8"
-    M77_9 = "M77.9"
-    M79 = "M79"
-    M79_0 = "M79.0"
-    M79_1 = "M79.1"
-    M79_2 = "M79.2"
-    M79_3 = "M79.3"
-    M79_4 = "M79.4"
-    M79_5 = "M79.5"
-    M79_6 = "M79.6"
-    M79_7 = "M79.7"
-    M79_8 = "M79.8"
-    M79_9 = "M79.9"
-    M80_M94 = "M80-M94"
-    M80_M85 = "M80-M85"
-    M80 = "M80"
-    M80_0 = "M80.0"
-    M80_1 = "M80.1"
-    M80_2 = "M80.2"
-    M80_3 = "M80.3"
-    M80_4 = "M80.4"
-    M80_5 = "M80.5"
-    M80_8 = "M80.8"
-    M80_9 = "M80.9"
-    M81 = "M81"
-    M81_0 = "M81.0"
-    M81_1 = "M81.1"
-    M81_2 = "M81.2"
-    M81_3 = "M81.3"
-    M81_4 = "M81.4"
-    M81_5 = "M81.5"
-    M81_6 = "M81.6"
-    M81_8 = "M81.8"
-    M81_9 = "M81.9"
-    M83 = "M83"
-    M83_0 = "M83.0"
-    M83_1 = "M83.1"
-    M83_2 = "M83.2"
-    M83_3 = "M83.3"
-    M83_4 = "M83.4"
-    M83_5 = "M83.5"
-    M83_8 = "M83.8"
-    M83_9 = "M83.9"
-    M84 = "M84"
-    M84_0 = "M84.0"
-    M84_1 = "M84.1"
-    M84_2 = "M84.2"
-    M84_3 = "M84.3"
-    M84_4 = "M84.4"
-    M84_8 = "M84.8"
-    M84_9 = "M84.9"
-    M85 = "M85"
-    M85_0 = "M85.0"
-    M85_1 = "M85.1"
-    M85_2 = "M85.2"
-    M85_3 = "M85.3"
-    M85_4 = "M85.4"
-    M85_5 = "M85.5"
-    M85_6 = "M85.6"
-    M85_8 = "M85.8"
-    M85_9 = "M85.9"
-    M86_M89 = "M86-M89"
-    M86 = "M86"
-    M86_0 = "M86.0"
-    M86_1 = "M86.1"
-    M86_2 = "M86.2"
-    M86_3 = "M86.3"
-    M86_4 = "M86.4"
-    M86_5 = "M86.5"
-    M86_6 = "M86.6"
-    M86_8 = "M86.8"
-    M86_9 = "M86.9"
-    M87 = "M87"
-    M87_0 = "M87.0"
-    M87_1 = "M87.1"
-    M87_2 = "M87.2"
-    M87_3 = "M87.3"
-    M87_8 = "M87.8"
-    M87_9 = "M87.9"
-    M88 = "M88"
-    M88_0 = "M88.0"
-    M88_8 = "M88.8"
-    M88_9 = "M88.9"
-    M89 = "M89"
-    M89_0 = "M89.0"
-    M89_1 = "M89.1"
-    M89_2 = "M89.2"
-    M89_3 = "M89.3"
-    M89_4 = "M89.4"
-    M89_5 = "M89.5"
-    M89_6 = "M89.6"
-    M89_8 = "M89.8"
-    M89_9 = "M89.9"
-    M91_M94 = "M91-M94"
-    M91 = "M91"
-    M91_0 = "M91.0"
-    M91_1 = "M91.1"
-    M91_2 = "M91.2"
-    M91_3 = "M91.3"
-    M91_8 = "M91.8"
-    M91_9 = "M91.9"
-    M92 = "M92"
-    M92_0 = "M92.0"
-    M92_1 = "M92.1"
-    M92_2 = "M92.2"
-    M92_3 = "M92.3"
-    M92_4 = "M92.4"
-    M92_5 = "M92.5"
-    M92_6 = "M92.6"
-    M92_7 = "M92.7"
-    M92_8 = "M92.8"
-    M92_9 = "M92.9"
-    M93 = "M93"
-    M93_0 = "M93.0"
-    M93_1 = "M93.1"
-    M93_2 = "M93.2"
-    M93_8 = "M93.8"
-    M93_9 = "M93.9"
-    M94 = "M94"
-    M94_0 = "M94.0"
-    M94_1 = "M94.1"
-    M94_2 = "M94.2"
-    M94_3 = "M94.3"
-    M94_8 = "M94.8"
-    M94_9 = "M94.9"
-    M95_M99 = "M95-M99"
-    M95 = "M95"
-    M95_0 = "M95.0"
-    M95_1 = "M95.1"
-    M95_2 = "M95.2"
-    M95_3 = "M95.3"
-    M95_4 = "M95.4"
-    M95_5 = "M95.5"
-    M95_8 = "M95.8"
-    M95_9 = "M95.9"
-    M99 = "M99"
-    M99_0 = "M99.0"
-    M99_1 = "M99.1"
-    M99_2 = "M99.2"
-    M99_3 = "M99.3"
-    M99_4 = "M99.4"
-    M99_5 = "M99.5"
-    M99_6 = "M99.6"
-    M99_7 = "M99.7"
-    M99_8 = "M99.8"
-    M99_9 = "M99.9"
-    N00_N98 = "N00-N98"
-    N00_N07 = "N00-N07"
-    N00 = "N00"
-    N00_0 = "N00.0"
-    N00_1 = "N00.1"
-    N00_2 = "N00.2"
-    N00_3 = "N00.3"
-    N00_4 = "N00.4"
-    N00_5 = "N00.5"
-    N00_6 = "N00.6"
-    N00_7 = "N00.7"
-    N00_8 = "N00.8"
-    N00_9 = "N00.9"
-    N01 = "N01"
-    N01_0 = "N01.0"
-    N01_1 = "N01.1"
-    N01_2 = "N01.2"
-    N01_3 = "N01.3"
-    N01_4 = "N01.4"
-    N01_5 = "N01.5"
-    N01_6 = "N01.6"
-    N01_7 = "N01.7"
-    N01_8 = "N01.8"
-    N01_9 = "N01.9"
-    N02 = "N02"
-    N02_0 = "N02.0"
-    N02_1 = "N02.1"
-    N02_2 = "N02.2"
-    N02_3 = "N02.3"
-    N02_4 = "N02.4"
-    N02_5 = "N02.5"
-    N02_6 = "N02.6"
-    N02_7 = "N02.7"
-    N02_8 = "N02.8"
-    N02_9 = "N02.9"
-    N03 = "N03"
-    N03_0 = "N03.0"
-    N03_1 = "N03.1"
-    N03_2 = "N03.2"
-    N03_3 = "N03.3"
-    N03_4 = "N03.4"
-    N03_5 = "N03.5"
-    N03_6 = "N03.6"
-    N03_7 = "N03.7"
-    N03_8 = "N03.8"
-    N03_9 = "N03.9"
-    N04 = "N04"
-    N04_0 = "N04.0"
-    N04_1 = "N04.1"
-    N04_2 = "N04.2"
-    N04_3 = "N04.3"
-    N04_4 = "N04.4"
-    N04_5 = "N04.5"
-    N04_6 = "N04.6"
-    N04_7 = "N04.7"
-    N04_8 = "N04.8"
-    N04_9 = "N04.9"
-    N05 = "N05"
-    N05_0 = "N05.0"
-    N05_1 = "N05.1"
-    N05_2 = "N05.2"
-    N05_3 = "N05.3"
-    N05_4 = "N05.4"
-    N05_5 = "N05.5"
-    N05_6 = "N05.6"
-    N05_7 = "N05.7"
-    N05_8 = "N05.8"
-    N05_9 = "N05.9"
-    N06 = "N06"
-    N06_0 = "N06.0"
-    N06_1 = "N06.1"
-    N06_2 = "N06.2"
-    N06_3 = "N06.3"
-    N06_4 = "N06.4"
-    N06_5 = "N06.5"
-    N06_6 = "N06.6"
-    N06_7 = "N06.7"
-    N06_8 = "N06.8"
-    N06_9 = "N06.9"
-    N07 = "N07"
-    N07_0 = "N07.0"
-    N07_1 = "N07.1"
-    N07_2 = "N07.2"
-    N07_3 = "N07.3"
-    N07_4 = "N07.4"
-    N07_5 = "N07.5"
-    N07_6 = "N07.6"
-    N07_7 = "N07.7"
-    N07_8 = "N07.8"
-    N07_9 = "N07.9"
-    N10_N15 = "N10-N15"
-    N10 = "N10"
-    N11 = "N11"
-    N11_0 = "N11.0"
-    N11_1 = "N11.1"
-    N11_8 = "N11.8"
-    N11_9 = "N11.9"
-    N12 = "N12"
-    N13 = "N13"
-    N13_0 = "N13.0"
-    N13_1 = "N13.1"
-    N13_2 = "N13.2"
-    N13_3 = "N13.3"
-    N13_4 = "N13.4"
-    N13_5 = "N13.5"
-    N13_6 = "N13.6"
-    N13_7 = "N13.7"
-    N13_8 = "N13.8"
-    N13_9 = "N13.9"
-    N14 = "N14"
-    N14_0 = "N14.0"
-    N14_1 = "N14.1"
-    N14_2 = "N14.2"
-    N14_3 = "N14.3"
-    N14_4 = "N14.4"
-    N15 = "N15"
-    N15_0 = "N15.0"
-    N15_1 = "N15.1"
-    N15_8 = "N15.8"
-    N15_9 = "N15.9"
-    N17_N19 = "N17-N19"
-    N17 = "N17"
-    N17_0 = "N17.0"
-    N17_1 = "N17.1"
-    N17_2 = "N17.2"
-    N17_8 = "N17.8"
-    N17_9 = "N17.9"
-    N18 = "N18"
-    N18_0 = "N18.0"
-    N18_1 = "N18.1"
-    N18_2 = "N18.2"
-    N18_3 = "N18.3"
-    N18_4 = "N18.4"
-    N18_5 = "N18.5"
-    N18_8 = "N18.8"
-    N18_9 = "N18.9"
-    N19 = "N19"
-    N20_N23 = "N20-N23"
-    N20 = "N20"
-    N20_0 = "N20.0"
-    N20_1 = "N20.1"
-    N20_2 = "N20.2"
-    N20_9 = "N20.9"
-    N21 = "N21"
-    N21_0 = "N21.0"
-    N21_1 = "N21.1"
-    N21_8 = "N21.8"
-    N21_9 = "N21.9"
-    N23 = "N23"
-    N25_N28 = "N25-N28"
-    N25 = "N25"
-    N25_0 = "N25.0"
-    N25_1 = "N25.1"
-    N25_8 = "N25.8"
-    N25_9 = "N25.9"
-    N26 = "N26"
-    N27 = "N27"
-    N27_0 = "N27.0"
-    N27_1 = "N27.1"
-    N27_9 = "N27.9"
-    N28 = "N28"
-    N28_0 = "N28.0"
-    N28_1 = "N28.1"
-    N28_8 = "N28.8"
-    N28_9 = "N28.9"
-    N30_N39 = "N30-N39"
-    N30 = "N30"
-    N30_0 = "N30.0"
-    N30_1 = "N30.1"
-    N30_2 = "N30.2"
-    N30_3 = "N30.3"
-    N30_4 = "N30.4"
-    N30_8 = "N30.8"
-    N30_9 = "N30.9"
-    N31 = "N31"
-    N31_0 = "N31.0"
-    N31_1 = "N31.1"
-    N31_2 = "N31.2"
-    N31_8 = "N31.8"
-    N31_9 = "N31.9"
-    N32 = "N32"
-    N32_0 = "N32.0"
-    N32_1 = "N32.1"
-    N32_2 = "N32.2"
-    N32_3 = "N32.3"
-    N32_4 = "N32.4"
-    N32_8 = "N32.8"
-    N32_9 = "N32.9"
-    N34 = "N34"
-    N34_0 = "N34.0"
-    N34_1 = "N34.1"
-    N34_2 = "N34.2"
-    N34_3 = "N34.3"
-    N35 = "N35"
-    N35_0 = "N35.0"
-    N35_1 = "N35.1"
-    N35_8 = "N35.8"
-    N35_9 = "N35.9"
-    N36 = "N36"
-    N36_0 = "N36.0"
-    N36_1 = "N36.1"
-    N36_2 = "N36.2"
-    N36_3 = "N36.3"
-    N36_8 = "N36.8"
-    N36_9 = "N36.9"
-    N39 = "N39"
-    N39_0 = "N39.0"
-    N39_1 = "N39.1"
-    N39_2 = "N39.2"
-    N39_3 = "N39.3"
-    N39_4 = "N39.4"
-    N39_8 = "N39.8"
-    N39_9 = "N39.9"
-    N40_N50 = "N40-N50"
-    N40 = "N40"
-    N41 = "N41"
-    N41_0 = "N41.0"
-    N41_1 = "N41.1"
-    N41_2 = "N41.2"
-    N41_3 = "N41.3"
-    N41_8 = "N41.8"
-    N41_9 = "N41.9"
-    N42 = "N42"
-    N42_0 = "N42.0"
-    N42_1 = "N42.1"
-    N42_2 = "N42.2"
-    N42_3 = "N42.3"
-    N42_8 = "N42.8"
-    N42_9 = "N42.9"
-    N43 = "N43"
-    N43_0 = "N43.0"
-    N43_1 = "N43.1"
-    N43_2 = "N43.2"
-    N43_3 = "N43.3"
-    N43_4 = "N43.4"
-    N44 = "N44"
-    N45 = "N45"
-    N45_0 = "N45.0"
-    N45_9 = "N45.9"
-    N46 = "N46"
-    N47 = "N47"
-    N48 = "N48"
-    N48_0 = "N48.0"
-    N48_1 = "N48.1"
-    N48_2 = "N48.2"
-    N48_3 = "N48.3"
-    N48_4 = "N48.4"
-    N48_5 = "N48.5"
-    N48_6 = "N48.6"
-    N48_8 = "N48.8"
-    N48_9 = "N48.9"
-    N49 = "N49"
-    N49_0 = "N49.0"
-    N49_1 = "N49.1"
-    N49_2 = "N49.2"
-    N49_8 = "N49.8"
-    N49_9 = "N49.9"
-    N50 = "N50"
-    N50_0 = "N50.0"
-    N50_1 = "N50.1"
-    N50_8 = "N50.8"
-    N50_9 = "N50.9"
-    N60_N64 = "N60-N64"
-    N60 = "N60"
-    N60_0 = "N60.0"
-    N60_1 = "N60.1"
-    N60_2 = "N60.2"
-    N60_3 = "N60.3"
-    N60_4 = "N60.4"
-    N60_8 = "N60.8"
-    N60_9 = "N60.9"
-    N61 = "N61"
-    N62 = "N62"
-    N63 = "N63"
-    N64 = "N64"
-    N64_0 = "N64.0"
-    N64_1 = "N64.1"
-    N64_2 = "N64.2"
-    N64_3 = "N64.3"
-    N64_4 = "N64.4"
-    N64_5 = "N64.5"
-    N64_8 = "N64.8"
-    N64_9 = "N64.9"
-    N70_N76 = "N70-N76"
-    N70 = "N70"
-    N70_0 = "N70.0"
-    N70_1 = "N70.1"
-    N70_9 = "N70.9"
-    N71 = "N71"
-    N71_0 = "N71.0"
-    N71_1 = "N71.1"
-    N71_9 = "N71.9"
-    N72 = "N72"
-    N73 = "N73"
-    N73_0 = "N73.0"
-    N73_1 = "N73.1"
-    N73_2 = "N73.2"
-    N73_3 = "N73.3"
-    N73_4 = "N73.4"
-    N73_5 = "N73.5"
-    N73_6 = "N73.6"
-    N73_8 = "N73.8"
-    N73_9 = "N73.9"
-    N75 = "N75"
-    N75_0 = "N75.0"
-    N75_1 = "N75.1"
-    N75_8 = "N75.8"
-    N75_9 = "N75.9"
-    N76 = "N76"
-    N76_0 = "N76.0"
-    N76_1 = "N76.1"
-    N76_2 = "N76.2"
-    N76_3 = "N76.3"
-    N76_4 = "N76.4"
-    N76_5 = "N76.5"
-    N76_6 = "N76.6"
-    N76_8 = "N76.8"
-    N80_N98 = "N80-N98"
-    N80 = "N80"
-    N80_0 = "N80.0"
-    N80_1 = "N80.1"
-    N80_2 = "N80.2"
-    N80_3 = "N80.3"
-    N80_4 = "N80.4"
-    N80_5 = "N80.5"
-    N80_6 = "N80.6"
-    N80_8 = "N80.8"
-    N80_9 = "N80.9"
-    N81 = "N81"
-    N81_0 = "N81.0"
-    N81_1 = "N81.1"
-    N81_2 = "N81.2"
-    N81_3 = "N81.3"
-    N81_4 = "N81.4"
-    N81_5 = "N81.5"
-    N81_6 = "N81.6"
-    N81_8 = "N81.8"
-    N81_9 = "N81.9"
-    N82 = "N82"
-    N82_0 = "N82.0"
-    N82_1 = "N82.1"
-    N82_2 = "N82.2"
-    N82_3 = "N82.3"
-    N82_4 = "N82.4"
-    N82_5 = "N82.5"
-    N82_8 = "N82.8"
-    N82_9 = "N82.9"
-    N83 = "N83"
-    N83_0 = "N83.0"
-    N83_1 = "N83.1"
-    N83_2 = "N83.2"
-    N83_3 = "N83.3"
-    N83_4 = "N83.4"
-    N83_5 = "N83.5"
-    N83_6 = "N83.6"
-    N83_7 = "N83.7"
-    N83_8 = "N83.8"
-    N83_9 = "N83.9"
-    N84 = "N84"
-    N84_0 = "N84.0"
-    N84_1 = "N84.1"
-    N84_2 = "N84.2"
-    N84_3 = "N84.3"
-    N84_8 = "N84.8"
-    N84_9 = "N84.9"
-    N85 = "N85"
-    N85_0 = "N85.0"
-    N85_1 = "N85.1"
-    N85_2 = "N85.2"
-    N85_3 = "N85.3"
-    N85_4 = "N85.4"
-    N85_5 = "N85.5"
-    N85_6 = "N85.6"
-    N85_7 = "N85.7"
-    N85_8 = "N85.8"
-    N85_9 = "N85.9"
-    N86 = "N86"
-    N87 = "N87"
-    N87_0 = "N87.0"
-    N87_1 = "N87.1"
-    N87_2 = "N87.2"
-    N87_9 = "N87.9"
-    N88 = "N88"
-    N88_0 = "N88.0"
-    N88_1 = "N88.1"
-    N88_2 = "N88.2"
-    N88_3 = "N88.3"
-    N88_4 = "N88.4"
-    N88_8 = "N88.8"
-    N88_9 = "N88.9"
-    N89 = "N89"
-    N89_0 = "N89.0"
-    N89_1 = "N89.1"
-    N89_2 = "N89.2"
-    N89_3 = "N89.3"
-    N89_4 = "N89.4"
-    N89_5 = "N89.5"
-    N89_6 = "N89.6"
-    N89_7 = "N89.7"
-    N89_8 = "N89.8"
-    N89_9 = "N89.9"
-    N90 = "N90"
-    N90_0 = "N90.0"
-    N90_1 = "N90.1"
-    N90_2 = "N90.2"
-    N90_3 = "N90.3"
-    N90_4 = "N90.4"
-    N90_5 = "N90.5"
-    N90_6 = "N90.6"
-    N90_7 = "N90.7"
-    N90_8 = "N90.8"
-    N90_9 = "N90.9"
-    N91 = "N91"
-    N91_0 = "N91.0"
-    N91_1 = "N91.1"
-    N91_2 = "N91.2"
-    N91_3 = "N91.3"
-    N91_4 = "N91.4"
-    N91_5 = "N91.5"
-    N92 = "N92"
-    N92_0 = "N92.0"
-    N92_1 = "N92.1"
-    N92_2 = "N92.2"
-    N92_3 = "N92.3"
-    N92_4 = "N92.4"
-    N92_5 = "N92.5"
-    N92_6 = "N92.6"
-    N93 = "N93"
-    N93_0 = "N93.0"
-    N93_8 = "N93.8"
-    N93_9 = "N93.9"
-    N94 = "N94"
-    N94_0 = "N94.0"
-    N94_1 = "N94.1"
-    N94_2 = "N94.2"
-    N94_3 = "N94.3"
-    N94_4 = "N94.4"
-    N94_5 = "N94.5"
-    N94_6 = "N94.6"
-    N94_8 = "N94.8"
-    N94_9 = "N94.9"
-    N95 = "N95"
-    N95_0 = "N95.0"
-    N95_1 = "N95.1"
-    N95_2 = "N95.2"
-    N95_3 = "N95.3"
-    N95_8 = "N95.8"
-    N95_9 = "N95.9"
-    N96 = "N96"
-    N97 = "N97"
-    N97_0 = "N97.0"
-    N97_1 = "N97.1"
-    N97_2 = "N97.2"
-    N97_3 = "N97.3"
-    N97_4 = "N97.4"
-    N97_8 = "N97.8"
-    N97_9 = "N97.9"
-    N98 = "N98"
-    N98_0 = "N98.0"
-    N98_1 = "N98.1"
-    N98_2 = "N98.2"
-    N98_3 = "N98.3"
-    N98_8 = "N98.8"
-    N98_9 = "N98.9"
-    O00_O99 = "O00-O99"
-    O00_O07 = "O00-O07"
-    O00 = "O00"
-    O00_0 = "O00.0"
-    O00_1 = "O00.1"
-    O00_2 = "O00.2"
-    O00_8 = "O00.8"
-    O00_9 = "O00.9"
-    O01 = "O01"
-    O01_0 = "O01.0"
-    O01_1 = "O01.1"
-    O01_9 = "O01.9"
-    O02 = "O02"
-    O02_0 = "O02.0"
-    O02_1 = "O02.1"
-    O02_8 = "O02.8"
-    O02_9 = "O02.9"
-    O03 = "O03"
-    O03_0 = "O03.0"
-    O03_1 = "O03.1"
-    O03_2 = "O03.2"
-    O03_3 = "O03.3"
-    O03_4 = "O03.4"
-    O03_5 = "O03.5"
-    O03_6 = "O03.6"
-    O03_7 = "O03.7"
-    O03_8 = "O03.8"
-    O03_9 = "O03.9"
-    O04 = "O04"
-    O04_0 = "O04.0"
-    O04_1 = "O04.1"
-    O04_2 = "O04.2"
-    O04_3 = "O04.3"
-    O04_4 = "O04.4"
-    O04_5 = "O04.5"
-    O04_6 = "O04.6"
-    O04_7 = "O04.7"
-    O04_8 = "O04.8"
-    O04_9 = "O04.9"
-    O05 = "O05"
-    O05_0 = "O05.0"
-    O05_1 = "O05.1"
-    O05_2 = "O05.2"
-    O05_3 = "O05.3"
-    O05_4 = "O05.4"
-    O05_5 = "O05.5"
-    O05_6 = "O05.6"
-    O05_7 = "O05.7"
-    O05_8 = "O05.8"
-    O05_9 = "O05.9"
-    O06 = "O06"
-    O06_0 = "O06.0"
-    O06_1 = "O06.1"
-    O06_2 = "O06.2"
-    O06_3 = "O06.3"
-    O06_4 = "O06.4"
-    O06_5 = "O06.5"
-    O06_6 = "O06.6"
-    O06_7 = "O06.7"
-    O06_8 = "O06.8"
-    O06_9 = "O06.9"
-    O07 = "O07"
-    O07_0 = "O07.0"
-    O07_1 = "O07.1"
-    O07_2 = "O07.2"
-    O07_3 = "O07.3"
-    O07_4 = "O07.4"
-    O07_5 = "O07.5"
-    O07_6 = "O07.6"
-    O07_7 = "O07.7"
-    O07_8 = "O07.8"
-    O07_9 = "O07.9"
-    O10_O16 = "O10-O16"
-    O10 = "O10"
-    O10_0 = "O10.0"
-    O10_1 = "O10.1"
-    O10_2 = "O10.2"
-    O10_3 = "O10.3"
-    O10_4 = "O10.4"
-    O10_9 = "O10.9"
-    O11 = "O11"
-    O12 = "O12"
-    O12_0 = "O12.0"
-    O12_1 = "O12.1"
-    O12_2 = "O12.2"
-    O13 = "O13"
-    O14 = "O14"
-    O14_0 = "O14.0"
-    O14_1 = "O14.1"
-    O14_2 = "O14.2"
-    O14_9 = "O14.9"
-    O15 = "O15"
-    O15_0 = "O15.0"
-    O15_1 = "O15.1"
-    O15_2 = "O15.2"
-    O15_9 = "O15.9"
-    O16 = "O16"
-    O20_O29 = "O20-O29"
-    O20 = "O20"
-    O20_0 = "O20.0"
-    O20_8 = "O20.8"
-    O20_9 = "O20.9"
-    O21 = "O21"
-    O21_0 = "O21.0"
-    O21_1 = "O21.1"
-    O21_2 = "O21.2"
-    O21_8 = "O21.8"
-    O21_9 = "O21.9"
-    O22 = "O22"
-    O22_0 = "O22.0"
-    O22_1 = "O22.1"
-    O22_2 = "O22.2"
-    O22_3 = "O22.3"
-    O22_4 = "O22.4"
-    O22_5 = "O22.5"
-    O22_8 = "O22.8"
-    O22_9 = "O22.9"
-    O23 = "O23"
-    O23_0 = "O23.0"
-    O23_1 = "O23.1"
-    O23_2 = "O23.2"
-    O23_3 = "O23.3"
-    O23_4 = "O23.4"
-    O23_5 = "O23.5"
-    O23_9 = "O23.9"
-    O24 = "O24"
-    O24_0 = "O24.0"
-    O24_1 = "O24.1"
-    O24_2 = "O24.2"
-    O24_3 = "O24.3"
-    O24_4 = "O24.4"
-    O24_9 = "O24.9"
-    O25 = "O25"
-    O26 = "O26"
-    O26_0 = "O26.0"
-    O26_1 = "O26.1"
-    O26_2 = "O26.2"
-    O26_3 = "O26.3"
-    O26_4 = "O26.4"
-    O26_5 = "O26.5"
-    O26_6 = "O26.6"
-    O26_7 = "O26.7"
-    O26_8 = "O26.8"
-    O26_9 = "O26.9"
-    O28 = "O28"
-    O28_0 = "O28.0"
-    O28_1 = "O28.1"
-    O28_2 = "O28.2"
-    O28_3 = "O28.3"
-    O28_4 = "O28.4"
-    O28_5 = "O28.5"
-    O28_8 = "O28.8"
-    O28_9 = "O28.9"
-    O29 = "O29"
-    O29_0 = "O29.0"
-    O29_1 = "O29.1"
-    O29_2 = "O29.2"
-    O29_3 = "O29.3"
-    O29_4 = "O29.4"
-    O29_5 = "O29.5"
-    O29_6 = "O29.6"
-    O29_8 = "O29.8"
-    O29_9 = "O29.9"
-    O30_O48 = "O30-O48"
-    O30 = "O30"
-    O30_0 = "O30.0"
-    O30_1 = "O30.1"
-    O30_2 = "O30.2"
-    O30_8 = "O30.8"
-    O30_9 = "O30.9"
-    O31 = "O31"
-    O31_0 = "O31.0"
-    O31_1 = "O31.1"
-    O31_2 = "O31.2"
-    O31_8 = "O31.8"
-    O32 = "O32"
-    O32_0 = "O32.0"
-    O32_1 = "O32.1"
-    O32_2 = "O32.2"
-    O32_3 = "O32.3"
-    O32_4 = "O32.4"
-    O32_5 = "O32.5"
-    O32_6 = "O32.6"
-    O32_8 = "O32.8"
-    O32_9 = "O32.9"
-    O33 = "O33"
-    O33_0 = "O33.0"
-    O33_1 = "O33.1"
-    O33_2 = "O33.2"
-    O33_3 = "O33.3"
-    O33_4 = "O33.4"
-    O33_5 = "O33.5"
-    O33_6 = "O33.6"
-    O33_7 = "O33.7"
-    O33_8 = "O33.8"
-    O33_9 = "O33.9"
-    O34 = "O34"
-    O34_0 = "O34.0"
-    O34_1 = "O34.1"
-    O34_2 = "O34.2"
-    O34_3 = "O34.3"
-    O34_4 = "O34.4"
-    O34_5 = "O34.5"
-    O34_6 = "O34.6"
-    O34_7 = "O34.7"
-    O34_8 = "O34.8"
-    O34_9 = "O34.9"
-    O35 = "O35"
-    O35_0 = "O35.0"
-    O35_1 = "O35.1"
-    O35_2 = "O35.2"
-    O35_3 = "O35.3"
-    O35_4 = "O35.4"
-    O35_5 = "O35.5"
-    O35_6 = "O35.6"
-    O35_7 = "O35.7"
-    O35_8 = "O35.8"
-    O35_9 = "O35.9"
-    O36 = "O36"
-    O36_0 = "O36.0"
-    O36_1 = "O36.1"
-    O36_2 = "O36.2"
-    O36_3 = "O36.3"
-    O36_4 = "O36.4"
-    O36_5 = "O36.5"
-    O36_6 = "O36.6"
-    O36_7 = "O36.7"
-    O36_8 = "O36.8"
-    O36_9 = "O36.9"
-    O40 = "O40"
-    O41 = "O41"
-    O41_0 = "O41.0"
-    O41_1 = "O41.1"
-    O41_8 = "O41.8"
-    O41_9 = "O41.9"
-    O42 = "O42"
-    O42_0 = "O42.0"
-    O42_1 = "O42.1"
-    O42_2 = "O42.2"
-    O42_9 = "O42.9"
-    O43 = "O43"
-    O43_0 = "O43.0"
-    O43_1 = "O43.1"
-    O43_2 = "O43.2"
-    O43_8 = "O43.8"
-    O43_9 = "O43.9"
-    O44 = "O44"
-    O44_0 = "O44.0"
-    O44_1 = "O44.1"
-    O45 = "O45"
-    O45_0 = "O45.0"
-    O45_8 = "O45.8"
-    O45_9 = "O45.9"
-    O46 = "O46"
-    O46_0 = "O46.0"
-    O46_8 = "O46.8"
-    O46_9 = "O46.9"
-    O47 = "O47"
-    O47_0 = "O47.0"
-    O47_1 = "O47.1"
-    O47_9 = "O47.9"
-    O48 = "O48"
-    O60_O75 = "O60-O75"
-    O60 = "O60"
-    O61 = "O61"
-    O61_0 = "O61.0"
-    O61_1 = "O61.1"
-    O61_8 = "O61.8"
-    O61_9 = "O61.9"
-    O62 = "O62"
-    O62_0 = "O62.0"
-    O62_1 = "O62.1"
-    O62_2 = "O62.2"
-    O62_3 = "O62.3"
-    O62_4 = "O62.4"
-    O62_8 = "O62.8"
-    O62_9 = "O62.9"
-    O63 = "O63"
-    O63_0 = "O63.0"
-    O63_1 = "O63.1"
-    O63_2 = "O63.2"
-    O63_9 = "O63.9"
-    O64 = "O64"
-    O64_0 = "O64.0"
-    O64_1 = "O64.1"
-    O64_2 = "O64.2"
-    O64_3 = "O64.3"
-    O64_4 = "O64.4"
-    O64_5 = "O64.5"
-    O64_8 = "O64.8"
-    O64_9 = "O64.9"
-    O65 = "O65"
-    O65_0 = "O65.0"
-    O65_1 = "O65.1"
-    O65_2 = "O65.2"
-    O65_3 = "O65.3"
-    O65_4 = "O65.4"
-    O65_5 = "O65.5"
-    O65_8 = "O65.8"
-    O65_9 = "O65.9"
-    O66 = "O66"
-    O66_0 = "O66.0"
-    O66_1 = "O66.1"
-    O66_2 = "O66.2"
-    O66_3 = "O66.3"
-    O66_4 = "O66.4"
-    O66_5 = "O66.5"
-    O66_8 = "O66.8"
-    O66_9 = "O66.9"
-    O67 = "O67"
-    O67_0 = "O67.0"
-    O67_8 = "O67.8"
-    O67_9 = "O67.9"
-    O68 = "O68"
-    O68_0 = "O68.0"
-    O68_1 = "O68.1"
-    O68_2 = "O68.2"
-    O68_3 = "O68.3"
-    O68_8 = "O68.8"
-    O68_9 = "O68.9"
-    O69 = "O69"
-    O69_0 = "O69.0"
-    O69_1 = "O69.1"
-    O69_2 = "O69.2"
-    O69_3 = "O69.3"
-    O69_4 = "O69.4"
-    O69_5 = "O69.5"
-    O69_8 = "O69.8"
-    O69_9 = "O69.9"
-    O70 = "O70"
-    O70_0 = "O70.0"
-    O70_1 = "O70.1"
-    O70_2 = "O70.2"
-    O70_3 = "O70.3"
-    O70_9 = "O70.9"
-    O71 = "O71"
-    O71_0 = "O71.0"
-    O71_1 = "O71.1"
-    O71_2 = "O71.2"
-    O71_3 = "O71.3"
-    O71_4 = "O71.4"
-    O71_5 = "O71.5"
-    O71_6 = "O71.6"
-    O71_7 = "O71.7"
-    O71_8 = "O71.8"
-    O71_9 = "O71.9"
-    O72 = "O72"
-    O72_0 = "O72.0"
-    O72_1 = "O72.1"
-    O72_2 = "O72.2"
-    O72_3 = "O72.3"
-    O73 = "O73"
-    O73_0 = "O73.0"
-    O73_1 = "O73.1"
-    O74 = "O74"
-    O74_0 = "O74.0"
-    O74_1 = "O74.1"
-    O74_2 = "O74.2"
-    O74_3 = "O74.3"
-    O74_4 = "O74.4"
-    O74_5 = "O74.5"
-    O74_6 = "O74.6"
-    O74_7 = "O74.7"
-    O74_8 = "O74.8"
-    O74_9 = "O74.9"
-    O75 = "O75"
-    O75_0 = "O75.0"
-    O75_1 = "O75.1"
-    O75_2 = "O75.2"
-    O75_3 = "O75.3"
-    O75_4 = "O75.4"
-    O75_5 = "O75.5"
-    O75_6 = "O75.6"
-    O75_7 = "O75.7"
-    O75_8 = "O75.8"
-    O75_9 = "O75.9"
-    O85_O92 = "O85-O92"
-    O85 = "O85"
-    O86 = "O86"
-    O86_0 = "O86.0"
-    O86_1 = "O86.1"
-    O86_2 = "O86.2"
-    O86_3 = "O86.3"
-    O86_4 = "O86.4"
-    O86_8 = "O86.8"
-    O87 = "O87"
-    O87_0 = "O87.0"
-    O87_1 = "O87.1"
-    O87_2 = "O87.2"
-    O87_3 = "O87.3"
-    O87_8 = "O87.8"
-    O87_9 = "O87.9"
-    O88 = "O88"
-    O88_0 = "O88.0"
-    O88_1 = "O88.1"
-    O88_2 = "O88.2"
-    O88_3 = "O88.3"
-    O88_8 = "O88.8"
-    O89 = "O89"
-    O89_0 = "O89.0"
-    O89_1 = "O89.1"
-    O89_2 = "O89.2"
-    O89_3 = "O89.3"
-    O89_4 = "O89.4"
-    O89_5 = "O89.5"
-    O89_6 = "O89.6"
-    O89_8 = "O89.8"
-    O89_9 = "O89.9"
-    O90 = "O90"
-    O90_0 = "O90.0"
-    O90_1 = "O90.1"
-    O90_2 = "O90.2"
-    O90_3 = "O90.3"
-    O90_4 = "O90.4"
-    O90_5 = "O90.5"
-    O90_8 = "O90.8"
-    O90_9 = "O90.9"
-    O91 = "O91"
-    O91_0 = "O91.0"
-    O91_1 = "O91.1"
-    O91_2 = "O91.2"
-    O92 = "O92"
-    O92_0 = "O92.0"
-    O92_1 = "O92.1"
-    O92_2 = "O92.2"
-    O92_3 = "O92.3"
-    O92_4 = "O92.4"
-    O92_5 = "O92.5"
-    O92_6 = "O92.6"
-    O92_7 = "O92.7"
-    O95_O99 = "O95-O99"
-    O95 = "O95"
-    O96 = "O96"
-    O96_0 = "O96.0"
-    O96_1 = "O96.1"
-    O96_9 = "O96.9"
-    O97 = "O97"
-    O97_0 = "O97.0"
-    O97_1 = "O97.1"
-    O97_9 = "O97.9"
-    O98 = "O98"
-    O98_0 = "O98.0"
-    O98_1 = "O98.1"
-    O98_2 = "O98.2"
-    O98_3 = "O98.3"
-    O98_4 = "O98.4"
-    O98_5 = "O98.5"
-    O98_6 = "O98.6"
-    O98_7 = "O98.7"
-    O98_8 = "O98.8"
-    O98_9 = "O98.9"
-    O99 = "O99"
-    O99_0 = "O99.0"
-    O99_1 = "O99.1"
-    O99_2 = "O99.2"
-    O99_3 = "O99.3"
-    O99_4 = "O99.4"
-    O99_5 = "O99.5"
-    O99_6 = "O99.6"
-    O99_7 = "O99.7"
-    O99_8 = "O99.8"
-    P00_P96 = "P00-P96"
-    P00_P04 = "P00-P04"
-    P00 = "P00"
-    P00_0 = "P00.0"
-    P00_1 = "P00.1"
-    P00_2 = "P00.2"
-    P00_3 = "P00.3"
-    P00_4 = "P00.4"
-    P00_5 = "P00.5"
-    P00_6 = "P00.6"
-    P00_7 = "P00.7"
-    P00_8 = "P00.8"
-    P00_9 = "P00.9"
-    P01 = "P01"
-    P01_0 = "P01.0"
-    P01_1 = "P01.1"
-    P01_2 = "P01.2"
-    P01_3 = "P01.3"
-    P01_4 = "P01.4"
-    P01_5 = "P01.5"
-    P01_6 = "P01.6"
-    P01_7 = "P01.7"
-    P01_8 = "P01.8"
-    P01_9 = "P01.9"
-    P02 = "P02"
-    P02_0 = "P02.0"
-    P02_1 = "P02.1"
-    P02_2 = "P02.2"
-    P02_3 = "P02.3"
-    P02_4 = "P02.4"
-    P02_5 = "P02.5"
-    P02_6 = "P02.6"
-    P02_7 = "P02.7"
-    P02_8 = "P02.8"
-    P02_9 = "P02.9"
-    P03 = "P03"
-    P03_0 = "P03.0"
-    P03_1 = "P03.1"
-    P03_2 = "P03.2"
-    P03_3 = "P03.3"
-    P03_4 = "P03.4"
-    P03_5 = "P03.5"
-    P03_6 = "P03.6"
-    P03_8 = "P03.8"
-    P03_9 = "P03.9"
-    P04 = "P04"
-    P04_0 = "P04.0"
-    P04_1 = "P04.1"
-    P04_2 = "P04.2"
-    P04_3 = "P04.3"
-    P04_4 = "P04.4"
-    P04_5 = "P04.5"
-    P04_6 = "P04.6"
-    P04_8 = "P04.8"
-    P04_9 = "P04.9"
-    P05_P08 = "P05-P08"
-    P05 = "P05"
-    P05_0 = "P05.0"
-    P05_1 = "P05.1"
-    P05_2 = "P05.2"
-    P05_9 = "P05.9"
-    P07 = "P07"
-    P07_0 = "P07.0"
-    P07_1 = "P07.1"
-    P07_2 = "P07.2"
-    P07_3 = "P07.3"
-    P08 = "P08"
-    P08_0 = "P08.0"
-    P08_1 = "P08.1"
-    P08_2 = "P08.2"
-    P10_P15 = "P10-P15"
-    P10 = "P10"
-    P10_0 = "P10.0"
-    P10_1 = "P10.1"
-    P10_2 = "P10.2"
-    P10_3 = "P10.3"
-    P10_4 = "P10.4"
-    P10_8 = "P10.8"
-    P10_9 = "P10.9"
-    P11 = "P11"
-    P11_0 = "P11.0"
-    P11_1 = "P11.1"
-    P11_2 = "P11.2"
-    P11_3 = "P11.3"
-    P11_4 = "P11.4"
-    P11_5 = "P11.5"
-    P11_9 = "P11.9"
-    P12 = "P12"
-    P12_0 = "P12.0"
-    P12_1 = "P12.1"
-    P12_2 = "P12.2"
-    P12_3 = "P12.3"
-    P12_4 = "P12.4"
-    P12_8 = "P12.8"
-    P12_9 = "P12.9"
-    P13 = "P13"
-    P13_0 = "P13.0"
-    P13_1 = "P13.1"
-    P13_2 = "P13.2"
-    P13_3 = "P13.3"
-    P13_4 = "P13.4"
-    P13_8 = "P13.8"
-    P13_9 = "P13.9"
-    P14 = "P14"
-    P14_0 = "P14.0"
-    P14_1 = "P14.1"
-    P14_2 = "P14.2"
-    P14_3 = "P14.3"
-    P14_8 = "P14.8"
-    P14_9 = "P14.9"
-    P15 = "P15"
-    P15_0 = "P15.0"
-    P15_1 = "P15.1"
-    P15_2 = "P15.2"
-    P15_3 = "P15.3"
-    P15_4 = "P15.4"
-    P15_5 = "P15.5"
-    P15_6 = "P15.6"
-    P15_8 = "P15.8"
-    P15_9 = "P15.9"
-    P20_P29 = "P20-P29"
-    P20 = "P20"
-    P20_0 = "P20.0"
-    P20_1 = "P20.1"
-    P20_9 = "P20.9"
-    P21 = "P21"
-    P21_0 = "P21.0"
-    P21_1 = "P21.1"
-    P21_9 = "P21.9"
-    P22 = "P22"
-    P22_0 = "P22.0"
-    P22_1 = "P22.1"
-    P22_8 = "P22.8"
-    P22_9 = "P22.9"
-    P23 = "P23"
-    P23_0 = "P23.0"
-    P23_1 = "P23.1"
-    P23_2 = "P23.2"
-    P23_3 = "P23.3"
-    P23_4 = "P23.4"
-    P23_5 = "P23.5"
-    P23_6 = "P23.6"
-    P23_8 = "P23.8"
-    P23_9 = "P23.9"
-    P24 = "P24"
-    P24_0 = "P24.0"
-    P24_1 = "P24.1"
-    P24_2 = "P24.2"
-    P24_3 = "P24.3"
-    P24_8 = "P24.8"
-    P24_9 = "P24.9"
-    P25 = "P25"
-    P25_0 = "P25.0"
-    P25_1 = "P25.1"
-    P25_2 = "P25.2"
-    P25_3 = "P25.3"
-    P25_8 = "P25.8"
-    P26 = "P26"
-    P26_0 = "P26.0"
-    P26_1 = "P26.1"
-    P26_8 = "P26.8"
-    P26_9 = "P26.9"
-    P27 = "P27"
-    P27_0 = "P27.0"
-    P27_1 = "P27.1"
-    P27_8 = "P27.8"
-    P27_9 = "P27.9"
-    P28 = "P28"
-    P28_0 = "P28.0"
-    P28_1 = "P28.1"
-    P28_2 = "P28.2"
-    P28_3 = "P28.3"
-    P28_4 = "P28.4"
-    P28_5 = "P28.5"
-    P28_8 = "P28.8"
-    P28_9 = "P28.9"
-    P29 = "P29"
-    P29_0 = "P29.0"
-    P29_1 = "P29.1"
-    P29_2 = "P29.2"
-    P29_3 = "P29.3"
-    P29_4 = "P29.4"
-    P29_8 = "P29.8"
-    P29_9 = "P29.9"
-    P35_P39 = "P35-P39"
-    P35 = "P35"
-    P35_0 = "P35.0"
-    P35_1 = "P35.1"
-    P35_2 = "P35.2"
-    P35_3 = "P35.3"
-    P35_8 = "P35.8"
-    P35_9 = "P35.9"
-    P36 = "P36"
-    P36_0 = "P36.0"
-    P36_1 = "P36.1"
-    P36_2 = "P36.2"
-    P36_3 = "P36.3"
-    P36_4 = "P36.4"
-    P36_5 = "P36.5"
-    P36_8 = "P36.8"
-    P36_9 = "P36.9"
-    P37 = "P37"
-    P37_0 = "P37.0"
-    P37_1 = "P37.1"
-    P37_2 = "P37.2"
-    P37_3 = "P37.3"
-    P37_4 = "P37.4"
-    P37_5 = "P37.5"
-    P37_8 = "P37.8"
-    P37_9 = "P37.9"
-    P38 = "P38"
-    P39 = "P39"
-    P39_0 = "P39.0"
-    P39_1 = "P39.1"
-    P39_2 = "P39.2"
-    P39_3 = "P39.3"
-    P39_4 = "P39.4"
-    P39_8 = "P39.8"
-    P39_9 = "P39.9"
-    P50_P61 = "P50-P61"
-    P50 = "P50"
-    P50_0 = "P50.0"
-    P50_1 = "P50.1"
-    P50_2 = "P50.2"
-    P50_3 = "P50.3"
-    P50_4 = "P50.4"
-    P50_5 = "P50.5"
-    P50_8 = "P50.8"
-    P50_9 = "P50.9"
-    P51 = "P51"
-    P51_0 = "P51.0"
-    P51_8 = "P51.8"
-    P51_9 = "P51.9"
-    P52 = "P52"
-    P52_0 = "P52.0"
-    P52_1 = "P52.1"
-    P52_2 = "P52.2"
-    P52_3 = "P52.3"
-    P52_4 = "P52.4"
-    P52_5 = "P52.5"
-    P52_6 = "P52.6"
-    P52_8 = "P52.8"
-    P52_9 = "P52.9"
-    P53 = "P53"
-    P54 = "P54"
-    P54_0 = "P54.0"
-    P54_1 = "P54.1"
-    P54_2 = "P54.2"
-    P54_3 = "P54.3"
-    P54_4 = "P54.4"
-    P54_5 = "P54.5"
-    P54_6 = "P54.6"
-    P54_8 = "P54.8"
-    P54_9 = "P54.9"
-    P55 = "P55"
-    P55_0 = "P55.0"
-    P55_1 = "P55.1"
-    P55_8 = "P55.8"
-    P55_9 = "P55.9"
-    P56 = "P56"
-    P56_0 = "P56.0"
-    P56_9 = "P56.9"
-    P57 = "P57"
-    P57_0 = "P57.0"
-    P57_8 = "P57.8"
-    P57_9 = "P57.9"
-    P58 = "P58"
-    P58_0 = "P58.0"
-    P58_1 = "P58.1"
-    P58_2 = "P58.2"
-    P58_3 = "P58.3"
-    P58_4 = "P58.4"
-    P58_5 = "P58.5"
-    P58_8 = "P58.8"
-    P58_9 = "P58.9"
-    P59 = "P59"
-    P59_0 = "P59.0"
-    P59_1 = "P59.1"
-    P59_2 = "P59.2"
-    P59_3 = "P59.3"
-    P59_8 = "P59.8"
-    P59_9 = "P59.9"
-    P60 = "P60"
-    P61 = "P61"
-    P61_0 = "P61.0"
-    P61_1 = "P61.1"
-    P61_2 = "P61.2"
-    P61_3 = "P61.3"
-    P61_4 = "P61.4"
-    P61_5 = "P61.5"
-    P61_6 = "P61.6"
-    P61_8 = "P61.8"
-    P61_9 = "P61.9"
-    P70_P74 = "P70-P74"
-    P70 = "P70"
-    P70_0 = "P70.0"
-    P70_1 = "P70.1"
-    P70_2 = "P70.2"
-    P70_3 = "P70.3"
-    P70_4 = "P70.4"
-    P70_8 = "P70.8"
-    P70_9 = "P70.9"
-    P71 = "P71"
-    P71_0 = "P71.0"
-    P71_1 = "P71.1"
-    P71_2 = "P71.2"
-    P71_3 = "P71.3"
-    P71_4 = "P71.4"
-    P71_8 = "P71.8"
-    P71_9 = "P71.9"
-    P72 = "P72"
-    P72_0 = "P72.0"
-    P72_1 = "P72.1"
-    P72_2 = "P72.2"
-    P72_8 = "P72.8"
-    P72_9 = "P72.9"
-    P74 = "P74"
-    P74_0 = "P74.0"
-    P74_1 = "P74.1"
-    P74_2 = "P74.2"
-    P74_3 = "P74.3"
-    P74_4 = "P74.4"
-    P74_5 = "P74.5"
-    P74_8 = "P74.8"
-    P74_9 = "P74.9"
-    P76_P78 = "P76-P78"
-    P76 = "P76"
-    P76_0 = "P76.0"
-    P76_1 = "P76.1"
-    P76_2 = "P76.2"
-    P76_8 = "P76.8"
-    P76_9 = "P76.9"
-    P77 = "P77"
-    P78 = "P78"
-    P78_0 = "P78.0"
-    P78_1 = "P78.1"
-    P78_2 = "P78.2"
-    P78_3 = "P78.3"
-    P78_8 = "P78.8"
-    P78_9 = "P78.9"
-    P80_P83 = "P80-P83"
-    P80 = "P80"
-    P80_0 = "P80.0"
-    P80_8 = "P80.8"
-    P80_9 = "P80.9"
-    P81 = "P81"
-    P81_0 = "P81.0"
-    P81_8 = "P81.8"
-    P81_9 = "P81.9"
-    P83 = "P83"
-    P83_0 = "P83.0"
-    P83_1 = "P83.1"
-    P83_2 = "P83.2"
-    P83_3 = "P83.3"
-    P83_4 = "P83.4"
-    P83_5 = "P83.5"
-    P83_6 = "P83.6"
-    P83_8 = "P83.8"
-    P83_9 = "P83.9"
-    P90_P96 = "P90-P96"
-    P90 = "P90"
-    P91 = "P91"
-    P91_0 = "P91.0"
-    P91_1 = "P91.1"
-    P91_2 = "P91.2"
-    P91_3 = "P91.3"
-    P91_4 = "P91.4"
-    P91_5 = "P91.5"
-    P91_6 = "P91.6"
-    P91_8 = "P91.8"
-    P91_9 = "P91.9"
-    P92 = "P92"
-    P92_0 = "P92.0"
-    P92_1 = "P92.1"
-    P92_2 = "P92.2"
-    P92_3 = "P92.3"
-    P92_4 = "P92.4"
-    P92_5 = "P92.5"
-    P92_8 = "P92.8"
-    P92_9 = "P92.9"
-    P93 = "P93"
-    P94 = "P94"
-    P94_0 = "P94.0"
-    P94_1 = "P94.1"
-    P94_2 = "P94.2"
-    P94_8 = "P94.8"
-    P94_9 = "P94.9"
-    P96 = "P96"
-    P96_0 = "P96.0"
-    P96_1 = "P96.1"
-    P96_2 = "P96.2"
-    P96_3 = "P96.3"
-    P96_4 = "P96.4"
-    P96_5 = "P96.5"
-    P96_8 = "P96.8"
-    P96_9 = "P96.9"
-    Q00_Q99 = "Q00-Q99"
-    Q00_Q07 = "Q00-Q07"
-    Q00 = "Q00"
-    Q00_0 = "Q00.0"
-    Q00_1 = "Q00.1"
-    Q00_2 = "Q00.2"
-    Q01 = "Q01"
-    Q01_0 = "Q01.0"
-    Q01_1 = "Q01.1"
-    Q01_2 = "Q01.2"
-    Q01_8 = "Q01.8"
-    Q01_9 = "Q01.9"
-    Q02 = "Q02"
-    Q03 = "Q03"
-    Q03_0 = "Q03.0"
-    Q03_1 = "Q03.1"
-    Q03_8 = "Q03.8"
-    Q03_9 = "Q03.9"
-    Q04 = "Q04"
-    Q04_0 = "Q04.0"
-    Q04_1 = "Q04.1"
-    Q04_2 = "Q04.2"
-    Q04_3 = "Q04.3"
-    Q04_4 = "Q04.4"
-    Q04_5 = "Q04.5"
-    Q04_6 = "Q04.6"
-    Q04_8 = "Q04.8"
-    Q04_9 = "Q04.9"
-    Q05 = "Q05"
-    Q05_0 = "Q05.0"
-    Q05_1 = "Q05.1"
-    Q05_2 = "Q05.2"
-    Q05_3 = "Q05.3"
-    Q05_4 = "Q05.4"
-    Q05_5 = "Q05.5"
-    Q05_6 = "Q05.6"
-    Q05_7 = "Q05.7"
-    Q05_8 = "Q05.8"
-    Q05_9 = "Q05.9"
-    Q06 = "Q06"
-    Q06_0 = "Q06.0"
-    Q06_1 = "Q06.1"
-    Q06_2 = "Q06.2"
-    Q06_3 = "Q06.3"
-    Q06_4 = "Q06.4"
-    Q06_8 = "Q06.8"
-    Q06_9 = "Q06.9"
-    Q07 = "Q07"
-    Q07_0 = "Q07.0"
-    Q07_8 = "Q07.8"
-    Q07_9 = "Q07.9"
-    Q10_Q18 = "Q10-Q18"
-    Q10 = "Q10"
-    Q10_0 = "Q10.0"
-    Q10_1 = "Q10.1"
-    Q10_2 = "Q10.2"
-    Q10_3 = "Q10.3"
-    Q10_4 = "Q10.4"
-    Q10_5 = "Q10.5"
-    Q10_6 = "Q10.6"
-    Q10_7 = "Q10.7"
-    Q11 = "Q11"
-    Q11_0 = "Q11.0"
-    Q11_1 = "Q11.1"
-    Q11_2 = "Q11.2"
-    Q11_3 = "Q11.3"
-    Q12 = "Q12"
-    Q12_0 = "Q12.0"
-    Q12_1 = "Q12.1"
-    Q12_2 = "Q12.2"
-    Q12_3 = "Q12.3"
-    Q12_4 = "Q12.4"
-    Q12_8 = "Q12.8"
-    Q12_9 = "Q12.9"
-    Q13 = "Q13"
-    Q13_0 = "Q13.0"
-    Q13_1 = "Q13.1"
-    Q13_2 = "Q13.2"
-    Q13_3 = "Q13.3"
-    Q13_4 = "Q13.4"
-    Q13_5 = "Q13.5"
-    Q13_8 = "Q13.8"
-    Q13_9 = "Q13.9"
-    Q14 = "Q14"
-    Q14_0 = "Q14.0"
-    Q14_1 = "Q14.1"
-    Q14_2 = "Q14.2"
-    Q14_3 = "Q14.3"
-    Q14_8 = "Q14.8"
-    Q14_9 = "Q14.9"
-    Q15 = "Q15"
-    Q15_0 = "Q15.0"
-    Q15_8 = "Q15.8"
-    Q15_9 = "Q15.9"
-    Q16 = "Q16"
-    Q16_0 = "Q16.0"
-    Q16_1 = "Q16.1"
-    Q16_2 = "Q16.2"
-    Q16_3 = "Q16.3"
-    Q16_4 = "Q16.4"
-    Q16_5 = "Q16.5"
-    Q16_9 = "Q16.9"
-    Q17 = "Q17"
-    Q17_0 = "Q17.0"
-    Q17_1 = "Q17.1"
-    Q17_2 = "Q17.2"
-    Q17_3 = "Q17.3"
-    Q17_4 = "Q17.4"
-    Q17_5 = "Q17.5"
-    Q17_8 = "Q17.8"
-    Q17_9 = "Q17.9"
-    Q18 = "Q18"
-    Q18_0 = "Q18.0"
-    Q18_1 = "Q18.1"
-    Q18_2 = "Q18.2"
-    Q18_3 = "Q18.3"
-    Q18_4 = "Q18.4"
-    Q18_5 = "Q18.5"
-    Q18_6 = "Q18.6"
-    Q18_7 = "Q18.7"
-    Q18_8 = "Q18.8"
-    Q18_9 = "Q18.9"
-    Q20_Q28 = "Q20-Q28"
-    Q20 = "Q20"
-    Q20_0 = "Q20.0"
-    Q20_1 = "Q20.1"
-    Q20_2 = "Q20.2"
-    Q20_3 = "Q20.3"
-    Q20_4 = "Q20.4"
-    Q20_5 = "Q20.5"
-    Q20_6 = "Q20.6"
-    Q20_8 = "Q20.8"
-    Q20_9 = "Q20.9"
-    Q21 = "Q21"
-    Q21_0 = "Q21.0"
-    Q21_1 = "Q21.1"
-    Q21_2 = "Q21.2"
-    Q21_3 = "Q21.3"
-    Q21_4 = "Q21.4"
-    Q21_8 = "Q21.8"
-    Q21_9 = "Q21.9"
-    Q22 = "Q22"
-    Q22_0 = "Q22.0"
-    Q22_1 = "Q22.1"
-    Q22_2 = "Q22.2"
-    Q22_3 = "Q22.3"
-    Q22_4 = "Q22.4"
-    Q22_5 = "Q22.5"
-    Q22_6 = "Q22.6"
-    Q22_8 = "Q22.8"
-    Q22_9 = "Q22.9"
-    Q23 = "Q23"
-    Q23_0 = "Q23.0"
-    Q23_1 = "Q23.1"
-    Q23_2 = "Q23.2"
-    Q23_3 = "Q23.3"
-    Q23_4 = "Q23.4"
-    Q23_8 = "Q23.8"
-    Q23_9 = "Q23.9"
-    Q24 = "Q24"
-    Q24_0 = "Q24.0"
-    Q24_1 = "Q24.1"
-    Q24_2 = "Q24.2"
-    Q24_3 = "Q24.3"
-    Q24_4 = "Q24.4"
-    Q24_5 = "Q24.5"
-    Q24_6 = "Q24.6"
-    Q24_8 = "Q24.8"
-    Q24_9 = "Q24.9"
-    Q25 = "Q25"
-    Q25_0 = "Q25.0"
-    Q25_1 = "Q25.1"
-    Q25_2 = "Q25.2"
-    Q25_3 = "Q25.3"
-    Q25_4 = "Q25.4"
-    Q25_5 = "Q25.5"
-    Q25_6 = "Q25.6"
-    Q25_7 = "Q25.7"
-    Q25_8 = "Q25.8"
-    Q25_9 = "Q25.9"
-    Q26 = "Q26"
-    Q26_0 = "Q26.0"
-    Q26_1 = "Q26.1"
-    Q26_2 = "Q26.2"
-    Q26_3 = "Q26.3"
-    Q26_4 = "Q26.4"
-    Q26_5 = "Q26.5"
-    Q26_6 = "Q26.6"
-    Q26_8 = "Q26.8"
-    Q26_9 = "Q26.9"
-    Q27 = "Q27"
-    Q27_0 = "Q27.0"
-    Q27_1 = "Q27.1"
-    Q27_2 = "Q27.2"
-    Q27_3 = "Q27.3"
-    Q27_4 = "Q27.4"
-    Q27_8 = "Q27.8"
-    Q27_9 = "Q27.9"
-    Q28 = "Q28"
-    Q28_0 = "Q28.0"
-    Q28_1 = "Q28.1"
-    Q28_2 = "Q28.2"
-    Q28_3 = "Q28.3"
-    Q28_8 = "Q28.8"
-    Q28_9 = "Q28.9"
-    Q30_Q34 = "Q30-Q34"
-    Q30 = "Q30"
-    Q30_0 = "Q30.0"
-    Q30_1 = "Q30.1"
-    Q30_2 = "Q30.2"
-    Q30_3 = "Q30.3"
-    Q30_8 = "Q30.8"
-    Q30_9 = "Q30.9"
-    Q31 = "Q31"
-    Q31_0 = "Q31.0"
-    Q31_1 = "Q31.1"
-    Q31_2 = "Q31.2"
-    Q31_3 = "Q31.3"
-    Q31_4 = "Q31.4"
-    Q31_5 = "Q31.5"
-    Q31_8 = "Q31.8"
-    Q31_9 = "Q31.9"
-    Q32 = "Q32"
-    Q32_0 = "Q32.0"
-    Q32_1 = "Q32.1"
-    Q32_2 = "Q32.2"
-    Q32_3 = "Q32.3"
-    Q32_4 = "Q32.4"
-    Q33 = "Q33"
-    Q33_0 = "Q33.0"
-    Q33_1 = "Q33.1"
-    Q33_2 = "Q33.2"
-    Q33_3 = "Q33.3"
-    Q33_4 = "Q33.4"
-    Q33_5 = "Q33.5"
-    Q33_6 = "Q33.6"
-    Q33_8 = "Q33.8"
-    Q33_9 = "Q33.9"
-    Q34 = "Q34"
-    Q34_0 = "Q34.0"
-    Q34_1 = "Q34.1"
-    Q34_8 = "Q34.8"
-    Q34_9 = "Q34.9"
-    Q35_Q37 = "Q35-Q37"
-    Q35 = "Q35"
-    Q35_1 = "Q35.1"
-    Q35_3 = "Q35.3"
-    Q35_5 = "Q35.5"
-    Q35_6 = "Q35.6"
-    Q35_7 = "Q35.7"
-    Q35_9 = "Q35.9"
-    Q36 = "Q36"
-    Q36_0 = "Q36.0"
-    Q36_1 = "Q36.1"
-    Q36_9 = "Q36.9"
-    Q37 = "Q37"
-    Q37_0 = "Q37.0"
-    Q37_1 = "Q37.1"
-    Q37_2 = "Q37.2"
-    Q37_3 = "Q37.3"
-    Q37_4 = "Q37.4"
-    Q37_5 = "Q37.5"
-    Q37_8 = "Q37.8"
-    Q37_9 = "Q37.9"
-    Q38_Q45 = "Q38-Q45"
-    Q38 = "Q38"
-    Q38_0 = "Q38.0"
-    Q38_1 = "Q38.1"
-    Q38_2 = "Q38.2"
-    Q38_3 = "Q38.3"
-    Q38_4 = "Q38.4"
-    Q38_5 = "Q38.5"
-    Q38_6 = "Q38.6"
-    Q38_7 = "Q38.7"
-    Q38_8 = "Q38.8"
-    Q39 = "Q39"
-    Q39_0 = "Q39.0"
-    Q39_1 = "Q39.1"
-    Q39_2 = "Q39.2"
-    Q39_3 = "Q39.3"
-    Q39_4 = "Q39.4"
-    Q39_5 = "Q39.5"
-    Q39_6 = "Q39.6"
-    Q39_8 = "Q39.8"
-    Q39_9 = "Q39.9"
-    Q40 = "Q40"
-    Q40_0 = "Q40.0"
-    Q40_1 = "Q40.1"
-    Q40_2 = "Q40.2"
-    Q40_3 = "Q40.3"
-    Q40_8 = "Q40.8"
-    Q40_9 = "Q40.9"
-    Q41 = "Q41"
-    Q41_0 = "Q41.0"
-    Q41_1 = "Q41.1"
-    Q41_2 = "Q41.2"
-    Q41_8 = "Q41.8"
-    Q41_9 = "Q41.9"
-    Q42 = "Q42"
-    Q42_0 = "Q42.0"
-    Q42_1 = "Q42.1"
-    Q42_2 = "Q42.2"
-    Q42_3 = "Q42.3"
-    Q42_8 = "Q42.8"
-    Q42_9 = "Q42.9"
-    Q43 = "Q43"
-    Q43_0 = "Q43.0"
-    Q43_1 = "Q43.1"
-    Q43_2 = "Q43.2"
-    Q43_3 = "Q43.3"
-    Q43_4 = "Q43.4"
-    Q43_5 = "Q43.5"
-    Q43_6 = "Q43.6"
-    Q43_7 = "Q43.7"
-    Q43_8 = "Q43.8"
-    Q43_9 = "Q43.9"
-    Q44 = "Q44"
-    Q44_0 = "Q44.0"
-    Q44_1 = "Q44.1"
-    Q44_2 = "Q44.2"
-    Q44_3 = "Q44.3"
-    Q44_4 = "Q44.4"
-    Q44_5 = "Q44.5"
-    Q44_6 = "Q44.6"
-    Q44_7 = "Q44.7"
-    Q45 = "Q45"
-    Q45_0 = "Q45.0"
-    Q45_1 = "Q45.1"
-    Q45_2 = "Q45.2"
-    Q45_3 = "Q45.3"
-    Q45_8 = "Q45.8"
-    Q45_9 = "Q45.9"
-    Q50_Q56 = "Q50-Q56"
-    Q50 = "Q50"
-    Q50_0 = "Q50.0"
-    Q50_1 = "Q50.1"
-    Q50_2 = "Q50.2"
-    Q50_3 = "Q50.3"
-    Q50_4 = "Q50.4"
-    Q50_5 = "Q50.5"
-    Q50_6 = "Q50.6"
-    Q51 = "Q51"
-    Q51_0 = "Q51.0"
-    Q51_1 = "Q51.1"
-    Q51_2 = "Q51.2"
-    Q51_3 = "Q51.3"
-    Q51_4 = "Q51.4"
-    Q51_5 = "Q51.5"
-    Q51_6 = "Q51.6"
-    Q51_7 = "Q51.7"
-    Q51_8 = "Q51.8"
-    Q51_9 = "Q51.9"
-    Q52 = "Q52"
-    Q52_0 = "Q52.0"
-    Q52_1 = "Q52.1"
-    Q52_2 = "Q52.2"
-    Q52_3 = "Q52.3"
-    Q52_4 = "Q52.4"
-    Q52_5 = "Q52.5"
-    Q52_6 = "Q52.6"
-    Q52_7 = "Q52.7"
-    Q52_8 = "Q52.8"
-    Q52_9 = "Q52.9"
-    Q53 = "Q53"
-    Q53_0 = "Q53.0"
-    Q53_1 = "Q53.1"
-    Q53_2 = "Q53.2"
-    Q53_9 = "Q53.9"
-    Q54 = "Q54"
-    Q54_0 = "Q54.0"
-    Q54_1 = "Q54.1"
-    Q54_2 = "Q54.2"
-    Q54_3 = "Q54.3"
-    Q54_4 = "Q54.4"
-    Q54_8 = "Q54.8"
-    Q54_9 = "Q54.9"
-    Q55 = "Q55"
-    Q55_0 = "Q55.0"
-    Q55_1 = "Q55.1"
-    Q55_2 = "Q55.2"
-    Q55_3 = "Q55.3"
-    Q55_4 = "Q55.4"
-    Q55_5 = "Q55.5"
-    Q55_6 = "Q55.6"
-    Q55_8 = "Q55.8"
-    Q55_9 = "Q55.9"
-    Q56 = "Q56"
-    Q56_0 = "Q56.0"
-    Q56_1 = "Q56.1"
-    Q56_2 = "Q56.2"
-    Q56_3 = "Q56.3"
-    Q56_4 = "Q56.4"
-    Q60_Q64 = "Q60-Q64"
-    Q60 = "Q60"
-    Q60_0 = "Q60.0"
-    Q60_1 = "Q60.1"
-    Q60_2 = "Q60.2"
-    Q60_3 = "Q60.3"
-    Q60_4 = "Q60.4"
-    Q60_5 = "Q60.5"
-    Q60_6 = "Q60.6"
-    Q61 = "Q61"
-    Q61_0 = "Q61.0"
-    Q61_1 = "Q61.1"
-    Q61_2 = "Q61.2"
-    Q61_3 = "Q61.3"
-    Q61_4 = "Q61.4"
-    Q61_5 = "Q61.5"
-    Q61_8 = "Q61.8"
-    Q61_9 = "Q61.9"
-    Q62 = "Q62"
-    Q62_0 = "Q62.0"
-    Q62_1 = "Q62.1"
-    Q62_2 = "Q62.2"
-    Q62_3 = "Q62.3"
-    Q62_4 = "Q62.4"
-    Q62_5 = "Q62.5"
-    Q62_6 = "Q62.6"
-    Q62_7 = "Q62.7"
-    Q62_8 = "Q62.8"
-    Q63 = "Q63"
-    Q63_0 = "Q63.0"
-    Q63_1 = "Q63.1"
-    Q63_2 = "Q63.2"
-    Q63_3 = "Q63.3"
-    Q63_8 = "Q63.8"
-    Q63_9 = "Q63.9"
-    Q64 = "Q64"
-    Q64_0 = "Q64.0"
-    Q64_1 = "Q64.1"
-    Q64_2 = "Q64.2"
-    Q64_3 = "Q64.3"
-    Q64_4 = "Q64.4"
-    Q64_5 = "Q64.5"
-    Q64_6 = "Q64.6"
-    Q64_7 = "Q64.7"
-    Q64_8 = "Q64.8"
-    Q64_9 = "Q64.9"
-    Q65_Q79 = "Q65-Q79"
-    Q65 = "Q65"
-    Q65_0 = "Q65.0"
-    Q65_1 = "Q65.1"
-    Q65_2 = "Q65.2"
-    Q65_3 = "Q65.3"
-    Q65_4 = "Q65.4"
-    Q65_5 = "Q65.5"
-    Q65_6 = "Q65.6"
-    Q65_8 = "Q65.8"
-    Q65_9 = "Q65.9"
-    Q66 = "Q66"
-    Q66_0 = "Q66.0"
-    Q66_1 = "Q66.1"
-    Q66_2 = "Q66.2"
-    Q66_3 = "Q66.3"
-    Q66_4 = "Q66.4"
-    Q66_5 = "Q66.5"
-    Q66_6 = "Q66.6"
-    Q66_7 = "Q66.7"
-    Q66_8 = "Q66.8"
-    Q66_9 = "Q66.9"
-    Q67 = "Q67"
-    Q67_0 = "Q67.0"
-    Q67_1 = "Q67.1"
-    Q67_2 = "Q67.2"
-    Q67_3 = "Q67.3"
-    Q67_4 = "Q67.4"
-    Q67_5 = "Q67.5"
-    Q67_6 = "Q67.6"
-    Q67_7 = "Q67.7"
-    Q67_8 = "Q67.8"
-    Q68 = "Q68"
-    Q68_0 = "Q68.0"
-    Q68_1 = "Q68.1"
-    Q68_2 = "Q68.2"
-    Q68_3 = "Q68.3"
-    Q68_4 = "Q68.4"
-    Q68_5 = "Q68.5"
-    Q68_8 = "Q68.8"
-    Q69 = "Q69"
-    Q69_0 = "Q69.0"
-    Q69_1 = "Q69.1"
-    Q69_2 = "Q69.2"
-    Q69_9 = "Q69.9"
-    Q70 = "Q70"
-    Q70_0 = "Q70.0"
-    Q70_1 = "Q70.1"
-    Q70_2 = "Q70.2"
-    Q70_3 = "Q70.3"
-    Q70_4 = "Q70.4"
-    Q70_9 = "Q70.9"
-    Q71 = "Q71"
-    Q71_0 = "Q71.0"
-    Q71_1 = "Q71.1"
-    Q71_2 = "Q71.2"
-    Q71_3 = "Q71.3"
-    Q71_4 = "Q71.4"
-    Q71_5 = "Q71.5"
-    Q71_6 = "Q71.6"
-    Q71_8 = "Q71.8"
-    Q71_9 = "Q71.9"
-    Q72 = "Q72"
-    Q72_0 = "Q72.0"
-    Q72_1 = "Q72.1"
-    Q72_2 = "Q72.2"
-    Q72_3 = "Q72.3"
-    Q72_4 = "Q72.4"
-    Q72_5 = "Q72.5"
-    Q72_6 = "Q72.6"
-    Q72_7 = "Q72.7"
-    Q72_8 = "Q72.8"
-    Q72_9 = "Q72.9"
-    Q73 = "Q73"
-    Q73_0 = "Q73.0"
-    Q73_1 = "Q73.1"
-    Q73_8 = "Q73.8"
-    Q74 = "Q74"
-    Q74_0 = "Q74.0"
-    Q74_1 = "Q74.1"
-    Q74_2 = "Q74.2"
-    Q74_3 = "Q74.3"
-    Q74_8 = "Q74.8"
-    Q74_9 = "Q74.9"
-    Q75 = "Q75"
-    Q75_0 = "Q75.0"
-    Q75_1 = "Q75.1"
-    Q75_2 = "Q75.2"
-    Q75_3 = "Q75.3"
-    Q75_4 = "Q75.4"
-    Q75_5 = "Q75.5"
-    Q75_8 = "Q75.8"
-    Q75_9 = "Q75.9"
-    Q76 = "Q76"
-    Q76_0 = "Q76.0"
-    Q76_1 = "Q76.1"
-    Q76_2 = "Q76.2"
-    Q76_3 = "Q76.3"
-    Q76_4 = "Q76.4"
-    Q76_5 = "Q76.5"
-    Q76_6 = "Q76.6"
-    Q76_7 = "Q76.7"
-    Q76_8 = "Q76.8"
-    Q76_9 = "Q76.9"
-    Q77 = "Q77"
-    Q77_0 = "Q77.0"
-    Q77_1 = "Q77.1"
-    Q77_2 = "Q77.2"
-    Q77_3 = "Q77.3"
-    Q77_4 = "Q77.4"
-    Q77_5 = "Q77.5"
-    Q77_6 = "Q77.6"
-    Q77_7 = "Q77.7"
-    Q77_8 = "Q77.8"
-    Q77_9 = "Q77.9"
-    Q78 = "Q78"
-    Q78_0 = "Q78.0"
-    Q78_1 = "Q78.1"
-    Q78_2 = "Q78.2"
-    Q78_3 = "Q78.3"
-    Q78_4 = "Q78.4"
-    Q78_5 = "Q78.5"
-    Q78_6 = "Q78.6"
-    Q78_8 = "Q78.8"
-    Q78_9 = "Q78.9"
-    Q79 = "Q79"
-    Q79_0 = "Q79.0"
-    Q79_1 = "Q79.1"
-    Q79_2 = "Q79.2"
-    Q79_3 = "Q79.3"
-    Q79_4 = "Q79.4"
-    Q79_5 = "Q79.5"
-    Q79_6 = "Q79.6"
-    Q79_8 = "Q79.8"
-    Q79_9 = "Q79.9"
-    Q80_Q89 = "Q80-Q89"
-    Q80 = "Q80"
-    Q80_0 = "Q80.0"
-    Q80_1 = "Q80.1"
-    Q80_2 = "Q80.2"
-    Q80_3 = "Q80.3"
-    Q80_4 = "Q80.4"
-    Q80_8 = "Q80.8"
-    Q80_9 = "Q80.9"
-    Q81 = "Q81"
-    Q81_0 = "Q81.0"
-    Q81_1 = "Q81.1"
-    Q81_2 = "Q81.2"
-    Q81_8 = "Q81.8"
-    Q81_9 = "Q81.9"
-    Q82 = "Q82"
-    Q82_0 = "Q82.0"
-    Q82_1 = "Q82.1"
-    Q82_2 = "Q82.2"
-    Q82_3 = "Q82.3"
-    Q82_4 = "Q82.4"
-    Q82_5 = "Q82.5"
-    Q82_8 = "Q82.8"
-    Q82_9 = "Q82.9"
-    Q83 = "Q83"
-    Q83_0 = "Q83.0"
-    Q83_1 = "Q83.1"
-    Q83_2 = "Q83.2"
-    Q83_3 = "Q83.3"
-    Q83_8 = "Q83.8"
-    Q83_9 = "Q83.9"
-    Q84 = "Q84"
-    Q84_0 = "Q84.0"
-    Q84_1 = "Q84.1"
-    Q84_2 = "Q84.2"
-    Q84_3 = "Q84.3"
-    Q84_4 = "Q84.4"
-    Q84_5 = "Q84.5"
-    Q84_6 = "Q84.6"
-    Q84_8 = "Q84.8"
-    Q84_9 = "Q84.9"
-    Q85 = "Q85"
-    Q85_0 = "Q85.0"
-    Q85_1 = "Q85.1"
-    Q85_8 = "Q85.8"
-    Q85_9 = "Q85.9"
-    Q86 = "Q86"
-    Q86_0 = "Q86.0"
-    Q86_1 = "Q86.1"
-    Q86_2 = "Q86.2"
-    Q86_8 = "Q86.8"
-    Q87 = "Q87"
-    Q87_0 = "Q87.0"
-    Q87_1 = "Q87.1"
-    Q87_2 = "Q87.2"
-    Q87_3 = "Q87.3"
-    Q87_4 = "Q87.4"
-    Q87_5 = "Q87.5"
-    Q87_8 = "Q87.8"
-    Q89 = "Q89"
-    Q89_0 = "Q89.0"
-    Q89_1 = "Q89.1"
-    Q89_2 = "Q89.2"
-    Q89_3 = "Q89.3"
-    Q89_4 = "Q89.4"
-    Q89_7 = "Q89.7"
-    Q89_8 = "Q89.8"
-    Q89_9 = "Q89.9"
-    Q90_Q99 = "Q90-Q99"
-    Q90 = "Q90"
-    Q90_0 = "Q90.0"
-    Q90_1 = "Q90.1"
-    Q90_2 = "Q90.2"
-    Q90_9 = "Q90.9"
-    Q91 = "Q91"
-    Q91_0 = "Q91.0"
-    Q91_1 = "Q91.1"
-    Q91_2 = "Q91.2"
-    Q91_3 = "Q91.3"
-    Q91_4 = "Q91.4"
-    Q91_5 = "Q91.5"
-    Q91_6 = "Q91.6"
-    Q91_7 = "Q91.7"
-    Q92 = "Q92"
-    Q92_0 = "Q92.0"
-    Q92_1 = "Q92.1"
-    Q92_2 = "Q92.2"
-    Q92_3 = "Q92.3"
-    Q92_4 = "Q92.4"
-    Q92_5 = "Q92.5"
-    Q92_6 = "Q92.6"
-    Q92_7 = "Q92.7"
-    Q92_8 = "Q92.8"
-    Q92_9 = "Q92.9"
-    Q93 = "Q93"
-    Q93_0 = "Q93.0"
-    Q93_1 = "Q93.1"
-    Q93_2 = "Q93.2"
-    Q93_3 = "Q93.3"
-    Q93_4 = "Q93.4"
-    Q93_5 = "Q93.5"
-    Q93_6 = "Q93.6"
-    Q93_7 = "Q93.7"
-    Q93_8 = "Q93.8"
-    Q93_9 = "Q93.9"
-    Q95 = "Q95"
-    Q95_0 = "Q95.0"
-    Q95_1 = "Q95.1"
-    Q95_2 = "Q95.2"
-    Q95_3 = "Q95.3"
-    Q95_4 = "Q95.4"
-    Q95_5 = "Q95.5"
-    Q95_8 = "Q95.8"
-    Q95_9 = "Q95.9"
-    Q96 = "Q96"
-    Q96_0 = "Q96.0"
-    Q96_1 = "Q96.1"
-    Q96_2 = "Q96.2"
-    Q96_3 = "Q96.3"
-    Q96_4 = "Q96.4"
-    Q96_8 = "Q96.8"
-    Q96_9 = "Q96.9"
-    Q97 = "Q97"
-    Q97_0 = "Q97.0"
-    Q97_1 = "Q97.1"
-    Q97_2 = "Q97.2"
-    Q97_3 = "Q97.3"
-    Q97_8 = "Q97.8"
-    Q97_9 = "Q97.9"
-    Q98 = "Q98"
-    Q98_0 = "Q98.0"
-    Q98_1 = "Q98.1"
-    Q98_2 = "Q98.2"
-    Q98_3 = "Q98.3"
-    Q98_4 = "Q98.4"
-    Q98_5 = "Q98.5"
-    Q98_6 = "Q98.6"
-    Q98_7 = "Q98.7"
-    Q98_8 = "Q98.8"
-    Q98_9 = "Q98.9"
-    Q99 = "Q99"
-    Q99_0 = "Q99.0"
-    Q99_1 = "Q99.1"
-    Q99_2 = "Q99.2"
-    Q99_8 = "Q99.8"
-    Q99_9 = "Q99.9"
-    R00_R99 = "R00-R99"
-    R00_R09 = "R00-R09"
-    R00 = "R00"
-    R00_0 = "R00.0"
-    R00_1 = "R00.1"
-    R00_2 = "R00.2"
-    R00_8 = "R00.8"
-    R01 = "R01"
-    R01_0 = "R01.0"
-    R01_1 = "R01.1"
-    R01_2 = "R01.2"
-    R02 = "R02"
-    R03 = "R03"
-    R03_0 = "R03.0"
-    R03_1 = "R03.1"
-    R04 = "R04"
-    R04_0 = "R04.0"
-    R04_1 = "R04.1"
-    R04_2 = "R04.2"
-    R04_8 = "R04.8"
-    R04_9 = "R04.9"
-    R05 = "R05"
-    R06 = "R06"
-    R06_0 = "R06.0"
-    R06_1 = "R06.1"
-    R06_2 = "R06.2"
-    R06_3 = "R06.3"
-    R06_4 = "R06.4"
-    R06_5 = "R06.5"
-    R06_6 = "R06.6"
-    R06_7 = "R06.7"
-    R06_8 = "R06.8"
-    R07 = "R07"
-    R07_0 = "R07.0"
-    R07_1 = "R07.1"
-    R07_2 = "R07.2"
-    R07_3 = "R07.3"
-    R07_4 = "R07.4"
-    R09 = "R09"
-    R09_0 = "R09.0"
-    R09_1 = "R09.1"
-    R09_2 = "R09.2"
-    R09_3 = "R09.3"
-    R09_8 = "R09.8"
-    R10_R19 = "R10-R19"
-    R10 = "R10"
-    R10_0 = "R10.0"
-    R10_1 = "R10.1"
-    R10_2 = "R10.2"
-    R10_3 = "R10.3"
-    R10_4 = "R10.4"
-    R11 = "R11"
-    R12 = "R12"
-    R13 = "R13"
-    R14 = "R14"
-    R15 = "R15"
-    R16 = "R16"
-    R16_0 = "R16.0"
-    R16_1 = "R16.1"
-    R16_2 = "R16.2"
-    R17 = "R17"
-    R18 = "R18"
-    R19 = "R19"
-    R19_0 = "R19.0"
-    R19_1 = "R19.1"
-    R19_2 = "R19.2"
-    R19_3 = "R19.3"
-    R19_4 = "R19.4"
-    R19_5 = "R19.5"
-    R19_6 = "R19.6"
-    R19_8 = "R19.8"
-    R20_R23 = "R20-R23"
-    R20 = "R20"
-    R20_0 = "R20.0"
-    R20_1 = "R20.1"
-    R20_2 = "R20.2"
-    R20_3 = "R20.3"
-    R20_8 = "R20.8"
-    R21 = "R21"
-    R22 = "R22"
-    R22_0 = "R22.0"
-    R22_1 = "R22.1"
-    R22_2 = "R22.2"
-    R22_3 = "R22.3"
-    R22_4 = "R22.4"
-    R22_7 = "R22.7"
-    R22_9 = "R22.9"
-    R23 = "R23"
-    R23_0 = "R23.0"
-    R23_1 = "R23.1"
-    R23_2 = "R23.2"
-    R23_3 = "R23.3"
-    R23_4 = "R23.4"
-    R23_8 = "R23.8"
-    R25_R29 = "R25-R29"
-    R25 = "R25"
-    R25_0 = "R25.0"
-    R25_1 = "R25.1"
-    R25_2 = "R25.2"
-    R25_3 = "R25.3"
-    R25_8 = "R25.8"
-    R26 = "R26"
-    R26_0 = "R26.0"
-    R26_1 = "R26.1"
-    R26_2 = "R26.2"
-    R26_3 = "R26.3"
-    R26_8 = "R26.8"
-    R27 = "R27"
-    R27_0 = "R27.0"
-    R27_8 = "R27.8"
-    R29 = "R29"
-    R29_0 = "R29.0"
-    R29_1 = "R29.1"
-    R29_2 = "R29.2"
-    R29_3 = "R29.3"
-    R29_4 = "R29.4"
-    R29_6 = "R29.6"
-    R29_8 = "R29.8"
-    R30_R39 = "R30-R39"
-    R30 = "R30"
-    R30_0 = "R30.0"
-    R30_1 = "R30.1"
-    R30_9 = "R30.9"
-    R31 = "R31"
-    R32 = "R32"
-    R33 = "R33"
-    R34 = "R34"
-    R35 = "R35"
-    R36 = "R36"
-    R39 = "R39"
-    R39_0 = "R39.0"
-    R39_1 = "R39.1"
-    R39_2 = "R39.2"
-    R39_8 = "R39.8"
-    R40_R46 = "R40-R46"
-    R40 = "R40"
-    R40_0 = "R40.0"
-    R40_1 = "R40.1"
-    R40_2 = "R40.2"
-    R41 = "R41"
-    R41_0 = "R41.0"
-    R41_1 = "R41.1"
-    R41_2 = "R41.2"
-    R41_3 = "R41.3"
-    R41_8 = "R41.8"
-    R42 = "R42"
-    R43 = "R43"
-    R43_0 = "R43.0"
-    R43_1 = "R43.1"
-    R43_2 = "R43.2"
-    R43_8 = "R43.8"
-    R44 = "R44"
-    R44_0 = "R44.0"
-    R44_1 = "R44.1"
-    R44_2 = "R44.2"
-    R44_3 = "R44.3"
-    R44_8 = "R44.8"
-    R45 = "R45"
-    R45_0 = "R45.0"
-    R45_1 = "R45.1"
-    R45_2 = "R45.2"
-    R45_3 = "R45.3"
-    R45_4 = "R45.4"
-    R45_5 = "R45.5"
-    R45_6 = "R45.6"
-    R45_7 = "R45.7"
-    R45_8 = "R45.8"
-    R46 = "R46"
-    R46_0 = "R46.0"
-    R46_1 = "R46.1"
-    R46_2 = "R46.2"
-    R46_3 = "R46.3"
-    R46_4 = "R46.4"
-    R46_5 = "R46.5"
-    R46_6 = "R46.6"
-    R46_7 = "R46.7"
-    R46_8 = "R46.8"
-    R47_R49 = "R47-R49"
-    R47 = "R47"
-    R47_0 = "R47.0"
-    R47_1 = "R47.1"
-    R47_8 = "R47.8"
-    R48 = "R48"
-    R48_0 = "R48.0"
-    R48_1 = "R48.1"
-    R48_2 = "R48.2"
-    R48_8 = "R48.8"
-    R49 = "R49"
-    R49_0 = "R49.0"
-    R49_1 = "R49.1"
-    R49_2 = "R49.2"
-    R49_8 = "R49.8"
-    R50_R68 = "R50-R68"
-    R50 = "R50"
-    R50_0 = "R50.0"
-    R50_1 = "R50.1"
-    R50_2 = "R50.2"
-    R50_8 = "R50.8"
-    R50_9 = "R50.9"
-    R51 = "R51"
-    R52 = "R52"
-    R52_0 = "R52.0"
-    R52_1 = "R52.1"
-    R52_2 = "R52.2"
-    R52_9 = "R52.9"
-    R53 = "R53"
-    R54 = "R54"
-    R55 = "R55"
-    R56 = "R56"
-    R56_0 = "R56.0"
-    R56_8 = "R56.8"
-    R57 = "R57"
-    R57_0 = "R57.0"
-    R57_1 = "R57.1"
-    R57_8 = "R57.8"
-    R57_9 = "R57.9"
-    R58 = "R58"
-    R59 = "R59"
-    R59_0 = "R59.0"
-    R59_1 = "R59.1"
-    R59_9 = "R59.9"
-    R60 = "R60"
-    R60_0 = "R60.0"
-    R60_1 = "R60.1"
-    R60_9 = "R60.9"
-    R61 = "R61"
-    R61_0 = "R61.0"
-    R61_1 = "R61.1"
-    R61_9 = "R61.9"
-    R62 = "R62"
-    R62_0 = "R62.0"
-    R62_8 = "R62.8"
-    R62_9 = "R62.9"
-    R63 = "R63"
-    R63_0 = "R63.0"
-    R63_1 = "R63.1"
-    R63_2 = "R63.2"
-    R63_3 = "R63.3"
-    R63_4 = "R63.4"
-    R63_5 = "R63.5"
-    R63_6 = "R63.6"
-    R63_8 = "R63.8"
-    R64 = "R64"
-    R68 = "R68"
-    R68_0 = "R68.0"
-    R68_1 = "R68.1"
-    R68_2 = "R68.2"
-    R68_3 = "R68.3"
-    R68_8 = "R68.8"
-    R70_R79 = "R70-R79"
-    R70 = "R70"
-    R70_0 = "R70.0"
-    R70_1 = "R70.1"
-    R71 = "R71"
-    R72 = "R72"
-    R73 = "R73"
-    R73_0 = "R73.0"
-    R73_9 = "R73.9"
-    R74 = "R74"
-    R74_0 = "R74.0"
-    R74_8 = "R74.8"
-    R74_9 = "R74.9"
-    R75 = "R75"
-    R76 = "R76"
-    R76_0 = "R76.0"
-    R76_1 = "R76.1"
-    R76_2 = "R76.2"
-    R76_8 = "R76.8"
-    R76_9 = "R76.9"
-    R77 = "R77"
-    R77_0 = "R77.0"
-    R77_1 = "R77.1"
-    R77_2 = "R77.2"
-    R77_8 = "R77.8"
-    R77_9 = "R77.9"
-    R78 = "R78"
-    R78_0 = "R78.0"
-    R78_1 = "R78.1"
-    R78_2 = "R78.2"
-    R78_3 = "R78.3"
-    R78_4 = "R78.4"
-    R78_5 = "R78.5"
-    R78_6 = "R78.6"
-    R78_7 = "R78.7"
-    R78_8 = "R78.8"
-    R78_9 = "R78.9"
-    R79 = "R79"
-    R79_0 = "R79.0"
-    R79_8 = "R79.8"
-    R79_9 = "R79.9"
-    R80_R82 = "R80-R82"
-    R80 = "R80"
-    R81 = "R81"
-    R82 = "R82"
-    R82_0 = "R82.0"
-    R82_1 = "R82.1"
-    R82_2 = "R82.2"
-    R82_3 = "R82.3"
-    R82_4 = "R82.4"
-    R82_5 = "R82.5"
-    R82_6 = "R82.6"
-    R82_7 = "R82.7"
-    R82_8 = "R82.8"
-    R82_9 = "R82.9"
-    R83_R89 = "R83-R89"
-    R83 = "R83"
-    R83_0 = "R83.0"
-    R83_1 = "R83.1"
-    R83_2 = "R83.2"
-    R83_3 = "R83.3"
-    R83_4 = "R83.4"
-    R83_5 = "R83.5"
-    R83_6 = "R83.6"
-    R83_7 = "R83.7"
-    R83_8 = "R83.8"
-    R83_9 = "R83.9"
-    R84 = "R84"
-    R84_0 = "R84.0"
-    R84_1 = "R84.1"
-    R84_2 = "R84.2"
-    R84_3 = "R84.3"
-    R84_4 = "R84.4"
-    R84_5 = "R84.5"
-    R84_6 = "R84.6"
-    R84_7 = "R84.7"
-    R84_8 = "R84.8"
-    R84_9 = "R84.9"
-    R85 = "R85"
-    R85_0 = "R85.0"
-    R85_1 = "R85.1"
-    R85_2 = "R85.2"
-    R85_3 = "R85.3"
-    R85_4 = "R85.4"
-    R85_5 = "R85.5"
-    R85_6 = "R85.6"
-    R85_7 = "R85.7"
-    R85_8 = "R85.8"
-    R85_9 = "R85.9"
-    R86 = "R86"
-    R86_0 = "R86.0"
-    R86_1 = "R86.1"
-    R86_2 = "R86.2"
-    R86_3 = "R86.3"
-    R86_4 = "R86.4"
-    R86_5 = "R86.5"
-    R86_6 = "R86.6"
-    R86_7 = "R86.7"
-    R86_8 = "R86.8"
-    R86_9 = "R86.9"
-    R87 = "R87"
-    R87_0 = "R87.0"
-    R87_1 = "R87.1"
-    R87_2 = "R87.2"
-    R87_3 = "R87.3"
-    R87_4 = "R87.4"
-    R87_5 = "R87.5"
-    R87_6 = "R87.6"
-    R87_7 = "R87.7"
-    R87_8 = "R87.8"
-    R87_9 = "R87.9"
-    R89 = "R89"
-    R89_0 = "R89.0"
-    R89_1 = "R89.1"
-    R89_2 = "R89.2"
-    R89_3 = "R89.3"
-    R89_4 = "R89.4"
-    R89_5 = "R89.5"
-    R89_6 = "R89.6"
-    R89_7 = "R89.7"
-    R89_8 = "R89.8"
-    R89_9 = "R89.9"
-    R90_R94 = "R90-R94"
-    R90 = "R90"
-    R90_0 = "R90.0"
-    R90_8 = "R90.8"
-    R91 = "R91"
-    R92 = "R92"
-    R93 = "R93"
-    R93_0 = "R93.0"
-    R93_1 = "R93.1"
-    R93_2 = "R93.2"
-    R93_3 = "R93.3"
-    R93_4 = "R93.4"
-    R93_5 = "R93.5"
-    R93_6 = "R93.6"
-    R93_7 = "R93.7"
-    R93_8 = "R93.8"
-    R94 = "R94"
-    R94_0 = "R94.0"
-    R94_1 = "R94.1"
-    R94_2 = "R94.2"
-    R94_3 = "R94.3"
-    R94_4 = "R94.4"
-    R94_5 = "R94.5"
-    R94_6 = "R94.6"
-    R94_7 = "R94.7"
-    R94_8 = "R94.8"
-    R95_R99 = "R95-R99"
-    R95 = "R95"
-    R96 = "R96"
-    R96_0 = "R96.0"
-    R96_1 = "R96.1"
-    R98 = "R98"
-    R99 = "R99"
-    U00_U99 = "U00-U99"
-    U00_U49 = "U00-U49"
-    U01 = "U01"
-    U01_0 = "U01.0"
-    U01_1 = "U01.1"
-    U01_2 = "U01.2"
-    U01_3 = "U01.3"
-    U01_4 = "U01.4"
-    U01_5 = "U01.5"
-    U01_6 = "U01.6"
-    U01_7 = "U01.7"
-    U01_8 = "U01.8"
-    U01_9 = "U01.9"
-    U02 = "U02"
-    U03 = "U03"
-    U03_0 = "U03.0"
-    U03_9 = "U03.9"
-    U04 = "U04"
-    U04_9 = "U04.9"
-    V01_Y89 = "V01-Y89"
-    V01_V99 = "V01-V99"
-    V01_V09 = "V01-V09"
-    V01 = "V01"
-    V01_0 = "V01.0"
-    V01_1 = "V01.1"
-    V01_9 = "V01.9"
-    V02 = "V02"
-    V02_0 = "V02.0"
-    V02_1 = "V02.1"
-    V02_9 = "V02.9"
-    V03 = "V03"
-    V03_0 = "V03.0"
-    V03_1 = "V03.1"
-    V03_9 = "V03.9"
-    V04 = "V04"
-    V04_0 = "V04.0"
-    V04_1 = "V04.1"
-    V04_9 = "V04.9"
-    V05 = "V05"
-    V05_0 = "V05.0"
-    V05_1 = "V05.1"
-    V05_9 = "V05.9"
-    V06 = "V06"
-    V06_0 = "V06.0"
-    V06_1 = "V06.1"
-    V06_9 = "V06.9"
-    V09 = "V09"
-    V09_0 = "V09.0"
-    V09_1 = "V09.1"
-    V09_2 = "V09.2"
-    V09_3 = "V09.3"
-    V09_9 = "V09.9"
-    V10_V19 = "V10-V19"
-    V10 = "V10"
-    V10_0 = "V10.0"
-    V10_1 = "V10.1"
-    V10_2 = "V10.2"
-    V10_3 = "V10.3"
-    V10_4 = "V10.4"
-    V10_5 = "V10.5"
-    V10_9 = "V10.9"
-    V11 = "V11"
-    V11_0 = "V11.0"
-    V11_1 = "V11.1"
-    V11_2 = "V11.2"
-    V11_3 = "V11.3"
-    V11_4 = "V11.4"
-    V11_5 = "V11.5"
-    V11_9 = "V11.9"
-    V12 = "V12"
-    V12_0 = "V12.0"
-    V12_1 = "V12.1"
-    V12_2 = "V12.2"
-    V12_3 = "V12.3"
-    V12_4 = "V12.4"
-    V12_5 = "V12.5"
-    V12_9 = "V12.9"
-    V13 = "V13"
-    V13_0 = "V13.0"
-    V13_1 = "V13.1"
-    V13_2 = "V13.2"
-    V13_3 = "V13.3"
-    V13_4 = "V13.4"
-    V13_5 = "V13.5"
-    V13_9 = "V13.9"
-    V14 = "V14"
-    V14_0 = "V14.0"
-    V14_1 = "V14.1"
-    V14_2 = "V14.2"
-    V14_3 = "V14.3"
-    V14_4 = "V14.4"
-    V14_5 = "V14.5"
-    V14_9 = "V14.9"
-    V15 = "V15"
-    V15_0 = "V15.0"
-    V15_1 = "V15.1"
-    V15_2 = "V15.2"
-    V15_3 = "V15.3"
-    V15_4 = "V15.4"
-    V15_5 = "V15.5"
-    V15_9 = "V15.9"
-    V16 = "V16"
-    V16_0 = "V16.0"
-    V16_1 = "V16.1"
-    V16_2 = "V16.2"
-    V16_3 = "V16.3"
-    V16_4 = "V16.4"
-    V16_5 = "V16.5"
-    V16_9 = "V16.9"
-    V17 = "V17"
-    V17_0 = "V17.0"
-    V17_1 = "V17.1"
-    V17_2 = "V17.2"
-    V17_3 = "V17.3"
-    V17_4 = "V17.4"
-    V17_5 = "V17.5"
-    V17_9 = "V17.9"
-    V18 = "V18"
-    V18_0 = "V18.0"
-    V18_1 = "V18.1"
-    V18_2 = "V18.2"
-    V18_3 = "V18.3"
-    V18_4 = "V18.4"
-    V18_5 = "V18.5"
-    V18_9 = "V18.9"
-    V19 = "V19"
-    V19_0 = "V19.0"
-    V19_1 = "V19.1"
-    V19_2 = "V19.2"
-    V19_3 = "V19.3"
-    V19_4 = "V19.4"
-    V19_5 = "V19.5"
-    V19_6 = "V19.6"
-    V19_8 = "V19.8"
-    V19_9 = "V19.9"
-    V20_V29 = "V20-V29"
-    V20 = "V20"
-    V20_0 = "V20.0"
-    V20_1 = "V20.1"
-    V20_2 = "V20.2"
-    V20_3 = "V20.3"
-    V20_4 = "V20.4"
-    V20_5 = "V20.5"
-    V20_9 = "V20.9"
-    V21 = "V21"
-    V21_0 = "V21.0"
-    V21_1 = "V21.1"
-    V21_2 = "V21.2"
-    V21_3 = "V21.3"
-    V21_4 = "V21.4"
-    V21_5 = "V21.5"
-    V21_9 = "V21.9"
-    V22 = "V22"
-    V22_0 = "V22.0"
-    V22_1 = "V22.1"
-    V22_2 = "V22.2"
-    V22_3 = "V22.3"
-    V22_4 = "V22.4"
-    V22_5 = "V22.5"
-    V22_9 = "V22.9"
-    V23 = "V23"
-    V23_0 = "V23.0"
-    V23_1 = "V23.1"
-    V23_2 = "V23.2"
-    V23_3 = "V23.3"
-    V23_4 = "V23.4"
-    V23_5 = "V23.5"
-    V23_9 = "V23.9"
-    V24 = "V24"
-    V24_0 = "V24.0"
-    V24_1 = "V24.1"
-    V24_2 = "V24.2"
-    V24_3 = "V24.3"
-    V24_4 = "V24.4"
-    V24_5 = "V24.5"
-    V24_9 = "V24.9"
-    V25 = "V25"
-    V25_0 = "V25.0"
-    V25_1 = "V25.1"
-    V25_2 = "V25.2"
-    V25_3 = "V25.3"
-    V25_4 = "V25.4"
-    V25_5 = "V25.5"
-    V25_9 = "V25.9"
-    V26 = "V26"
-    V26_0 = "V26.0"
-    V26_1 = "V26.1"
-    V26_2 = "V26.2"
-    V26_3 = "V26.3"
-    V26_4 = "V26.4"
-    V26_5 = "V26.5"
-    V26_9 = "V26.9"
-    V27 = "V27"
-    V27_0 = "V27.0"
-    V27_1 = "V27.1"
-    V27_2 = "V27.2"
-    V27_3 = "V27.3"
-    V27_4 = "V27.4"
-    V27_5 = "V27.5"
-    V27_9 = "V27.9"
-    V28 = "V28"
-    V28_0 = "V28.0"
-    V28_1 = "V28.1"
-    V28_2 = "V28.2"
-    V28_3 = "V28.3"
-    V28_4 = "V28.4"
-    V28_5 = "V28.5"
-    V28_9 = "V28.9"
-    V29 = "V29"
-    V29_0 = "V29.0"
-    V29_1 = "V29.1"
-    V29_2 = "V29.2"
-    V29_3 = "V29.3"
-    V29_4 = "V29.4"
-    V29_5 = "V29.5"
-    V29_6 = "V29.6"
-    V29_8 = "V29.8"
-    V29_9 = "V29.9"
-    V30_V39 = "V30-V39"
-    V30 = "V30"
-    V30_0 = "V30.0"
-    V30_1 = "V30.1"
-    V30_2 = "V30.2"
-    V30_3 = "V30.3"
-    V30_4 = "V30.4"
-    V30_5 = "V30.5"
-    V30_6 = "V30.6"
-    V30_7 = "V30.7"
-    V30_9 = "V30.9"
-    V31 = "V31"
-    V31_0 = "V31.0"
-    V31_1 = "V31.1"
-    V31_2 = "V31.2"
-    V31_3 = "V31.3"
-    V31_4 = "V31.4"
-    V31_5 = "V31.5"
-    V31_6 = "V31.6"
-    V31_7 = "V31.7"
-    V31_9 = "V31.9"
-    V32 = "V32"
-    V32_0 = "V32.0"
-    V32_1 = "V32.1"
-    V32_2 = "V32.2"
-    V32_3 = "V32.3"
-    V32_4 = "V32.4"
-    V32_5 = "V32.5"
-    V32_6 = "V32.6"
-    V32_7 = "V32.7"
-    V32_9 = "V32.9"
-    V33 = "V33"
-    V33_0 = "V33.0"
-    V33_1 = "V33.1"
-    V33_2 = "V33.2"
-    V33_3 = "V33.3"
-    V33_4 = "V33.4"
-    V33_5 = "V33.5"
-    V33_6 = "V33.6"
-    V33_7 = "V33.7"
-    V33_9 = "V33.9"
-    V34 = "V34"
-    V34_0 = "V34.0"
-    V34_1 = "V34.1"
-    V34_2 = "V34.2"
-    V34_3 = "V34.3"
-    V34_4 = "V34.4"
-    V34_5 = "V34.5"
-    V34_6 = "V34.6"
-    V34_7 = "V34.7"
-    V34_9 = "V34.9"
-    V35 = "V35"
-    V35_0 = "V35.0"
-    V35_1 = "V35.1"
-    V35_2 = "V35.2"
-    V35_3 = "V35.3"
-    V35_4 = "V35.4"
-    V35_5 = "V35.5"
-    V35_6 = "V35.6"
-    V35_7 = "V35.7"
-    V35_9 = "V35.9"
-    V36 = "V36"
-    V36_0 = "V36.0"
-    V36_1 = "V36.1"
-    V36_2 = "V36.2"
-    V36_3 = "V36.3"
-    V36_4 = "V36.4"
-    V36_5 = "V36.5"
-    V36_6 = "V36.6"
-    V36_7 = "V36.7"
-    V36_9 = "V36.9"
-    V37 = "V37"
-    V37_0 = "V37.0"
-    V37_1 = "V37.1"
-    V37_2 = "V37.2"
-    V37_3 = "V37.3"
-    V37_4 = "V37.4"
-    V37_5 = "V37.5"
-    V37_6 = "V37.6"
-    V37_7 = "V37.7"
-    V37_9 = "V37.9"
-    V38 = "V38"
-    V38_0 = "V38.0"
-    V38_1 = "V38.1"
-    V38_2 = "V38.2"
-    V38_3 = "V38.3"
-    V38_4 = "V38.4"
-    V38_5 = "V38.5"
-    V38_6 = "V38.6"
-    V38_7 = "V38.7"
-    V38_9 = "V38.9"
-    V39 = "V39"
-    V39_0 = "V39.0"
-    V39_1 = "V39.1"
-    V39_2 = "V39.2"
-    V39_3 = "V39.3"
-    V39_4 = "V39.4"
-    V39_5 = "V39.5"
-    V39_6 = "V39.6"
-    V39_8 = "V39.8"
-    V39_9 = "V39.9"
-    V40_V49 = "V40-V49"
-    V40 = "V40"
-    V40_0 = "V40.0"
-    V40_1 = "V40.1"
-    V40_2 = "V40.2"
-    V40_3 = "V40.3"
-    V40_4 = "V40.4"
-    V40_5 = "V40.5"
-    V40_6 = "V40.6"
-    V40_7 = "V40.7"
-    V40_9 = "V40.9"
-    V41 = "V41"
-    V41_0 = "V41.0"
-    V41_1 = "V41.1"
-    V41_2 = "V41.2"
-    V41_3 = "V41.3"
-    V41_4 = "V41.4"
-    V41_5 = "V41.5"
-    V41_6 = "V41.6"
-    V41_7 = "V41.7"
-    V41_9 = "V41.9"
-    V42 = "V42"
-    V42_0 = "V42.0"
-    V42_1 = "V42.1"
-    V42_2 = "V42.2"
-    V42_3 = "V42.3"
-    V42_4 = "V42.4"
-    V42_5 = "V42.5"
-    V42_6 = "V42.6"
-    V42_7 = "V42.7"
-    V42_9 = "V42.9"
-    V43 = "V43"
-    V43_0 = "V43.0"
-    V43_1 = "V43.1"
-    V43_2 = "V43.2"
-    V43_3 = "V43.3"
-    V43_4 = "V43.4"
-    V43_5 = "V43.5"
-    V43_6 = "V43.6"
-    V43_7 = "V43.7"
-    V43_9 = "V43.9"
-    V44 = "V44"
-    V44_0 = "V44.0"
-    V44_1 = "V44.1"
-    V44_2 = "V44.2"
-    V44_3 = "V44.3"
-    V44_4 = "V44.4"
-    V44_5 = "V44.5"
-    V44_6 = "V44.6"
-    V44_7 = "V44.7"
-    V44_9 = "V44.9"
-    V45 = "V45"
-    V45_0 = "V45.0"
-    V45_1 = "V45.1"
-    V45_2 = "V45.2"
-    V45_3 = "V45.3"
-    V45_4 = "V45.4"
-    V45_5 = "V45.5"
-    V45_6 = "V45.6"
-    V45_7 = "V45.7"
-    V45_9 = "V45.9"
-    V46 = "V46"
-    V46_0 = "V46.0"
-    V46_1 = "V46.1"
-    V46_2 = "V46.2"
-    V46_3 = "V46.3"
-    V46_4 = "V46.4"
-    V46_5 = "V46.5"
-    V46_6 = "V46.6"
-    V46_7 = "V46.7"
-    V46_9 = "V46.9"
-    V47 = "V47"
-    V47_0 = "V47.0"
-    V47_1 = "V47.1"
-    V47_2 = "V47.2"
-    V47_3 = "V47.3"
-    V47_4 = "V47.4"
-    V47_5 = "V47.5"
-    V47_6 = "V47.6"
-    V47_7 = "V47.7"
-    V47_9 = "V47.9"
-    V48 = "V48"
-    V48_0 = "V48.0"
-    V48_1 = "V48.1"
-    V48_2 = "V48.2"
-    V48_3 = "V48.3"
-    V48_4 = "V48.4"
-    V48_5 = "V48.5"
-    V48_6 = "V48.6"
-    V48_7 = "V48.7"
-    V48_9 = "V48.9"
-    V49 = "V49"
-    V49_0 = "V49.0"
-    V49_1 = "V49.1"
-    V49_2 = "V49.2"
-    V49_3 = "V49.3"
-    V49_4 = "V49.4"
-    V49_5 = "V49.5"
-    V49_6 = "V49.6"
-    V49_8 = "V49.8"
-    V49_9 = "V49.9"
-    V50_V59 = "V50-V59"
-    V50 = "V50"
-    V50_0 = "V50.0"
-    V50_1 = "V50.1"
-    V50_2 = "V50.2"
-    V50_3 = "V50.3"
-    V50_4 = "V50.4"
-    V50_5 = "V50.5"
-    V50_6 = "V50.6"
-    V50_7 = "V50.7"
-    V50_9 = "V50.9"
-    V51 = "V51"
-    V51_0 = "V51.0"
-    V51_1 = "V51.1"
-    V51_2 = "V51.2"
-    V51_3 = "V51.3"
-    V51_4 = "V51.4"
-    V51_5 = "V51.5"
-    V51_6 = "V51.6"
-    V51_7 = "V51.7"
-    V51_9 = "V51.9"
-    V52 = "V52"
-    V52_0 = "V52.0"
-    V52_1 = "V52.1"
-    V52_2 = "V52.2"
-    V52_3 = "V52.3"
-    V52_4 = "V52.4"
-    V52_5 = "V52.5"
-    V52_6 = "V52.6"
-    V52_7 = "V52.7"
-    V52_9 = "V52.9"
-    V53 = "V53"
-    V53_0 = "V53.0"
-    V53_1 = "V53.1"
-    V53_2 = "V53.2"
-    V53_3 = "V53.3"
-    V53_4 = "V53.4"
-    V53_5 = "V53.5"
-    V53_6 = "V53.6"
-    V53_7 = "V53.7"
-    V53_9 = "V53.9"
-    V54 = "V54"
-    V54_0 = "V54.0"
-    V54_1 = "V54.1"
-    V54_2 = "V54.2"
-    V54_3 = "V54.3"
-    V54_4 = "V54.4"
-    V54_5 = "V54.5"
-    V54_6 = "V54.6"
-    V54_7 = "V54.7"
-    V54_9 = "V54.9"
-    V55 = "V55"
-    V55_0 = "V55.0"
-    V55_1 = "V55.1"
-    V55_2 = "V55.2"
-    V55_3 = "V55.3"
-    V55_4 = "V55.4"
-    V55_5 = "V55.5"
-    V55_6 = "V55.6"
-    V55_7 = "V55.7"
-    V55_9 = "V55.9"
-    V56 = "V56"
-    V56_0 = "V56.0"
-    V56_1 = "V56.1"
-    V56_2 = "V56.2"
-    V56_3 = "V56.3"
-    V56_4 = "V56.4"
-    V56_5 = "V56.5"
-    V56_6 = "V56.6"
-    V56_7 = "V56.7"
-    V56_9 = "V56.9"
-    V57 = "V57"
-    V57_0 = "V57.0"
-    V57_1 = "V57.1"
-    V57_2 = "V57.2"
-    V57_3 = "V57.3"
-    V57_4 = "V57.4"
-    V57_5 = "V57.5"
-    V57_6 = "V57.6"
-    V57_7 = "V57.7"
-    V57_9 = "V57.9"
-    V58 = "V58"
-    V58_0 = "V58.0"
-    V58_1 = "V58.1"
-    V58_2 = "V58.2"
-    V58_3 = "V58.3"
-    V58_4 = "V58.4"
-    V58_5 = "V58.5"
-    V58_6 = "V58.6"
-    V58_7 = "V58.7"
-    V58_9 = "V58.9"
-    V59 = "V59"
-    V59_0 = "V59.0"
-    V59_1 = "V59.1"
-    V59_2 = "V59.2"
-    V59_3 = "V59.3"
-    V59_4 = "V59.4"
-    V59_5 = "V59.5"
-    V59_6 = "V59.6"
-    V59_8 = "V59.8"
-    V59_9 = "V59.9"
-    V60_V69 = "V60-V69"
-    V60 = "V60"
-    V60_0 = "V60.0"
-    V60_1 = "V60.1"
-    V60_2 = "V60.2"
-    V60_3 = "V60.3"
-    V60_4 = "V60.4"
-    V60_5 = "V60.5"
-    V60_6 = "V60.6"
-    V60_7 = "V60.7"
-    V60_9 = "V60.9"
-    V61 = "V61"
-    V61_0 = "V61.0"
-    V61_1 = "V61.1"
-    V61_2 = "V61.2"
-    V61_3 = "V61.3"
-    V61_4 = "V61.4"
-    V61_5 = "V61.5"
-    V61_6 = "V61.6"
-    V61_7 = "V61.7"
-    V61_9 = "V61.9"
-    V62 = "V62"
-    V62_0 = "V62.0"
-    V62_1 = "V62.1"
-    V62_2 = "V62.2"
-    V62_3 = "V62.3"
-    V62_4 = "V62.4"
-    V62_5 = "V62.5"
-    V62_6 = "V62.6"
-    V62_7 = "V62.7"
-    V62_9 = "V62.9"
-    V63 = "V63"
-    V63_0 = "V63.0"
-    V63_1 = "V63.1"
-    V63_2 = "V63.2"
-    V63_3 = "V63.3"
-    V63_4 = "V63.4"
-    V63_5 = "V63.5"
-    V63_6 = "V63.6"
-    V63_7 = "V63.7"
-    V63_9 = "V63.9"
-    V64 = "V64"
-    V64_0 = "V64.0"
-    V64_1 = "V64.1"
-    V64_2 = "V64.2"
-    V64_3 = "V64.3"
-    V64_4 = "V64.4"
-    V64_5 = "V64.5"
-    V64_6 = "V64.6"
-    V64_7 = "V64.7"
-    V64_9 = "V64.9"
-    V65 = "V65"
-    V65_0 = "V65.0"
-    V65_1 = "V65.1"
-    V65_2 = "V65.2"
-    V65_3 = "V65.3"
-    V65_4 = "V65.4"
-    V65_5 = "V65.5"
-    V65_6 = "V65.6"
-    V65_7 = "V65.7"
-    V65_9 = "V65.9"
-    V66 = "V66"
-    V66_0 = "V66.0"
-    V66_1 = "V66.1"
-    V66_2 = "V66.2"
-    V66_3 = "V66.3"
-    V66_4 = "V66.4"
-    V66_5 = "V66.5"
-    V66_6 = "V66.6"
-    V66_7 = "V66.7"
-    V66_9 = "V66.9"
-    V67 = "V67"
-    V67_0 = "V67.0"
-    V67_1 = "V67.1"
-    V67_2 = "V67.2"
-    V67_3 = "V67.3"
-    V67_4 = "V67.4"
-    V67_5 = "V67.5"
-    V67_6 = "V67.6"
-    V67_7 = "V67.7"
-    V67_9 = "V67.9"
-    V68 = "V68"
-    V68_0 = "V68.0"
-    V68_1 = "V68.1"
-    V68_2 = "V68.2"
-    V68_3 = "V68.3"
-    V68_4 = "V68.4"
-    V68_5 = "V68.5"
-    V68_6 = "V68.6"
-    V68_7 = "V68.7"
-    V68_9 = "V68.9"
-    V69 = "V69"
-    V69_0 = "V69.0"
-    V69_1 = "V69.1"
-    V69_2 = "V69.2"
-    V69_3 = "V69.3"
-    V69_4 = "V69.4"
-    V69_5 = "V69.5"
-    V69_6 = "V69.6"
-    V69_8 = "V69.8"
-    V69_9 = "V69.9"
-    V70_V79 = "V70-V79"
-    V70 = "V70"
-    V70_0 = "V70.0"
-    V70_1 = "V70.1"
-    V70_2 = "V70.2"
-    V70_3 = "V70.3"
-    V70_4 = "V70.4"
-    V70_5 = "V70.5"
-    V70_6 = "V70.6"
-    V70_7 = "V70.7"
-    V70_9 = "V70.9"
-    V71 = "V71"
-    V71_0 = "V71.0"
-    V71_1 = "V71.1"
-    V71_2 = "V71.2"
-    V71_3 = "V71.3"
-    V71_4 = "V71.4"
-    V71_5 = "V71.5"
-    V71_6 = "V71.6"
-    V71_7 = "V71.7"
-    V71_9 = "V71.9"
-    V72 = "V72"
-    V72_0 = "V72.0"
-    V72_1 = "V72.1"
-    V72_2 = "V72.2"
-    V72_3 = "V72.3"
-    V72_4 = "V72.4"
-    V72_5 = "V72.5"
-    V72_6 = "V72.6"
-    V72_7 = "V72.7"
-    V72_9 = "V72.9"
-    V73 = "V73"
-    V73_0 = "V73.0"
-    V73_1 = "V73.1"
-    V73_2 = "V73.2"
-    V73_3 = "V73.3"
-    V73_4 = "V73.4"
-    V73_5 = "V73.5"
-    V73_6 = "V73.6"
-    V73_7 = "V73.7"
-    V73_9 = "V73.9"
-    V74 = "V74"
-    V74_0 = "V74.0"
-    V74_1 = "V74.1"
-    V74_2 = "V74.2"
-    V74_3 = "V74.3"
-    V74_4 = "V74.4"
-    V74_5 = "V74.5"
-    V74_6 = "V74.6"
-    V74_7 = "V74.7"
-    V74_9 = "V74.9"
-    V75 = "V75"
-    V75_0 = "V75.0"
-    V75_1 = "V75.1"
-    V75_2 = "V75.2"
-    V75_3 = "V75.3"
-    V75_4 = "V75.4"
-    V75_5 = "V75.5"
-    V75_6 = "V75.6"
-    V75_7 = "V75.7"
-    V75_9 = "V75.9"
-    V76 = "V76"
-    V76_0 = "V76.0"
-    V76_1 = "V76.1"
-    V76_2 = "V76.2"
-    V76_3 = "V76.3"
-    V76_4 = "V76.4"
-    V76_5 = "V76.5"
-    V76_6 = "V76.6"
-    V76_7 = "V76.7"
-    V76_9 = "V76.9"
-    V77 = "V77"
-    V77_0 = "V77.0"
-    V77_1 = "V77.1"
-    V77_2 = "V77.2"
-    V77_3 = "V77.3"
-    V77_4 = "V77.4"
-    V77_5 = "V77.5"
-    V77_6 = "V77.6"
-    V77_7 = "V77.7"
-    V77_9 = "V77.9"
-    V78 = "V78"
-    V78_0 = "V78.0"
-    V78_1 = "V78.1"
-    V78_2 = "V78.2"
-    V78_3 = "V78.3"
-    V78_4 = "V78.4"
-    V78_5 = "V78.5"
-    V78_6 = "V78.6"
-    V78_7 = "V78.7"
-    V78_9 = "V78.9"
-    V79 = "V79"
-    V79_0 = "V79.0"
-    V79_1 = "V79.1"
-    V79_2 = "V79.2"
-    V79_3 = "V79.3"
-    V79_4 = "V79.4"
-    V79_5 = "V79.5"
-    V79_6 = "V79.6"
-    V79_8 = "V79.8"
-    V79_9 = "V79.9"
-    V80_V89 = "V80-V89"
-    V80 = "V80"
-    V80_0 = "V80.0"
-    V80_1 = "V80.1"
-    V80_2 = "V80.2"
-    V80_3 = "V80.3"
-    V80_4 = "V80.4"
-    V80_5 = "V80.5"
-    V80_6 = "V80.6"
-    V80_7 = "V80.7"
-    V80_8 = "V80.8"
-    V80_9 = "V80.9"
-    V81 = "V81"
-    V81_0 = "V81.0"
-    V81_1 = "V81.1"
-    V81_2 = "V81.2"
-    V81_3 = "V81.3"
-    V81_4 = "V81.4"
-    V81_5 = "V81.5"
-    V81_6 = "V81.6"
-    V81_7 = "V81.7"
-    V81_8 = "V81.8"
-    V81_9 = "V81.9"
-    V82 = "V82"
-    V82_0 = "V82.0"
-    V82_1 = "V82.1"
-    V82_2 = "V82.2"
-    V82_3 = "V82.3"
-    V82_4 = "V82.4"
-    V82_5 = "V82.5"
-    V82_6 = "V82.6"
-    V82_7 = "V82.7"
-    V82_8 = "V82.8"
-    V82_9 = "V82.9"
-    V83 = "V83"
-    V83_0 = "V83.0"
-    V83_1 = "V83.1"
-    V83_2 = "V83.2"
-    V83_3 = "V83.3"
-    V83_4 = "V83.4"
-    V83_5 = "V83.5"
-    V83_6 = "V83.6"
-    V83_7 = "V83.7"
-    V83_9 = "V83.9"
-    V84 = "V84"
-    V84_0 = "V84.0"
-    V84_1 = "V84.1"
-    V84_2 = "V84.2"
-    V84_3 = "V84.3"
-    V84_4 = "V84.4"
-    V84_5 = "V84.5"
-    V84_6 = "V84.6"
-    V84_7 = "V84.7"
-    V84_9 = "V84.9"
-    V85 = "V85"
-    V85_0 = "V85.0"
-    V85_1 = "V85.1"
-    V85_2 = "V85.2"
-    V85_3 = "V85.3"
-    V85_4 = "V85.4"
-    V85_5 = "V85.5"
-    V85_6 = "V85.6"
-    V85_7 = "V85.7"
-    V85_9 = "V85.9"
-    V86 = "V86"
-    V86_0 = "V86.0"
-    V86_1 = "V86.1"
-    V86_2 = "V86.2"
-    V86_3 = "V86.3"
-    V86_4 = "V86.4"
-    V86_5 = "V86.5"
-    V86_6 = "V86.6"
-    V86_7 = "V86.7"
-    V86_9 = "V86.9"
-    V87 = "V87"
-    V87_0 = "V87.0"
-    V87_1 = "V87.1"
-    V87_2 = "V87.2"
-    V87_3 = "V87.3"
-    V87_4 = "V87.4"
-    V87_5 = "V87.5"
-    V87_6 = "V87.6"
-    V87_7 = "V87.7"
-    V87_8 = "V87.8"
-    V87_9 = "V87.9"
-    V88 = "V88"
-    V88_0 = "V88.0"
-    V88_1 = "V88.1"
-    V88_2 = "V88.2"
-    V88_3 = "V88.3"
-    V88_4 = "V88.4"
-    V88_5 = "V88.5"
-    V88_6 = "V88.6"
-    V88_7 = "V88.7"
-    V88_8 = "V88.8"
-    V88_9 = "V88.9"
-    V89 = "V89"
-    V89_0 = "V89.0"
-    V89_1 = "V89.1"
-    V89_2 = "V89.2"
-    V89_3 = "V89.3"
-    V89_9 = "V89.9"
-    V90_V94 = "V90-V94"
-    V90 = "V90"
-    V90_0 = "V90.0"
-    V90_1 = "V90.1"
-    V90_2 = "V90.2"
-    V90_3 = "V90.3"
-    V90_4 = "V90.4"
-    V90_5 = "V90.5"
-    V90_6 = "V90.6"
-    V90_7 = "V90.7"
-    V90_8 = "V90.8"
-    V90_9 = "V90.9"
-    V91 = "V91"
-    V91_0 = "V91.0"
-    V91_1 = "V91.1"
-    V91_2 = "V91.2"
-    V91_3 = "V91.3"
-    V91_4 = "V91.4"
-    V91_5 = "V91.5"
-    V91_6 = "V91.6"
-    V91_7 = "V91.7"
-    V91_8 = "V91.8"
-    V91_9 = "V91.9"
-    V92 = "V92"
-    V92_0 = "V92.0"
-    V92_1 = "V92.1"
-    V92_2 = "V92.2"
-    V92_3 = "V92.3"
-    V92_4 = "V92.4"
-    V92_5 = "V92.5"
-    V92_6 = "V92.6"
-    V92_7 = "V92.7"
-    V92_8 = "V92.8"
-    V92_9 = "V92.9"
-    V93 = "V93"
-    V93_0 = "V93.0"
-    V93_1 = "V93.1"
-    V93_2 = "V93.2"
-    V93_3 = "V93.3"
-    V93_4 = "V93.4"
-    V93_5 = "V93.5"
-    V93_6 = "V93.6"
-    V93_7 = "V93.7"
-    V93_8 = "V93.8"
-    V93_9 = "V93.9"
-    V94 = "V94"
-    V94_0 = "V94.0"
-    V94_1 = "V94.1"
-    V94_2 = "V94.2"
-    V94_3 = "V94.3"
-    V94_4 = "V94.4"
-    V94_5 = "V94.5"
-    V94_6 = "V94.6"
-    V94_7 = "V94.7"
-    V94_8 = "V94.8"
-    V94_9 = "V94.9"
-    V95_V97 = "V95-V97"
-    V95 = "V95"
-    V95_0 = "V95.0"
-    V95_1 = "V95.1"
-    V95_2 = "V95.2"
-    V95_3 = "V95.3"
-    V95_4 = "V95.4"
-    V95_8 = "V95.8"
-    V95_9 = "V95.9"
-    V96 = "V96"
-    V96_0 = "V96.0"
-    V96_1 = "V96.1"
-    V96_2 = "V96.2"
-    V96_8 = "V96.8"
-    V96_9 = "V96.9"
-    V97 = "V97"
-    V97_0 = "V97.0"
-    V97_1 = "V97.1"
-    V97_2 = "V97.2"
-    V97_3 = "V97.3"
-    V97_8 = "V97.8"
-    V98_V99 = "V98-V99"
-    V98 = "V98"
-    V99 = "V99"
-    W00_X59 = "W00-X59"
-    W00_W19 = "W00-W19"
-    W00 = "W00"
-    W01 = "W01"
-    W02 = "W02"
-    W03 = "W03"
-    W04 = "W04"
-    W05 = "W05"
-    W06 = "W06"
-    W07 = "W07"
-    W08 = "W08"
-    W09 = "W09"
-    W10 = "W10"
-    W11 = "W11"
-    W12 = "W12"
-    W13 = "W13"
-    W14 = "W14"
-    W15 = "W15"
-    W16 = "W16"
-    W17 = "W17"
-    W18 = "W18"
-    W19 = "W19"
-    W20_W49 = "W20-W49"
-    W20 = "W20"
-    W21 = "W21"
-    W22 = "W22"
-    W23 = "W23"
-    W24 = "W24"
-    W25 = "W25"
-    W26 = "W26"
-    W27 = "W27"
-    W28 = "W28"
-    W29 = "W29"
-    W30 = "W30"
-    W31 = "W31"
-    W32 = "W32"
-    W33 = "W33"
-    W34 = "W34"
-    W35 = "W35"
-    W36 = "W36"
-    W37 = "W37"
-    W38 = "W38"
-    W39 = "W39"
-    W40 = "W40"
-    W41 = "W41"
-    W42 = "W42"
-    W43 = "W43"
-    W44 = "W44"
-    W45 = "W45"
-    W46 = "W46"
-    W49 = "W49"
-    W50_W64 = "W50-W64"
-    W50 = "W50"
-    W51 = "W51"
-    W52 = "W52"
-    W53 = "W53"
-    W54 = "W54"
-    W55 = "W55"
-    W56 = "W56"
-    W57 = "W57"
-    W58 = "W58"
-    W59 = "W59"
-    W60 = "W60"
-    W64 = "W64"
-    W65_W74 = "W65-W74"
-    W65 = "W65"
-    W66 = "W66"
-    W67 = "W67"
-    W68 = "W68"
-    W69 = "W69"
-    W70 = "W70"
-    W73 = "W73"
-    W74 = "W74"
-    W75_W84 = "W75-W84"
-    W75 = "W75"
-    W76 = "W76"
-    W77 = "W77"
-    W78 = "W78"
-    W79 = "W79"
-    W80 = "W80"
-    W81 = "W81"
-    W83 = "W83"
-    W84 = "W84"
-    W85_W99 = "W85-W99"
-    W85 = "W85"
-    W86 = "W86"
-    W87 = "W87"
-    W88 = "W88"
-    W89 = "W89"
-    W90 = "W90"
-    W91 = "W91"
-    W92 = "W92"
-    W93 = "W93"
-    W94 = "W94"
-    W99 = "W99"
-    X00_X09 = "X00-X09"
-    X00 = "X00"
-    X01 = "X01"
-    X02 = "X02"
-    X03 = "X03"
-    X04 = "X04"
-    X05 = "X05"
-    X06 = "X06"
-    X08 = "X08"
-    X09 = "X09"
-    X10_X19 = "X10-X19"
-    X10 = "X10"
-    X11 = "X11"
-    X12 = "X12"
-    X13 = "X13"
-    X14 = "X14"
-    X15 = "X15"
-    X16 = "X16"
-    X17 = "X17"
-    X18 = "X18"
-    X19 = "X19"
-    X20_X29 = "X20-X29"
-    X20 = "X20"
-    X21 = "X21"
-    X22 = "X22"
-    X23 = "X23"
-    X24 = "X24"
-    X25 = "X25"
-    X26 = "X26"
-    X27 = "X27"
-    X28 = "X28"
-    X29 = "X29"
-    X30_X39 = "X30-X39"
-    X30 = "X30"
-    X31 = "X31"
-    X32 = "X32"
-    X33 = "X33"
-    X34 = "X34"
-    X34_0 = "X34.0"
-    X34_1 = "X34.1"
-    X34_8 = "X34.8"
-    X34_9 = "X34.9"
-    X35 = "X35"
-    X36 = "X36"
-    X37 = "X37"
-    X38 = "X38"
-    X39 = "X39"
-    X40_X49 = "X40-X49"
-    X40 = "X40"
-    X41 = "X41"
-    X42 = "X42"
-    X43 = "X43"
-    X44 = "X44"
-    X45 = "X45"
-    X46 = "X46"
-    X47 = "X47"
-    X48 = "X48"
-    X49 = "X49"
-    X50_X57 = "X50-X57"
-    X50 = "X50"
-    X51 = "X51"
-    X52 = "X52"
-    X53 = "X53"
-    X54 = "X54"
-    X57 = "X57"
-    X58_X59 = "X58-X59"
-    X58 = "X58"
-    X59 = "X59"
-    X59_0 = "X59.0"
-    X59_9 = "X59.9"
-    X60_X84 = "X60-X84"
-    X60 = "X60"
-    X61 = "X61"
-    X62 = "X62"
-    X63 = "X63"
-    X64 = "X64"
-    X65 = "X65"
-    X66 = "X66"
-    X67 = "X67"
-    X68 = "X68"
-    X69 = "X69"
-    X70 = "X70"
-    X71 = "X71"
-    X72 = "X72"
-    X73 = "X73"
-    X74 = "X74"
-    X75 = "X75"
-    X76 = "X76"
-    X77 = "X77"
-    X78 = "X78"
-    X79 = "X79"
-    X80 = "X80"
-    X81 = "X81"
-    X82 = "X82"
-    X83 = "X83"
-    X84 = "X84"
-    X85_Y09 = "X85-Y09"
-    X85 = "X85"
-    X86 = "X86"
-    X87 = "X87"
-    X88 = "X88"
-    X89 = "X89"
-    X90 = "X90"
-    X91 = "X91"
-    X92 = "X92"
-    X93 = "X93"
-    X94 = "X94"
-    X95 = "X95"
-    X96 = "X96"
-    X97 = "X97"
-    X98 = "X98"
-    X99 = "X99"
-    Y00 = "Y00"
-    Y01 = "Y01"
-    Y02 = "Y02"
-    Y03 = "Y03"
-    Y04 = "Y04"
-    Y05 = "Y05"
-    Y06 = "Y06"
-    Y06_0 = "Y06.0"
-    Y06_1 = "Y06.1"
-    Y06_2 = "Y06.2"
-    Y06_8 = "Y06.8"
-    Y06_9 = "Y06.9"
-    Y07 = "Y07"
-    Y07_0 = "Y07.0"
-    Y07_1 = "Y07.1"
-    Y07_2 = "Y07.2"
-    Y07_3 = "Y07.3"
-    Y07_8 = "Y07.8"
-    Y07_9 = "Y07.9"
-    Y08 = "Y08"
-    Y09 = "Y09"
-    Y10_Y34 = "Y10-Y34"
-    Y10 = "Y10"
-    Y11 = "Y11"
-    Y12 = "Y12"
-    Y13 = "Y13"
-    Y14 = "Y14"
-    Y15 = "Y15"
-    Y16 = "Y16"
-    Y17 = "Y17"
-    Y18 = "Y18"
-    Y19 = "Y19"
-    Y20 = "Y20"
-    Y21 = "Y21"
-    Y22 = "Y22"
-    Y23 = "Y23"
-    Y24 = "Y24"
-    Y25 = "Y25"
-    Y26 = "Y26"
-    Y27 = "Y27"
-    Y28 = "Y28"
-    Y29 = "Y29"
-    Y30 = "Y30"
-    Y31 = "Y31"
-    Y32 = "Y32"
-    Y33 = "Y33"
-    Y34 = "Y34"
-    Y35_Y36 = "Y35-Y36"
-    Y35 = "Y35"
-    Y35_0 = "Y35.0"
-    Y35_1 = "Y35.1"
-    Y35_2 = "Y35.2"
-    Y35_3 = "Y35.3"
-    Y35_4 = "Y35.4"
-    Y35_5 = "Y35.5"
-    Y35_6 = "Y35.6"
-    Y35_7 = "Y35.7"
-    Y36 = "Y36"
-    Y36_0 = "Y36.0"
-    Y36_1 = "Y36.1"
-    Y36_2 = "Y36.2"
-    Y36_3 = "Y36.3"
-    Y36_4 = "Y36.4"
-    Y36_5 = "Y36.5"
-    Y36_6 = "Y36.6"
-    Y36_7 = "Y36.7"
-    Y36_8 = "Y36.8"
-    Y36_9 = "Y36.9"
-    Y40_Y84 = "Y40-Y84"
-    Y40_Y59 = "Y40-Y59"
-    Y40 = "Y40"
-    Y40_0 = "Y40.0"
-    Y40_1 = "Y40.1"
-    Y40_2 = "Y40.2"
-    Y40_3 = "Y40.3"
-    Y40_4 = "Y40.4"
-    Y40_5 = "Y40.5"
-    Y40_6 = "Y40.6"
-    Y40_7 = "Y40.7"
-    Y40_8 = "Y40.8"
-    Y40_9 = "Y40.9"
-    Y41 = "Y41"
-    Y41_0 = "Y41.0"
-    Y41_1 = "Y41.1"
-    Y41_2 = "Y41.2"
-    Y41_3 = "Y41.3"
-    Y41_4 = "Y41.4"
-    Y41_5 = "Y41.5"
-    Y41_8 = "Y41.8"
-    Y41_9 = "Y41.9"
-    Y42 = "Y42"
-    Y42_0 = "Y42.0"
-    Y42_1 = "Y42.1"
-    Y42_2 = "Y42.2"
-    Y42_3 = "Y42.3"
-    Y42_4 = "Y42.4"
-    Y42_5 = "Y42.5"
-    Y42_6 = "Y42.6"
-    Y42_7 = "Y42.7"
-    Y42_8 = "Y42.8"
-    Y42_9 = "Y42.9"
-    Y43 = "Y43"
-    Y43_0 = "Y43.0"
-    Y43_1 = "Y43.1"
-    Y43_2 = "Y43.2"
-    Y43_3 = "Y43.3"
-    Y43_4 = "Y43.4"
-    Y43_5 = "Y43.5"
-    Y43_6 = "Y43.6"
-    Y43_8 = "Y43.8"
-    Y43_9 = "Y43.9"
-    Y44 = "Y44"
-    Y44_0 = "Y44.0"
-    Y44_1 = "Y44.1"
-    Y44_2 = "Y44.2"
-    Y44_3 = "Y44.3"
-    Y44_4 = "Y44.4"
-    Y44_5 = "Y44.5"
-    Y44_6 = "Y44.6"
-    Y44_7 = "Y44.7"
-    Y44_9 = "Y44.9"
-    Y45 = "Y45"
-    Y45_0 = "Y45.0"
-    Y45_1 = "Y45.1"
-    Y45_2 = "Y45.2"
-    Y45_3 = "Y45.3"
-    Y45_4 = "Y45.4"
-    Y45_5 = "Y45.5"
-    Y45_8 = "Y45.8"
-    Y45_9 = "Y45.9"
-    Y46 = "Y46"
-    Y46_0 = "Y46.0"
-    Y46_1 = "Y46.1"
-    Y46_2 = "Y46.2"
-    Y46_3 = "Y46.3"
-    Y46_4 = "Y46.4"
-    Y46_5 = "Y46.5"
-    Y46_6 = "Y46.6"
-    Y46_7 = "Y46.7"
-    Y46_8 = "Y46.8"
-    Y47 = "Y47"
-    Y47_0 = "Y47.0"
-    Y47_1 = "Y47.1"
-    Y47_2 = "Y47.2"
-    Y47_3 = "Y47.3"
-    Y47_4 = "Y47.4"
-    Y47_5 = "Y47.5"
-    Y47_8 = "Y47.8"
-    Y47_9 = "Y47.9"
-    Y48 = "Y48"
-    Y48_0 = "Y48.0"
-    Y48_1 = "Y48.1"
-    Y48_2 = "Y48.2"
-    Y48_3 = "Y48.3"
-    Y48_4 = "Y48.4"
-    Y48_5 = "Y48.5"
-    Y49 = "Y49"
-    Y49_0 = "Y49.0"
-    Y49_1 = "Y49.1"
-    Y49_2 = "Y49.2"
-    Y49_3 = "Y49.3"
-    Y49_4 = "Y49.4"
-    Y49_5 = "Y49.5"
-    Y49_6 = "Y49.6"
-    Y49_7 = "Y49.7"
-    Y49_8 = "Y49.8"
-    Y49_9 = "Y49.9"
-    Y50 = "Y50"
-    Y50_0 = "Y50.0"
-    Y50_1 = "Y50.1"
-    Y50_2 = "Y50.2"
-    Y50_8 = "Y50.8"
-    Y50_9 = "Y50.9"
-    Y51 = "Y51"
-    Y51_0 = "Y51.0"
-    Y51_1 = "Y51.1"
-    Y51_2 = "Y51.2"
-    Y51_3 = "Y51.3"
-    Y51_4 = "Y51.4"
-    Y51_5 = "Y51.5"
-    Y51_6 = "Y51.6"
-    Y51_7 = "Y51.7"
-    Y51_8 = "Y51.8"
-    Y51_9 = "Y51.9"
-    Y52 = "Y52"
-    Y52_0 = "Y52.0"
-    Y52_1 = "Y52.1"
-    Y52_2 = "Y52.2"
-    Y52_3 = "Y52.3"
-    Y52_4 = "Y52.4"
-    Y52_5 = "Y52.5"
-    Y52_6 = "Y52.6"
-    Y52_7 = "Y52.7"
-    Y52_8 = "Y52.8"
-    Y52_9 = "Y52.9"
-    Y53 = "Y53"
-    Y53_0 = "Y53.0"
-    Y53_1 = "Y53.1"
-    Y53_2 = "Y53.2"
-    Y53_3 = "Y53.3"
-    Y53_4 = "Y53.4"
-    Y53_5 = "Y53.5"
-    Y53_6 = "Y53.6"
-    Y53_7 = "Y53.7"
-    Y53_8 = "Y53.8"
-    Y53_9 = "Y53.9"
-    Y54 = "Y54"
-    Y54_0 = "Y54.0"
-    Y54_1 = "Y54.1"
-    Y54_2 = "Y54.2"
-    Y54_3 = "Y54.3"
-    Y54_4 = "Y54.4"
-    Y54_5 = "Y54.5"
-    Y54_6 = "Y54.6"
-    Y54_7 = "Y54.7"
-    Y54_8 = "Y54.8"
-    Y54_9 = "Y54.9"
-    Y55 = "Y55"
-    Y55_0 = "Y55.0"
-    Y55_1 = "Y55.1"
-    Y55_2 = "Y55.2"
-    Y55_3 = "Y55.3"
-    Y55_4 = "Y55.4"
-    Y55_5 = "Y55.5"
-    Y55_6 = "Y55.6"
-    Y55_7 = "Y55.7"
-    Y56 = "Y56"
-    Y56_0 = "Y56.0"
-    Y56_1 = "Y56.1"
-    Y56_2 = "Y56.2"
-    Y56_3 = "Y56.3"
-    Y56_4 = "Y56.4"
-    Y56_5 = "Y56.5"
-    Y56_6 = "Y56.6"
-    Y56_7 = "Y56.7"
-    Y56_8 = "Y56.8"
-    Y56_9 = "Y56.9"
-    Y57 = "Y57"
-    Y57_0 = "Y57.0"
-    Y57_1 = "Y57.1"
-    Y57_2 = "Y57.2"
-    Y57_3 = "Y57.3"
-    Y57_4 = "Y57.4"
-    Y57_5 = "Y57.5"
-    Y57_6 = "Y57.6"
-    Y57_7 = "Y57.7"
-    Y57_8 = "Y57.8"
-    Y57_9 = "Y57.9"
-    Y58 = "Y58"
-    Y58_0 = "Y58.0"
-    Y58_1 = "Y58.1"
-    Y58_2 = "Y58.2"
-    Y58_3 = "Y58.3"
-    Y58_4 = "Y58.4"
-    Y58_5 = "Y58.5"
-    Y58_6 = "Y58.6"
-    Y58_8 = "Y58.8"
-    Y58_9 = "Y58.9"
-    Y59 = "Y59"
-    Y59_0 = "Y59.0"
-    Y59_1 = "Y59.1"
-    Y59_2 = "Y59.2"
-    Y59_3 = "Y59.3"
-    Y59_8 = "Y59.8"
-    Y59_9 = "Y59.9"
-    Y60_Y69 = "Y60-Y69"
-    Y60 = "Y60"
-    Y60_0 = "Y60.0"
-    Y60_1 = "Y60.1"
-    Y60_2 = "Y60.2"
-    Y60_3 = "Y60.3"
-    Y60_4 = "Y60.4"
-    Y60_5 = "Y60.5"
-    Y60_6 = "Y60.6"
-    Y60_7 = "Y60.7"
-    Y60_8 = "Y60.8"
-    Y60_9 = "Y60.9"
-    Y61 = "Y61"
-    Y61_0 = "Y61.0"
-    Y61_1 = "Y61.1"
-    Y61_2 = "Y61.2"
-    Y61_3 = "Y61.3"
-    Y61_4 = "Y61.4"
-    Y61_5 = "Y61.5"
-    Y61_6 = "Y61.6"
-    Y61_7 = "Y61.7"
-    Y61_8 = "Y61.8"
-    Y61_9 = "Y61.9"
-    Y62 = "Y62"
-    Y62_0 = "Y62.0"
-    Y62_1 = "Y62.1"
-    Y62_2 = "Y62.2"
-    Y62_3 = "Y62.3"
-    Y62_4 = "Y62.4"
-    Y62_5 = "Y62.5"
-    Y62_6 = "Y62.6"
-    Y62_8 = "Y62.8"
-    Y62_9 = "Y62.9"
-    Y63 = "Y63"
-    Y63_0 = "Y63.0"
-    Y63_1 = "Y63.1"
-    Y63_2 = "Y63.2"
-    Y63_3 = "Y63.3"
-    Y63_4 = "Y63.4"
-    Y63_5 = "Y63.5"
-    Y63_6 = "Y63.6"
-    Y63_8 = "Y63.8"
-    Y63_9 = "Y63.9"
-    Y64 = "Y64"
-    Y64_0 = "Y64.0"
-    Y64_1 = "Y64.1"
-    Y64_8 = "Y64.8"
-    Y64_9 = "Y64.9"
-    Y65 = "Y65"
-    Y65_0 = "Y65.0"
-    Y65_1 = "Y65.1"
-    Y65_2 = "Y65.2"
-    Y65_3 = "Y65.3"
-    Y65_4 = "Y65.4"
-    Y65_5 = "Y65.5"
-    Y65_8 = "Y65.8"
-    Y66 = "Y66"
-    Y69 = "Y69"
-    Y70_Y82 = "Y70-Y82"
-    Y70 = "Y70"
-    Y70_0 = "Y70.0"
-    Y70_1 = "Y70.1"
-    Y70_2 = "Y70.2"
-    Y70_3 = "Y70.3"
-    Y70_8 = "Y70.8"
-    Y71 = "Y71"
-    Y71_0 = "Y71.0"
-    Y71_1 = "Y71.1"
-    Y71_2 = "Y71.2"
-    Y71_3 = "Y71.3"
-    Y71_8 = "Y71.8"
-    Y72 = "Y72"
-    Y72_0 = "Y72.0"
-    Y72_1 = "Y72.1"
-    Y72_2 = "Y72.2"
-    Y72_3 = "Y72.3"
-    Y72_8 = "Y72.8"
-    Y73 = "Y73"
-    Y73_0 = "Y73.0"
-    Y73_1 = "Y73.1"
-    Y73_2 = "Y73.2"
-    Y73_3 = "Y73.3"
-    Y73_8 = "Y73.8"
-    Y74 = "Y74"
-    Y74_0 = "Y74.0"
-    Y74_1 = "Y74.1"
-    Y74_2 = "Y74.2"
-    Y74_3 = "Y74.3"
-    Y74_8 = "Y74.8"
-    Y75 = "Y75"
-    Y75_0 = "Y75.0"
-    Y75_1 = "Y75.1"
-    Y75_2 = "Y75.2"
-    Y75_3 = "Y75.3"
-    Y75_8 = "Y75.8"
-    Y76 = "Y76"
-    Y76_0 = "Y76.0"
-    Y76_1 = "Y76.1"
-    Y76_2 = "Y76.2"
-    Y76_3 = "Y76.3"
-    Y76_8 = "Y76.8"
-    Y77 = "Y77"
-    Y77_0 = "Y77.0"
-    Y77_1 = "Y77.1"
-    Y77_2 = "Y77.2"
-    Y77_3 = "Y77.3"
-    Y77_8 = "Y77.8"
-    Y78 = "Y78"
-    Y78_0 = "Y78.0"
-    Y78_1 = "Y78.1"
-    Y78_2 = "Y78.2"
-    Y78_3 = "Y78.3"
-    Y78_8 = "Y78.8"
-    Y79 = "Y79"
-    Y79_0 = "Y79.0"
-    Y79_1 = "Y79.1"
-    Y79_2 = "Y79.2"
-    Y79_3 = "Y79.3"
-    Y79_8 = "Y79.8"
-    Y80 = "Y80"
-    Y80_0 = "Y80.0"
-    Y80_1 = "Y80.1"
-    Y80_2 = "Y80.2"
-    Y80_3 = "Y80.3"
-    Y80_8 = "Y80.8"
-    Y81 = "Y81"
-    Y81_0 = "Y81.0"
-    Y81_1 = "Y81.1"
-    Y81_2 = "Y81.2"
-    Y81_3 = "Y81.3"
-    Y81_8 = "Y81.8"
-    Y82 = "Y82"
-    Y82_0 = "Y82.0"
-    Y82_1 = "Y82.1"
-    Y82_2 = "Y82.2"
-    Y82_3 = "Y82.3"
-    Y82_8 = "Y82.8"
-    Y83_Y84 = "Y83-Y84"
-    Y83 = "Y83"
-    Y83_0 = "Y83.0"
-    Y83_1 = "Y83.1"
-    Y83_2 = "Y83.2"
-    Y83_3 = "Y83.3"
-    Y83_4 = "Y83.4"
-    Y83_5 = "Y83.5"
-    Y83_6 = "Y83.6"
-    Y83_8 = "Y83.8"
-    Y83_9 = "Y83.9"
-    Y84 = "Y84"
-    Y84_0 = "Y84.0"
-    Y84_1 = "Y84.1"
-    Y84_2 = "Y84.2"
-    Y84_3 = "Y84.3"
-    Y84_4 = "Y84.4"
-    Y84_5 = "Y84.5"
-    Y84_6 = "Y84.6"
-    Y84_7 = "Y84.7"
-    Y84_8 = "Y84.8"
-    Y84_9 = "Y84.9"
-    Y85_Y89 = "Y85-Y89"
-    Y85 = "Y85"
-    Y85_0 = "Y85.0"
-    Y85_9 = "Y85.9"
-    Y86 = "Y86"
-    Y87 = "Y87"
-    Y87_0 = "Y87.0"
-    Y87_1 = "Y87.1"
-    Y87_2 = "Y87.2"
-    Y88 = "Y88"
-    Y88_0 = "Y88.0"
-    Y88_1 = "Y88.1"
-    Y88_2 = "Y88.2"
-    Y88_3 = "Y88.3"
-    Y89 = "Y89"
-    Y89_0 = "Y89.0"
-    Y89_1 = "Y89.1"
-    Y89_9 = "Y89.9"
\ No newline at end of file
+    def __hash__(self):
+        return hash(self._name_)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ICD10Codes cannot be modified")
+
+    def __reduce__(self):
+        # Unpickling looks the member up by value, so there is only ever one instance per code.
+        return (ICD10Code, (self._value_,))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
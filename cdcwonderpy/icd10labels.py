@@ -0,0 +1,122 @@
+import collections.abc
+import mmap
+import os
+import struct
+import typing
+import numpy as np
+
+class LabelStore(collections.abc.Mapping):
+    """
+    * Read-only mapping from ICD-10 code values (e.g. "A00.0") to their descriptions, backed by a memory-mapped file.
+    *
+    * The file holds a sorted table of fixed width codes, an offsets table and a blob of UTF-8 encoded descriptions:
+    *   - header:   8 byte magic, number of codes and code width (little endian uint32)
+    *   - codes:    the code values, ASCII encoded, NUL padded to the code width and sorted
+    *   - offsets:  number of codes + 1 little endian uint32 offsets into the blob; description i spans offsets[i:i + 2]
+    *   - blob:     the concatenated descriptions
+    *
+    * Lookups binary search the code table and decode a single description, so nothing is deserialized up front.
+    * The file is mapped read-only, so processes using the same file share its pages through the OS page cache.
+    """
+    MAGIC = b"ICD10LBL"
+    DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icd10labels.bin")
+
+    _HEADER = struct.Struct("<8sII")
+
+    def __init__(self, path : str = DEFAULT_PATH):
+        """
+        Map a label store file into memory.
+        :param path:        the file to map, by default the labels shipped with the package
+        :raises ValueError: if the file is not a label store
+        """
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < LabelStore._HEADER.size or self._map[:len(LabelStore.MAGIC)] != LabelStore.MAGIC:
+            raise ValueError(f"{path} is not an ICD-10 label store")
+        magic, count, width = LabelStore._HEADER.unpack_from(self._map)
+
+        offset = LabelStore._HEADER.size
+        self._codes = np.frombuffer(self._map, dtype=f"S{width}", count=count, offset=offset)
+        offset += count * width
+        self._offsets = np.frombuffer(self._map, dtype="<u4", count=count + 1, offset=offset)
+        self._blob = offset + 4 * (count + 1)
+
+    def __getitem__(self, code : str) -> str:
+        i = self._position(code)
+        if i < 0:
+            raise KeyError(code)
+        return self._label(i)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return (code.decode("ascii") for code in self._codes)
+
+    def __contains__(self, code) -> bool:
+        return isinstance(code, str) and self._position(code) >= 0
+
+    def __repr__(self) -> str:
+        return f"LabelStore({len(self)} labels)"
+
+    def lookup_many(self, codes : typing.Sequence[str]) -> typing.List[str]:
+        """
+        Look up the descriptions of many codes at once with a single vectorized search.
+        :param codes:       the code values to look up
+        :raises KeyError:   if any code is not in the store
+        :returns:           the descriptions, in the order of the given codes
+        """
+        encoded = [code.encode("ascii", "replace") for code in codes]
+        for code, key in zip(codes, encoded):
+            if len(key) > self._codes.dtype.itemsize:
+                raise KeyError(code)
+        keys = np.array(encoded, dtype=self._codes.dtype)
+        positions = np.searchsorted(self._codes, keys)
+        positions[positions == len(self._codes)] = 0
+        missing = np.flatnonzero(self._codes[positions] != keys)
+        if len(missing):
+            raise KeyError(codes[missing[0]])
+        return [self._label(i) for i in positions]
+
+    @staticmethod
+    def write(path : str, labels : typing.Mapping[str, str]):
+        """
+        Write a label store file.
+        :param path:    the file to write
+        :param labels:  mapping from ASCII code values to descriptions
+        """
+        codes = sorted(code.encode("ascii") for code in labels)
+        width = max(len(code) for code in codes)
+        encoded = [labels[code.decode("ascii")].encode("utf-8") for code in codes]
+        offsets = np.zeros(len(codes) + 1, dtype="<u4")
+        np.cumsum([len(label) for label in encoded], out=offsets[1:])
+
+        with open(path, "wb") as f:
+            f.write(LabelStore._HEADER.pack(LabelStore.MAGIC, len(codes), width))
+            f.write(np.array(codes, dtype=f"S{width}").tobytes())
+            f.write(offsets.tobytes())
+            f.write(b"".join(encoded))
+
+    ##################################
+    # Private internal helper methods
+    ##################################
+    def _position(self, code : str) -> int:
+        """
+        Private helper returning the index of a code in the code table, or -1 if it is not in the store.
+        """
+        try:
+            key = code.encode("ascii")
+        except UnicodeEncodeError:
+            return -1
+        if len(key) > self._codes.dtype.itemsize:
+            return -1
+        i = int(np.searchsorted(self._codes, key))
+        if i < len(self._codes) and self._codes[i] == key:
+            return i
+        return -1
+
+    def _label(self, i : int) -> str:
+        start = self._blob + int(self._offsets[i])
+        end = self._blob + int(self._offsets[i + 1])
+        return self._map[start:end].decode("utf-8")
@@ -0,0 +1,145 @@
+import collections
+import functools
+import re
+import string
+import typing
+
+try:
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_parse
+
+class DescriptionIndex():
+    """
+    * Search index over ICD-10 code descriptions, used by ICD10Code.description_matches_regex.
+    *
+    * - A token inverted index (word -> descriptions containing it) answers whole word queries such as
+    *   r"\bkidney\b" without running any regex.
+    * - A trigram index over the lowercased descriptions narrows every other query down to the descriptions
+    *   containing all literal text the regex requires; only those candidates are checked with re.search.
+    * - The most recent queries are kept in an LRU cache.
+    *
+    * Narrowing is conservative, so results are exactly those of running re.search over every description.
+    """
+    DEFAULT_CACHE_SIZE = 256
+
+    def __init__(self, descriptions : typing.List[str], cache_size : int = DEFAULT_CACHE_SIZE):
+        """
+        Build the index.
+        :param descriptions:    the descriptions to index; results refer to positions in this list
+        :param cache_size:      number of recent queries to remember
+        """
+        self._descriptions = list(descriptions)
+        self._all = list(range(len(self._descriptions)))
+
+        tokens = collections.defaultdict(list)
+        folded_tokens = collections.defaultdict(list)
+        trigrams = collections.defaultdict(list)
+        for i, description in enumerate(self._descriptions):
+            for token in set(re.findall(r"\w+", description)):
+                tokens[token].append(i)
+            for token in set(re.findall(r"\w+", description.lower())):
+                folded_tokens[token].append(i)
+            folded = description.lower()
+            for trigram in {folded[j:j + 3] for j in range(len(folded) - 2)}:
+                trigrams[trigram].append(i)
+
+        self._tokens = dict(tokens)
+        self._folded_tokens = dict(folded_tokens)
+        self._trigrams = {trigram: frozenset(postings) for trigram, postings in trigrams.items()}
+
+        # Case-insensitive matching may equate ASCII letters with a few special characters (e.g. the Kelvin
+        # sign and 'k'). Lowercasing does not capture that, so trigram narrowing is unsafe if any occur.
+        special = {c for description in self._descriptions for c in description if not c.isascii()}
+        self._can_narrow = not any(re.fullmatch(letter, c, re.IGNORECASE) for c in special for letter in string.ascii_letters)
+
+        self._search = functools.lru_cache(maxsize=cache_size)(self._search_uncached)
+
+    def search(self, regex : str, flags : re.RegexFlag = 0) -> typing.List[int]:
+        """
+        Find the descriptions matched by re.search(regex, description, flags).
+        :param regex:   the regex string to match on
+        :param flags:   the regex flags to use
+        :returns:       sorted positions of the matching descriptions
+        :raises re.error: if the regex is invalid
+        """
+        return list(self._search(regex, flags))
+
+    def clear_cache(self):
+        """
+        Forget all cached query results.
+        """
+        self._search.cache_clear()
+
+    ##################################
+    # Private internal helper methods
+    ##################################
+    def _search_uncached(self, regex : str, flags : re.RegexFlag) -> typing.Tuple[int, ...]:
+        pattern = re.compile(regex, flags)
+        parsed = sre_parse.parse(regex, flags)
+
+        word = DescriptionIndex._whole_word(parsed)
+        if word is not None and not pattern.flags & re.ASCII:
+            if pattern.flags & re.IGNORECASE:
+                return tuple(self._folded_tokens.get(word.lower(), ()))
+            return tuple(self._tokens.get(word, ()))
+
+        candidates = self._candidates(DescriptionIndex._required_literals(parsed))
+        return tuple(i for i in candidates if pattern.search(self._descriptions[i]))
+
+    def _candidates(self, literals : typing.List[str]) -> typing.List[int]:
+        """
+        Private helper intersecting the trigram postings of every required literal.
+        """
+        if not self._can_narrow:
+            return self._all
+
+        result = None
+        for literal in literals:
+            folded = literal.lower()
+            for j in range(len(folded) - 2):
+                postings = self._trigrams.get(folded[j:j + 3], frozenset())
+                result = postings if result is None else result & postings
+                if not result:
+                    return []
+        return self._all if result is None else sorted(result)
+
+    @staticmethod
+    def _whole_word(parsed) -> typing.Optional[str]:
+        """
+        Private helper returning WORD if the parsed regex is exactly \\bWORD\\b for an ASCII word, else None.
+        """
+        items = list(parsed)
+        if len(items) < 3 or items[0] != (sre_parse.AT, sre_parse.AT_BOUNDARY) or items[-1] != (sre_parse.AT, sre_parse.AT_BOUNDARY):
+            return None
+        word = ""
+        for op, av in items[1:-1]:
+            if op != sre_parse.LITERAL or not (chr(av).isascii() and (chr(av).isalnum() or chr(av) == "_")):
+                return None
+            word += chr(av)
+        return word
+
+    @staticmethod
+    def _required_literals(parsed) -> typing.List[str]:
+        """
+        Private helper collecting runs of ASCII literal text that every match of the parsed regex must contain.
+        Only parts of the regex that are always matched (not optional, not inside alternations or lookarounds)
+        are considered.
+        """
+        literals = []
+        run = ""
+        for op, av in parsed:
+            if op == sre_parse.LITERAL and chr(av).isascii():
+                run += chr(av)
+                continue
+
+            literals.append(run)
+            run = ""
+            if op == sre_parse.SUBPATTERN:
+                literals.extend(DescriptionIndex._required_literals(av[-1]))
+            elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT, getattr(sre_parse, "POSSESSIVE_REPEAT", None)) and av[0] >= 1:
+                literals.extend(DescriptionIndex._required_literals(av[2]))
+            elif op == getattr(sre_parse, "ATOMIC_GROUP", None):
+                literals.extend(DescriptionIndex._required_literals(av))
+        literals.append(run)
+        return [literal for literal in literals if len(literal) >= 3]
@@ -0,0 +1,391 @@
+import bisect
+import collections
+import os
+import secrets
+import threading
+import time
+import typing
+
+
+class Instrumentation():
+    """
+    * Base class of collectors observing the life cycle of requests. Subclasses override the hooks they
+    * are interested in; every hook does nothing by default.
+    *
+    * For every request sent to the server (responses served from a ResponseCache are not sent):
+    * - on_build:      the request XML was built
+    * - on_send:       the request XML is about to be posted
+    * - on_first_byte: the response headers arrived
+    * - on_response:   the whole response body arrived
+    * - on_error:      sending or receiving failed (e.g. the server could not be reached); called instead of on_response
+    * The send hooks of a request receive the same context, a dict that collectors can keep per request state in.
+    * All hooks of a request go to the collectors that were installed when it started; a collector installed
+    * in the middle of a request sees nothing of it.
+    *
+    * on_parse is called whenever a Response parses its XML (see Response.as_2d_list, as_dataframe and as_arrow).
+    *
+    * Collectors are installed process wide, either with install or by using them as context managers:
+    *   with HistogramCollector() as metrics:
+    *       request.send().as_dataframe()
+    *   print(metrics.to_prometheus())
+    * While no collector is installed, requests and responses skip instrumentation entirely (no timers are read).
+    * Hooks can be called from several threads at once, and exceptions they raise propagate to the caller.
+    """
+    _collectors = ()
+    _collectors_lock = threading.Lock()
+
+    @classmethod
+    def install(cls, collector : 'Instrumentation'):
+        """
+        Start calling a collector's hooks. Installing a collector twice has no effect.
+        :param collector:   the Instrumentation to install
+        """
+        with Instrumentation._collectors_lock:
+            if collector not in Instrumentation._collectors:
+                Instrumentation._collectors = Instrumentation._collectors + (collector,)
+
+    @classmethod
+    def uninstall(cls, collector : 'Instrumentation'):
+        """
+        Stop calling a collector's hooks.
+        :param collector:   the Instrumentation to uninstall
+        """
+        with Instrumentation._collectors_lock:
+            Instrumentation._collectors = tuple(c for c in Instrumentation._collectors if c is not collector)
+
+    @classmethod
+    def installed(cls) -> typing.List['Instrumentation']:
+        """
+        Returns the installed collectors, in installation order.
+        :returns:   list of Instrumentation
+        """
+        return list(Instrumentation._collectors)
+
+    def on_build(self, request : 'Request', context : dict, seconds : float, size : int):
+        """
+        :param request: the Request being sent
+        :param context: per request state shared by the send hooks
+        :param seconds: time spent building the request XML
+        :param size:    size of the request XML in bytes
+        """
+
+    def on_send(self, request : 'Request', context : dict, size : int):
+        """
+        :param request: the Request being sent
+        :param context: per request state shared by the send hooks
+        :param size:    size of the request XML in bytes
+        """
+
+    def on_first_byte(self, request : 'Request', context : dict, seconds : float):
+        """
+        :param request: the Request being sent
+        :param context: per request state shared by the send hooks
+        :param seconds: time between posting the request (its last attempt, if it was retried) and the arrival of
+                        the response headers, i.e. network round trip and server side queueing and processing
+        """
+
+    def on_response(self, request : 'Request', context : dict, status_code : int, seconds : float, size : int):
+        """
+        :param request:     the Request being sent
+        :param context:     per request state shared by the send hooks
+        :param status_code: HTTP status code of the response
+        :param seconds:     time between on_send and the arrival of the whole response, retries included. For
+                            requests sent with stream=True this includes parsing, which overlaps the download.
+        :param size:        size of the (uncompressed) response body in bytes
+        """
+
+    def on_error(self, request : 'Request', context : dict, exception : Exception, seconds : float):
+        """
+        :param request:     the Request being sent
+        :param context:     per request state shared by the send hooks
+        :param exception:   the exception raised to the caller of send
+        :param seconds:     time between on_send and the failure, retries included
+        """
+
+    def on_parse(self, response : 'Response', seconds : float, rows : int):
+        """
+        :param response:    the Response that was parsed
+        :param seconds:     time spent parsing
+        :param rows:        number of rows parsed
+        """
+
+    def __enter__(self):
+        Instrumentation.install(self)
+        return self
+
+    def __exit__(self, *args):
+        Instrumentation.uninstall(self)
+
+    ##################################
+    # Private internal helper methods
+    ##################################
+    @staticmethod
+    def _emit(collectors : typing.Tuple['Instrumentation', ...], hook : str, *args):
+        """
+        Private helper calling a hook of the given collectors, a snapshot of Instrumentation._collectors.
+        """
+        for collector in collectors:
+            getattr(collector, hook)(*args)
+
+
+class HistogramCollector(Instrumentation):
+    """
+    * Collector keeping in-memory histograms of request timings and sizes, a count of responses per
+    * HTTP status code and a count of failed requests per exception type. Memory use does not grow with
+    * the number of requests.
+    *
+    * Histograms (see HistogramCollector.METRICS):
+    * - build_seconds, request_bytes:                           from on_build
+    * - first_byte_seconds:                                     from on_first_byte
+    * - response_seconds, response_bytes:                       from on_response
+    * - parse_seconds, parse_rows:                              from on_parse
+    *
+    * to_prometheus renders everything in the Prometheus text exposition format, with names prefixed by
+    * "cdcwonder_".
+    """
+    SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300)
+    BYTES_BUCKETS = tuple(1024 * 4 ** i for i in range(10))
+    ROWS_BUCKETS = tuple(10 ** i for i in range(8))
+
+    METRICS = {
+        "build_seconds": ("Time spent building request XML.", SECONDS_BUCKETS),
+        "request_bytes": ("Size of request XML.", BYTES_BUCKETS),
+        "first_byte_seconds": ("Time from posting a request to the arrival of the response headers.", SECONDS_BUCKETS),
+        "response_seconds": ("Time from posting a request to the arrival of the whole response, retries included.", SECONDS_BUCKETS),
+        "response_bytes": ("Size of response bodies.", BYTES_BUCKETS),
+        "parse_seconds": ("Time spent parsing response XML.", SECONDS_BUCKETS),
+        "parse_rows": ("Number of rows parsed from a response.", ROWS_BUCKETS),
+    }
+    PREFIX = "cdcwonder_"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {name: _Histogram(buckets) for name, (_, buckets) in HistogramCollector.METRICS.items()}
+        self._status_codes = collections.Counter()
+        self._errors = collections.Counter()
+
+    def on_build(self, request, context, seconds, size):
+        with self._lock:
+            self._histograms["build_seconds"].observe(seconds)
+            self._histograms["request_bytes"].observe(size)
+
+    def on_first_byte(self, request, context, seconds):
+        with self._lock:
+            self._histograms["first_byte_seconds"].observe(seconds)
+
+    def on_response(self, request, context, status_code, seconds, size):
+        with self._lock:
+            self._histograms["response_seconds"].observe(seconds)
+            self._histograms["response_bytes"].observe(size)
+            self._status_codes[status_code] += 1
+
+    def on_error(self, request, context, exception, seconds):
+        with self._lock:
+            self._errors[type(exception).__name__] += 1
+
+    def on_parse(self, response, seconds, rows):
+        with self._lock:
+            self._histograms["parse_seconds"].observe(seconds)
+            self._histograms["parse_rows"].observe(rows)
+
+    def histograms(self) -> typing.Dict[str, dict]:
+        """
+        Returns a snapshot of every histogram.
+        :returns:   metric name -> {"count": observations, "sum": sum of the observations,
+                    "buckets": [(upper bound, cumulative count), ...] ending with (inf, count)}
+        """
+        with self._lock:
+            return {name: histogram.snapshot() for name, histogram in self._histograms.items()}
+
+    def status_codes(self) -> typing.Dict[int, int]:
+        """
+        Returns the number of responses received per HTTP status code.
+        :returns:   status code -> count
+        """
+        with self._lock:
+            return dict(self._status_codes)
+
+    def errors(self) -> typing.Dict[str, int]:
+        """
+        Returns the number of failed requests per exception type (see on_error).
+        :returns:   exception class name -> count
+        """
+        with self._lock:
+            return dict(self._errors)
+
+    def to_prometheus(self) -> str:
+        """
+        Render the collected metrics in the Prometheus text exposition format.
+        :returns:   the metrics as a String
+        """
+        lines = []
+        for name, snapshot in self.histograms().items():
+            metric = HistogramCollector.PREFIX + name
+            lines.append(f"# HELP {metric} {HistogramCollector.METRICS[name][0]}")
+            lines.append(f"# TYPE {metric} histogram")
+            for bound, count in snapshot["buckets"]:
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                lines.append(f'{metric}_bucket{{le="{le}"}} {count}')
+            lines.append(f"{metric}_sum {snapshot['sum']!r}")
+            lines.append(f"{metric}_count {snapshot['count']}")
+
+        metric = HistogramCollector.PREFIX + "responses_total"
+        lines.append(f"# HELP {metric} Responses received, per HTTP status code.")
+        lines.append(f"# TYPE {metric} counter")
+        for status_code, count in sorted(self.status_codes().items()):
+            lines.append(f'{metric}{{status="{status_code}"}} {count}')
+
+        metric = HistogramCollector.PREFIX + "errors_total"
+        lines.append(f"# HELP {metric} Requests that failed without a response, per exception type.")
+        lines.append(f"# TYPE {metric} counter")
+        for exception, count in sorted(self.errors().items()):
+            lines.append(f'{metric}{{exception="{exception}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path : str):
+        """
+        Write the collected metrics (see to_prometheus) to a file, e.g. for the textfile collector of the
+        Prometheus node exporter. The file is replaced atomically, so scrapes never see a partial file.
+        :param path:    the file to write
+        """
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as f:
+            f.write(self.to_prometheus())
+        os.replace(temporary_path, path)
+
+    def reset(self):
+        """
+        Discard everything collected so far.
+        """
+        with self._lock:
+            self._histograms = {name: _Histogram(buckets) for name, (_, buckets) in HistogramCollector.METRICS.items()}
+            self._status_codes = collections.Counter()
+            self._errors = collections.Counter()
+
+
+class SpanCollector(Instrumentation):
+    """
+    * Collector recording OpenTelemetry style spans.
+    *
+    * Every request sent produces a "cdcwonder.request" span (from the start of on_build to on_response) with
+    * two children: "cdcwonder.build" and "cdcwonder.send", the latter carrying a "first_byte" event. Requests that
+    * fail (on_error) end both spans with an error status. Every parse
+    * produces a "cdcwonder.parse" span of its own trace. Spans are dicts following the field names of the
+    * OTLP JSON encoding (trace_id, span_id, parent_span_id, name, start_time_unix_nano, end_time_unix_nano,
+    * attributes, events), so they can be exported to any OpenTelemetry backend.
+    *
+    * Finished spans are passed to exporter, if given, and kept in memory up to max_spans (oldest dropped first).
+    """
+    def __init__(self, exporter : typing.Callable[[dict], None] = None, max_spans : int = 10000):
+        """
+        Create a span collector.
+        :param exporter:    optional function called with every finished span
+        :param max_spans:   number of finished spans kept in memory
+        """
+        self.exporter = exporter
+        self._lock = threading.Lock()
+        self._spans = collections.deque(maxlen=max_spans)
+
+    def on_build(self, request, context, seconds, size):
+        end = time.time_ns()
+        start = end - int(seconds * 1e9)
+        trace = {"trace_id": secrets.token_hex(16), "span_id": secrets.token_hex(8), "start": start}
+        context[self] = trace
+        self._finish(SpanCollector._span("cdcwonder.build", trace["trace_id"], trace["span_id"], start, end,
+                                         {"cdcwonder.request_bytes": size}))
+
+    def on_send(self, request, context, size):
+        trace = context.get(self)
+        if trace is not None:
+            trace["sent"] = time.time_ns()
+
+    def on_first_byte(self, request, context, seconds):
+        trace = context.get(self)
+        if trace is not None:
+            trace["first_byte"] = seconds
+
+    def on_response(self, request, context, status_code, seconds, size):
+        trace = context.pop(self, None)
+        if trace is not None:
+            self._finish_request(request, trace, seconds, {"http.status_code": status_code, "cdcwonder.response_bytes": size}, None)
+
+    def on_error(self, request, context, exception, seconds):
+        trace = context.pop(self, None)
+        if trace is not None:
+            status = {"code": "STATUS_CODE_ERROR", "message": str(exception)}
+            self._finish_request(request, trace, seconds, {"error.type": type(exception).__name__}, status)
+
+    def on_parse(self, response, seconds, rows):
+        end = time.time_ns()
+        self._finish(SpanCollector._span("cdcwonder.parse", secrets.token_hex(16), None, end - int(seconds * 1e9), end,
+                                         {"cdcwonder.rows": rows, "cdcwonder.groupings": ",".join(response._groupings)}))
+
+    def spans(self) -> typing.List[dict]:
+        """
+        Returns the finished spans kept in memory, in the order they finished.
+        :returns:   list of spans
+        """
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        """
+        Discard the finished spans kept in memory.
+        """
+        with self._lock:
+            self._spans.clear()
+
+    ##################################
+    # Private internal helper methods
+    ##################################
+    @staticmethod
+    def _span(name : str, trace_id : str, parent_span_id : typing.Optional[str], start : int, end : int, attributes : dict) -> dict:
+        return {"trace_id": trace_id, "span_id": secrets.token_hex(8), "parent_span_id": parent_span_id, "name": name,
+                "start_time_unix_nano": start, "end_time_unix_nano": end, "attributes": attributes, "events": []}
+
+    def _finish_request(self, request : 'Request', trace : dict, seconds : float, attributes : dict, status : typing.Optional[dict]):
+        """
+        Private helper finishing the send and request spans of a request, seconds after it was sent.
+        """
+        end = trace["sent"] + int(seconds * 1e9)
+        send = SpanCollector._span("cdcwonder.send", trace["trace_id"], trace["span_id"], trace["sent"], end, attributes)
+        if "first_byte" in trace:
+            send["events"].append({"name": "first_byte", "time_unix_nano": end - int((seconds - trace["first_byte"]) * 1e9)})
+
+        root_attributes = {"cdcwonder.groupings": ",".join(request._group_by_column_names)}
+        root_attributes.update(attributes)
+        root = SpanCollector._span("cdcwonder.request", trace["trace_id"], None, trace["start"], end, root_attributes)
+        root["span_id"] = trace["span_id"]
+        if status is not None:
+            send["status"] = root["status"] = status
+
+        self._finish(send)
+        self._finish(root)
+
+    def _finish(self, span : dict):
+        with self._lock:
+            self._spans.append(span)
+        if self.exporter is not None:
+            self.exporter(span)
+
+
+class _Histogram():
+    """
+    Private helper counting observations in fixed buckets.
+    """
+    def __init__(self, buckets : typing.Sequence[float]):
+        self._bounds = list(buckets)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0
+
+    def observe(self, value : float):
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self._sum += value
+
+    def snapshot(self) -> dict:
+        buckets = []
+        cumulative = 0
+        for bound, count in zip(self._bounds + [float("inf")], self._counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return {"count": cumulative, "sum": self._sum, "buckets": buckets}
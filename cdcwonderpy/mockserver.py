@@ -0,0 +1,176 @@
+import random
+import threading
+import time
+import typing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+from xml.sax.saxutils import escape
+
+from cdcwonderpy.request import Request
+from cdcwonderpy.cache import ResponseCache
+
+class MockD76Server():
+    """
+    * Local stand-in for the CDC Wonder D76 endpoint, for testing and benchmarking without network access.
+    *
+    * Posted request XML is parsed back into a Request (see Request.from_xml) and answered with:
+    * - a recorded response, if the request (or one asking for the same data) was recorded, either through
+    *   the recordings mapping or a ResponseCache of earlier real responses
+    * - otherwise the XML returned by generator(request), if a generator is given
+    * - otherwise a 400 error
+    *
+    * Every answer is delayed by latency seconds plus a uniformly distributed extra of up to jitter seconds,
+    * and a fraction error_rate of the requests is answered with error_status instead (503 by default,
+    * which WonderClient retries). Malformed requests are answered with a 400 error carrying a message,
+    * like the real endpoint does.
+    *
+    * Point Request.send at the server through a WonderClient, or for a whole process through
+    * WonderClient.set_default or the CDC_WONDER_URL environment variable:
+    *   with MockD76Server(recordings={request: xml}) as server:
+    *       response = request.send(client=WonderClient(url=server.url))
+    *
+    * The server runs on a background thread and answers requests concurrently.
+    """
+    PATH = "/controller/datarequest/D76"
+
+    def __init__(self, recordings : typing.Union[typing.Mapping[Request, str], ResponseCache] = None,
+                 generator : typing.Callable[[Request], str] = None, latency : float = 0.0, jitter : float = 0.0,
+                 error_rate : float = 0.0, error_status : int = 503, seed : int = None, host : str = "127.0.0.1", port : int = 0):
+        """
+        Create a mock server. It does not accept connections until started.
+        :param recordings:      responses to replay, either a mapping from Request to response XML or a ResponseCache
+        :param generator:       function producing the response XML of requests that were not recorded
+        :param latency:         seconds every answer is delayed by
+        :param jitter:          maximum number of seconds randomly added to the latency
+        :param error_rate:      fraction of requests answered with error_status
+        :param error_status:    HTTP status of injected errors
+        :param seed:            seed of the random numbers used for jitter and error injection
+        :param host:            interface to listen on
+        :param port:            port to listen on, 0 picks a free port
+        :raises ValueError:     if latency or jitter are negative or error_rate is not between 0 and 1
+        """
+        if latency < 0 or jitter < 0:
+            raise ValueError("Latency and jitter must not be negative")
+        if not 0 <= error_rate <= 1:
+            raise ValueError("Error rate must be between 0 and 1")
+
+        self.generator = generator
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests_received = 0
+        self.errors_injected = 0
+
+        self._cache = recordings if isinstance(recordings, ResponseCache) else None
+        self._recordings = dict()
+        if recordings is not None and self._cache is None:
+            for request, xml in recordings.items():
+                self.record(request, xml)
+
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._server = ThreadingHTTPServer((host, port), _MockD76Handler)
+        self._server.mock = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        The endpoint URL to post requests to.
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{MockD76Server.PATH}"
+
+    def record(self, request : Request, xml : str):
+        """
+        Add a response to replay whenever a request asking for the same data is received.
+        :param request: the Request to answer
+        :param xml:     the response XML to answer it with
+        """
+        self._recordings[ResponseCache.key(request)] = xml
+
+    def start(self) -> 'MockD76Server':
+        """
+        Start accepting requests on a background thread.
+        :returns:   self
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop accepting requests and release the port.
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def __repr__(self):
+        return f"MockD76Server(url={self.url!r}, requests_received={self.requests_received}, errors_injected={self.errors_injected})"
+
+    ##################################
+    # Private internal helper methods
+    ##################################
+    def _answer(self, body : bytes) -> typing.Tuple[int, str]:
+        """
+        Private helper computing the status and XML answering a posted form.
+        """
+        with self._lock:
+            self.requests_received += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            inject_error = self._random.random() < self.error_rate
+            if inject_error:
+                self.errors_injected += 1
+        if delay > 0:
+            time.sleep(delay)
+        if inject_error:
+            return self.error_status, MockD76Server._error("Injected error")
+
+        request_xml = parse_qs(body.decode("utf-8")).get("request_xml")
+        if request_xml is None:
+            return 400, MockD76Server._error("Missing request_xml parameter")
+        try:
+            request = Request.from_xml(request_xml[0])
+        except ValueError as e:
+            return 400, MockD76Server._error(str(e))
+
+        xml = self._cache.get(request) if self._cache is not None else self._recordings.get(ResponseCache.key(request))
+        if xml is None and self.generator is not None:
+            xml = self.generator(request)
+        if xml is None:
+            return 400, MockD76Server._error("No recorded response for this request")
+        return 200, xml
+
+    @staticmethod
+    def _error(message : str) -> str:
+        return f"<page><message>{escape(message)}</message></page>"
+
+
+class _MockD76Handler(BaseHTTPRequestHandler):
+    """
+    Private request handler of MockD76Server, delegating to the server's _answer.
+    """
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        status, xml = self.server.mock._answer(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        body = xml.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
@@ -0,0 +1,310 @@
+import bisect
+import concurrent.futures
+import copy
+import typing
+
+import pandas as pd
+
+from cdcwonderpy.enums import *
+from cdcwonderpy.dates import *
+from cdcwonderpy.request import Request
+from cdcwonderpy.response import Response, _ColumnarTable
+
+class QueryPlanner():
+    """
+    * Splits Requests whose results would exceed the CDC Wonder result limits into smaller sub-requests,
+    * sends them and merges the results back into a single DataFrame.
+    *
+    * The number of result rows of a Request is estimated from its group_by settings and filters (dates,
+    * ages, ICD-10 codes and enum filters). When the estimate exceeds max_rows, the request is split along
+    * a dimension that is also one of its groupings, either its dates (when grouped by Year or Month) or its
+    * ICD-10 codes (when grouped by an ICD-10 level). Every result row then comes from exactly one
+    * sub-request, so the merged result is identical to the unsplit result, suppressed cells included.
+    * ICD-10 codes are only subdivided down to the level of the ICD-10 grouping; a single code at that level
+    * whose results are still too large is split by dates instead, if the request is grouped by Year or Month.
+    * Requests that are not grouped by any splittable dimension are sent unsplit.
+    """
+    DEFAULT_MAX_ROWS = 75000
+
+    # Number of distinct values each grouping produces when its dimension is not filtered.
+    DEFAULT_CARDINALITIES = {
+        Grouping.TEN_YEAR_AGE_GROUPS: 12,
+        Grouping.FIVE_YEAR_AGE_GROUPS: 22,
+        Grouping.SINGLE_YEAR_AGE_GROUPS: 102,
+        Grouping.GENDER: len(Gender) - 1,
+        Grouping.HISPANIC_ORIGIN: len(HispanicOrigin) - 1,
+        Grouping.RACE: len(Race) - 1,
+        Grouping.WEEKDAY: len(Weekday) - 1,
+        Grouping.AUTOPSY: len(Autopsy) - 1,
+        Grouping.PLACE_OF_DEATH: len(PlaceOfDeath) - 1,
+        Grouping.LEADING_CAUSES_OF_DEATH: 52,
+        Grouping.ICD10_CAUSE_LIST_113: 113,
+        Grouping.INJURY_INTENT: 6,
+        Grouping.INJURY_MECHANISM_AND_ALL_OTHER_LEADING_CAUSES: 30,
+        Grouping.DRUG_OR_ALCOHOL_INDUCED_CAUSES: 4,
+    }
+
+    DATE_GROUPINGS = [Grouping.YEAR, Grouping.MONTH]
+    ICD10_GROUPINGS = [Grouping.ICD_CHAPTER, Grouping.ICD_SUBCHAPTER, Grouping.CAUSE_OF_DEATH]
+
+    def __init__(self, max_rows : int = DEFAULT_MAX_ROWS):
+        """
+        Create a query planner.
+        :param max_rows:    the largest number of result rows a single request may be estimated to return
+        :raises ValueError: if max_rows is not positive
+        """
+        if max_rows < 1:
+            raise ValueError("max_rows must be at least 1")
+        self.max_rows = max_rows
+
+    def estimate_rows(self, request : Request) -> int:
+        """
+        Estimate the number of rows the server returns for a request. The estimate is an upper bound
+        that ignores combinations for which the server reports no deaths.
+        :param request: the Request to estimate
+        :returns:       the estimated number of result rows
+        """
+        rows = 1
+        for grouping in QueryPlanner._groupings(request):
+            rows *= self._cardinality(request, grouping)
+        return rows
+
+    def split(self, request : Request) -> typing.List[Request]:
+        """
+        Split a request into sub-requests that are each estimated to return at most max_rows rows.
+        The original request is not modified.
+        :param request: the Request to split
+        :returns:       a list of Requests whose results together make up the result of the given request.
+                        Contains only a copy of the given request if it does not need to (or cannot) be split.
+        :raises ValueError: if the results of a single ICD-10 code at the level of the request's ICD-10 grouping
+                            are estimated to exceed max_rows and the request is not grouped by Year or Month
+        """
+        groupings = QueryPlanner._groupings(request)
+        if self.estimate_rows(request) <= self.max_rows:
+            return [copy.deepcopy(request)]
+
+        date_grouping = next((g for g in groupings if g in QueryPlanner.DATE_GROUPINGS), None)
+        icd10_grouping = next((g for g in groupings if g in QueryPlanner.ICD10_GROUPINGS), None)
+
+        if date_grouping is not None:
+            sub_requests = self._split_dates(request, date_grouping)
+        elif icd10_grouping is not None:
+            sub_requests = self._split_icd10_codes(request, icd10_grouping, None)
+        else:
+            return [copy.deepcopy(request)]
+
+        # A slice may still be too large along the other dimension (e.g. a single year grouped by cause).
+        if date_grouping is not None and icd10_grouping is not None:
+            return [part for sub_request in sub_requests for part in self._split_icd10_codes(sub_request, icd10_grouping, date_grouping)]
+        return sub_requests
+
+    def send(self, request : Request, max_workers : int = 1, cache : 'ResponseCache' = None,
+             client : 'WonderClient' = None) -> pd.DataFrame:
+        """
+        Send a request, splitting it first if it is estimated to exceed max_rows, and merge the results.
+        :param request:             the Request to send
+        :param max_workers:         number of sub-requests sent in parallel
+        :param cache:               optional ResponseCache passed on to Request.send
+        :param client:              optional WonderClient passed on to Request.send
+        :returns:                   DataFrame in the same format (and row order) as Response.as_dataframe
+                                    of the unsplit request
+        :raises RequestException:   if any of the sub-requests fails
+        :raises ValueError:         if the request cannot be split enough (see split)
+        """
+        sub_requests = self.split(request)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = list(executor.map(lambda r: r.send(cache=cache, client=client), sub_requests))
+        return QueryPlanner.merge(responses)
+
+    @staticmethod
+    def merge(responses : typing.List[Response]) -> pd.DataFrame:
+        """
+        Merge the responses of sub-requests that partition a request along one of its grouping dimensions.
+        Rows are ordered the way the server orders an unsplit result: nested by grouping, in the order
+        in which each grouping's values first appear.
+        :param responses:   the Responses of the sub-requests, in sub-request order
+        :returns:           the merged DataFrame
+        """
+        groupings = responses[0]._groupings
+        table = _ColumnarTable(len(groupings))
+        for response in responses:
+            for record in response.iter_rows():
+                table.append(record)
+
+        df = table.to_dataframe(groupings)
+        if groupings:
+            df = df.sort_values(by=groupings, kind="stable", ignore_index=True)
+
+        # Categories follow first appearance, like a DataFrame parsed from a single response.
+        for column in df.columns:
+            if isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = pd.Categorical(df[column], categories=df[column].dropna().unique())
+        return df
+
+    ##################################
+    # Private internal helper methods
+    ##################################
+    @staticmethod
+    def _groupings(request : Request) -> typing.List[Grouping]:
+        return [Grouping(value) for value in request._b_parameters.values() if value != "*None*"]
+
+    def _cardinality(self, request : Request, grouping : Grouping) -> int:
+        """
+        Private helper estimating the number of distinct values a grouping takes in the request's results.
+        """
+        if grouping == Grouping.YEAR:
+            return len({month.get_year() for month in QueryPlanner._months(request)})
+        elif grouping == Grouping.MONTH:
+            return len(QueryPlanner._months(request))
+        elif grouping in QueryPlanner.ICD10_GROUPINGS:
+            return sum(QueryPlanner._icd10_weight(code, grouping) for code in QueryPlanner._icd10_codes(request))
+
+        selected = request._v_parameters.get("V_" + grouping.value, "*All*")
+        if isinstance(selected, (list, tuple)) and "*All*" not in selected:
+            return len(selected)
+        return QueryPlanner.DEFAULT_CARDINALITIES[grouping]
+
+    @staticmethod
+    def _months(request : Request) -> typing.List[YearAndMonth]:
+        """
+        Private helper returning the sorted months selected by a request's date filter.
+        """
+        months = []
+        for date in request._f_parameters["F_D76.V1"]:
+            if date == "*All*":
+                return [YearAndMonth(year, month) for year in range(1999, 2019) for month in range(1, YearAndMonth.NUM_MONTHS + 1)]
+            elif "/" in date:
+                year, month = date.split("/")
+                months.append(YearAndMonth(int(year), int(month)))
+            else:
+                months.extend(YearAndMonth(int(date), month) for month in range(1, YearAndMonth.NUM_MONTHS + 1))
+        return sorted(months)
+
+    @staticmethod
+    def _icd10_codes(request : Request) -> list:
+        from cdcwonderpy.icd10code import ICD10Code
+        return request._parameter_data.get("ICD-10 Codes", [ICD10Code.ALL])
+
+    @staticmethod
+    def _icd10_weight(code, grouping : Grouping) -> int:
+        """
+        Private helper counting the ICD-10 codes at the grouping's level that fall under the given code,
+        at least 1 (a code below the grouping's level reports to a single row).
+        """
+        return max(1, QueryPlanner._icd10_count(code, grouping))
+
+    @staticmethod
+    def _icd10_count(code, grouping : Grouping) -> int:
+        """
+        Private helper counting the ICD-10 codes at the grouping's level that fall under the given code:
+        1 for a code at that level, 0 for a code below it.
+        """
+        from cdcwonderpy.icd10code import ICD10Code
+
+        levels = QueryPlanner._icd10_levels()
+        if grouping == Grouping.ICD_CHAPTER:
+            level = levels["chapters"]
+        elif grouping == Grouping.ICD_SUBCHAPTER:
+            level = levels["subchapters"]
+        else:
+            level = levels["causes"]
+
+        if code == ICD10Code.ALL:
+            return len(level)
+        hierarchy = ICD10Code._hierarchy()
+        start = hierarchy["position"][code]
+        return bisect.bisect_left(level, hierarchy["end"][start]) - bisect.bisect_left(level, start)
+
+    _levels = None
+
+    @staticmethod
+    def _icd10_levels() -> dict:
+        """
+        Private helper classifying the positions of ICD-10 codes in ICD10Code._hierarchy into sorted lists of
+        chapters (top level ranges), subchapters (nested ranges) and causes (codes without subdivisions).
+        Computed once.
+        """
+        if QueryPlanner._levels is None:
+            from cdcwonderpy.icd10code import ICD10Code
+
+            hierarchy = ICD10Code._hierarchy()
+            levels = {"chapters": [], "subchapters": [], "causes": []}
+            for i, code in enumerate(hierarchy["codes"]):
+                if "-" in code.value:
+                    levels["subchapters" if code in hierarchy["parent"] else "chapters"].append(i)
+                elif hierarchy["end"][i] == i + 1:
+                    levels["causes"].append(i)
+            QueryPlanner._levels = levels
+        return QueryPlanner._levels
+
+    def _split_dates(self, request : Request, grouping : Grouping) -> typing.List[Request]:
+        """
+        Private helper splitting a request into consecutive date ranges. Months of one year stay together
+        when grouping by Year, so no year is reported by more than one sub-request.
+        """
+        months = QueryPlanner._months(request)
+        if grouping == Grouping.YEAR:
+            units = []
+            for month in months:
+                if units and units[-1][0].get_year() == month.get_year():
+                    units[-1].append(month)
+                else:
+                    units.append([month])
+        else:
+            units = [[month] for month in months]
+
+        # Rows contributed by each unit of this dimension, given all the other groupings.
+        rows_per_unit = max(1, self.estimate_rows(request) // self._cardinality(request, grouping))
+        units_per_request = max(1, self.max_rows // rows_per_unit)
+
+        sub_requests = []
+        for start in range(0, len(units), units_per_request):
+            chunk = [month for unit in units[start:start + units_per_request] for month in unit]
+            sub_request = copy.deepcopy(request)
+            sub_request.dates(*[Dates.single(month) for month in chunk])
+            sub_requests.append(sub_request)
+        return sub_requests
+
+    def _split_icd10_codes(self, request : Request, grouping : Grouping, date_grouping : typing.Optional[Grouping]) -> typing.List[Request]:
+        """
+        Private helper splitting a request into groups of ICD-10 codes. Codes whose results alone are too
+        large are replaced by their direct subdivisions, down to the grouping's level: below it, the
+        subdivisions would each report a partial row for the same value. Codes at that level that are still
+        too large are split by date_grouping.
+        :raises ValueError: if such a code exists and date_grouping is None
+        """
+        from cdcwonderpy.icd10code import ICD10Code
+
+        rows_per_code = max(1, self.estimate_rows(request) // self._cardinality(request, grouping))
+
+        units = []
+        pending = list(reversed(QueryPlanner._icd10_codes(request)))
+        while pending:
+            code = pending.pop()
+            count = QueryPlanner._icd10_count(code, grouping)
+            if rows_per_code * max(1, count) > self.max_rows and count > 1:
+                pending.extend(reversed(ICD10Code.children(code)))
+            else:
+                units.append(code)
+
+        sub_requests = []
+        chunk, chunk_rows = [], 0
+        for code in units:
+            code_rows = rows_per_code * QueryPlanner._icd10_weight(code, grouping)
+            if code_rows > self.max_rows:
+                if date_grouping is None:
+                    raise ValueError(f"The results for {code.value} alone are estimated to exceed {self.max_rows} rows, "
+                                     f"and cannot be split further without grouping by Year or Month")
+                if chunk:
+                    sub_requests.append(copy.deepcopy(request).cause_of_death(chunk))
+                    chunk, chunk_rows = [], 0
+                sub_requests.extend(self._split_dates(copy.deepcopy(request).cause_of_death(code), date_grouping))
+                continue
+            if chunk and chunk_rows + code_rows > self.max_rows:
+                sub_requests.append(copy.deepcopy(request).cause_of_death(chunk))
+                chunk, chunk_rows = [], 0
+            chunk.append(code)
+            chunk_rows += code_rows
+        if chunk:
+            sub_requests.append(copy.deepcopy(request).cause_of_death(chunk))
+        return sub_requests
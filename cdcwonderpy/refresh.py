@@ -0,0 +1,195 @@
+import concurrent.futures
+import copy
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import typing
+import zlib
+
+from cdcwonderpy.dates import *
+from cdcwonderpy.request import Request
+from cdcwonderpy.response import Response
+from cdcwonderpy.cache import ResponseCache
+from cdcwonderpy.planner import QueryPlanner
+
+class RefreshReport():
+    """
+    * Outcome of RefreshPlanner.refresh.
+    *
+    * - years_checked:  every year that was re-queried
+    * - years_changed:  the years whose data differed from the stored data (all of them on the first refresh)
+    * - rows_added:     rows whose grouping labels were not reported before
+    * - rows_removed:   rows that are no longer reported
+    * - rows_changed:   rows reported before with different values
+    """
+    def __init__(self):
+        self.years_checked = []
+        self.years_changed = []
+        self.rows_added = 0
+        self.rows_removed = 0
+        self.rows_changed = 0
+
+    def __repr__(self):
+        return (f"RefreshReport(years_checked={len(self.years_checked)}, years_changed={self.years_changed}, "
+                f"rows_added={self.rows_added}, rows_removed={self.rows_removed}, rows_changed={self.rows_changed})")
+
+
+class RefreshPlanner():
+    """
+    * Keeps year-sliced copies of requests up to date when CDC republishes data, without rewriting the
+    * years that did not change.
+    *
+    * A request is split into one sub-request per year of its dates (see split). On refresh every slice is
+    * sent (concurrently) and a fingerprint of its rows is compared to the one stored for the same canonical
+    * request and year. Only the slices that differ are passed to the write callback, e.g. to rewrite that
+    * year's partition of a data lake:
+    *   planner = RefreshPlanner("state")
+    *   report = planner.refresh(request, write=lambda year, response: response.to_parquet(f"lake/Year={year}.parquet"))
+    *
+    * The rows of every slice are stored (compressed, in a local SQLite database) so the report can count the
+    * rows that were added, removed or changed. A slice is only recorded once write returned, so a failed
+    * write is retried by the next refresh.
+    *
+    * For requests grouped by Year or Month the slices together make up the result of the whole request;
+    * otherwise each slice holds the request's groupings for a single year.
+    """
+    DATABASE_NAME = "refresh.sqlite"
+
+    def __init__(self, path : str, max_workers : int = 4, client : 'WonderClient' = None):
+        """
+        Open (or create) the refresh state.
+        :param path:        directory in which the state database is stored; created if it does not exist
+        :param max_workers: number of slices sent in parallel
+        :param client:      optional WonderClient to send the slices with
+        :raises ValueError: if max_workers is not positive
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.max_workers = max_workers
+        self.client = client
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.path.join(path, RefreshPlanner.DATABASE_NAME), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS slices ("
+                "request TEXT NOT NULL, year INTEGER NOT NULL, fingerprint TEXT NOT NULL, rows BLOB NOT NULL, "
+                "refreshed REAL NOT NULL, PRIMARY KEY (request, year))")
+
+    @staticmethod
+    def split(request : Request) -> typing.List[typing.Tuple[int, Request]]:
+        """
+        Split a request into one copy per year of its dates, each limited to the dates of that year.
+        The original request is not modified.
+        :param request: the Request to split
+        :returns:       list of (year, Request) pairs in chronological order
+        """
+        years = dict()
+        for month in QueryPlanner._months(request):
+            years.setdefault(month.get_year(), []).append(month)
+
+        slices = []
+        for year, months in years.items():
+            if len(months) == YearAndMonth.NUM_MONTHS:
+                dates = [Dates.single(Year(year))]
+            else:
+                dates = [Dates.single(month) for month in months]
+            slices.append((year, copy.deepcopy(request).dates(*dates)))
+        return slices
+
+    def refresh(self, request : Request, write : typing.Callable[[int, Response], None] = None) -> RefreshReport:
+        """
+        Re-query every year of a request and record the years whose data changed.
+        :param request:             the Request to refresh
+        :param write:               optional function called with the year and new Response of every changed slice
+        :returns:                   RefreshReport describing the changes
+        :raises RequestException:   if any slice fails; no slice is recorded in that case
+        """
+        key = ResponseCache.key(request)
+        slices = RefreshPlanner.split(request)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            responses = list(executor.map(lambda s: s[1].send(client=self.client), slices))
+
+        report = RefreshReport()
+        for (year, _), response in zip(slices, responses):
+            report.years_checked.append(year)
+            rows = response.as_2d_list()
+            fingerprint = RefreshPlanner._fingerprint(rows)
+            stored = self._stored(key, year)
+            if stored is not None and stored[0] == fingerprint:
+                continue
+
+            added, removed, changed = RefreshPlanner._diff([] if stored is None else stored[1], rows, len(response._groupings))
+            if write is not None:
+                write(year, response)
+            self._store(key, year, fingerprint, rows)
+
+            report.years_changed.append(year)
+            report.rows_added += added
+            report.rows_removed += removed
+            report.rows_changed += changed
+        return report
+
+    def fingerprints(self, request : Request) -> typing.Dict[int, str]:
+        """
+        Returns the fingerprints stored for a request.
+        :param request: the Request
+        :returns:       year -> fingerprint of the rows recorded for that year
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT year, fingerprint FROM slices WHERE request = ? ORDER BY year",
+                                            (ResponseCache.key(request),)).fetchall()
+        return dict(rows)
+
+    def forget(self, request : Request):
+        """
+        Remove everything stored for a request, so the next refresh reports every year as changed.
+        :param request: the Request
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM slices WHERE request = ?", (ResponseCache.key(request),))
+
+    def close(self):
+        """
+        Close the underlying database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    ##################################
+    # Private internal helper methods
+    ##################################
+    @staticmethod
+    def _fingerprint(rows : typing.List[typing.List]) -> str:
+        return hashlib.blake2b(json.dumps(rows).encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _diff(old : typing.List[typing.List], new : typing.List[typing.List], num_groupings : int) -> typing.Tuple[int, int, int]:
+        """
+        Private helper counting the rows added, removed and changed between two versions of a slice.
+        Rows are matched by their grouping labels.
+        """
+        old_rows = {tuple(row[:num_groupings]): row[num_groupings:] for row in old}
+        new_rows = {tuple(row[:num_groupings]): row[num_groupings:] for row in new}
+        added = sum(1 for labels in new_rows if labels not in old_rows)
+        removed = sum(1 for labels in old_rows if labels not in new_rows)
+        changed = sum(1 for labels, values in new_rows.items() if labels in old_rows and old_rows[labels] != values)
+        return added, removed, changed
+
+    def _stored(self, key : str, year : int) -> typing.Optional[typing.Tuple[str, typing.List[typing.List]]]:
+        with self._lock:
+            row = self._connection.execute("SELECT fingerprint, rows FROM slices WHERE request = ? AND year = ?", (key, year)).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(zlib.decompress(row[1]))
+
+    def _store(self, key : str, year : int, fingerprint : str, rows : typing.List[typing.List]):
+        body = zlib.compress(json.dumps(rows).encode("utf-8"))
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO slices VALUES (?, ?, ?, ?, ?)", (key, year, fingerprint, body, time.time()))
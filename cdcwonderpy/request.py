@@ -1,9 +1,18 @@
-from requests import RequestException, post
+from requests import RequestException
 import bs4 as bs
+import copy
+import json
+import tempfile
+import time
+import typing
 from enum import Enum
 from collections.abc import Iterable
+from xml.sax.saxutils import escape
+from lxml import etree
 
 from cdcwonderpy.response import *
+from cdcwonderpy.client import WonderClient
+from cdcwonderpy.instrumentation import Instrumentation
 from cdcwonderpy.enums import *
 from cdcwonderpy.dates import *
 from cdcwonderpy.ages import *
@@ -195,38 +204,176 @@ class Request():
         self._parameter_data = dict()
 
 
-    def send(self) -> 'Response':
+    def send(self, cache : 'ResponseCache' = None, client : WonderClient = None, stream : bool = False,
+             spool : typing.Union[bool, str] = False) -> 'Response':
         """
         Sends this request to the CDC Wonder API endpoint and returns the response as a Response.
+        :param cache:               optional ResponseCache. If it holds a response for an identical request,
+                                    that response is returned without contacting the server; otherwise the
+                                    server's response is stored in it.
+        :param client:              optional WonderClient to send the request with. Defaults to the client
+                                    shared by the whole process (see WonderClient.default).
+        :param stream:              if True, the response body is read in chunks and fed to an incremental parser
+                                    that builds the columns of as_dataframe and as_arrow while it downloads,
+                                    instead of being read and decoded as a whole before parsing.
+        :param spool:               only with stream: if True (or the directory to use), the raw response is written
+                                    to an anonymous temporary file instead of kept in memory, and as_xml reads it
+                                    back from there. The file is deleted when the Response is garbage collected.
+                                    Storing a spooled response in a cache reads it back into memory once.
         :returns Response:          represents the response of the server
-        :raises RequestException:   when the server responds with an error (see exception message for details).
-        """
-        request_xml = "<request-parameters>\n"
-        request_xml += self._dictToXML({"accept_datause_restrictions": "true"})
-        request_xml += self._dictToXML(self._b_parameters)
-        request_xml += self._dictToXML(self._m_parameters)
-        request_xml += self._dictToXML(self._f_parameters)
-        request_xml += self._dictToXML(self._i_parameters)
-        request_xml += self._dictToXML(self._v_parameters)
-        request_xml += self._dictToXML(self._o_parameters)
-        request_xml += self._dictToXML(self._vm_parameters)
-        request_xml += self._dictToXML(self._misc_parameters)
-        request_xml += "</request-parameters>"
-
-        url = "https://wonder.cdc.gov/controller/datarequest/D76"
-        response = post(url, data={"request_xml": request_xml})
+        :raises RequestException:   when the server responds with an error (see exception message for details),
+                                    or when the cache is in offline mode and holds no response for this request.
+        :raises ValueError:         if spool is given without stream
+        """
+        if spool and not stream:
+            raise ValueError("spool requires stream=True")
+
+        cached = self._cached_response(cache)
+        if cached is not None:
+            return cached
+
+        # Every hook of this request goes to the collectors installed now.
+        collectors = Instrumentation._collectors
+        context = dict() if collectors else None
+        start = time.perf_counter() if context is not None else None
+        request_xml = self.to_xml()
+        if client is None:
+            client = WonderClient.default()
+        if context is not None:
+            size = len(request_xml.encode("utf-8"))
+            Instrumentation._emit(collectors, "on_build", self, context, time.perf_counter() - start, size)
+            Instrumentation._emit(collectors, "on_send", self, context, size)
+            start = time.perf_counter()
+
+        streamed = None
+        try:
+            response = client.post(request_xml, timeout=float(self._o_parameters["O_timeout"]), stream=stream)
+            if context is not None:
+                # Unless streaming, requests reads the whole body before returning; elapsed is the time until the headers were parsed.
+                Instrumentation._emit(collectors, "on_first_byte", self, context, response.elapsed.total_seconds())
+            if stream and response.status_code == 200:
+                streamed, size = self._read_stream(response, spool)
+            else:
+                size = len(response.content)
+        except Exception as e:
+            if context is not None:
+                Instrumentation._emit(collectors, "on_error", self, context, e, time.perf_counter() - start)
+            raise
+
+        if context is not None:
+            # For streamed responses, parsing overlaps the download, so it is included here rather than reported through on_parse.
+            Instrumentation._emit(collectors, "on_response", self, context, response.status_code, time.perf_counter() - start, size)
+        if streamed is not None:
+            if cache is not None:
+                cache.put(self, streamed.as_xml())
+            return streamed
+        return self._handle_response(response.status_code, response.text, cache)
+
+
+    async def send_async(self, session : 'aiohttp.ClientSession' = None, cache : 'ResponseCache' = None, url : str = None) -> 'Response':
+        """
+        Asynchronous version of send, built on aiohttp. Awaiting it sends this request without blocking
+        the event loop, so many requests can be in flight at once (see gather_requests).
+        :param session:             optional aiohttp ClientSession to send the request with. A temporary session
+                                    is opened and closed if none is given.
+        :param cache:               optional ResponseCache, used the same way as in send
+        :param url:                 endpoint to send the request to, defaults to the URL of the default WonderClient
+        :returns Response:          represents the response of the server
+        :raises RequestException:   when the server responds with an error (see exception message for details),
+                                    or when the cache is in offline mode and holds no response for this request.
+        :raises asyncio.TimeoutError: when connecting or reading exceeds the timeouts of the default WonderClient,
+                                    the same limits send applies. There is no limit on the total duration.
+        """
+        import aiohttp
+
+        cached = self._cached_response(cache)
+        if cached is not None:
+            return cached
+
+        # Every hook of this request goes to the collectors installed now.
+        collectors = Instrumentation._collectors
+        context = dict() if collectors else None
+        start = time.perf_counter() if context is not None else None
+        request_xml = self.to_xml()
+        client = WonderClient.default()
+        if url is None:
+            url = client.url
+        # Set per post, so sessions passed in (e.g. the one shared by gather_requests) get the same limits.
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=client.connect_timeout,
+                                        sock_read=float(self._o_parameters["O_timeout"]) + client.read_timeout_margin)
+        if context is not None:
+            size = len(request_xml.encode("utf-8"))
+            Instrumentation._emit(collectors, "on_build", self, context, time.perf_counter() - start, size)
+            Instrumentation._emit(collectors, "on_send", self, context, size)
+            start = time.perf_counter()
+
+        owns_session = session is None
+        if owns_session:
+            session = aiohttp.ClientSession()
+        try:
+            async with session.post(url, data={"request_xml": request_xml}, timeout=timeout) as response:
+                if context is not None:
+                    Instrumentation._emit(collectors, "on_first_byte", self, context, time.perf_counter() - start)
+                body = await response.read()
+                text = body.decode(response.get_encoding())
+                status_code = response.status
+        except Exception as e:
+            if context is not None:
+                Instrumentation._emit(collectors, "on_error", self, context, e, time.perf_counter() - start)
+            raise
+        finally:
+            if owns_session:
+                await session.close()
+        if context is not None:
+            Instrumentation._emit(collectors, "on_response", self, context, status_code, time.perf_counter() - start, len(body))
+        return self._handle_response(status_code, text, cache)
+
+
+    def to_xml(self) -> str:
+        """
+        Returns the request XML document that send posts to the server for this request.
+        Parameter values are XML escaped.
+        :returns:   the request XML as a String
+        """
+        return Request._template().render(self._parameter_dicts())
 
-        # Raise exception based on response status code and server error messages.
-        if response.status_code != 200:
-            error_messages = bs.BeautifulSoup(response.text, "lxml").find_all("message")
 
-            exception_message = ""
-            for message in error_messages:
-                exception_message = exception_message + message.contents[0] + "\n"
-
-            raise RequestException("The server returned an error: " + exception_message)
+    @staticmethod
+    def from_xml(xml : str) -> 'Request':
+        """
+        Creates a Request from a request XML document, such as one produced by to_xml.
+        Parameters missing from the document keep their default values.
+        :param xml:         the request XML
+        :raises ValueError: if the XML is not a request-parameters document or names unknown parameters
+        :returns:           a new Request that serializes to the same XML
+        """
+        try:
+            root = etree.fromstring(xml.encode("utf-8"))
+        except etree.XMLSyntaxError as e:
+            raise ValueError(f"Invalid request XML: {e}") from e
+        if root.tag != "request-parameters":
+            raise ValueError("Request XML must have a request-parameters root element")
+
+        request = Request()
+        defaults = Request()
+        for parameter in root.iterfind("parameter"):
+            name = parameter.findtext("name")
+            values = [value.text or "" for value in parameter.iterfind("value")]
+            if name == "accept_datause_restrictions":
+                continue
+
+            parameter_dict = request._parameter_dict_of(name)
+            default = defaults._parameter_dict_of(name).get(name)
+            if name.startswith("F_") or len(values) != 1:
+                parameter_dict[name] = values
+            elif name.startswith("V_") and values[0] != default:
+                # Filters set through the Request methods are lists of values.
+                parameter_dict[name] = values
+            else:
+                parameter_dict[name] = values[0]
 
-        return Response(response.text, self._group_by_column_names)
+        request._restore_parameter_data()
+        return request
 
 
     #########################################
@@ -413,27 +560,13 @@ class Request():
         for arg in args:
             if not isinstance(arg, Dates):
                 raise TypeError("Provided arguments are not Dates objects. Please create Dates objects to set the year(s) and month(s) you would like to retrieve data from.")
-            if any(e.is_before(Year(1999)) or e.is_after(Year(2018)) for e in arg.get_months()):
+            bounds = arg._bounds()
+            if bounds is not None and (bounds[0].is_before(Year(1999)) or bounds[1].is_after(Year(2018))):
                 raise ValueError("All dates must be between 1999 and 2018")
             total = Dates.union(total, arg)
 
-        all_months = sorted(total.get_months())
-        curr_year = None
-        curr_year_set = set()
-        date_params = set()
-        for month in all_months:
-            if curr_year != month.get_year():
-                date_params.update(curr_year_set)
-                curr_year_set = set()
-                curr_year = month.get_year()
-            
-            curr_year_set.add(month)
-            
-            if len(curr_year_set) == YearAndMonth.NUM_MONTHS:
-                date_params.add(Year(curr_year))
-                curr_year_set = set()
-
-        date_params.update(curr_year_set)
+        # Whole years are requested as a Year, the remaining months individually.
+        date_params = set(total._as_periods())
         date_params_list = [str(e) for e in date_params]
         self._f_parameters["F_D76.V1"] = sorted(date_params_list)
         self._parameter_data["Dates"] = date_params
@@ -535,18 +668,8 @@ class Request():
         if len(flattened) == 0:
             raise ValueError("Method expects at least one ICD10Code")
 
-        icd10_params = []
-        shouldBeAdded = True
-        for code in flattened:
-            for accepted_code in icd10_params:
-                if accepted_code.contains(code):
-                    shouldBeAdded = False
-                    break
-                elif code.contains(accepted_code):
-                    icd10_params.remove(accepted_code)
-            
-            if shouldBeAdded:
-                icd10_params.append(code)
+        # Drop codes that are already covered by a broader code
+        icd10_params = ICD10Code.minimal_cover(flattened)
 
         self._f_parameters["F_D76.V2"] = [ e.value for e in icd10_params ]
         self._parameter_data["ICD-10 Codes"] = icd10_params
@@ -562,28 +685,171 @@ class Request():
         Private helper function that transforms a dictionary single parameter -> value
         mappings to an equivalent XML string representation.
         """
-        parameterString = ""
-        for key in parameterDict:
-            parameterString += "<parameter>\n"
-            parameterString += "<name>" + key + "</name>\n"
+        return "".join(_RequestTemplate.render_parameter(key, value) for key, value in parameterDict.items())
 
-            # If value is a list, concatenate all values
-            if isinstance(parameterDict[key], list) or isinstance(parameterDict[key], tuple):
-                for value in parameterDict[key]:
-                    parameterString += "<value>" + value + "</value>\n"
-            else:
-                parameterString += "<value>" + parameterDict[key] + "</value>\n"
+    def _cached_response(self, cache : 'ResponseCache') -> 'Response':
+        """
+        Private helper returning the cached Response for this request, or None if there is no cache
+        or it holds no response for this request.
+        :raises RequestException:   when the cache is in offline mode and holds no response for this request.
+        """
+        if cache is None:
+            return None
+
+        cached_xml = cache.get(self)
+        if cached_xml is not None:
+            return Response(cached_xml, self._group_by_column_names, self._metadata())
+        if cache.offline:
+            raise RequestException("No cached response for this request and the cache is in offline mode.")
+        return None
+
+    def _handle_response(self, status_code : int, text : str, cache : 'ResponseCache') -> 'Response':
+        """
+        Private helper turning the server's reply into a Response (storing it in the cache, if any).
+        :raises RequestException:   when the server responded with an error.
+        """
+        # Raise exception based on response status code and server error messages.
+        if status_code != 200:
+            error_messages = bs.BeautifulSoup(text, "lxml").find_all("message")
 
-            parameterString += "</parameter>\n"
+            exception_message = ""
+            for message in error_messages:
+                exception_message = exception_message + message.contents[0] + "\n"
+
+            raise RequestException("The server returned an error: " + exception_message)
+
+        if cache is not None:
+            cache.put(self, text)
+
+        return Response(text, self._group_by_column_names, self._metadata())
+
+    def _read_stream(self, http_response : 'requests.Response', spool : typing.Union[bool, str]) -> typing.Tuple['Response', int]:
+        """
+        Private helper reading a successful streamed reply into a Response, parsing it as it downloads.
+        Returns the Response and the number of bytes received.
+        """
+        received = 0
+
+        def chunks():
+            nonlocal received
+            for chunk in http_response.iter_content(chunk_size=Response.STREAM_CHUNK_SIZE):
+                received += len(chunk)
+                yield chunk
+
+        spool_file = tempfile.TemporaryFile(dir=None if spool is True else spool) if spool else None
+        try:
+            with http_response:
+                response = Response._from_stream(chunks(), self._group_by_column_names, self._metadata(), spool_file)
+        except BaseException:
+            if spool_file is not None:
+                spool_file.close()
+            raise
+        return response, received
+
+    def _parameter_dicts(self) -> list:
+        """
+        Private helper returning every parameter dictionary in the order they are sent to the server.
+        """
+        return [{"accept_datause_restrictions": "true"}, self._b_parameters, self._m_parameters,
+                self._f_parameters, self._i_parameters, self._v_parameters, self._o_parameters,
+                self._vm_parameters, self._misc_parameters]
+
+    @staticmethod
+    def _build_xml(parameter_dicts) -> str:
+        """
+        Private helper that serializes parameter dictionaries into a complete request XML document.
+        """
+        return "<request-parameters>\n" + "".join(Request._dictToXML(d) for d in parameter_dicts) + "</request-parameters>"
+
+    @staticmethod
+    def _template() -> '_RequestTemplate':
+        """
+        Private helper returning the request template compiled from the default parameters, built once per process.
+        """
+        try:
+            return Request._compiled_template
+        except AttributeError:
+            Request._compiled_template = _RequestTemplate(Request()._parameter_dicts())
+            return Request._compiled_template
+
+    def _parameter_dict_of(self, name : str) -> dict:
+        """
+        Private helper returning the parameter dictionary a parameter belongs to, based on its name.
+        :raises ValueError: if the parameter name is unknown
+        """
+        for parameter_dict in self._parameter_dicts()[1:]:
+            if name in parameter_dict:
+                return parameter_dict
+        raise ValueError(f"Unknown request parameter: {name}")
+
+    def _restore_parameter_data(self):
+        """
+        Private helper recomputing the state derived from the parameter dictionaries (group by column names,
+        ages and the data shown by repr), for Requests created by from_xml.
+        """
+        from cdcwonderpy.icd10code import ICD10Code
+
+        groupings = [Grouping(value) for value in self._b_parameters.values() if value != "*None*"]
+        self._group_by_column_names = ["Age" if grouping.name.endswith("AGE_GROUPS") else grouping.name.capitalize()
+                                       for grouping in groupings]
+        self._parameter_data = dict()
+        if groupings != [Grouping.YEAR]:
+            self._parameter_data["Grouped by"] = groupings
+
+        ages = self._v_parameters["V_D76.V52"]
+        if isinstance(ages, list) and "*All*" not in ages:
+            self.ages = Ages()
+            for age in ages:
+                self.ages = self.ages.union(Ages.single(int(age)))
+            self._parameter_data["Ages"] = [self.ages]
+
+        for name, label, enum in [("V_D76.V7", "Gender", Gender), ("V_D76.V8", "Race", Race),
+                                  ("V_D76.V17", "Hispanic Origin", HispanicOrigin), ("V_D76.V24", "Weekday", Weekday),
+                                  ("V_D76.V20", "Autopsy", Autopsy)]:
+            if isinstance(self._v_parameters[name], list):
+                self._parameter_data[label] = [enum(value) for value in self._v_parameters[name]]
+
+        dates = self._f_parameters["F_D76.V1"]
+        if dates != ["*All*"]:
+            self._parameter_data["Dates"] = {YearAndMonth(*map(int, date.split("/"))) if "/" in date else Year(int(date))
+                                             for date in dates}
+
+        codes = self._f_parameters["F_D76.V2"]
+        if codes != ["*All*"]:
+            self._parameter_data["ICD-10 Codes"] = [ICD10Code(code) for code in codes]
+
+    def _metadata(self) -> dict:
+        """
+        Private helper returning the metadata attached to Responses of this request: the request XML and,
+        as JSON, the parameters shown by repr. Values are sorted, except for the order of the groupings.
+        """
+        from cdcwonderpy.icd10code import ICD10Code
+
+        parameters = dict()
+        for key, values in self._parameter_data.items():
+            names = [value.name if isinstance(value, (Enum, ICD10Code)) else str(value) for value in values]
+            parameters[key] = names if key == "Grouped by" else sorted(names)
+        return {"request": self.to_xml(), "parameters": json.dumps(parameters)}
+
+    def _canonical_xml(self) -> str:
+        """
+        Private helper returning the request XML with parameter names and multi-valued parameters sorted,
+        so that requests asking for the same data serialize identically regardless of argument order.
+        """
+        canonical = dict()
+        for parameter_dict in self._parameter_dicts():
+            for key, value in parameter_dict.items():
+                canonical[key] = sorted(value) if isinstance(value, (list, tuple)) else value
+        return self._build_xml([{key: canonical[key] for key in sorted(canonical)}])
 
-        return parameterString
-    
     def __repr__(self):
+        from cdcwonderpy.icd10code import ICD10Code
+
         mapPrint = dict()
         for (k,v) in self._parameter_data.items():
             newVal = []
             for val in v:
-                if isinstance(val, Enum):
+                if isinstance(val, (Enum, ICD10Code)):
                     newVal.append(val.name)
                 elif isinstance(val, Ages):
                     newVal = val
@@ -592,3 +858,41 @@ class Request():
             mapPrint[k] = newVal
         return "Request(" + str(mapPrint) + ")"
         # return "Request("+str(self._parameter_data)+")"
+
+
+class _RequestTemplate():
+    """
+    Private helper holding the request XML skeleton compiled from the default parameter dictionaries.
+    Parameters that still have their default value are emitted from pre-rendered fragments, and whole
+    dictionaries at once when none of their values changed. Only changed parameters are rendered.
+    """
+    def __init__(self, parameter_dicts : list):
+        self._defaults = copy.deepcopy(parameter_dicts)
+        self._dict_fragments = [Request._dictToXML(parameter_dict) for parameter_dict in parameter_dicts]
+        self._fragments = [{key: _RequestTemplate.render_parameter(key, value) for key, value in parameter_dict.items()}
+                           for parameter_dict in parameter_dicts]
+
+    def render(self, parameter_dicts : list) -> str:
+        """
+        Serializes parameter dictionaries (in the order given by Request._parameter_dicts) into a request XML document.
+        """
+        parts = ["<request-parameters>\n"]
+        for parameter_dict, default, dict_fragment, fragments in zip(parameter_dicts, self._defaults, self._dict_fragments, self._fragments):
+            if parameter_dict == default:
+                parts.append(dict_fragment)
+                continue
+            for key, value in parameter_dict.items():
+                if key in fragments and default[key] == value:
+                    parts.append(fragments[key])
+                else:
+                    parts.append(_RequestTemplate.render_parameter(key, value))
+        parts.append("</request-parameters>")
+        return "".join(parts)
+
+    @staticmethod
+    def render_parameter(name : str, value) -> str:
+        """
+        Serializes a single parameter, whose value is a String or a list of Strings, with XML escaping.
+        """
+        values = value if isinstance(value, (list, tuple)) else [value]
+        return "<parameter>\n<name>" + escape(name) + "</name>\n" + "".join("<value>" + escape(v) + "</value>\n" for v in values) + "</parameter>\n"
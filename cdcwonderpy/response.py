@@ -1,16 +1,51 @@
+import hashlib
+import io
+import json
+import threading
+import time
 import typing
-import bs4 as bs
+import zlib
+import numpy as np
 import pandas as pd
+from lxml import etree
+
+from cdcwonderpy.instrumentation import Instrumentation
 
 T = typing.TypeVar('T')
 
+# Shallow DataFrame copies only behave as independent copies when pandas copy-on-write is active.
+_COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3 or getattr(pd.options.mode, "copy_on_write", False) is True
+
 class Response():
     """
     Immutable representation of the response returned from the Wonder HTTP endpoint.
+    Parsed results are computed lazily on first access and memoized, so repeated calls to
+    as_2d_list, as_dataframe, as_arrow and hashing do not re-parse the XML. The memoized results are
+    safe to share between threads; use clear_cache to release them.
+    Responses received with Request.send(stream=True) are parsed into typed columns while they download,
+    and may keep their XML in a temporary spool file instead of in memory.
+    With compress=True (or after calling compress) the XML is kept zlib compressed and decompressed on demand.
+    Equality and hashing compare a BLAKE2 digest of the XML, computed once.
     """
-    def __init__(self, xml, groupings):
+    METADATA_PREFIX = "cdcwonderpy."
+    STREAM_CHUNK_SIZE = 64 * 1024
+    COMPRESSION_LEVEL = 6
+    DIGEST_SIZE = 32
+
+    def __init__(self, xml, groupings, metadata : typing.Dict[str, str] = None, compress : bool = False):
         self._xml = xml
+        self._spool = None
+        self._compressed = None
+        self._digest = None
         self._groupings = groupings
+        self._metadata = dict(metadata) if metadata is not None else dict()
+        self._lock = threading.RLock()
+        self._rows = None
+        self._table = None
+        self._dataframe = None
+        self._arrow = None
+        if compress:
+            self.compress()
 
     def __repr__(self) -> str:
         return self.as_dataframe().to_string()
@@ -21,73 +56,515 @@ class Response():
         :param f:   the user-defined function to call to parse the xml data. Function should take in raw XML string and compute any result
         :returns:   the return value of the user-defined parsing function
         """
-        return f(self._xml)
+        return f(self.as_xml())
 
 
     def as_xml(self) -> str:
         """
         Return the response data as an XML-formatted String.
+        The XML of a response spooled to a file (see Request.send) or compressed (see compress) is read back
+        on every call.
         :returns:   String representation single Response in XML format.
         """
-        return self._xml
+        xml = self._xml
+        if xml is not None:
+            return xml
+        return self._xml_bytes().decode("utf-8")
+
+    def compress(self) -> 'Response':
+        """
+        Keep the response XML zlib compressed from now on, which typically shrinks it 5 to 20 times, and release
+        the uncompressed XML (or spool file). as_xml then decompresses it on every call, and parsing decompresses it
+        in chunks. Parse results that are already memoized are kept. Does nothing if the XML is already compressed.
+        :returns:   self, so it can be chained, e.g. request.send().compress()
+        """
+        with self._lock:
+            if self._compressed is not None:
+                return self
+
+            compressor = zlib.compressobj(Response.COMPRESSION_LEVEL)
+            digest = hashlib.blake2b(digest_size=Response.DIGEST_SIZE) if self._digest is None else None
+            parts = []
+            for chunk in self._chunks():
+                if digest is not None:
+                    digest.update(chunk)
+                parts.append(compressor.compress(chunk))
+            parts.append(compressor.flush())
+
+            self._compressed = b"".join(parts)
+            if digest is not None:
+                self._digest = digest.digest()
+            self._xml = None
+            self._spool = None
+        return self
 
     def as_dataframe(self) -> pd.DataFrame:
         """
         Returns the response data as a formatted Pandas Dataframe with
         column labels corresponding to group_by settings in the Request.
+        The data is built column by column: grouping labels are categorical, Deaths and Population
+        are nullable 64-bit integers and the crude rate is a float64 column. Values that the server
+        did not report ("Suppressed", "Unreliable", "Not Applicable") become missing values, and the
+        reason they are missing is kept in a categorical "Missing" column.
         :returns:   Pandas Dataframe containing Response data.
         """
-        column_labels = self._groupings + ["Deaths", "Population", "Crude Rate Per 100,000"]
-        df = pd.DataFrame(data=self.as_2d_list(), columns=column_labels)
-        return df
+        if self._dataframe is None:
+            with self._lock:
+                if self._dataframe is None:
+                    self._dataframe = self._columnar_table().to_dataframe(self._groupings)
+
+        # Hand out a view so callers can modify their frame without affecting the cached one.
+        if _COPY_ON_WRITE:
+            return self._dataframe.copy(deep=False)
+        return self._dataframe.copy()
+
+    def as_arrow(self) -> 'pyarrow.Table':
+        """
+        Returns the response data as an Arrow Table with the same columns as as_dataframe, built straight
+        from the parsed columns without creating pandas objects. Grouping labels and the "Missing" column are
+        dictionary encoded, Deaths and Population are int64 and the crude rate is float64; values the server
+        did not report are null. The schema metadata holds the grouping column names and, for responses
+        returned by Request.send, the request XML and a summary of its parameters, under keys starting
+        with "cdcwonderpy.". Requires pyarrow.
+        :returns:   pyarrow Table containing Response data.
+        """
+        if self._arrow is None:
+            with self._lock:
+                if self._arrow is None:
+                    self._arrow = self._columnar_table().to_arrow(self._groupings, self._schema_metadata())
+        return self._arrow
+
+    def to_parquet(self, path : str, partition_cols : typing.List[str] = None, **kwargs):
+        """
+        Writes the response data (see as_arrow) to Parquet, including its metadata.
+        :param path:            the file to write, or the root directory of the dataset if partition_cols is given
+        :param partition_cols:  optional column names to partition the dataset by (e.g. ["Year"]), one directory
+                                per distinct value
+        :param kwargs:          passed on to pyarrow.parquet.write_table or write_to_dataset
+        """
+        import pyarrow.parquet as pq
+
+        if partition_cols:
+            pq.write_to_dataset(self.as_arrow(), path, partition_cols=partition_cols, **kwargs)
+        else:
+            pq.write_table(self.as_arrow(), path, **kwargs)
 
     def as_2d_list(self) -> typing.List[typing.List]:
         """
-        This function grabs the root single the XML document and iterates over
-        the 'r' (row) and 'c' (column) tags single the data-table
-        Rows with a 'v' attribute contain a numerical value.
-        Rows with a 'l attribute contain a text label and may contain an
-        additional 'r' (rowspan) tag which identifies how many rows the value
-        should be added. If present, that label will be added to the following
-        rows single the data table.
+        Returns the response data as a two-dimensional list, one inner list per row
+        single the data-table. See iter_rows for how rows are parsed.
         :returns List[List]:   A two-dimensional array representing the response data.
         """
-        root = bs.BeautifulSoup(self._xml,"lxml")
-        all_records = []
-        row_number = 0
-        rows = root.find_all("r")
-        
-        for row in rows:
-            if row_number >= len(all_records):
-                all_records.append([])
-                
-            for cell in row.find_all("c"):
-                if 'v' in cell.attrs:
-                    try:
-                        all_records[row_number].append(float(cell.attrs["v"].replace(',','')))
-                    except ValueError:
-                        all_records[row_number].append(cell.attrs["v"])
+        if self._rows is None:
+            with self._lock:
+                if self._rows is None:
+                    self._rows = self._instrumented_parse(lambda: list(self._parse_rows()))
+        return [list(row) for row in self._rows]
+
+    def clear_cache(self):
+        """
+        Discards all memoized parse results held by this Response. They will be recomputed
+        from the XML on next access.
+        """
+        with self._lock:
+            self._rows = None
+            self._dataframe = None
+            self._arrow = None
+            self._table = None
+
+    def iter_rows(self) -> typing.Iterator[typing.List]:
+        """
+        Lazily parses the response data one row at a time. The XML document is pulled
+        incrementally and each 'r' (row) element is discarded as soon as it has been read,
+        so the full document tree is never held in memory.
+        Cells with a 'v' attribute contain a numerical value.
+        Cells with a 'l' attribute contain a text label and may contain an
+        additional 'r' (rowspan) attribute which identifies how many rows the label
+        spans. Spanned labels are carried forward and prepended to the following rows.
+        :returns Iterator[List]:   A generator yielding one list per row single the data-table.
+        """
+        rows = self._rows
+        if rows is not None:
+            return (list(row) for row in rows)
+        return self._parse_rows()
+
+    def _columnar_table(self) -> '_ColumnarTable':
+        """
+        Private helper returning the response data in typed columns, either built while the response
+        was streamed or collected from the parsed rows on first use. as_dataframe and as_arrow share them.
+        """
+        table = self._table
+        if table is not None:
+            return table
+
+        def parse():
+            xml = self._xml
+            capacity = xml.count("<r>") if xml is not None else 0
+            table = _ColumnarTable(len(self._groupings), capacity=capacity)
+            for record in self.iter_rows():
+                table.append(record)
+            return table
+
+        with self._lock:
+            if self._table is None:
+                self._table = self._instrumented_parse(parse)
+            return self._table
+
+    def _instrumented_parse(self, parse : typing.Callable[[], T]) -> T:
+        """
+        Private helper calling parse, reporting its duration and number of rows to the installed
+        Instrumentation collectors, if any.
+        """
+        collectors = Instrumentation._collectors
+        if not collectors:
+            return parse()
+        start = time.perf_counter()
+        result = parse()
+        Instrumentation._emit(collectors, "on_parse", self, time.perf_counter() - start, len(result))
+        return result
+
+    def _schema_metadata(self) -> typing.Dict[str, str]:
+        """
+        Private helper returning the key-value metadata stored with Arrow and Parquet exports.
+        """
+        metadata = {Response.METADATA_PREFIX + "groupings": json.dumps(list(self._groupings))}
+        metadata.update({Response.METADATA_PREFIX + key: value for key, value in self._metadata.items()})
+        return metadata
+
+    def _parse_rows(self) -> typing.Iterator[typing.List]:
+        """
+        Private generator doing the actual incremental parse for iter_rows.
+        """
+        xml = self._xml
+        if xml is not None:
+            return Response._parse_records(xml.encode("utf-8"))
+        return Response._records(Response._pull_events(self._chunks()))
+
+    def _xml_bytes(self) -> bytes:
+        """
+        Private helper returning the UTF-8 encoded response XML.
+        """
+        xml = self._xml
+        if xml is not None:
+            return xml.encode("utf-8")
+        return b"".join(self._chunks())
+
+    def _chunks(self) -> typing.Iterator[bytes]:
+        """
+        Private generator yielding the UTF-8 encoded response XML in chunks, read from wherever it is stored:
+        a string, a spool file or compressed bytes. Memory use is bounded by the chunk size (times the
+        compression ratio for compressed XML).
+        """
+        with self._lock:
+            xml, spool, compressed = self._xml, self._spool, self._compressed
+        size = Response.STREAM_CHUNK_SIZE
+
+        if compressed is not None:
+            decompressor = zlib.decompressobj()
+            view = memoryview(compressed)
+            for offset in range(0, len(view), size):
+                chunk = decompressor.decompress(view[offset:offset + size])
+                if chunk:
+                    yield chunk
+            yield decompressor.flush()
+        elif spool is not None:
+            # The file position is shared, so every read seeks under the lock.
+            offset = 0
+            while True:
+                with self._lock:
+                    spool.seek(offset)
+                    chunk = spool.read(size)
+                if not chunk:
+                    return
+                offset += len(chunk)
+                yield chunk
+        else:
+            for offset in range(0, len(xml), size):
+                yield xml[offset:offset + size].encode("utf-8")
+
+    def _xml_digest(self) -> bytes:
+        """
+        Private helper returning the BLAKE2 digest of the UTF-8 encoded response XML, computed on first use.
+        """
+        if self._digest is None:
+            digest = hashlib.blake2b(digest_size=Response.DIGEST_SIZE)
+            for chunk in self._chunks():
+                digest.update(chunk)
+            self._digest = digest.digest()
+        return self._digest
+
+    @staticmethod
+    def _from_stream(chunks : typing.Iterable[bytes], groupings, metadata : typing.Dict[str, str] = None,
+                     spool : typing.BinaryIO = None) -> 'Response':
+        """
+        Private helper building a Response from the chunks of a UTF-8 encoded response body as they arrive.
+        Rows are parsed and added to typed columns chunk by chunk. The raw bytes are written to spool, an open
+        binary file the Response takes ownership of, if given, and collected in memory otherwise.
+        """
+        kept = bytearray()
+
+        def tee():
+            for chunk in chunks:
+                if spool is not None:
+                    spool.write(chunk)
                 else:
-                    if 'r' not in cell.attrs:
-                        all_records[row_number].append(cell.attrs["l"])
-                    else:
-                    
-                        for row_index in range(int(cell.attrs["r"])):
-                            if (row_number + row_index) >= len(all_records):
-                                all_records.append([])
-                                all_records[row_number + row_index].append(cell.attrs["l"])
-                            else:
-                                all_records[row_number + row_index].append(cell.attrs["l"])
-                                            
-            row_number += 1
-
-        return all_records
+                    kept.extend(chunk)
+                yield chunk
+
+        table = _ColumnarTable(len(groupings))
+        for record in Response._records(Response._pull_events(tee())):
+            table.append(record)
+
+        if spool is not None:
+            spool.flush()
+            response = Response(None, groupings, metadata)
+            response._spool = spool
+        else:
+            response = Response(kept.decode("utf-8"), groupings, metadata)
+        response._table = table
+        return response
+
+    @staticmethod
+    def _parse_records(data : bytes) -> typing.Iterator[typing.List]:
+        """
+        Private generator parsing the rows of UTF-8 encoded response XML, see iter_rows.
+        """
+        return Response._records(etree.iterparse(io.BytesIO(data), events=("end",), tag="r", html=True, encoding="utf-8"))
+
+    @staticmethod
+    def _pull_events(chunks : typing.Iterable[bytes]) -> typing.Iterator[tuple]:
+        """
+        Private generator feeding chunks of UTF-8 encoded response XML to an incremental parser and
+        yielding the same events as iterparse in _parse_records as soon as each row is complete.
+        """
+        parser = etree.HTMLPullParser(events=("end",), tag="r", encoding="utf-8")
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    @staticmethod
+    def _records(events : typing.Iterable[tuple]) -> typing.Iterator[typing.List]:
+        """
+        Private generator turning the end events of 'r' elements into rows, see iter_rows.
+        """
+        # carried[i] holds the labels spanning into the i-th row after the current one
+        carried = []
+
+        for _, row in events:
+            record = carried.pop(0) if carried else []
+
+            for cell in row.iterchildren("c"):
+                if "v" in cell.attrib:
+                    record.append(Response._parse_value(cell.attrib["v"]))
+                else:
+                    label = cell.attrib["l"]
+                    record.append(label)
+                    for offset in range(int(cell.attrib.get("r", 1)) - 1):
+                        if offset >= len(carried):
+                            carried.append([])
+                        carried[offset].append(label)
+
+            # Free the parsed row (and any already processed siblings) before moving on.
+            row.clear()
+            while row.getprevious() is not None:
+                del row.getparent()[0]
+
+            yield record
+
+        # Rowspans that extend past the last row still produce (partial) rows.
+        yield from carried
+
+    @staticmethod
+    def _parse_value(value : str) -> typing.Union[float, str]:
+        """
+        Private helper that converts a cell value to a float, stripping thousands separators.
+        Non-numeric values such as "Suppressed" or "Not Applicable" are returned unchanged.
+        """
+        try:
+            return float(value.replace(',', ''))
+        except ValueError:
+            return value
 
     def __eq__(self, other):
-        return isinstance(other, self.__class__) and (self.as_xml() == other.as_xml())
+        return isinstance(other, self.__class__) and (self._xml_digest() == other._xml_digest())
 
     def __hash__(self):
-        return hash(self.as_xml())
+        return int.from_bytes(self._xml_digest()[:8], "little", signed=True)
+
+    def __getstate__(self):
+        # Memoized results and the lock are rebuilt lazily after unpickling. Compressed XML stays compressed.
+        state = {"_groupings": self._groupings, "_metadata": self._metadata}
+        with self._lock:
+            compressed = self._compressed
+        if compressed is not None:
+            state.update({"_compressed": compressed, "_digest": self._xml_digest()})
+        else:
+            state["_xml"] = self.as_xml()
+        return state
+
+    def __setstate__(self, state):
+        self.__init__(state.get("_xml"), state["_groupings"], state.get("_metadata"))
+        self._compressed = state.get("_compressed")
+        self._digest = state.get("_digest")
 
     def __repr__(self):
-        return str(self.as_dataframe())
\ No newline at end of file
+        return str(self.as_dataframe())
+
+
+class _ColumnarTable():
+    """
+    Private helper that accumulates parsed response rows into preallocated, typed NumPy columns.
+    Arrays grow geometrically when the initial capacity estimate is exceeded.
+    """
+    MEASURE_LABELS = ["Deaths", "Population", "Crude Rate Per 100,000"]
+    MISSING_LABEL = "Missing"
+
+    def __init__(self, num_groupings : int, capacity : int = 0):
+        capacity = max(capacity, 16)
+        self._size = 0
+        self._num_groupings = num_groupings
+
+        # Grouping labels are dictionary encoded as they are read (label -> category code).
+        self._categories = [dict() for _ in range(num_groupings)]
+        self._label_codes = np.empty((num_groupings, capacity), dtype=np.int32)
+
+        self._deaths = np.zeros(capacity, dtype=np.int64)
+        self._population = np.zeros(capacity, dtype=np.int64)
+        self._crude_rate = np.full(capacity, np.nan, dtype=np.float64)
+        self._deaths_missing = np.zeros(capacity, dtype=bool)
+        self._population_missing = np.zeros(capacity, dtype=bool)
+
+        # Reason a row has missing values, -1 if nothing is missing.
+        self._reasons = dict()
+        self._reason_codes = np.full(capacity, -1, dtype=np.int16)
+
+    def __len__(self):
+        return self._size
+
+    def append(self, record : typing.List):
+        """
+        Adds a single row, as produced by Response.iter_rows, to the table.
+        """
+        if self._size == len(self._deaths):
+            self._grow()
+
+        i = self._size
+        for column, label in enumerate(record[:self._num_groupings]):
+            categories = self._categories[column]
+            self._label_codes[column, i] = categories.setdefault(label, len(categories))
+
+        deaths, population, crude_rate = record[self._num_groupings:]
+        reasons = []
+        if isinstance(deaths, float):
+            self._deaths[i] = deaths
+        else:
+            self._deaths_missing[i] = True
+            reasons.append(deaths)
+        if isinstance(population, float):
+            self._population[i] = population
+        else:
+            self._population_missing[i] = True
+            if population not in reasons:
+                reasons.append(population)
+        if isinstance(crude_rate, float):
+            self._crude_rate[i] = crude_rate
+        elif crude_rate not in reasons:
+            reasons.append(crude_rate)
+
+        if reasons:
+            reason = "; ".join(reasons)
+            self._reason_codes[i] = self._reasons.setdefault(reason, len(self._reasons))
+        self._size += 1
+
+    def to_dataframe(self, groupings : typing.List[str]) -> pd.DataFrame:
+        """
+        Wraps the filled portion of the columns in a DataFrame without copying measure values.
+        """
+        n = self._size
+        columns = dict()
+        for column, label in enumerate(groupings):
+            columns[label] = pd.Categorical.from_codes(self._label_codes[column, :n], categories=list(self._categories[column]))
+
+        deaths, population, crude_rate = _ColumnarTable.MEASURE_LABELS
+        columns[deaths] = pd.arrays.IntegerArray(self._deaths[:n], self._deaths_missing[:n])
+        columns[population] = pd.arrays.IntegerArray(self._population[:n], self._population_missing[:n])
+        columns[crude_rate] = self._crude_rate[:n]
+        columns[_ColumnarTable.MISSING_LABEL] = pd.Categorical.from_codes(self._reason_codes[:n], categories=list(self._reasons))
+        return pd.DataFrame(columns, copy=False)
+
+    def to_arrow(self, groupings : typing.List[str], metadata : typing.Dict[str, str] = None) -> 'pyarrow.Table':
+        """
+        Wraps the filled portion of the columns in an Arrow Table. Label columns become dictionary arrays
+        over the category codes, and missing values become nulls.
+        """
+        import pyarrow as pa
+
+        n = self._size
+        columns = []
+        for column in range(len(groupings)):
+            dictionary = pa.array(list(self._categories[column]), type=pa.string())
+            columns.append(pa.DictionaryArray.from_arrays(self._label_codes[column, :n], dictionary))
+
+        columns.append(pa.array(self._deaths[:n], mask=self._deaths_missing[:n]))
+        columns.append(pa.array(self._population[:n], mask=self._population_missing[:n]))
+        columns.append(pa.array(self._crude_rate[:n], from_pandas=True))
+        reason_codes = self._reason_codes[:n]
+        columns.append(pa.DictionaryArray.from_arrays(pa.array(reason_codes, mask=reason_codes < 0),
+                                                      pa.array(list(self._reasons), type=pa.string())))
+
+        names = list(groupings) + _ColumnarTable.MEASURE_LABELS + [_ColumnarTable.MISSING_LABEL]
+        return pa.Table.from_arrays(columns, names=names, metadata=metadata)
+
+    def arrays(self) -> typing.Dict[str, np.ndarray]:
+        """
+        Returns the filled portion of every column array, keyed by name. Labels and missing value reasons
+        are not included, see categories and reasons.
+        """
+        n = self._size
+        arrays = {"label_codes": self._label_codes[:, :n]}
+        for name in _ColumnarTable._COLUMNS:
+            arrays[name] = getattr(self, "_" + name)[:n]
+        return arrays
+
+    def categories(self) -> typing.List[typing.List[str]]:
+        """
+        Returns the labels of every grouping column, in category code order.
+        """
+        return [list(categories) for categories in self._categories]
+
+    def reasons(self) -> typing.List[str]:
+        """
+        Returns the reasons values are missing, in reason code order.
+        """
+        return list(self._reasons)
+
+    @staticmethod
+    def from_arrays(arrays : typing.Dict[str, np.ndarray], categories : typing.List[typing.List[str]],
+                    reasons : typing.List[str]) -> '_ColumnarTable':
+        """
+        Rebuilds a table from the output of arrays, categories and reasons, without copying the arrays.
+        """
+        table = _ColumnarTable(len(categories))
+        table._label_codes = arrays["label_codes"]
+        for name in _ColumnarTable._COLUMNS:
+            setattr(table, "_" + name, arrays[name])
+        table._categories = [{label: code for code, label in enumerate(labels)} for labels in categories]
+        table._reasons = {reason: code for code, reason in enumerate(reasons)}
+        table._size = len(arrays["deaths"])
+        return table
+
+    _COLUMNS = ["deaths", "population", "crude_rate", "deaths_missing", "population_missing", "reason_codes"]
+
+    def _grow(self):
+        capacity = 2 * len(self._deaths)
+        label_codes = np.empty((self._num_groupings, capacity), dtype=np.int32)
+        label_codes[:, :self._size] = self._label_codes[:, :self._size]
+        self._label_codes = label_codes
+        for name, fill in [("_deaths", 0), ("_population", 0), ("_crude_rate", np.nan),
+                           ("_deaths_missing", False), ("_population_missing", False), ("_reason_codes", -1)]:
+            old = getattr(self, name)
+            new = np.full(capacity, fill, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
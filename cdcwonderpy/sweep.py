@@ -0,0 +1,226 @@
+import concurrent.futures
+import copy
+import itertools
+import typing
+
+import pandas as pd
+
+from cdcwonderpy.enums import *
+from cdcwonderpy.dates import *
+from cdcwonderpy.request import Request
+
+class RequestSweep():
+    """
+    * Generates and sends one Request per cell of a parameter sweep: the cartesian product of a set of axes,
+    * each applied to a copy of a base Request.
+    *
+    * Axes are given as keyword arguments named after the Request method that applies them (race, gender,
+    * hispanic_origin, weekday, autopsy, place_of_death, dates, age_groups or cause_of_death). Each axis value
+    * is passed to that method, a list or tuple of values being passed as separate arguments, e.g.
+    *   RequestSweep(Request().group_by(Grouping.YEAR), race=[Race.WHITE, Race.ASIAN_OR_PACIFIC_ISLANDER],
+    *                dates=[Dates.single(Year(2000)), Dates.single(Year(2001))])
+    *
+    * When sending, cells that differ only in axes the server can group by (single Gender, Race, HispanicOrigin,
+    * Weekday or Autopsy values, single whole Years and single ICD-10 chapters) are merged into one query that
+    * filters on all of their values and is grouped by that axis as well, which cuts the number of round trips.
+    * The results are identical to sending every cell on its own.
+    """
+    AXES = ["race", "gender", "hispanic_origin", "weekday", "autopsy", "place_of_death", "dates", "age_groups", "cause_of_death"]
+
+    ENUM_GROUPINGS = {
+        "race": (Race, Grouping.RACE),
+        "gender": (Gender, Grouping.GENDER),
+        "hispanic_origin": (HispanicOrigin, Grouping.HISPANIC_ORIGIN),
+        "weekday": (Weekday, Grouping.WEEKDAY),
+        "autopsy": (Autopsy, Grouping.AUTOPSY),
+    }
+
+    MAX_GROUPINGS = 5
+
+    def __init__(self, base : Request, **axes):
+        """
+        Create a sweep over the given axes.
+        :param base:        the Request every cell starts from; it is not modified
+        :param axes:        axis name -> list of values (see the class documentation)
+        :raises TypeError:  if base is not a Request
+        :raises ValueError: if an axis name is unknown or an axis has no values
+        """
+        if not isinstance(base, Request):
+            raise TypeError("The base of a sweep must be a Request")
+        for name, values in axes.items():
+            if name not in RequestSweep.AXES:
+                raise ValueError(f"Unknown sweep axis: {name}. Valid axes are {RequestSweep.AXES}")
+            if len(values) == 0:
+                raise ValueError(f"Sweep axis {name} has no values")
+
+        self._base = copy.deepcopy(base)
+        self._axes = {name: list(values) for name, values in axes.items()}
+
+    def __len__(self) -> int:
+        """
+        Returns the number of cells of the sweep.
+        """
+        size = 1
+        for values in self._axes.values():
+            size *= len(values)
+        return size
+
+    def __iter__(self) -> typing.Iterator[typing.Tuple[dict, Request]]:
+        """
+        Lazily yields every cell of the sweep, without merging.
+        :returns:   iterator of (coordinates, Request) pairs, coordinates mapping every axis name to its value
+        """
+        for values in itertools.product(*self._axes.values()):
+            coordinates = dict(zip(self._axes, values))
+            yield coordinates, self._query(coordinates, [])
+
+    def queries(self, merge : bool = True) -> typing.Iterator[typing.Tuple[dict, typing.List[str], Request]]:
+        """
+        Lazily yields the queries needed to answer the whole sweep.
+        :param merge:   whether cells that can be served by a single query are merged
+        :returns:       iterator of (coordinates, merged axes, Request) triples. The coordinates hold the values of
+                        the axes that are not merged; the Request covers every value of the merged axes.
+        """
+        merged = self._mergeable_axes() if merge else []
+        fixed = [name for name in self._axes if name not in merged]
+        for values in itertools.product(*[self._axes[name] for name in fixed]):
+            coordinates = dict(zip(fixed, values))
+            yield coordinates, merged, self._query(coordinates, merged)
+
+    def send(self, max_workers : int = 1, merge : bool = True, cache : 'ResponseCache' = None,
+             client : 'WonderClient' = None, planner : 'QueryPlanner' = None) -> pd.DataFrame:
+        """
+        Send every query of the sweep and combine the results.
+        :param max_workers:         number of queries sent in parallel
+        :param merge:               whether cells that can be served by a single query are merged
+        :param cache:               optional ResponseCache passed on to Request.send
+        :param client:              optional WonderClient passed on to Request.send
+        :param planner:             optional QueryPlanner used to send (and split) every query
+        :returns:                   DataFrame with one column per axis holding the cell's coordinates, followed by
+                                    the columns of Response.as_dataframe, ordered by cell
+        :raises RequestException:   if any of the queries fails
+        :raises ValueError:         if the server reports a row that cannot be attributed to a cell of a merged query
+        """
+        def run(query):
+            coordinates, merged, request = query
+            if planner is not None:
+                df = planner.send(request, cache=cache, client=client)
+            else:
+                df = request.send(cache=cache, client=client).as_dataframe()
+            return self._attribute_rows(df, coordinates, merged)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            frames = list(executor.map(run, self.queries(merge)))
+
+        result = pd.concat(frames, ignore_index=True)
+        return result.sort_values(by="_cell", kind="stable", ignore_index=True).drop(columns="_cell")
+
+    ##################################
+    # Private internal helper methods
+    ##################################
+    @staticmethod
+    def _arguments(value) -> tuple:
+        return tuple(value) if isinstance(value, (list, tuple)) else (value,)
+
+    def _groupings(self) -> typing.List[Grouping]:
+        return [Grouping(value) for value in self._base._b_parameters.values() if value != "*None*"]
+
+    def _query(self, coordinates : dict, merged : typing.List[str]) -> Request:
+        """
+        Private helper returning a copy of the base request with the given axis values applied, that also covers
+        every value of the merged axes and is grouped by them. The groupings are re-applied in any case, so age
+        groupings reflect an age_groups axis.
+        """
+        request = copy.deepcopy(self._base)
+        for name, value in coordinates.items():
+            getattr(request, name)(*RequestSweep._arguments(value))
+        for name in merged:
+            getattr(request, name)(*self._axes[name])
+        groupings = self._groupings()
+        groupings.extend(grouping for grouping in (self._merge_grouping(name) for name in merged) if grouping not in groupings)
+        return request.group_by(*groupings)
+
+    def _mergeable_axes(self) -> typing.List[str]:
+        """
+        Private helper choosing the axes to merge, in axis order, while the merged queries stay within the
+        server's limit on the number of groupings.
+        """
+        groupings = self._groupings()
+        merged = []
+        for name, values in self._axes.items():
+            grouping = self._merge_grouping(name)
+            if grouping is None or (len(values) == 1 and grouping not in groupings):
+                continue
+            if grouping not in groupings:
+                if len(groupings) == RequestSweep.MAX_GROUPINGS:
+                    continue
+                groupings.append(grouping)
+            merged.append(name)
+        return merged
+
+    def _merge_grouping(self, name : str) -> typing.Optional[Grouping]:
+        """
+        Private helper returning the grouping whose row labels identify the values of an axis, or None if
+        the axis cannot be merged.
+        """
+        values = self._axes[name]
+        if len(set(values)) != len(values):
+            return None
+
+        if name in RequestSweep.ENUM_GROUPINGS:
+            (enum, grouping) = RequestSweep.ENUM_GROUPINGS[name]
+            if all(isinstance(value, enum) and value in ENUM_LABELS for value in values):
+                return grouping
+        elif name == "dates":
+            if all(isinstance(value, Dates) and len(value._as_periods()) == 1 and isinstance(value._as_periods()[0], Year)
+                   for value in values):
+                return Grouping.YEAR
+        elif name == "cause_of_death":
+            from cdcwonderpy.icd10code import ICD10Code
+
+            chapters = set(ICD10Code.children(ICD10Code.ALL))
+            if all(value in chapters for value in values):
+                return Grouping.ICD_CHAPTER
+        return None
+
+    @staticmethod
+    def _label(name : str, value) -> str:
+        """
+        Private helper returning the row label the server reports for a value of a merged axis.
+        """
+        if name == "dates":
+            return str(value._as_periods()[0])
+        elif name == "cause_of_death":
+            return f"({value.value})"
+        return ENUM_LABELS[value]
+
+    def _attribute_rows(self, df : pd.DataFrame, coordinates : dict, merged : typing.List[str]) -> pd.DataFrame:
+        """
+        Private helper adding the coordinate columns (and the cell position used to order the rows)
+        to the DataFrame of a query, and dropping the grouping columns that were only added for merging.
+        """
+        base_columns = set(self._base._group_by_column_names)
+        positions = pd.Series(0, index=df.index)
+        columns = dict()
+        for name in self._axes:
+            values = self._axes[name]
+            if name in coordinates:
+                index = pd.Series(values.index(coordinates[name]), index=df.index)
+            else:
+                grouping = self._merge_grouping(name)
+                column = df[grouping.name.capitalize()].astype(str)
+                index = pd.Series(-1, index=df.index)
+                for i, value in enumerate(values):
+                    label = RequestSweep._label(name, value)
+                    matches = column.str.endswith(label) if name == "cause_of_death" else column == label
+                    index[matches] = i
+                if (index < 0).any():
+                    raise ValueError(f"Cannot attribute rows labelled {sorted(set(column[index < 0]))} to values of sweep axis {name}")
+            columns[name] = [values[i] for i in index]
+            positions = positions * len(values) + index
+
+        extra = [self._merge_grouping(name).name.capitalize() for name in merged]
+        df = df.drop(columns=[column for column in extra if column not in base_columns])
+        coordinates_df = pd.DataFrame(columns, index=df.index)
+        coordinates_df["_cell"] = positions
+        return pd.concat([coordinates_df, df], axis=1)
@@ -0,0 +1,199 @@
+import calendar
+import random
+import typing
+from xml.sax.saxutils import escape
+
+from cdcwonderpy.enums import *
+
+class SyntheticResponseGenerator():
+    """
+    * Generates valid, realistic looking D76 response XML for any combination of Groupings, to test and
+    * benchmark response parsing at scales the real server is rarely asked for.
+    *
+    * Rows are the cartesian product of every grouping's labels, nested in grouping order the way the server
+    * lays them out: a label spans all rows of its block through an 'r' (rowspan) attribute. Each row holds
+    * comma formatted Deaths and Population counts and a crude rate with 9 decimals. As on the server:
+    * - counts below 10 are "Suppressed" (unless suppress is False)
+    * - rates computed from fewer than 20 deaths are "Unreliable"
+    * - populations and rates are "Not Applicable" when grouping by Month, Weekday, Autopsy or Place of Death,
+    *   and for rows with a "Not Stated" age or Hispanic origin
+    * With totals, every block is followed by a row adding it up, labelled "Total" in its inner grouping
+    * columns, and the document ends with a grand total row.
+    *
+    * Output is deterministic for a given seed. An instance can be used as the generator of a MockD76Server.
+    """
+    SUPPRESSED_DEATHS = 10
+    UNRELIABLE_DEATHS = 20
+    TOTAL_LABEL = "Total"
+    NOT_STATED_LABEL = "Not Stated"
+
+    NOT_APPLICABLE_GROUPINGS = [Grouping.MONTH, Grouping.WEEKDAY, Grouping.AUTOPSY, Grouping.PLACE_OF_DEATH]
+
+    def __init__(self, seed : int = 0, suppress : bool = True, totals : bool = False, mean_deaths : float = 200):
+        """
+        Create a generator.
+        :param seed:            seed of the generated values
+        :param suppress:        whether counts below 10 are suppressed
+        :param totals:          whether total rows are included
+        :param mean_deaths:     mean of the (exponentially distributed) number of deaths per row
+        """
+        self.seed = seed
+        self.suppress = suppress
+        self.totals = totals
+        self.mean_deaths = mean_deaths
+
+    def __call__(self, request : 'Request') -> str:
+        """
+        Generate a response for a request's groupings. Its filters are ignored.
+        :param request: the Request to answer
+        :returns:       the response XML
+        """
+        return self.xml([Grouping(value) for value in request._b_parameters.values() if value != "*None*"])
+
+    @staticmethod
+    def labels(grouping : Grouping) -> typing.List[str]:
+        """
+        Returns the row labels generated for a grouping, in server order.
+        :param grouping:    the Grouping
+        :returns:           list of labels
+        """
+        if grouping == Grouping.YEAR:
+            return [str(year) for year in range(1999, 2019)]
+        elif grouping == Grouping.MONTH:
+            return [f"{calendar.month_abbr[month]}., {year}" for year in range(1999, 2019) for month in range(1, 13)]
+        elif grouping == Grouping.TEN_YEAR_AGE_GROUPS:
+            return SyntheticResponseGenerator._age_labels([1, 5] + list(range(15, 86, 10)))
+        elif grouping == Grouping.FIVE_YEAR_AGE_GROUPS:
+            return SyntheticResponseGenerator._age_labels([1] + list(range(5, 101, 5)))
+        elif grouping == Grouping.SINGLE_YEAR_AGE_GROUPS:
+            return ["< 1 year", "1 year"] + [f"{age} years" for age in range(2, 100)] + ["100+ years", SyntheticResponseGenerator.NOT_STATED_LABEL]
+        elif grouping in [Grouping.ICD_CHAPTER, Grouping.ICD_SUBCHAPTER, Grouping.CAUSE_OF_DEATH]:
+            return SyntheticResponseGenerator._icd10_labels(grouping)
+        elif grouping in SyntheticResponseGenerator._ENUM_GROUPINGS:
+            enum = SyntheticResponseGenerator._ENUM_GROUPINGS[grouping]
+            return [ENUM_LABELS.get(member, member.name.replace("_", " ").title()) for member in enum if member.value != "*All*"]
+
+        from cdcwonderpy.planner import QueryPlanner
+
+        title = grouping.name.replace("_", " ").capitalize()
+        return [f"{title} {i}" for i in range(1, QueryPlanner.DEFAULT_CARDINALITIES[grouping] + 1)]
+
+    def rows(self, groupings : typing.List[Grouping]) -> int:
+        """
+        Returns the number of rows (total rows included) of the full response for the given groupings.
+        :param groupings:   the Groupings
+        :returns:           number of rows
+        """
+        if not groupings:
+            return 1
+        label_lists = [SyntheticResponseGenerator.labels(grouping) for grouping in groupings]
+        return len(label_lists[0]) * self._spans(label_lists)[0] + (1 if self.totals else 0)
+
+    def xml(self, groupings : typing.List[Grouping], rows : int = None) -> str:
+        """
+        Generate a response.
+        :param groupings:   the Groupings of the response, outermost first
+        :param rows:        if given, only the first rows rows are generated, with rowspans ending at the last one
+        :returns:           the response XML
+        """
+        limit = self.rows(groupings) if rows is None else min(rows, self.rows(groupings))
+        rng = random.Random(self.seed)
+        out = []
+        if not groupings:
+            out.append("<r>" + self._measure_cells(*self._draw(rng, True)) + "</r>")
+        else:
+            label_lists = [SyntheticResponseGenerator.labels(grouping) for grouping in groupings]
+            applicable = not any(grouping in SyntheticResponseGenerator.NOT_APPLICABLE_GROUPINGS for grouping in groupings)
+            deaths, population = self._block(rng, label_lists, self._spans(label_lists), 0, [], applicable, out, limit)
+            if self.totals and len(out) < limit:
+                total_labels = "".join(f'<c l="{SyntheticResponseGenerator.TOTAL_LABEL}"/>' for _ in groupings)
+                out.append("<r>" + total_labels + self._measure_cells(deaths, population) + "</r>")
+        return '<?xml version="1.0"?>\n<page><response><data-table>\n' + "\n".join(out) + "\n</data-table></response></page>"
+
+    ##################################
+    # Private internal helper methods
+    ##################################
+    _ENUM_GROUPINGS = {
+        Grouping.GENDER: Gender,
+        Grouping.RACE: Race,
+        Grouping.HISPANIC_ORIGIN: HispanicOrigin,
+        Grouping.WEEKDAY: Weekday,
+        Grouping.AUTOPSY: Autopsy,
+        Grouping.PLACE_OF_DEATH: PlaceOfDeath,
+    }
+
+    @staticmethod
+    def _age_labels(starts : typing.List[int]) -> typing.List[str]:
+        """
+        Private helper returning the labels of age groups starting at the given ages, below 1 year,
+        above the last start and not stated ages included.
+        """
+        labels = ["< 1 year"] + [f"{start}-{end - 1} years" for start, end in zip(starts, starts[1:])]
+        return labels + [f"{starts[-1]}+ years", SyntheticResponseGenerator.NOT_STATED_LABEL]
+
+    @staticmethod
+    def _icd10_labels(grouping : Grouping) -> typing.List[str]:
+        from cdcwonderpy.icd10code import ICD10Code
+        from cdcwonderpy.planner import QueryPlanner
+
+        level = {Grouping.ICD_CHAPTER: "chapters", Grouping.ICD_SUBCHAPTER: "subchapters", Grouping.CAUSE_OF_DEATH: "causes"}[grouping]
+        codes = ICD10Code._hierarchy()["codes"]
+        return [f"{ICD10Code.description(codes[i])} ({codes[i].value})" for i in QueryPlanner._icd10_levels()[level]]
+
+    def _spans(self, label_lists : typing.List[typing.List[str]]) -> typing.List[int]:
+        """
+        Private helper returning the number of rows a label of each grouping spans.
+        """
+        spans = [1] * len(label_lists)
+        for depth in range(len(label_lists) - 2, -1, -1):
+            spans[depth] = len(label_lists[depth + 1]) * spans[depth + 1] + (1 if self.totals else 0)
+        return spans
+
+    def _block(self, rng : random.Random, label_lists : typing.List[typing.List[str]], spans : typing.List[int], depth : int,
+               pending : typing.List[str], applicable : bool, out : typing.List[str], limit : int) -> typing.Tuple[int, typing.Optional[int]]:
+        """
+        Private helper appending the rows of every label of a grouping to out, nested labels included, until
+        limit rows exist. pending holds the label cells of outer groupings that start on the next row.
+        Returns the deaths and population (None if not applicable) of the appended rows.
+        """
+        deaths, population = 0, 0
+        last = depth == len(label_lists) - 1
+        for label in label_lists[depth]:
+            if len(out) == limit:
+                break
+            span = min(spans[depth], limit - len(out))
+            cells = pending + [f'<c l="{escape(label)}"' + (f' r="{span}"/>' if span > 1 else '/>')]
+            pending = []
+            label_applicable = applicable and label != SyntheticResponseGenerator.NOT_STATED_LABEL
+
+            if last:
+                block_deaths, block_population = self._draw(rng, label_applicable)
+                out.append("<r>" + "".join(cells) + self._measure_cells(block_deaths, block_population) + "</r>")
+            else:
+                block_deaths, block_population = self._block(rng, label_lists, spans, depth + 1, cells, label_applicable, out, limit)
+                if self.totals and len(out) < limit:
+                    total_labels = "".join(f'<c l="{SyntheticResponseGenerator.TOTAL_LABEL}"/>' for _ in range(len(label_lists) - depth - 1))
+                    out.append("<r>" + total_labels + self._measure_cells(block_deaths, block_population) + "</r>")
+
+            deaths += block_deaths
+            population = None if population is None or block_population is None else population + block_population
+        return deaths, population
+
+    def _draw(self, rng : random.Random, applicable : bool) -> typing.Tuple[int, typing.Optional[int]]:
+        deaths = int(rng.expovariate(1 / self.mean_deaths))
+        population = rng.randint(10000, 10000000)
+        return deaths, population if applicable else None
+
+    def _measure_cells(self, deaths : int, population : typing.Optional[int]) -> str:
+        """
+        Private helper formatting the Deaths, Population and Crude Rate cells of a row.
+        """
+        if self.suppress and deaths < SyntheticResponseGenerator.SUPPRESSED_DEATHS:
+            return '<c v="Suppressed"/>' * 3
+        if population is None:
+            return f'<c v="{deaths:,}"/><c v="Not Applicable"/><c v="Not Applicable"/>'
+        if deaths < SyntheticResponseGenerator.UNRELIABLE_DEATHS:
+            rate = "Unreliable"
+        else:
+            rate = f"{deaths / population * 100000:.9f}"
+        return f'<c v="{deaths:,}"/><c v="{population:,}"/><c v="{rate}"/>'
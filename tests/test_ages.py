@@ -0,0 +1,59 @@
+from cdcwonderpy.ages import Ages
+from cdcwonderpy.enums import Grouping
+import copy
+import pickle
+import unittest
+
+# Testing the Ages bitmask representation
+class AgesTests(unittest.TestCase):
+    def test_set_operations(self):
+        first = Ages.range(10, 20)
+        second = Ages.range(15, 30).union(Ages.single(40))
+        self.assertEqual(first.union(second).as_list(), list(range(10, 31)) + [40])
+        self.assertEqual(first.intersection(second).as_list(), list(range(15, 21)))
+        self.assertEqual(first.difference(second).as_list(), list(range(10, 15)))
+        self.assertEqual(second.difference(first).as_list(), list(range(21, 31)) + [40])
+        self.assertEqual(first.as_list(), list(range(10, 21)))
+        with self.assertRaises(TypeError):
+            first.intersection([15])
+        with self.assertRaises(TypeError):
+            first.difference(None)
+
+    def test_contains_and_len(self):
+        ages = Ages.range(1, 5).union(Ages.single(99))
+        self.assertEqual(len(ages), 6)
+        self.assertEqual(len(Ages()), 0)
+        self.assertIn(1, ages)
+        self.assertIn(99, ages)
+        self.assertNotIn(0, ages)
+        self.assertNotIn(6, ages)
+        self.assertNotIn(100, ages)
+        self.assertNotIn("1", ages)
+
+    def test_repr_extracts_runs(self):
+        ages = Ages.range(15, 44).union(Ages.single(50)).union(Ages.range(97, 99))
+        self.assertEqual(repr(ages), "['15-44', '50', '97-99']")
+        self.assertEqual(repr(Ages.single(1)), "['1']")
+
+    def test_age_group_validation(self):
+        self.assertTrue(Ages.range(15, 44)._is_valid_age_group(Grouping.TEN_YEAR_AGE_GROUPS))
+        self.assertFalse(Ages.range(15, 39)._is_valid_age_group(Grouping.TEN_YEAR_AGE_GROUPS))
+        self.assertTrue(Ages.range(15, 39)._is_valid_age_group(Grouping.FIVE_YEAR_AGE_GROUPS))
+        self.assertFalse(Ages.range(15, 38)._is_valid_age_group(Grouping.FIVE_YEAR_AGE_GROUPS))
+        self.assertTrue(Ages.range(15, 38)._is_valid_age_group(Grouping.SINGLE_YEAR_AGE_GROUPS))
+        self.assertFalse(Ages.range(10, 19)._is_valid_age_group(Grouping.TEN_YEAR_AGE_GROUPS))
+        self.assertEqual(Ages.range(15, 34)._as_age_group_type(Grouping.TEN_YEAR_AGE_GROUPS),
+                         [list(range(15, 25)), list(range(25, 35))])
+        with self.assertRaises(ValueError):
+            Ages.range(15, 38)._as_age_group_type(Grouping.FIVE_YEAR_AGE_GROUPS)
+        with self.assertRaises(TypeError):
+            Ages.range(15, 38)._is_valid_age_group(Grouping.YEAR)
+
+    def test_value_semantics(self):
+        ages = Ages.range(20, 29)
+        self.assertEqual(ages, Ages.range(20, 24).union(Ages.range(25, 29)))
+        self.assertEqual(len({ages, Ages.range(20, 29)}), 1)
+        self.assertEqual(copy.deepcopy(ages), ages)
+        self.assertEqual(pickle.loads(pickle.dumps(ages)), ages)
+        with self.assertRaises(AttributeError):
+            ages._age_set = set()
@@ -0,0 +1,112 @@
+import cdcwonderpy as wonder
+from cdcwonderpy.enums import *
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from requests import RequestException
+from urllib.parse import parse_qs
+import asyncio
+import re
+import threading
+import time
+import unittest
+
+class StubD76Handler(BaseHTTPRequestHandler):
+    """
+    Replays tests/sample_response.xml, except for requests filtered by gender which get a one row
+    response naming the gender (answered slowest first, so completion order differs from send order).
+    Gender "X" fails and gender "S" is answered after a second.
+    """
+    sample_xml = open("tests/sample_response.xml").read()
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        cls = StubD76Handler
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+
+        body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+        request_xml = parse_qs(body)["request_xml"][0]
+        gender = re.search(r"<name>V_D76.V7</name>\n<value>([^<]*)</value>", request_xml).group(1)
+
+        if gender == "X":
+            status, xml = 500, "<page><message>Stub failure</message></page>"
+        elif gender == "S":
+            time.sleep(1)
+            status, xml = 200, cls.sample_xml
+        elif gender != "*All*":
+            time.sleep({"M": 0.2, "F": 0.1}.get(gender, 0))
+            status, xml = 200, f'<page><data-table><r><c l="{gender}"/><c v="1"/><c v="2"/><c v="3"/></r></data-table></page>'
+        else:
+            time.sleep(0.05)
+            status, xml = 200, cls.sample_xml
+
+        with cls.lock:
+            cls.in_flight -= 1
+
+        self.send_response(status)
+        self.send_header("Content-Type", "text/xml; charset=utf-8")
+        self.end_headers()
+        self.wfile.write(xml.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+# Testing the asynchronous send path against a local stub server
+class AsyncSendTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubD76Handler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}/controller/datarequest/D76"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_send_async(self):
+        request = wonder.Request().group_by(Grouping.YEAR, Grouping.RACE)
+        response = asyncio.run(request.send_async(url=AsyncSendTests.url))
+        self.assertEqual(response.as_xml(), StubD76Handler.sample_xml)
+        self.assertEqual(response.as_2d_list()[0][:2], ['1999', 'American Indian or Alaska Native'])
+
+    def test_send_async_error(self):
+        request = wonder.Request()
+        request._v_parameters["V_D76.V7"] = "X"
+        with self.assertRaises(RequestException):
+            asyncio.run(request.send_async(url=AsyncSendTests.url))
+
+    def test_gather_requests_order_and_concurrency(self):
+        StubD76Handler.max_in_flight = 0
+        requests = [wonder.Request().group_by(Grouping.GENDER).gender(gender) for gender in [Gender.MALE, Gender.FEMALE]] * 3
+        responses = asyncio.run(wonder.gather_requests(requests, concurrency=2, rate=None, url=AsyncSendTests.url))
+        self.assertEqual([response.as_2d_list()[0][0] for response in responses], ["M", "F"] * 3)
+        self.assertEqual(StubD76Handler.max_in_flight, 2)
+
+    def test_gather_requests_rate_limit(self):
+        requests = [wonder.Request() for _ in range(5)]
+        start = time.monotonic()
+        responses = asyncio.run(wonder.gather_requests(requests, concurrency=5, rate=20, burst=1, url=AsyncSendTests.url))
+        self.assertGreaterEqual(time.monotonic() - start, 4 / 20)
+        self.assertEqual(len(responses), 5)
+
+    def test_send_async_read_timeout(self):
+        request = wonder.Request()
+        request._v_parameters["V_D76.V7"] = "S"
+        request._o_parameters["O_timeout"] = "0.2"
+        wonder.WonderClient.set_default(wonder.WonderClient(read_timeout_margin=0.1))
+        try:
+            start = time.monotonic()
+            with self.assertRaises(asyncio.TimeoutError):
+                asyncio.run(request.send_async(url=AsyncSendTests.url))
+            # Aborted after O_timeout plus the margin, well before the server answers.
+            self.assertTrue(0.3 <= time.monotonic() - start < 0.9)
+
+            with self.assertRaises(asyncio.TimeoutError):
+                asyncio.run(wonder.gather_requests([request], url=AsyncSendTests.url))
+        finally:
+            wonder.WonderClient.default().close()
+            wonder.WonderClient.set_default(None)
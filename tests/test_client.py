@@ -0,0 +1,80 @@
+import cdcwonderpy as wonder
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from requests import RequestException
+import threading
+import unittest
+
+class FlakyD76Handler(BaseHTTPRequestHandler):
+    """
+    Keep-alive stub that answers the first `failures` requests with `failure_status`, then replays
+    tests/sample_response.xml. Records the client port of every request to detect connection reuse.
+    """
+    protocol_version = "HTTP/1.1"
+    sample_xml = open("tests/sample_response.xml").read()
+    failures = 0
+    failure_status = 503
+    client_ports = []
+
+    def do_POST(self):
+        cls = FlakyD76Handler
+        self.rfile.read(int(self.headers["Content-Length"]))
+        cls.client_ports.append(self.client_address[1])
+
+        if cls.failures > 0:
+            cls.failures -= 1
+            status, body = cls.failure_status, b"<page><message>Try again later</message></page>"
+        else:
+            status, body = 200, cls.sample_xml.encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "text/xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+# Testing the pooled HTTP client
+class WonderClientTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyD76Handler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}/controller/datarequest/D76"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        FlakyD76Handler.failures = 0
+        FlakyD76Handler.failure_status = 503
+        FlakyD76Handler.client_ports = []
+
+    def test_keep_alive(self):
+        with wonder.WonderClient(url=WonderClientTests.url) as client:
+            for _ in range(3):
+                response = wonder.Request().send(client=client)
+                self.assertEqual(len(response.as_2d_list()), 80)
+        self.assertEqual(len(set(FlakyD76Handler.client_ports)), 1)
+
+    def test_retries_with_backoff(self):
+        FlakyD76Handler.failures = 2
+        with wonder.WonderClient(url=WonderClientTests.url, retries=2, backoff=0.01) as client:
+            response = wonder.Request().send(client=client)
+        self.assertEqual(response.as_xml(), FlakyD76Handler.sample_xml)
+        self.assertEqual(len(FlakyD76Handler.client_ports), 3)
+
+    def test_retries_exhausted(self):
+        FlakyD76Handler.failures = 5
+        FlakyD76Handler.failure_status = 429
+        with wonder.WonderClient(url=WonderClientTests.url, retries=1, backoff=0.01) as client:
+            with self.assertRaises(RequestException):
+                wonder.Request().send(client=client)
+        self.assertEqual(len(FlakyD76Handler.client_ports), 2)
+
+    def test_default_client_is_shared(self):
+        self.assertIs(wonder.WonderClient.default(), wonder.WonderClient.default())
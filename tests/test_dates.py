@@ -0,0 +1,59 @@
+import cdcwonderpy as wonder
+from cdcwonderpy.dates import *
+import copy
+import unittest
+
+# Testing the interval representation of Dates
+class DatesTests(unittest.TestCase):
+    def test_range_and_single(self):
+        dates = Dates.range(YearAndMonth(2001, 11), YearAndMonth(2002, 2))
+        self.assertEqual(dates.get_months(), [YearAndMonth(2001, 11), YearAndMonth(2001, 12), YearAndMonth(2002, 1), YearAndMonth(2002, 2)])
+        self.assertEqual(len(Dates.range(Year(1999), Year(2018))), 240)
+        self.assertEqual(Dates.single(Year(2005)), Dates.range(YearAndMonth(2005, 1), YearAndMonth(2005, 12)))
+        self.assertEqual(Dates.single(YearAndMonth(2005, 3)).get_months(), [YearAndMonth(2005, 3)])
+        self.assertEqual(len(Dates()), 0)
+        with self.assertRaises(ValueError):
+            Dates.range(Year(2005), Year(2004))
+        with self.assertRaises(TypeError):
+            Dates.range(Year(2005), YearAndMonth(2006, 1))
+
+    def test_set_operations(self):
+        first = Dates.range(YearAndMonth(2000, 1), YearAndMonth(2000, 6)).union(Dates.single(Year(2003)))
+        second = Dates.range(YearAndMonth(2000, 7), YearAndMonth(2001, 2))
+        union = first.union(second)
+        self.assertEqual(union._intervals, ((2000 * 12, 2001 * 12 + 1), (2003 * 12, 2003 * 12 + 11)))
+        self.assertEqual(union, Dates.range(YearAndMonth(2000, 1), YearAndMonth(2001, 2)).union(Dates.single(Year(2003))))
+        self.assertEqual(len(first.intersection(second)), 0)
+        self.assertEqual(union.intersection(Dates.range(YearAndMonth(2000, 12), YearAndMonth(2003, 1))).get_months(),
+                         [YearAndMonth(2000, 12), YearAndMonth(2001, 1), YearAndMonth(2001, 2), YearAndMonth(2003, 1)])
+        with self.assertRaises(TypeError):
+            first.intersection([YearAndMonth(2000, 1)])
+
+    def test_contains(self):
+        dates = Dates.range(YearAndMonth(2000, 3), YearAndMonth(2001, 12))
+        self.assertIn(YearAndMonth(2000, 3), dates)
+        self.assertIn(YearAndMonth(2001, 12), dates)
+        self.assertNotIn(YearAndMonth(2000, 2), dates)
+        self.assertNotIn(YearAndMonth(2002, 1), dates)
+        self.assertIn(Year(2001), dates)
+        self.assertNotIn(Year(2000), dates)
+        self.assertNotIn(2001, dates)
+
+    def test_periods_ordering_and_hashing(self):
+        self.assertLess(YearAndMonth(2000, 12), YearAndMonth(2001, 1))
+        self.assertGreaterEqual(YearAndMonth(2001, 1), YearAndMonth(2001, 1))
+        self.assertLess(Year(1999), Year(2000))
+        self.assertEqual(sorted([Year(2003), Year(2001)]), [Year(2001), Year(2003)])
+        self.assertEqual({YearAndMonth(2001, 1): 1}[YearAndMonth(2001, 1)], 1)
+        self.assertEqual(len({Year(2001), Year(2001), Year(2002)}), 2)
+        self.assertEqual(copy.deepcopy(YearAndMonth(2001, 1)), YearAndMonth(2001, 1))
+        with self.assertRaises(TypeError):
+            Year(2001) < YearAndMonth(2001, 1)
+        with self.assertRaises(AttributeError):
+            Year(2001).month = 1
+
+    def test_request_compacts_whole_years(self):
+        request = wonder.Request().dates(Dates.range(YearAndMonth(2000, 11), YearAndMonth(2002, 2)), Dates.single(Year(2005)))
+        self.assertEqual(request._f_parameters["F_D76.V1"], ["2000/11", "2000/12", "2001", "2002/01", "2002/02", "2005"])
+        with self.assertRaises(ValueError):
+            wonder.Request().dates(Dates.range(YearAndMonth(2018, 6), YearAndMonth(2019, 1)))
@@ -0,0 +1,52 @@
+from cdcwonderpy.icd10code import ICD10Code
+from cdcwonderpy.icd10labels import LabelStore
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import unittest
+
+# Testing the memory-mapped ICD-10 label store
+class LabelStoreTests(unittest.TestCase):
+    def test_matches_pickled_labels(self):
+        with open(os.path.join("resources", "ICD10CodeToLabels.pickle"), "rb") as f:
+            labels = pickle.load(f)
+        store = LabelStore()
+        self.assertEqual(len(store), len(labels))
+        self.assertEqual(dict(store), labels)
+        self.assertEqual(store.lookup_many(list(labels)), list(labels.values()))
+        self.assertEqual(ICD10Code.description(ICD10Code.C88_0), labels["C88.0"])
+
+    def test_lookups(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "labels.bin")
+            LabelStore.write(path, {"B01": "Varicella", "A00.0": "Cholera", "*All*": "All", "C88.0": "Waldenström"})
+            store = LabelStore(path)
+            self.assertEqual(list(store), ["*All*", "A00.0", "B01", "C88.0"])
+            self.assertEqual(store["C88.0"], "Waldenström")
+            self.assertEqual(store.get("A00"), None)
+            self.assertIn("B01", store)
+            self.assertNotIn("B01.0", store)
+            self.assertNotIn("B01.00000", store)
+            self.assertEqual(store.lookup_many(["C88.0", "B01"]), ["Waldenström", "Varicella"])
+            with self.assertRaises(KeyError):
+                store["Z99"]
+            with self.assertRaises(KeyError):
+                store.lookup_many(["B01", "Z99"])
+
+    def test_rejects_other_files(self):
+        with tempfile.NamedTemporaryFile(suffix=".pickle", delete=False) as f:
+            pickle.dump({"A00": "Cholera"}, f)
+        try:
+            with self.assertRaises(ValueError):
+                LabelStore(f.name)
+        finally:
+            os.remove(f.name)
+
+    def test_independent_of_working_directory(self):
+        package = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        with tempfile.TemporaryDirectory() as directory:
+            result = subprocess.run([sys.executable, "-c", "from cdcwonderpy.icd10code import ICD10Code; print(ICD10Code.description(ICD10Code.A00_0))"],
+                                    cwd=directory, env=dict(os.environ, PYTHONPATH=package), capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "Cholera due to Vibrio cholerae 01, biovar cholerae")
@@ -0,0 +1,62 @@
+from cdcwonderpy.icd10code import ICD10Code
+import copy
+import pickle
+import subprocess
+import sys
+import unittest
+
+# Testing the lazily built ICD10Code registry
+class ICD10CodeImportTests(unittest.TestCase):
+    # Importing the module (excluding the cdcwonderpy package itself) used to take over 200 ms.
+    max_import_microseconds = 50000
+
+    def import_time(self) -> int:
+        """
+        Import cdcwonderpy.icd10code in a fresh interpreter and return the time, in microseconds, spent in the
+        module according to python -X importtime.
+        """
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import cdcwonderpy.icd10code"],
+                                capture_output=True, text=True, check=True)
+        total = 0
+        for line in result.stderr.splitlines():
+            fields = [field.strip() for field in line.split("|")]
+            if fields[-1] == "cdcwonderpy.icd10code":
+                total += int(fields[0].split(":")[-1])
+        return total
+
+    def test_import_time(self):
+        # The first run may compile the modules, so keep the best of a few.
+        self.assertLess(min(self.import_time() for _ in range(3)), ICD10CodeImportTests.max_import_microseconds)
+
+    def test_enum_behaviour(self):
+        self.assertEqual(len(ICD10Code), 9601)
+        self.assertEqual(list(ICD10Code)[:3], [ICD10Code.ALL, ICD10Code.A00_B99, ICD10Code.A00_A09])
+        self.assertEqual(list(reversed(ICD10Code))[0], ICD10Code.Y89_9)
+        self.assertIs(ICD10Code("A00.0"), ICD10Code.A00_0)
+        self.assertIs(ICD10Code["A00_0"], ICD10Code.A00_0)
+        self.assertIs(ICD10Code(ICD10Code.A00_0), ICD10Code.A00_0)
+        self.assertEqual(ICD10Code.A00_0.name, "A00_0")
+        self.assertEqual(ICD10Code.A00_0.value, "A00.0")
+        self.assertEqual(ICD10Code.ALL.value, "*All*")
+        self.assertIn(ICD10Code.A00, ICD10Code)
+        self.assertNotIn("A00", ICD10Code)
+        self.assertIsInstance(ICD10Code.A00, ICD10Code)
+        self.assertNotEqual(ICD10Code.A00, ICD10Code.A01)
+        self.assertEqual(len({ICD10Code.A00, ICD10Code("A00"), ICD10Code.A01}), 2)
+        self.assertIn("A00_0", dir(ICD10Code))
+        self.assertEqual(len(ICD10Code.__members__), 9601)
+
+    def test_invalid_lookups(self):
+        with self.assertRaises(AttributeError):
+            ICD10Code.NOT_A_CODE
+        with self.assertRaises(KeyError):
+            ICD10Code["NOT_A_CODE"]
+        with self.assertRaises(ValueError):
+            ICD10Code("Z99.9")
+        with self.assertRaises(AttributeError):
+            ICD10Code.A00.extra = 1
+
+    def test_members_are_singletons(self):
+        self.assertIs(pickle.loads(pickle.dumps(ICD10Code.A00_0)), ICD10Code.A00_0)
+        self.assertIs(copy.deepcopy([ICD10Code.B01])[0], ICD10Code.B01)
+        self.assertIs(copy.copy(ICD10Code.B01), ICD10Code.B01)
@@ -0,0 +1,150 @@
+import cdcwonderpy as wonder
+from cdcwonderpy.enums import *
+from requests import RequestException
+import asyncio
+import os
+import tempfile
+import unittest
+
+# Testing request life cycle instrumentation and the built-in collectors
+class InstrumentationTests(unittest.TestCase):
+    sample_xml = open("tests/sample_response.xml").read()
+
+    def setUp(self):
+        self.server = wonder.MockD76Server(generator=lambda request: InstrumentationTests.sample_xml, latency=0.05)
+        self.server.start()
+        self.client = wonder.WonderClient(url=self.server.url, retries=0)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_hooks(self):
+        class Recorder(wonder.Instrumentation):
+            def __init__(self):
+                self.events = []
+
+            def on_build(self, request, context, seconds, size):
+                context["id"] = len(self.events)
+                self.events.append(("build", size))
+
+            def on_first_byte(self, request, context, seconds):
+                self.events.append(("first_byte", context["id"], seconds >= 0.05))
+
+            def on_response(self, request, context, status_code, seconds, size):
+                self.events.append(("response", context["id"], status_code, size))
+
+            def on_parse(self, response, seconds, rows):
+                self.events.append(("parse", rows))
+
+        request = wonder.Request().group_by(Grouping.YEAR, Grouping.RACE)
+        with Recorder() as recorder:
+            self.assertEqual(wonder.Instrumentation.installed(), [recorder])
+            response = request.send(client=self.client)
+            response.as_2d_list()
+            response.as_2d_list()
+        self.assertEqual(wonder.Instrumentation.installed(), [])
+
+        size = len(InstrumentationTests.sample_xml.encode("utf-8"))
+        self.assertEqual(recorder.events, [("build", len(request.to_xml())), ("first_byte", 0, True),
+                                           ("response", 0, 200, size), ("parse", 80)])
+
+        # Nothing is reported once uninstalled.
+        request.send(client=self.client).as_dataframe()
+        self.assertEqual(len(recorder.events), 4)
+
+    def test_histograms(self):
+        with wonder.HistogramCollector() as metrics:
+            for _ in range(3):
+                wonder.Request().group_by(Grouping.YEAR, Grouping.RACE).send(client=self.client).as_dataframe()
+            asyncio.run(wonder.Request().send_async(url=self.server.url))
+
+        histograms = metrics.histograms()
+        self.assertEqual(histograms["build_seconds"]["count"], 4)
+        self.assertEqual(histograms["response_seconds"]["count"], 4)
+        self.assertGreaterEqual(histograms["first_byte_seconds"]["sum"], 4 * 0.05)
+        self.assertEqual(histograms["parse_rows"]["count"], 3)
+        self.assertEqual(histograms["parse_rows"]["sum"], 240)
+        self.assertEqual(histograms["parse_rows"]["buckets"][2], (100, 3))
+        self.assertEqual(histograms["response_bytes"]["buckets"][-1], (float("inf"), 4))
+        self.assertEqual(metrics.status_codes(), {200: 4})
+
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE cdcwonder_parse_rows histogram\n", text)
+        self.assertIn('cdcwonder_parse_rows_bucket{le="10.0"} 0\n', text)
+        self.assertIn('cdcwonder_parse_rows_bucket{le="+Inf"} 3\n', text)
+        self.assertIn("cdcwonder_parse_rows_sum 240\n", text)
+        self.assertIn('cdcwonder_responses_total{status="200"} 4\n', text)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cdcwonder.prom")
+            metrics.write_prometheus(path)
+            self.assertEqual(open(path).read(), text)
+            self.assertEqual(os.listdir(directory), ["cdcwonder.prom"])
+
+        metrics.reset()
+        self.assertEqual(metrics.histograms()["build_seconds"]["count"], 0)
+
+    def test_spans(self):
+        exported = []
+        with wonder.SpanCollector(exporter=exported.append) as tracer:
+            wonder.Request().group_by(Grouping.YEAR, Grouping.RACE).send(client=self.client).as_2d_list()
+
+        spans = {span["name"]: span for span in tracer.spans()}
+        self.assertEqual(exported, tracer.spans())
+        self.assertEqual(list(spans), ["cdcwonder.build", "cdcwonder.send", "cdcwonder.request", "cdcwonder.parse"])
+
+        root = spans["cdcwonder.request"]
+        self.assertIsNone(root["parent_span_id"])
+        self.assertEqual(root["attributes"]["cdcwonder.groupings"], "Year,Race")
+        for name in ["cdcwonder.build", "cdcwonder.send"]:
+            self.assertEqual(spans[name]["trace_id"], root["trace_id"])
+            self.assertEqual(spans[name]["parent_span_id"], root["span_id"])
+            self.assertLessEqual(root["start_time_unix_nano"], spans[name]["start_time_unix_nano"])
+            self.assertLessEqual(spans[name]["end_time_unix_nano"], root["end_time_unix_nano"])
+
+        send = spans["cdcwonder.send"]
+        self.assertGreaterEqual(send["end_time_unix_nano"] - send["start_time_unix_nano"], 0.05 * 1e9)
+        self.assertEqual(send["attributes"]["http.status_code"], 200)
+        self.assertEqual([event["name"] for event in send["events"]], ["first_byte"])
+        self.assertTrue(send["start_time_unix_nano"] <= send["events"][0]["time_unix_nano"] <= send["end_time_unix_nano"])
+
+        self.assertNotEqual(spans["cdcwonder.parse"]["trace_id"], root["trace_id"])
+        self.assertEqual(spans["cdcwonder.parse"]["attributes"]["cdcwonder.rows"], 80)
+
+        tracer.clear()
+        self.assertEqual(tracer.spans(), [])
+
+    def test_errors(self):
+        # Nothing listens on the port of a stopped server.
+        self.server.stop()
+        request = wonder.Request().group_by(Grouping.YEAR, Grouping.RACE)
+        exported = []
+        with wonder.HistogramCollector() as metrics, wonder.SpanCollector(exporter=exported.append):
+            with self.assertRaises(RequestException):
+                request.send(client=self.client)
+
+        self.assertEqual(metrics.histograms()["response_seconds"]["count"], 0)
+        self.assertEqual(metrics.errors(), {"ConnectionError": 1})
+        self.assertIn('cdcwonder_errors_total{exception="ConnectionError"} 1\n', metrics.to_prometheus())
+        metrics.reset()
+        self.assertEqual(metrics.errors(), {})
+
+        spans = {span["name"]: span for span in exported}
+        self.assertEqual(list(spans), ["cdcwonder.build", "cdcwonder.send", "cdcwonder.request"])
+        for name in ["cdcwonder.send", "cdcwonder.request"]:
+            self.assertEqual(spans[name]["status"]["code"], "STATUS_CODE_ERROR")
+            self.assertEqual(spans[name]["attributes"]["error.type"], "ConnectionError")
+
+    def test_installed_during_request(self):
+        tracer = wonder.SpanCollector()
+
+        class Installer(wonder.Instrumentation):
+            def on_build(self, request, context, seconds, size):
+                wonder.Instrumentation.install(tracer)
+
+        with Installer():
+            wonder.Request().send(client=self.client)
+        self.assertEqual(tracer.spans(), [])
+        self.assertIn(tracer, wonder.Instrumentation.installed())
+        wonder.Instrumentation.uninstall(tracer)
@@ -0,0 +1,80 @@
+import cdcwonderpy as wonder
+from cdcwonderpy.enums import *
+from requests import RequestException
+import asyncio
+import os
+import requests
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+# Testing the local D76 stand-in
+class MockD76ServerTests(unittest.TestCase):
+    sample_xml = open("tests/sample_response.xml").read()
+
+    def test_replays_recordings(self):
+        request = wonder.Request().group_by(Grouping.YEAR, Grouping.RACE).race(Race.WHITE, Race.ASIAN_OR_PACIFIC_ISLANDER)
+        with wonder.MockD76Server(recordings={request: MockD76ServerTests.sample_xml}) as server, \
+                wonder.WonderClient(url=server.url, retries=0) as client:
+            same_data = wonder.Request().race(Race.ASIAN_OR_PACIFIC_ISLANDER, Race.WHITE).group_by(Grouping.YEAR, Grouping.RACE)
+            self.assertEqual(same_data.send(client=client).as_xml(), MockD76ServerTests.sample_xml)
+            with self.assertRaises(RequestException):
+                wonder.Request().send(client=client)
+            self.assertEqual(server.requests_received, 2)
+
+    def test_replays_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = wonder.ResponseCache(directory)
+            cache.put(wonder.Request(), MockD76ServerTests.sample_xml)
+            with wonder.MockD76Server(recordings=cache) as server, wonder.WonderClient(url=server.url) as client:
+                self.assertEqual(wonder.Request().send(client=client).as_xml(), MockD76ServerTests.sample_xml)
+            cache.close()
+
+    def test_generator(self):
+        generator = lambda request: f'<page><data-table><r><c l="{len(request._group_by_column_names)}"/><c v="1"/><c v="2"/><c v="3"/></r></data-table></page>'
+        with wonder.MockD76Server(generator=generator) as server, wonder.WonderClient(url=server.url) as client:
+            response = wonder.Request().group_by(Grouping.YEAR, Grouping.GENDER).send(client=client)
+            self.assertEqual(response.as_2d_list(), [["2", 1.0, 2.0, 3.0]])
+
+            # Requests the server cannot parse are rejected with a message.
+            reply = requests.post(server.url, data={"request_xml": "<request-parameters><parameter><name>X</name></parameter></request-parameters>"})
+            self.assertEqual(reply.status_code, 400)
+            self.assertIn("Unknown request parameter", reply.text)
+
+    def test_latency_and_errors(self):
+        with wonder.MockD76Server(generator=lambda request: "<page/>", latency=0.05, jitter=0.02, error_rate=0.5, seed=3) as server, \
+                wonder.WonderClient(url=server.url, retries=0) as client:
+            outcomes = []
+            start = time.perf_counter()
+            for _ in range(10):
+                try:
+                    wonder.Request().send(client=client)
+                    outcomes.append(True)
+                except RequestException:
+                    outcomes.append(False)
+            self.assertGreaterEqual(time.perf_counter() - start, 0.5)
+            self.assertEqual(outcomes.count(False), server.errors_injected)
+            self.assertTrue(0 < server.errors_injected < 10)
+
+        with self.assertRaises(ValueError):
+            wonder.MockD76Server(error_rate=2)
+
+    def test_default_endpoint(self):
+        with wonder.MockD76Server(recordings={wonder.Request(): MockD76ServerTests.sample_xml}) as server, \
+                mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop(wonder.WonderClient.URL_ENVIRONMENT_VARIABLE, None)
+            with wonder.WonderClient() as client:
+                self.assertEqual(client.url, wonder.WonderClient.DEFAULT_URL)
+            os.environ[wonder.WonderClient.URL_ENVIRONMENT_VARIABLE] = server.url
+            with wonder.WonderClient() as client:
+                self.assertEqual(client.url, server.url)
+
+            with wonder.WonderClient(url=server.url) as client:
+                wonder.WonderClient.set_default(client)
+                try:
+                    self.assertEqual(wonder.Request().send().as_xml(), MockD76ServerTests.sample_xml)
+                    self.assertEqual(asyncio.run(wonder.Request().send_async()).as_xml(), MockD76ServerTests.sample_xml)
+                finally:
+                    wonder.WonderClient.set_default(None)
+            self.assertEqual(server.requests_received, 2)
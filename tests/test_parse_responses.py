@@ -0,0 +1,39 @@
+import cdcwonderpy as wonder
+from cdcwonderpy.enums import *
+import concurrent.futures
+import pandas as pd
+import unittest
+
+# Testing parallel response parsing
+class ParseResponsesTests(unittest.TestCase):
+    sample_xml = open("tests/sample_response.xml").read()
+
+    def test_matches_as_dataframe(self):
+        generator = wonder.SyntheticResponseGenerator(seed=4, totals=True)
+        responses = [wonder.Response(ParseResponsesTests.sample_xml, ["Year", "Race"]),
+                     wonder.Response(generator.xml([Grouping.MONTH, Grouping.TEN_YEAR_AGE_GROUPS, Grouping.GENDER]), ["Month", "Age", "Gender"]),
+                     wonder.Response("<page/>", ["Year"])]
+        expected = [wonder.Response(response.as_xml(), response._groupings).as_dataframe() for response in responses]
+
+        dataframes = wonder.parse_responses(responses, max_workers=2)
+        self.assertEqual(len(dataframes), 3)
+        for dataframe, response, frame in zip(dataframes, responses, expected):
+            pd.testing.assert_frame_equal(dataframe, frame)
+            self.assertIsNotNone(response._dataframe)
+        self.assertEqual(len(dataframes[0]), 80)
+        self.assertEqual(len(dataframes[2]), 0)
+
+    def test_shared_executor(self):
+        responses = [wonder.Response(ParseResponsesTests.sample_xml, ["Year", "Race"]) for _ in range(3)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            dataframes = wonder.parse_responses(responses, executor=executor)
+            # Responses parsed before are not sent to the executor again.
+            self.assertEqual(len(wonder.parse_responses(responses, executor=executor)), 3)
+        self.assertTrue(all(dataframe.equals(dataframes[0]) for dataframe in dataframes))
+
+    def test_errors(self):
+        responses = [wonder.Response("<page><data-table><r><c l=\"1999\"/><c v=\"1\"/></r></data-table></page>", ["Year"]),
+                     wonder.Response(ParseResponsesTests.sample_xml, ["Year", "Race"])]
+        with self.assertRaises(ValueError):
+            wonder.parse_responses(responses, max_workers=1)
+        self.assertIsNotNone(responses[1]._dataframe)
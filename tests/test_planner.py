@@ -0,0 +1,109 @@
+import cdcwonderpy as wonder
+from cdcwonderpy.dates import *
+from cdcwonderpy.enums import *
+from cdcwonderpy.icd10code import ICD10Code
+import itertools
+import pandas as pd
+import unittest
+
+def grouping_d76_response(request):
+    """
+    Answers Year, Month and Gender groupings over the selected dates with deterministic values, laid out
+    with rowspans like the real endpoint. Small death counts are reported as "Suppressed".
+    """
+    months = []
+    for date in request._f_parameters["F_D76.V1"]:
+        if date == "*All*":
+            months = [f"{y}/{m:02d}" for y in range(1999, 2019) for m in range(1, 13)]
+        elif "/" in date:
+            months.append(date)
+        else:
+            months.extend(f"{date}/{m:02d}" for m in range(1, 13))
+    months.sort()
+
+    dimensions = []
+    for i in range(1, 6):
+        grouping = request._b_parameters[f"B_{i}"]
+        if grouping == Grouping.YEAR.value:
+            dimensions.append(sorted({month[:4] for month in months}))
+        elif grouping == Grouping.MONTH.value:
+            dimensions.append(months)
+        elif grouping == Grouping.GENDER.value:
+            dimensions.append(["Female", "Male"])
+
+    rows = []
+    for key in itertools.product(*dimensions):
+        deaths = sum(ord(c) for c in "".join(key)) % 50
+        cells = [f'<c l="{label}"/>' for label in key]
+        cells.append(f'<c v="{deaths:,}"/><c v="{deaths * 1000:,}"/><c v="{deaths / 10}"/>' if deaths >= 10 else
+                     '<c v="Suppressed"/><c v="Not Applicable"/><c v="Suppressed"/>')
+        rows.append(cells)
+
+    # Collapse repeated outer labels into rowspans.
+    for depth in range(len(dimensions) - 1):
+        span_start = 0
+        for i in range(1, len(rows) + 1):
+            if i == len(rows) or rows[i][depth] != rows[span_start][depth]:
+                rows[span_start][depth] = rows[span_start][depth].replace("/>", f' r="{i - span_start}"/>')
+                for j in range(span_start + 1, i):
+                    rows[j][depth] = ""
+                span_start = i
+    return "<page><data-table>" + "".join("<r>" + "".join(cells) + "</r>" for cells in rows) + "</data-table></page>"
+
+
+# Testing automatic query splitting
+class QueryPlannerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = wonder.MockD76Server(generator=grouping_d76_response)
+        cls.server.start()
+        cls.client = wonder.WonderClient(url=cls.server.url)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+        cls.server.stop()
+
+    def test_estimate_rows(self):
+        planner = wonder.QueryPlanner()
+        self.assertEqual(planner.estimate_rows(wonder.Request()), 20)
+        self.assertEqual(planner.estimate_rows(wonder.Request().group_by(Grouping.MONTH, Grouping.GENDER)), 480)
+        request = wonder.Request().group_by(Grouping.YEAR, Grouping.RACE).race(Race.WHITE).dates(Dates.range(Year(2000), Year(2004)))
+        self.assertEqual(planner.estimate_rows(request), 5)
+        request = wonder.Request().group_by(Grouping.ICD_SUBCHAPTER).cause_of_death(ICD10Code.A00_B99)
+        self.assertEqual(planner.estimate_rows(request), 20)
+
+    def test_split_dates(self):
+        request = wonder.Request().group_by(Grouping.YEAR, Grouping.GENDER).dates(Dates.range(YearAndMonth(2001, 7), YearAndMonth(2005, 2)))
+        sub_requests = wonder.QueryPlanner(max_rows=4).split(request)
+        self.assertEqual([r._f_parameters["F_D76.V1"] for r in sub_requests],
+                         [[f"2001/{m:02d}" for m in range(7, 13)] + ["2002"], ["2003", "2004"], ["2005/01", "2005/02"]])
+
+    def test_split_icd10_codes(self):
+        planner = wonder.QueryPlanner(max_rows=100)
+        sub_requests = planner.split(wonder.Request().group_by(Grouping.ICD_SUBCHAPTER))
+        self.assertGreater(len(sub_requests), 1)
+        self.assertTrue(all(planner.estimate_rows(r) <= 100 for r in sub_requests))
+        self.assertEqual(sum(planner.estimate_rows(r) for r in sub_requests), 236)
+
+    def test_split_stops_at_grouping_level(self):
+        # A single chapter grouped by chapter reports one row per gender; its subchapters would each report a partial one.
+        request = wonder.Request().group_by(Grouping.ICD_CHAPTER, Grouping.GENDER).cause_of_death(ICD10Code.A00_B99)
+        with self.assertRaises(ValueError):
+            wonder.QueryPlanner(max_rows=1).split(request)
+
+        request = (wonder.Request().group_by(Grouping.MONTH, Grouping.ICD_CHAPTER, Grouping.GENDER)
+                   .dates(Dates.range(YearAndMonth(2000, 1), YearAndMonth(2000, 2))).cause_of_death(ICD10Code.A00_B99, ICD10Code.C00_D48))
+        sub_requests = wonder.QueryPlanner(max_rows=1).split(request)
+        self.assertEqual([(r._f_parameters["F_D76.V1"], r._f_parameters["F_D76.V2"]) for r in sub_requests],
+                         [(["2000/01"], ["A00-B99"]), (["2000/01"], ["C00-D48"]), (["2000/02"], ["A00-B99"]), (["2000/02"], ["C00-D48"])])
+
+    def test_merged_result_matches_unsplit(self):
+        for groupings, max_rows in [((Grouping.YEAR, Grouping.GENDER), 4), ((Grouping.GENDER, Grouping.MONTH), 50)]:
+            request = wonder.Request().group_by(*groupings).dates(Dates.range(Year(2003), Year(2010)))
+            unsplit = request.send(client=QueryPlannerTests.client).as_dataframe()
+
+            QueryPlannerTests.server.requests_received = 0
+            merged = wonder.QueryPlanner(max_rows=max_rows).send(request, max_workers=3, client=QueryPlannerTests.client)
+            self.assertEqual(QueryPlannerTests.server.requests_received, 4)
+            pd.testing.assert_frame_equal(merged, unsplit)
@@ -0,0 +1,98 @@
+import cdcwonderpy as wonder
+from cdcwonderpy.enums import *
+from cdcwonderpy.dates import *
+from requests import RequestException
+import tempfile
+import unittest
+
+# Testing incremental refreshes of year slices
+class RefreshPlannerTests(unittest.TestCase):
+    def setUp(self):
+        # Deaths per year and gender, as currently "published" by the stub server.
+        self.data = {year: {"Male": 100, "Female": 90} for year in range(2010, 2014)}
+        self.years_requested = []
+
+    def generator(self, request):
+        years = sorted({date.split("/")[0] for date in request._f_parameters["F_D76.V1"]})
+        self.assertEqual(len(years), 1)
+        year = int(years[0])
+        self.years_requested.append(year)
+        rows = "".join(f'<r><c l="{year}"/><c l="{gender}"/><c v="{deaths}"/><c v="1,000"/><c v="1.0"/></r>'
+                       for gender, deaths in self.data[year].items())
+        return f"<page><data-table>{rows}</data-table></page>"
+
+    def test_split(self):
+        request = wonder.Request().dates(Dates.range(YearAndMonth(2011, 11), YearAndMonth(2013, 2))).gender(Gender.MALE)
+        slices = wonder.RefreshPlanner.split(request)
+        self.assertEqual([year for year, _ in slices], [2011, 2012, 2013])
+        self.assertEqual(slices[0][1]._f_parameters["F_D76.V1"], ["2011/11", "2011/12"])
+        self.assertEqual(slices[1][1]._f_parameters["F_D76.V1"], ["2012"])
+        self.assertEqual(slices[2][1]._f_parameters["F_D76.V1"], ["2013/01", "2013/02"])
+        self.assertEqual(slices[1][1]._v_parameters["V_D76.V7"], ["M"])
+        self.assertEqual(request._f_parameters["F_D76.V1"], ["2011/11", "2011/12", "2012", "2013/01", "2013/02"])
+
+    def test_refresh(self):
+        request = wonder.Request().dates(Dates.range(Year(2010), Year(2013))).group_by(Grouping.YEAR, Grouping.GENDER)
+        written = []
+        with tempfile.TemporaryDirectory() as directory, \
+                wonder.MockD76Server(generator=self.generator) as server, \
+                wonder.WonderClient(url=server.url) as client:
+            planner = wonder.RefreshPlanner(directory, client=client)
+            write = lambda year, response: written.append((year, response.as_2d_list()))
+
+            report = planner.refresh(request, write=write)
+            self.assertEqual(report.years_checked, [2010, 2011, 2012, 2013])
+            self.assertEqual(report.years_changed, [2010, 2011, 2012, 2013])
+            self.assertEqual((report.rows_added, report.rows_removed, report.rows_changed), (8, 0, 0))
+            self.assertEqual(written[1], (2011, [["2011", "Male", 100, 1000, 1.0], ["2011", "Female", 90, 1000, 1.0]]))
+            self.assertEqual(list(planner.fingerprints(request)), [2010, 2011, 2012, 2013])
+
+            # Nothing changed: every year is re-queried but nothing is written.
+            written.clear()
+            report = planner.refresh(request, write=write)
+            self.assertEqual(len(self.years_requested), 8)
+            self.assertEqual(report.years_changed, [])
+            self.assertEqual(written, [])
+
+            # CDC revises 2011 and drops a row from 2013.
+            self.data[2011]["Male"] = 101
+            self.data[2013] = {"Female": 90}
+            report = planner.refresh(request, write=write)
+            self.assertEqual(report.years_changed, [2011, 2013])
+            self.assertEqual((report.rows_added, report.rows_removed, report.rows_changed), (0, 1, 1))
+            self.assertEqual([year for year, _ in written], [2011, 2013])
+
+            # The state persists, and requests for the same data share it.
+            planner.close()
+            planner = wonder.RefreshPlanner(directory, client=client)
+            same_data = wonder.Request().group_by(Grouping.YEAR, Grouping.GENDER).dates(Dates.range(Year(2010), Year(2013)))
+            self.assertEqual(planner.refresh(same_data).years_changed, [])
+
+            planner.forget(request)
+            self.assertEqual(planner.fingerprints(request), {})
+            self.assertEqual(planner.refresh(request).rows_added, 7)
+            planner.close()
+
+    def test_failed_write_is_retried(self):
+        request = wonder.Request().dates(Dates.range(Year(2010), Year(2011))).group_by(Grouping.YEAR, Grouping.GENDER)
+        with tempfile.TemporaryDirectory() as directory, \
+                wonder.MockD76Server(generator=self.generator) as server, \
+                wonder.WonderClient(url=server.url, retries=0) as client:
+            planner = wonder.RefreshPlanner(directory, max_workers=1, client=client)
+
+            def write(year, response):
+                if year == 2011:
+                    raise IOError("disk full")
+
+            with self.assertRaises(IOError):
+                planner.refresh(request, write=write)
+            self.assertEqual(list(planner.fingerprints(request)), [2010])
+            self.assertEqual(planner.refresh(request).years_changed, [2011])
+
+            server.error_rate = 1
+            with self.assertRaises(RequestException):
+                planner.refresh(request)
+            planner.close()
+
+        with self.assertRaises(ValueError):
+            wonder.RefreshPlanner(directory, max_workers=0)
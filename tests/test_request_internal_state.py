@@ -28,4 +28,42 @@ class RequestInternalTest(unittest.TestCase):
 
     def test_response_obj_custom(cls):
         resp = wonder.Response("HI YASS QUEEN", None)
-        assert(resp.as_custom(parse_as_int) == 7)
\ No newline at end of file
+        assert(resp.as_custom(parse_as_int) == 7)
+
+    def test_icd10_hierarchy(cls):
+        assert(ICD10Code.children(ICD10Code.A00) == [ICD10Code.A00_0, ICD10Code.A00_1, ICD10Code.A00_9])
+        assert(ICD10Code.children(ICD10Code.A00_0) == [])
+        assert(ICD10Code.children(ICD10Code.ALL)[0] == ICD10Code.A00_B99)
+        assert(len(ICD10Code.children(ICD10Code.ALL)) == 20)
+        assert(ICD10Code.ancestors(ICD10Code.A00_0) == [ICD10Code.A00, ICD10Code.A00_A09, ICD10Code.A00_B99])
+        assert(ICD10Code.ancestors(ICD10Code.A00_B99) == [])
+        assert(ICD10Code.minimal_cover([ICD10Code.A00_0, ICD10Code.B01, ICD10Code.A00, ICD10Code.A00_0, ICD10Code.A00_A09]) == [ICD10Code.B01, ICD10Code.A00_A09])
+        assert(ICD10Code.minimal_cover([ICD10Code.A00, ICD10Code.ALL]) == [ICD10Code.ALL])
+        assert(ICD10Code.minimal_cover(ICD10Code) == [ICD10Code.ALL])
+
+    def test_cause_of_death_deduplication(cls):
+        req = wonder.Request().cause_of_death(ICD10Code.A00, ICD10Code.A00_0, ICD10Code.B01, [ICD10Code.C00, ICD10Code.C00_C14])
+        assert(req._f_parameters["F_D76.V2"] == ["A00", "B01", "C00-C14"])
+
+    def test_description_search_index_matches_full_scan(cls):
+        ICD10Code._open_description_map()
+        queries = [("kidney", 0), ("Kidney", 0), ("kidney", re.I), (r"\bkidney\b", re.I), (r"\bKidney\b", 0),
+                   (r"\bcalv\b", re.A | re.I), ("(?i)MALIGNANT neoplasm", 0), ("^Malignant (neoplasm|tumou?r) of (upper|lower)", 0),
+                   ("(?:tuberculosis)+ of", re.I), ("[Ww]aldenstr.m", 0), ("x{2,}", 0), ("", 0), ("acute\\s+myocardial", 0)]
+        for regex, flags in queries:
+            expected = [code for code in ICD10Code if re.search(regex, ICD10Code.codeToLabels[code.value], flags)]
+            assert(ICD10Code.description_matches_regex(regex, flags) == expected)
+            assert(ICD10Code.description_matches_regex(regex, flags) == expected)
+
+    def test_batch_fuzzy_matching(cls):
+        from rapidfuzz import fuzz, utils
+        ICD10Code._open_description_map()
+        queries = ["Diseases of the nervous system", "kidney failure", "Lung CANCER", ""]
+        for query, best in zip(queries, ICD10Code.best_matches(queries)):
+            scores = [fuzz.token_set_ratio(query, ICD10Code.codeToLabels[code.value], processor=utils.default_process) for code in ICD10Code]
+            assert(best == (list(ICD10Code)[scores.index(max(scores))] if max(scores) > 0 else None))
+        assert(ICD10Code.best_matches([""]) == [None])
+        top = ICD10Code.top_matches(queries, k=3)
+        assert([matches[0][0] for matches in top[:3]] == ICD10Code.best_matches(queries[:3]))
+        assert(all(len(matches) == 3 and matches[0][1] >= matches[1][1] >= matches[2][1] for matches in top[:3]))
+        assert(all(score >= 80 for matches in ICD10Code.top_matches(queries, k=10, score_cutoff=80) for _, score in matches))
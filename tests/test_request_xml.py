@@ -0,0 +1,46 @@
+import cdcwonderpy as wonder
+from cdcwonderpy.enums import *
+from cdcwonderpy.dates import *
+from cdcwonderpy.ages import Ages
+from cdcwonderpy.icd10code import ICD10Code
+from lxml import etree
+import unittest
+
+# Testing request XML serialization
+class RequestXMLTests(unittest.TestCase):
+    def requests(self):
+        return [wonder.Request(),
+                wonder.Request().group_by(Grouping.YEAR, Grouping.RACE).race(Race.WHITE, Race.BLACK_OR_AFRICAN_AMERICAN),
+                wonder.Request().age_groups(Ages.range(15, 44)).group_by(Grouping.TEN_YEAR_AGE_GROUPS, Grouping.GENDER).gender(Gender.FEMALE),
+                wonder.Request().dates(Dates.range(YearAndMonth(2001, 7), YearAndMonth(2005, 2))).group_by(Grouping.MONTH).cause_of_death(ICD10Code.A00, ICD10Code.C00_C14)]
+
+    def test_template_matches_full_rendering(self):
+        for request in self.requests():
+            self.assertEqual(request.to_xml(), wonder.Request._build_xml(request._parameter_dicts()))
+
+    def test_round_trip(self):
+        for request in self.requests():
+            copy = wonder.Request.from_xml(request.to_xml())
+            self.assertEqual(copy.to_xml(), request.to_xml())
+            self.assertEqual(copy._canonical_xml(), request._canonical_xml())
+            self.assertEqual(copy._group_by_column_names, request._group_by_column_names)
+            self.assertEqual(copy._parameter_data.get("ICD-10 Codes"), request._parameter_data.get("ICD-10 Codes"))
+            self.assertEqual(copy._parameter_data.get("Dates"), request._parameter_data.get("Dates"))
+            self.assertEqual(copy.ages, request.ages)
+
+    def test_values_are_escaped(self):
+        request = wonder.Request()
+        request._o_parameters["O_title"] = "Deaths <2000 & \"more\""
+        xml = request.to_xml()
+        parsed = etree.fromstring(xml.encode("utf-8"))
+        titles = [p.findtext("value") for p in parsed.iterfind("parameter") if p.findtext("name") == "O_title"]
+        self.assertEqual(titles, ["Deaths <2000 & \"more\""])
+        self.assertEqual(wonder.Request.from_xml(xml)._o_parameters["O_title"], "Deaths <2000 & \"more\"")
+
+    def test_invalid_xml(self):
+        with self.assertRaises(ValueError):
+            wonder.Request.from_xml("<request-parameters>")
+        with self.assertRaises(ValueError):
+            wonder.Request.from_xml("<other/>")
+        with self.assertRaises(ValueError):
+            wonder.Request.from_xml("<request-parameters><parameter><name>X_1</name><value>1</value></parameter></request-parameters>")
@@ -0,0 +1,71 @@
+import cdcwonderpy as wonder
+from cdcwonderpy.enums import *
+import importlib.util
+import json
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+# Testing Arrow and Parquet export of responses
+@unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+class ResponseArrowTests(unittest.TestCase):
+    sample_xml = open("tests/sample_response.xml").read()
+    nested_xml = ('<page><data-table>'
+                  '<r><c l="1999" r="3"/><c l="Female" r="2"/><c l="1"/><c v="1,234"/><c v="Suppressed"/><c v="Not Applicable"/></r>'
+                  '<r><c l="2"/><c v="12"/><c v="100"/><c v="Unreliable"/></r>'
+                  '<r><c l="Male"/><c l="1"/><c v="3"/><c v="40"/><c v="7.5"/></r>'
+                  '</data-table></page>')
+
+    def test_columns(self):
+        import pyarrow as pa
+
+        table = wonder.Response(ResponseArrowTests.nested_xml, ["Year", "Gender", "Age"]).as_arrow()
+        self.assertEqual(table.column_names, ["Year", "Gender", "Age", "Deaths", "Population", "Crude Rate Per 100,000", "Missing"])
+        self.assertEqual(table.schema.field("Gender").type, pa.dictionary(pa.int32(), pa.string()))
+        self.assertEqual(table.schema.field("Deaths").type, pa.int64())
+        self.assertEqual(table.schema.field("Crude Rate Per 100,000").type, pa.float64())
+        self.assertEqual(table.to_pydict(), {
+            "Year": ["1999", "1999", "1999"],
+            "Gender": ["Female", "Female", "Male"],
+            "Age": ["1", "2", "1"],
+            "Deaths": [1234, 12, 3],
+            "Population": [None, 100, 40],
+            "Crude Rate Per 100,000": [None, None, 7.5],
+            "Missing": ["Suppressed; Not Applicable", "Unreliable", None],
+        })
+        self.assertEqual(json.loads(table.schema.metadata[b"cdcwonderpy.groupings"]), ["Year", "Gender", "Age"])
+
+    def test_matches_dataframe(self):
+        response = wonder.Response(ResponseArrowTests.sample_xml, ["Year", "Race"])
+        with mock.patch.object(response, "_parse_rows", wraps=response._parse_rows) as parse_rows:
+            table = response.as_arrow()
+            self.assertIs(response.as_arrow(), table)
+            df = response.as_dataframe()
+        # Both are built from the same parsed columns.
+        self.assertEqual(parse_rows.call_count, 1)
+        self.assertEqual(table.column("Deaths").to_pylist(), list(df["Deaths"]))
+        self.assertEqual(table.column("Race").to_pylist(), list(df["Race"]))
+
+    def test_parquet_metadata(self):
+        import pyarrow.parquet as pq
+
+        request = wonder.Request().group_by(Grouping.YEAR, Grouping.RACE).race(Race.WHITE, Race.BLACK_OR_AFRICAN_AMERICAN)
+        response = wonder.Response(ResponseArrowTests.sample_xml, ["Year", "Race"], request._metadata())
+        response = pickle.loads(pickle.dumps(response))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "result.parquet")
+            response.to_parquet(path)
+            table = pq.read_table(path)
+            self.assertTrue(table.equals(response.as_arrow()))
+
+            metadata = pq.read_metadata(path).metadata
+            self.assertEqual(json.loads(metadata[b"cdcwonderpy.parameters"]),
+                             {"Grouped by": ["YEAR", "RACE"], "Race": ["BLACK_OR_AFRICAN_AMERICAN", "WHITE"]})
+            restored = wonder.Request.from_xml(metadata[b"cdcwonderpy.request"].decode("utf-8"))
+            self.assertEqual(restored.to_xml(), request.to_xml())
+
+            response.to_parquet(os.path.join(directory, "dataset"), partition_cols=["Year"])
+            self.assertEqual(len(os.listdir(os.path.join(directory, "dataset"))), 20)
+            self.assertEqual(pq.read_table(os.path.join(directory, "dataset")).num_rows, 80)
@@ -0,0 +1,141 @@
+import cdcwonderpy as wonder
+from cdcwonderpy.enums import *
+from cdcwonderpy.dates import *
+from requests import RequestException
+import tempfile
+import time
+import unittest
+
+# Testing the on-disk response cache
+class ResponseCacheTests(unittest.TestCase):
+    sample_xml = open("tests/sample_response.xml").read()
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_canonical_key(self):
+        first = wonder.Request().race(Race.WHITE, Race.ASIAN_OR_PACIFIC_ISLANDER)
+        second = wonder.Request().race(Race.ASIAN_OR_PACIFIC_ISLANDER, Race.WHITE)
+        third = wonder.Request().race(Race.WHITE)
+        self.assertEqual(wonder.ResponseCache.key(first), wonder.ResponseCache.key(second))
+        self.assertNotEqual(wonder.ResponseCache.key(first), wonder.ResponseCache.key(third))
+
+    def test_send_uses_cache(self):
+        cache = wonder.ResponseCache(self.directory.name)
+        request = wonder.Request().group_by(Grouping.YEAR, Grouping.RACE)
+        self.assertIsNone(cache.get(request))
+        cache.put(request, ResponseCacheTests.sample_xml)
+
+        response = request.send(cache=cache)
+        self.assertEqual(response.as_xml(), ResponseCacheTests.sample_xml)
+        self.assertEqual(list(response.as_dataframe().columns[:2]), ["Year", "Race"])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        # Entries survive reopening the cache.
+        cache.close()
+        self.assertEqual(len(wonder.ResponseCache(self.directory.name)), 1)
+
+    def test_offline_miss_raises(self):
+        cache = wonder.ResponseCache(self.directory.name, offline=True)
+        with self.assertRaises(RequestException):
+            wonder.Request().send(cache=cache)
+
+    def test_ttl_expiry(self):
+        cache = wonder.ResponseCache(self.directory.name, ttl=0.05)
+        request = wonder.Request()
+        cache.put(request, "<page/>")
+        self.assertEqual(cache.get(request), "<page/>")
+        time.sleep(0.1)
+        self.assertIsNone(cache.get(request))
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        cache = wonder.ResponseCache(self.directory.name)
+        requests = [wonder.Request().gender(gender) for gender in Gender]
+        for i, request in enumerate(requests):
+            cache.put(request, str(i) * 10000)
+            time.sleep(0.01)
+        cache.get(requests[0])
+
+        cache.max_size = cache.size() - 1
+        cache.put(requests[0], "0" * 10000)
+        self.assertIsNotNone(cache.get(requests[0]))
+        self.assertIsNone(cache.get(requests[1]))
+        self.assertIsNotNone(cache.get(requests[2]))
+
+    def test_coalesced_slice(self):
+        cache = wonder.ResponseCache(self.directory.name, coalesce=True)
+        cache.put(wonder.Request().group_by(Grouping.YEAR, Grouping.RACE), ResponseCacheTests.sample_xml)
+        full = wonder.Response(ResponseCacheTests.sample_xml, ["Year", "Race"]).as_dataframe()
+
+        df = wonder.Request().race(Race.WHITE).send(cache=cache).as_dataframe()
+        expected = full[full["Race"] == "White"]
+        self.assertEqual(list(df["Year"]), [str(year) for year in range(1999, 2019)])
+        self.assertEqual(list(df["Deaths"]), list(expected["Deaths"]))
+        self.assertEqual(list(df["Crude Rate Per 100,000"]), list(expected["Crude Rate Per 100,000"]))
+
+        df = wonder.Request().group_by(Grouping.RACE, Grouping.YEAR).dates(Dates.single(Year(2003))).send(cache=cache).as_dataframe()
+        self.assertEqual(list(df.columns[:2]), ["Race", "Year"])
+        self.assertEqual(list(df["Deaths"]), list(full[full["Year"] == "2003"]["Deaths"]))
+        self.assertEqual((cache.hits, cache.misses, cache.coalesced), (2, 0, 2))
+
+    def test_coalesced_sum(self):
+        cache = wonder.ResponseCache(self.directory.name, coalesce=True)
+        cache.put(wonder.Request().group_by(Grouping.YEAR, Grouping.RACE), ResponseCacheTests.sample_xml)
+        full = wonder.Response(ResponseCacheTests.sample_xml, ["Year", "Race"]).as_dataframe()
+
+        races = [Race.WHITE, Race.BLACK_OR_AFRICAN_AMERICAN]
+        df = wonder.Request().race(*races).send(cache=cache).as_dataframe()
+        selected = full[full["Race"].isin(["White", "Black or African American"])].groupby("Year", observed=True)
+        self.assertEqual(list(df["Deaths"]), list(selected["Deaths"].sum()))
+        self.assertEqual(list(df["Population"]), list(selected["Population"].sum()))
+        rates = selected["Deaths"].sum() / selected["Population"].sum() * 100000
+        self.assertTrue(all(abs(a - b) < 1e-9 for a, b in zip(df["Crude Rate Per 100,000"], rates)))
+
+        df = wonder.Request().group_by(Grouping.RACE).dates(Dates.range(Year(2000), Year(2002))).send(cache=cache).as_dataframe()
+        self.assertEqual(list(df["Race"]), list(full["Race"].cat.categories))
+        selected = full[full["Year"].isin(["2000", "2001", "2002"])].groupby("Race", observed=True)
+        self.assertEqual(list(df["Deaths"]), list(selected["Deaths"].sum()))
+
+    def test_coalescing_misses(self):
+        cache = wonder.ResponseCache(self.directory.name, coalesce=True)
+        cache.put(wonder.Request().group_by(Grouping.YEAR, Grouping.RACE), ResponseCacheTests.sample_xml)
+
+        # Filters on dimensions the cached response is not grouped by, or other parameters, must match.
+        self.assertIsNone(cache.get(wonder.Request().gender(Gender.MALE)))
+        self.assertIsNone(cache.get(wonder.Request().race(Race.WHITE).weekday(Weekday.MON)))
+        self.assertIsNone(cache.get(wonder.Request().group_by(Grouping.GENDER)))
+        self.assertIsNone(cache.get(wonder.Request().dates(Dates.single(YearAndMonth(2000, 1)))))
+        self.assertIsNone(wonder.ResponseCache(self.directory.name).get(wonder.Request().race(Race.WHITE)))
+        self.assertEqual(cache.coalesced, 0)
+
+    def test_coalescing_missing_values(self):
+        cache = wonder.ResponseCache(self.directory.name, coalesce=True)
+        xml = ('<page><data-table>'
+               '<r><c l="Female" r="2"/><c l="Asian or Pacific Islander"/><c v="Suppressed"/><c v="Suppressed"/><c v="Suppressed"/></r>'
+               '<r><c l="White"/><c v="15"/><c v="100,000"/><c v="Unreliable"/></r>'
+               '<r><c l="Male" r="2"/><c l="Asian or Pacific Islander"/><c v="12"/><c v="90,000"/><c v="Unreliable"/></r>'
+               '<r><c l="White"/><c v="30"/><c v="120,000"/><c v="25.000000000"/></r>'
+               '</data-table></page>')
+        cache.put(wonder.Request().group_by(Grouping.GENDER, Grouping.RACE), xml)
+
+        # Suppressed cells are kept when slicing, but cannot be added up.
+        df = wonder.Request().group_by(Grouping.GENDER).race(Race.ASIAN_OR_PACIFIC_ISLANDER).send(cache=cache).as_dataframe()
+        self.assertEqual(list(df["Missing"].astype(str)), ["Suppressed", "Unreliable"])
+        self.assertIsNone(cache.get(wonder.Request().group_by(Grouping.RACE)))
+
+        df = wonder.Request().group_by(Grouping.RACE).gender(Gender.MALE).send(cache=cache).as_dataframe()
+        self.assertEqual(list(df["Deaths"]), [12, 30])
+        df = wonder.Request().group_by(Grouping.GENDER).race(Race.WHITE).send(cache=cache).as_dataframe()
+        self.assertEqual(list(df["Gender"]), ["Female", "Male"])
+
+        # Sums below 20 deaths have an unreliable rate.
+        cache.clear()
+        cache.put(wonder.Request().group_by(Grouping.GENDER, Grouping.RACE).race(Race.WHITE, Race.ASIAN_OR_PACIFIC_ISLANDER).gender(Gender.MALE),
+                  '<page><data-table><r><c l="Male" r="2"/><c l="Asian or Pacific Islander"/><c v="12"/><c v="90,000"/><c v="Unreliable"/></r>'
+                  '<r><c l="White"/><c v="3"/><c v="120,000"/><c v="Unreliable"/></r></data-table></page>')
+        response = wonder.Request().group_by(Grouping.GENDER).race(Race.WHITE, Race.ASIAN_OR_PACIFIC_ISLANDER).gender(Gender.MALE).send(cache=cache)
+        self.assertEqual(response.as_2d_list(), [["Male", 15.0, 210000.0, "Unreliable"]])
@@ -1,11 +1,19 @@
 import cdcwonderpy as wonder
 import unittest
 import bs4 as bs
+import numpy as np
 import pandas as pd
+import pickle
+from unittest import mock
 
 # Testing parsing of response
 class ResponseFormattingTests(unittest.TestCase):
     sample_xml = open("tests/sample_response.xml").read()
+    nested_xml = ('<page><data-table>'
+                  '<r><c l="1999" r="3"/><c l="Female" r="2"/><c l="1"/><c v="1,234"/><c v="Suppressed"/><c v="Not Applicable"/></r>'
+                  '<r><c l="2"/><c v="12"/><c v="100"/><c v="Unreliable"/></r>'
+                  '<r><c l="Male"/><c l="1"/><c v="3"/><c v="40"/><c v="7.5"/></r>'
+                  '</data-table></page>')
 
     def test_as_2d_list(self):
         response = wonder.Response(ResponseFormattingTests.sample_xml, ["Year", "Race"])
@@ -93,20 +101,111 @@ class ResponseFormattingTests(unittest.TestCase):
 
     def test_as_dataframe(self):
         response = wonder.Response(ResponseFormattingTests.sample_xml, ["Year", "Race"])
-        expected_result = """    Year                              Race  Deaths  Population  Crude Rate Per 100,000
-0   1999  American Indian or Alaska Native   210.0   1375207.0               15.270428
-1   1999         Asian or Pacific Islander    73.0   5813970.0                1.255596
-2   1999         Black or African American  1176.0  17026405.0                6.906919
-3   1999                             White  5067.0  99715532.0                5.081455
-4   2000  American Indian or Alaska Native   213.0   1438695.0               14.805084
-..   ...                               ...     ...         ...                     ...
-75  2017                             White  5170.0  97574426.0                5.298520
-76  2018  American Indian or Alaska Native   408.0   2126784.0               19.183895
-77  2018         Asian or Pacific Islander   164.0   9953048.0                1.647736
-78  2018         Black or African American   742.0  20132411.0                3.685599
-79  2018                             White  5371.0  97734219.0                5.495516
-
-[80 rows x 5 columns]"""
+        expected_result = """    Year                              Race  Deaths  Population  Crude Rate Per 100,000 Missing
+0   1999  American Indian or Alaska Native     210     1375207               15.270428     NaN
+1   1999         Asian or Pacific Islander      73     5813970                1.255596     NaN
+2   1999         Black or African American    1176    17026405                6.906919     NaN
+3   1999                             White    5067    99715532                5.081455     NaN
+4   2000  American Indian or Alaska Native     213     1438695               14.805084     NaN
+..   ...                               ...     ...         ...                     ...     ...
+75  2017                             White    5170    97574426                5.298520     NaN
+76  2018  American Indian or Alaska Native     408     2126784               19.183895     NaN
+77  2018         Asian or Pacific Islander     164     9953048                1.647736     NaN
+78  2018         Black or African American     742    20132411                3.685599     NaN
+79  2018                             White    5371    97734219                5.495516     NaN
+
+[80 rows x 6 columns]"""
+
+        with pd.option_context("display.max_columns", None, "display.width", None):
+            self.assertEqual(str(response), expected_result)
         
-        self.assertEquals(str(response), expected_result)
-        
\ No newline at end of file
+    def test_iter_rows(self):
+        response = wonder.Response(ResponseFormattingTests.sample_xml, ["Year", "Race"])
+        rows = response.iter_rows()
+        self.assertEqual(next(rows), ['1999', 'American Indian or Alaska Native', 210.0, 1375207.0, 15.270428379])
+        self.assertEqual(next(rows), ['1999', 'Asian or Pacific Islander', 73.0, 5813970.0, 1.255596434])
+        self.assertEqual(len(list(rows)), 78)
+
+    def test_iter_rows_nested_rowspans(self):
+        response = wonder.Response(ResponseFormattingTests.nested_xml, ["Year", "Gender", "Weekday"])
+        self.assertEqual(response.as_2d_list(), [
+            ['1999', 'Female', '1', 1234.0, 'Suppressed', 'Not Applicable'],
+            ['1999', 'Female', '2', 12.0, 100.0, 'Unreliable'],
+            ['1999', 'Male', '1', 3.0, 40.0, 7.5]])
+
+    def test_as_dataframe_typed_columns(self):
+        response = wonder.Response(ResponseFormattingTests.nested_xml, ["Year", "Gender", "Weekday"])
+        df = response.as_dataframe()
+        self.assertEqual(list(df.columns), ["Year", "Gender", "Weekday", "Deaths", "Population", "Crude Rate Per 100,000", "Missing"])
+        self.assertEqual(str(df["Gender"].dtype), "category")
+        self.assertEqual(str(df["Deaths"].dtype), "Int64")
+        self.assertEqual(str(df["Population"].dtype), "Int64")
+        self.assertEqual(str(df["Crude Rate Per 100,000"].dtype), "float64")
+        self.assertEqual(list(df["Deaths"]), [1234, 12, 3])
+        self.assertTrue(pd.isna(df["Population"][0]))
+        self.assertEqual(df["Population"][2], 40)
+        self.assertTrue(df["Crude Rate Per 100,000"][:2].isna().all())
+        self.assertEqual(list(df["Missing"].astype(object)[:2]), ["Suppressed; Not Applicable", "Unreliable"])
+        self.assertTrue(pd.isna(df["Missing"][2]))
+
+    def test_as_dataframe_grows_past_capacity(self):
+        xml = "<page><data-table>" + "".join(f'<r><c l="{i}"/><c v="{i}"/><c v="{i * 10}"/><c v="1.5"/></r>' for i in range(50)) + "</data-table></page>"
+        table = wonder.response._ColumnarTable(1)
+        for record in wonder.Response(xml, ["Weekday"]).iter_rows():
+            table.append(record)
+        df = table.to_dataframe(["Weekday"])
+        self.assertEqual(list(df["Weekday"].astype(object)), [str(i) for i in range(50)])
+        self.assertEqual(list(df["Population"]), [i * 10 for i in range(50)])
+
+    def test_memoized_results(self):
+        response = wonder.Response(ResponseFormattingTests.sample_xml, ["Year", "Race"])
+        with mock.patch.object(response, "_parse_rows", wraps=response._parse_rows) as parse_rows:
+            first = response.as_dataframe()
+            second = response.as_dataframe()
+        self.assertEqual(parse_rows.call_count, 1)
+
+        # Every call hands out its own frame; with copy-on-write they are views of the memoized one.
+        self.assertIsNot(first, second)
+        if wonder.response._COPY_ON_WRITE:
+            rate = "Crude Rate Per 100,000"
+            self.assertTrue(np.shares_memory(second[rate].to_numpy(), response._dataframe[rate].to_numpy()))
+        first.loc[0, "Deaths"] = -1
+        self.assertEqual(second.loc[0, "Deaths"], 210)
+        self.assertEqual(response.as_dataframe().loc[0, "Deaths"], 210)
+
+        rows = response.as_2d_list()
+        rows[0][0] = "changed"
+        self.assertEqual(response.as_2d_list()[0][0], "1999")
+        self.assertEqual(next(response.iter_rows())[0], "1999")
+
+        self.assertEqual(hash(response), hash(wonder.Response(ResponseFormattingTests.sample_xml, ["Year", "Race"])))
+        response.clear_cache()
+        self.assertIsNone(response._rows)
+        self.assertIsNone(response._dataframe)
+        self.assertEqual(len(response.as_dataframe()), 80)
+
+    def test_compressed_xml(self):
+        plain = wonder.Response(ResponseFormattingTests.sample_xml, ["Year", "Race"])
+        response = wonder.Response(ResponseFormattingTests.sample_xml, ["Year", "Race"], compress=True)
+        self.assertIsNone(response._xml)
+        self.assertLess(len(response._compressed) * 4, len(ResponseFormattingTests.sample_xml))
+        self.assertEqual(response.as_xml(), ResponseFormattingTests.sample_xml)
+        self.assertEqual(response, plain)
+        self.assertEqual(hash(response), hash(plain))
+        self.assertNotEqual(response, wonder.Response(ResponseFormattingTests.nested_xml, ["Year", "Race"]))
+
+        # Parsing decompresses in chunks.
+        with mock.patch.object(wonder.Response, "STREAM_CHUNK_SIZE", 100):
+            self.assertEqual(response.as_2d_list(), plain.as_2d_list())
+        self.assertTrue(response.as_dataframe().equals(plain.as_dataframe()))
+
+        # Compressing after parsing keeps the parsed results; the digest is computed while compressing.
+        self.assertIs(plain.compress(), plain)
+        self.assertIsNotNone(plain._dataframe)
+        self.assertIsNotNone(plain._digest)
+        self.assertEqual(plain.compress().as_xml(), ResponseFormattingTests.sample_xml)
+
+        copy = pickle.loads(pickle.dumps(response))
+        self.assertEqual(copy._compressed, response._compressed)
+        self.assertEqual(copy, response)
+        self.assertEqual(copy.as_2d_list(), plain.as_2d_list())
@@ -0,0 +1,84 @@
+import cdcwonderpy as wonder
+from cdcwonderpy.enums import *
+from requests import RequestException
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+# Testing streamed downloads and spooled responses
+class StreamResponseTests(unittest.TestCase):
+    generator = wonder.SyntheticResponseGenerator(totals=True)
+    request = wonder.Request().group_by(Grouping.YEAR, Grouping.RACE, Grouping.GENDER)
+
+    def setUp(self):
+        self.server = wonder.MockD76Server(generator=StreamResponseTests.generator)
+        self.server.start()
+        self.client = wonder.WonderClient(url=self.server.url, retries=0)
+        self.expected = StreamResponseTests.request.send(client=self.client)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+    def test_stream(self):
+        # Small chunks split rows and labels across chunk boundaries.
+        with mock.patch.object(wonder.Response, "STREAM_CHUNK_SIZE", 97):
+            response = StreamResponseTests.request.send(client=self.client, stream=True)
+        self.assertIsNotNone(response._table)
+        self.assertEqual(len(response._table), StreamResponseTests.generator.rows([Grouping.YEAR, Grouping.RACE, Grouping.GENDER]))
+        self.assertTrue(response.as_dataframe().equals(self.expected.as_dataframe()))
+        self.assertEqual(response.as_xml(), self.expected.as_xml())
+        self.assertEqual(response.as_2d_list(), self.expected.as_2d_list())
+        self.assertEqual(response, self.expected)
+
+        response.clear_cache()
+        self.assertTrue(response.as_dataframe().equals(self.expected.as_dataframe()))
+
+    def test_spool(self):
+        with tempfile.TemporaryDirectory() as directory:
+            response = StreamResponseTests.request.send(client=self.client, stream=True, spool=directory)
+            self.assertIsNone(response._xml)
+            self.assertTrue(response.as_dataframe().equals(self.expected.as_dataframe()))
+            self.assertEqual(response.as_xml(), self.expected.as_xml())
+            self.assertEqual(hash(response), hash(self.expected))
+
+            # Once the columns are released, they are parsed again from the spool file.
+            response.clear_cache()
+            with mock.patch.object(wonder.Response, "STREAM_CHUNK_SIZE", 1000):
+                self.assertEqual(list(response.iter_rows()), self.expected.as_2d_list())
+            self.assertTrue(response.as_dataframe().equals(self.expected.as_dataframe()))
+
+            copy = pickle.loads(pickle.dumps(response))
+            self.assertEqual(copy.as_xml(), self.expected.as_xml())
+            self.assertEqual(os.listdir(directory), [])
+
+            # Compressing releases the spool file.
+            response.compress()
+            self.assertIsNone(response._spool)
+            self.assertEqual(response.as_xml(), self.expected.as_xml())
+
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = wonder.ResponseCache(directory)
+            StreamResponseTests.request.send(client=self.client, cache=cache, stream=True, spool=True)
+            cached = StreamResponseTests.request.send(cache=cache, stream=True)
+            self.assertEqual(cached.as_xml(), self.expected.as_xml())
+            self.assertEqual(self.server.requests_received, 2)
+            cache.close()
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            StreamResponseTests.request.send(client=self.client, spool=True)
+
+        self.server.error_rate = 1
+        with self.assertRaises(RequestException):
+            StreamResponseTests.request.send(client=self.client, stream=True, spool=True)
+
+    def test_parse_responses(self):
+        streamed = StreamResponseTests.request.send(client=self.client, stream=True)
+        with mock.patch("cdcwonderpy.batch._parse_in") as parse_in:
+            dataframes = wonder.parse_responses([streamed])
+        parse_in.assert_not_called()
+        self.assertTrue(dataframes[0].equals(self.expected.as_dataframe()))
@@ -0,0 +1,97 @@
+import cdcwonderpy as wonder
+from cdcwonderpy.dates import *
+from cdcwonderpy.enums import *
+import itertools
+import pandas as pd
+import unittest
+
+def filtering_d76_response(request):
+    """
+    Answers Year and Gender groupings, honouring the date and gender filters. Every (year, gender) has a
+    fixed number of deaths, so a row's values only depend on the years and genders it covers.
+    """
+    labels = {"F": "Female", "M": "Male"}
+    dates = request._f_parameters["F_D76.V1"]
+    years = [str(y) for y in range(1999, 2019)] if dates == ["*All*"] else sorted(dates)
+    genders = ["F", "M"] if request._v_parameters["V_D76.V7"] == "*All*" else sorted(request._v_parameters["V_D76.V7"])
+    groupings = [request._b_parameters[f"B_{i}"] for i in range(1, 6)]
+
+    dimensions = []
+    for grouping in groupings:
+        if grouping == Grouping.YEAR.value:
+            dimensions.append([[year] for year in years])
+        elif grouping == Grouping.GENDER.value:
+            dimensions.append([[gender] for gender in genders])
+    if Grouping.YEAR.value not in groupings:
+        dimensions.append([years])
+    if Grouping.GENDER.value not in groupings:
+        dimensions.append([genders])
+
+    rows = []
+    for key in itertools.product(*dimensions):
+        cell_years = next(k for k in key if k[0][0].isdigit())
+        cell_genders = next(k for k in key if not k[0][0].isdigit())
+        deaths = sum(int(y) % 37 + ord(g) for y in cell_years for g in cell_genders)
+        cells = []
+        for k, grouping in zip(key, groupings):
+            if grouping == Grouping.YEAR.value:
+                cells.append(f'<c l="{k[0]}"/>')
+            elif grouping == Grouping.GENDER.value:
+                cells.append(f'<c l="{labels[k[0]]}"/>')
+        cells.append(f'<c v="{deaths:,}"/><c v="{deaths * 1000:,}"/><c v="{deaths / 10}"/>')
+        rows.append("<r>" + "".join(cells) + "</r>")
+    return "<page><data-table>" + "".join(rows) + "</data-table></page>"
+
+
+# Testing parameter sweeps
+class RequestSweepTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = wonder.MockD76Server(generator=filtering_d76_response)
+        cls.server.start()
+        cls.client = wonder.WonderClient(url=cls.server.url)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+        cls.server.stop()
+
+    def test_cells(self):
+        base = wonder.Request().group_by(Grouping.YEAR)
+        sweep = wonder.RequestSweep(base, gender=[Gender.FEMALE, Gender.MALE], race=[Race.WHITE, [Race.ASIAN_OR_PACIFIC_ISLANDER, Race.BLACK_OR_AFRICAN_AMERICAN]])
+        cells = list(sweep)
+        self.assertEqual(len(sweep), 4)
+        self.assertEqual(len(cells), 4)
+        self.assertEqual(cells[1][0], {"gender": Gender.FEMALE, "race": [Race.ASIAN_OR_PACIFIC_ISLANDER, Race.BLACK_OR_AFRICAN_AMERICAN]})
+        self.assertEqual(cells[1][1]._v_parameters["V_D76.V7"], ["F"])
+        self.assertEqual(sorted(cells[1][1]._v_parameters["V_D76.V8"]), ["2054-5", "A-PI"])
+        self.assertEqual(base._v_parameters["V_D76.V7"], "*All*")
+        with self.assertRaises(ValueError):
+            wonder.RequestSweep(base, colour=[1])
+
+    def test_merging(self):
+        sweep = wonder.RequestSweep(wonder.Request().group_by(Grouping.YEAR), gender=[Gender.FEMALE, Gender.MALE],
+                                    dates=[Dates.single(Year(year)) for year in range(2000, 2004)])
+        queries = list(sweep.queries())
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(queries[0][1], ["gender", "dates"])
+        self.assertEqual(queries[0][2]._group_by_column_names, ["Year", "Gender"])
+        self.assertEqual(len(list(sweep.queries(merge=False))), 8)
+
+        # Months cannot be told apart by a Year grouping, so that axis is not merged.
+        sweep = wonder.RequestSweep(wonder.Request(), dates=[Dates.single(YearAndMonth(2000, 1)), Dates.single(YearAndMonth(2000, 2))])
+        self.assertEqual([merged for _, merged, _ in sweep.queries()], [[], []])
+
+    def test_merged_results_match_cells(self):
+        sweep = wonder.RequestSweep(wonder.Request().group_by(Grouping.YEAR), gender=[Gender.MALE, Gender.FEMALE],
+                                    dates=[Dates.range(Year(2000), Year(2001)), Dates.single(Year(2005))])
+        RequestSweepTests.server.requests_received = 0
+        merged = sweep.send(client=RequestSweepTests.client)
+        self.assertEqual(RequestSweepTests.server.requests_received, 2)
+        separate = sweep.send(merge=False, max_workers=3, client=RequestSweepTests.client)
+        self.assertEqual(RequestSweepTests.server.requests_received, 6)
+
+        self.assertEqual(list(merged.columns), ["gender", "dates", "Year", "Deaths", "Population", "Crude Rate Per 100,000", "Missing"])
+        self.assertEqual(list(merged["gender"]), [Gender.MALE] * 3 + [Gender.FEMALE] * 3)
+        self.assertEqual(list(merged["Year"].astype(str)), ["2000", "2001", "2005"] * 2)
+        pd.testing.assert_frame_equal(merged.astype({"Year": str, "Missing": str}), separate.astype({"Year": str, "Missing": str}))
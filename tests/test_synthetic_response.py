@@ -0,0 +1,54 @@
+import cdcwonderpy as wonder
+from cdcwonderpy.enums import *
+import unittest
+
+# Testing the synthetic response generator
+class SyntheticResponseTests(unittest.TestCase):
+    def test_deterministic(self):
+        groupings = [Grouping.YEAR, Grouping.TEN_YEAR_AGE_GROUPS]
+        self.assertEqual(wonder.SyntheticResponseGenerator(seed=1).xml(groupings), wonder.SyntheticResponseGenerator(seed=1).xml(groupings))
+        self.assertNotEqual(wonder.SyntheticResponseGenerator(seed=1).xml(groupings), wonder.SyntheticResponseGenerator(seed=2).xml(groupings))
+
+    def test_layout(self):
+        generator = wonder.SyntheticResponseGenerator()
+        groupings = [Grouping.YEAR, Grouping.GENDER, Grouping.RACE]
+        xml = generator.xml(groupings)
+        self.assertIn('<c l="1999" r="8"/><c l="Male" r="4"/>', xml)
+
+        rows = wonder.Response(xml, ["Year", "Gender", "Race"]).as_2d_list()
+        self.assertEqual(len(rows), generator.rows(groupings))
+        self.assertEqual(len(rows), 20 * 2 * 4)
+        self.assertEqual(rows[5][:3], ["1999", "Female", "Asian or Pacific Islander"])
+        self.assertTrue(all(len(row) == 6 for row in rows))
+
+        values = [value for row in rows for value in row[3:]]
+        self.assertIn("Suppressed", values)
+        self.assertIn("Unreliable", values)
+        self.assertRegex(xml, r'<c v="\d{1,3}(,\d{3})+"/>')
+
+    def test_totals(self):
+        generator = wonder.SyntheticResponseGenerator(totals=True, suppress=False)
+        groupings = [Grouping.GENDER, Grouping.AUTOPSY]
+        rows = wonder.Response(generator.xml(groupings), ["Gender", "Autopsy"]).as_2d_list()
+        self.assertEqual(len(rows), generator.rows(groupings))
+        self.assertEqual(len(rows), 2 * (3 + 1) + 1)
+        self.assertEqual(rows[3][:2], ["Male", "Total"])
+        self.assertEqual(rows[3][2], sum(row[2] for row in rows[:3]))
+        self.assertEqual(rows[-1][:2], ["Total", "Total"])
+        self.assertEqual(rows[-1][2], sum(row[2] for row in rows if row[1] == "Total" and row[0] != "Total"))
+        self.assertTrue(all(row[3] == "Not Applicable" for row in rows))
+
+    def test_truncated(self):
+        generator = wonder.SyntheticResponseGenerator(totals=True)
+        groupings = [Grouping.MONTH, Grouping.SINGLE_YEAR_AGE_GROUPS, Grouping.RACE]
+        for rows in [1, 7, 1000]:
+            df = wonder.Response(generator.xml(groupings, rows=rows), ["Month", "Age", "Race"]).as_dataframe()
+            self.assertEqual(len(df), rows)
+            self.assertEqual(df["Month"][0], "Jan., 1999")
+
+    def test_serves_requests(self):
+        with wonder.MockD76Server(generator=wonder.SyntheticResponseGenerator()) as server, \
+                wonder.WonderClient(url=server.url) as client:
+            df = wonder.Request().group_by(Grouping.ICD_CHAPTER, Grouping.HISPANIC_ORIGIN).send(client=client).as_dataframe()
+        self.assertEqual(len(df), 20 * 3)
+        self.assertEqual(df["Icd_chapter"][0], "Certain infectious and parasitic diseases (A00-B99)")